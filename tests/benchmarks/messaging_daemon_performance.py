@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+Load generator and throughput benchmark for the messaging daemon.
+
+Starts HighPerformanceMessagingDaemon on a temporary Unix socket against a
+simulated tmux, then drives it with concurrent DaemonClient connections
+publishing to many targets. Reports throughput, publish-ack and end-to-end
+delivery latency percentiles, CPU time and RSS, and tracks results against a
+JSON baseline so daemon regressions show up as numbers.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+from unittest.mock import patch
+
+import psutil
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from tmux_orchestrator.core.messaging_daemon import DaemonClient, HighPerformanceMessagingDaemon  # noqa: E402
+from tmux_orchestrator.utils.quantile_sketch import QuantileSketch  # noqa: E402
+from tmux_orchestrator.utils.rate_limiter import RateLimitConfig  # noqa: E402
+
+# Marker embedded in every benchmark message so deliveries can be matched to publishes
+MARKER = re.compile(r"\[bench:(\d+)\]")
+
+# Rate limits loose enough that the benchmark measures delivery, not admission
+UNLIMITED = RateLimitConfig(max_requests=10**9, window_seconds=1.0, burst_size=10**9)
+
+
+class SimulatedTmux:
+    """Stand-in for AsyncTmuxOperations: Claude-like panes that render keystrokes instantly.
+
+    Every call waits for ``call_latency`` to model the cost of a tmux
+    subprocess. Submitted prompts are scanned for benchmark markers and the
+    time Enter was pressed is recorded per message.
+    """
+
+    def __init__(self, call_latency: float = 0.002) -> None:
+        self.call_latency = call_latency
+        self.prompts: dict[str, str] = {}
+        self.delivered: dict[int, float] = {}
+        self.submissions = 0
+        self.calls = 0
+
+    async def _call(self) -> None:
+        self.calls += 1
+        if self.call_latency:
+            await asyncio.sleep(self.call_latency)
+
+    def _screen(self, target: str) -> str:
+        return f"╭────╮\n│ > {self.prompts.get(target, '')} │\n╰────╯"
+
+    async def capture_pane(self, target: str, lines: int = 50) -> str:
+        await self._call()
+        return self._screen(target)
+
+    async def capture_pane_with_cursor(self, target: str) -> tuple[str, tuple[int, int]]:
+        await self._call()
+        prompt = self.prompts.get(target, "")
+        return self._screen(target), (4 + len(prompt), 1)
+
+    async def send_text(self, target: str, text: str) -> bool:
+        await self._call()
+        self.prompts[target] = self.prompts.get(target, "") + text
+        return True
+
+    async def press_ctrl_u(self, target: str) -> bool:
+        await self._call()
+        self.prompts[target] = ""
+        return True
+
+    async def press_enter(self, target: str) -> bool:
+        await self._call()
+        now = time.perf_counter()
+        text = self.prompts.pop(target, "")
+        self.submissions += 1
+        for message_id in MARKER.findall(text):
+            self.delivered.setdefault(int(message_id), now)
+        return True
+
+
+class MessagingDaemonBenchmark:
+    """Benchmark runner for the messaging daemon."""
+
+    def __init__(self, results_dir: str = "tests/benchmarks/results"):
+        """Initialize benchmark runner.
+
+        Args:
+            results_dir: Directory to store benchmark results
+        """
+        self.results_dir = Path(results_dir)
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+
+        # Configuration
+        self.clients = 8
+        self.targets = 16
+        self.messages_per_client = 250
+        self.message_sizes = [100, 2000]
+        self.tmux_latency = 0.002
+        self.coalesce = True
+        self.drain_timeout = 120.0
+
+    def config(self) -> dict[str, Any]:
+        """Benchmark parameters, stored with the results."""
+        return {
+            "clients": self.clients,
+            "targets": self.targets,
+            "messages_per_client": self.messages_per_client,
+            "message_sizes": self.message_sizes,
+            "tmux_latency_ms": self.tmux_latency * 1000,
+            "coalesce": self.coalesce,
+        }
+
+    def run_benchmark(self, message_size: int) -> dict[str, Any]:
+        """Run one load scenario in a fresh daemon.
+
+        Args:
+            message_size: Approximate message size in bytes
+
+        Returns:
+            Benchmark results
+        """
+        base_dir = tempfile.mkdtemp(prefix="msgb", dir="/tmp")  # Unix socket paths are short
+        previous_home = os.environ.get("HOME")
+        os.environ["HOME"] = base_dir
+        try:
+            return asyncio.run(self._run(base_dir, message_size))
+        finally:
+            if previous_home is not None:
+                os.environ["HOME"] = previous_home
+            shutil.rmtree(base_dir, ignore_errors=True)
+
+    async def _run(self, base_dir: str, message_size: int) -> dict[str, Any]:
+        tmux = SimulatedTmux(self.tmux_latency)
+        with patch("tmux_orchestrator.core.messaging_daemon.AsyncTmuxOperations", return_value=tmux):
+            daemon = HighPerformanceMessagingDaemon(
+                socket_path=f"{base_dir}/msgd.sock",
+                target_rate_limit=UNLIMITED,
+                sender_rate_limit=UNLIMITED,
+                max_queue_depth=10**9,
+                max_target_queue_depth=10**9,
+            )
+        if not self.coalesce:
+            daemon._coalesce_window = 0
+        daemon.running = True
+        server = await daemon.start_server()
+
+        process = psutil.Process()
+        published: dict[int, float] = {}
+        ack_sketch = QuantileSketch()
+        statuses: dict[str, int] = {}
+        padding = "x" * max(0, message_size - 40)
+
+        async def client_loop(client_id: int) -> None:
+            async with DaemonClient(daemon.socket_path) as client:
+                for n in range(self.messages_per_client):
+                    message_id = client_id * self.messages_per_client + n
+                    target = f"bench:{message_id % self.targets}"
+                    start = time.perf_counter()
+                    published[message_id] = start
+                    response = await client.send_command(
+                        {
+                            "command": "publish",
+                            "target": target,
+                            "message": f"[bench:{message_id}] {padding}",
+                            "sender": f"client-{client_id}",
+                        }
+                    )
+                    ack_sketch.add(time.perf_counter() - start)
+                    status = response.get("status", "error")
+                    statuses[status] = statuses.get(status, 0) + 1
+                    if status != "queued":
+                        published.pop(message_id, None)
+
+        cpu_before = process.cpu_times()
+        start = time.perf_counter()
+        try:
+            async with server:
+                await asyncio.gather(*(client_loop(i) for i in range(self.clients)))
+                publish_elapsed = time.perf_counter() - start
+
+                deadline = time.perf_counter() + self.drain_timeout
+                while len(tmux.delivered) < len(published) and time.perf_counter() < deadline:
+                    await asyncio.sleep(0.01)
+                elapsed = time.perf_counter() - start
+                stats = await daemon._handle_stats({})
+        finally:
+            daemon.stop()
+        cpu_after = process.cpu_times()
+
+        delivery_sketch = QuantileSketch()
+        for message_id, published_at in published.items():
+            if message_id in tmux.delivered:
+                delivery_sketch.add(tmux.delivered[message_id] - published_at)
+
+        total = self.clients * self.messages_per_client
+        delivered = delivery_sketch.count
+        cpu_seconds = (cpu_after.user - cpu_before.user) + (cpu_after.system - cpu_before.system)
+        return {
+            "message_size": message_size,
+            "messages": total,
+            "accepted": len(published),
+            "delivered": delivered,
+            "statuses": statuses,
+            "submissions": tmux.submissions,
+            "tmux_calls": tmux.calls,
+            "elapsed_s": elapsed,
+            "publish_throughput": total / publish_elapsed if publish_elapsed else 0.0,
+            "delivery_throughput": delivered / elapsed if elapsed else 0.0,
+            "ack_ms": {key: value * 1000 for key, value in ack_sketch.percentiles((0.5, 0.99)).items()},
+            "delivery_ms": {key: value * 1000 for key, value in delivery_sketch.percentiles((0.5, 0.99)).items()},
+            "cpu_seconds": cpu_seconds,
+            "cpu_percent": 100 * cpu_seconds / elapsed if elapsed else 0.0,
+            "rss_mb": process.memory_info().rss / (1024 * 1024),
+            "coalescing": stats["coalescing"],
+        }
+
+    def run_all_benchmarks(self) -> list[dict[str, Any]]:
+        """Run the scenario for every configured message size.
+
+        Returns:
+            List of benchmark results
+        """
+        results = []
+
+        print("Running messaging daemon benchmarks...")
+        print(
+            f"{self.clients} clients x {self.messages_per_client} messages -> {self.targets} targets, "
+            f"tmux latency {self.tmux_latency * 1000:.1f}ms"
+        )
+        print("-" * 60)
+
+        for size in self.message_sizes:
+            print(f"Message size {size}B...", end="", flush=True)
+            result = self.run_benchmark(size)
+            results.append(result)
+            print(
+                f" {result['delivery_throughput']:.0f} msg/s, "
+                f"ack p99 {result['ack_ms']['p99']:.2f}ms, delivery p99 {result['delivery_ms']['p99']:.1f}ms"
+            )
+
+        print("-" * 60)
+        return results
+
+    def save_results(self, results: list[dict[str, Any]], commit_sha: Optional[str] = None) -> str:
+        """Save benchmark results to file.
+
+        Args:
+            results: Benchmark results
+            commit_sha: Git commit SHA for tracking
+
+        Returns:
+            Path to results file
+        """
+        if not commit_sha:
+            try:
+                import subprocess
+
+                commit_sha = subprocess.check_output(["git", "rev-parse", "HEAD"], text=True).strip()[:8]
+            except Exception:
+                commit_sha = "unknown"
+
+        document = {
+            "timestamp": datetime.now().isoformat(),
+            "commit": commit_sha,
+            "config": self.config(),
+            "results": results,
+        }
+
+        filepath = self.results_dir / f"messaging_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        with open(filepath, "w") as f:
+            json.dump(document, f, indent=2)
+
+        with open(self.results_dir / "messaging_latest.json", "w") as f:
+            json.dump(document, f, indent=2)
+
+        return str(filepath)
+
+    def compare_with_baseline(
+        self, results: list[dict[str, Any]], baseline_file: Optional[str] = None, tolerance_pct: float = 10.0
+    ) -> dict[str, Any]:
+        """Compare results with baseline.
+
+        Throughput more than ``tolerance_pct`` lower, or p99 latency more than
+        ``tolerance_pct`` higher, counts as a regression.
+
+        Args:
+            results: Current benchmark results
+            baseline_file: Path to baseline results file
+            tolerance_pct: Allowed change before flagging
+
+        Returns:
+            Comparison results
+        """
+        baseline_path = Path(baseline_file) if baseline_file else self.results_dir / "messaging_baseline.json"
+        if not baseline_path.exists():
+            print(f"No baseline found at {baseline_path}")
+            return {"status": "no_baseline"}
+
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+
+        comparison: dict[str, Any] = {
+            "status": "compared",
+            "baseline_commit": baseline.get("commit", "unknown"),
+            "baseline_date": baseline.get("timestamp", "unknown"),
+            "regressions": [],
+            "improvements": [],
+        }
+
+        # (metric, higher is better)
+        metrics = [
+            ("delivery_throughput", True),
+            ("publish_throughput", True),
+            ("ack_ms.p99", False),
+            ("delivery_ms.p99", False),
+        ]
+
+        for current in results:
+            previous = next(
+                (r for r in baseline.get("results", []) if r["message_size"] == current["message_size"]), None
+            )
+            if not previous:
+                continue
+
+            for metric, higher_is_better in metrics:
+                old, new = _lookup(previous, metric), _lookup(current, metric)
+                if not old:
+                    continue
+                diff_pct = (new - old) / old * 100
+                worse = -diff_pct if higher_is_better else diff_pct
+                entry = {
+                    "message_size": current["message_size"],
+                    "metric": metric,
+                    "baseline": old,
+                    "current": new,
+                    "diff_pct": diff_pct,
+                }
+                if worse > tolerance_pct:
+                    comparison["regressions"].append(entry)
+                elif worse < -tolerance_pct:
+                    comparison["improvements"].append(entry)
+
+        return comparison
+
+    def update_baseline(self, results_file: str) -> None:
+        """Update baseline with specified results.
+
+        Args:
+            results_file: Path to results file to use as baseline
+        """
+        with open(results_file) as f:
+            results = json.load(f)
+
+        with open(self.results_dir / "messaging_baseline.json", "w") as f:
+            json.dump(results, f, indent=2)
+
+        print(f"Baseline updated from {results_file}")
+
+    def generate_report(self, results: list[dict[str, Any]], comparison: Optional[dict[str, Any]] = None) -> str:
+        """Generate performance report.
+
+        Args:
+            results: Benchmark results
+            comparison: Comparison with baseline
+
+        Returns:
+            Report text
+        """
+        report = ["# Messaging Daemon Benchmark Report", ""]
+        report.append(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        report.append(
+            f"Load: {self.clients} clients x {self.messages_per_client} messages, {self.targets} targets, "
+            f"coalescing {'on' if self.coalesce else 'off'}"
+        )
+        report.append("")
+
+        report.append("## Results")
+        columns = [
+            "Size",
+            "Delivered",
+            "Msg/s",
+            "Ack p50",
+            "Ack p99",
+            "Deliv p50",
+            "Deliv p99",
+            "Submits",
+            "CPU %",
+            "RSS MB",
+        ]
+        report.append("| " + " | ".join(columns) + " |")
+        report.append("|" + "|".join("-" * (len(column) + 2) for column in columns) + "|")
+
+        for r in results:
+            report.append(
+                f"| {r['message_size']:4d} | "
+                f"{r['delivered']:5d}/{r['messages']:<5d} | "
+                f"{r['delivery_throughput']:5.0f} | "
+                f"{r['ack_ms']['p50']:7.2f} | "
+                f"{r['ack_ms']['p99']:7.2f} | "
+                f"{r['delivery_ms']['p50']:9.1f} | "
+                f"{r['delivery_ms']['p99']:9.1f} | "
+                f"{r['submissions']:7d} | "
+                f"{r['cpu_percent']:5.1f} | "
+                f"{r['rss_mb']:6.1f} |"
+            )
+
+        if comparison and comparison["status"] == "compared":
+            report.append("")
+            report.append("## Baseline Comparison")
+            report.append(f"Baseline: {comparison['baseline_commit']} ({comparison['baseline_date']})")
+
+            for title, entries in (
+                ("### ❌ Performance Regressions", comparison["regressions"]),
+                ("### ✅ Performance Improvements", comparison["improvements"]),
+            ):
+                if entries:
+                    report.append("")
+                    report.append(title)
+                    for entry in entries:
+                        report.append(
+                            f"- {entry['message_size']}B {entry['metric']}: "
+                            f"{entry['baseline']:.2f} → {entry['current']:.2f} ({entry['diff_pct']:+.1f}%)"
+                        )
+
+            if not comparison["regressions"] and not comparison["improvements"]:
+                report.append("")
+                report.append("✅ Performance is stable compared to baseline")
+
+        return "\n".join(report)
+
+
+def _lookup(result: dict[str, Any], metric: str) -> float:
+    """Read a dotted metric path such as "delivery_ms.p99"."""
+    value: Any = result
+    for key in metric.split("."):
+        value = value.get(key, 0) if isinstance(value, dict) else 0
+    return float(value or 0)
+
+
+def main():
+    """Main entry point for CLI usage."""
+    parser = argparse.ArgumentParser(description="Run messaging daemon load benchmarks")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent client connections")
+    parser.add_argument("--targets", type=int, default=16, help="Distinct target panes")
+    parser.add_argument("--messages", type=int, default=250, help="Messages published per client")
+    parser.add_argument("--message-size", type=int, nargs="+", default=[100, 2000], help="Message sizes in bytes")
+    parser.add_argument("--tmux-latency-ms", type=float, default=2.0, help="Simulated cost of each tmux call")
+    parser.add_argument("--no-coalesce", action="store_true", help="Deliver every message separately")
+    parser.add_argument("--update-baseline", action="store_true", help="Update baseline with current results")
+    parser.add_argument("--baseline", type=str, help="Path to baseline file for comparison")
+    parser.add_argument("--output", type=str, help="Output directory for results")
+    parser.add_argument("--commit", type=str, help="Git commit SHA for tracking")
+
+    args = parser.parse_args()
+
+    # Slow deliveries are summarized in the report instead of logged one by one
+    logging.getLogger("tmux_orchestrator.core.messaging_daemon").setLevel(logging.ERROR)
+
+    benchmark = MessagingDaemonBenchmark(args.output or "tests/benchmarks/results")
+    benchmark.clients = args.clients
+    benchmark.targets = args.targets
+    benchmark.messages_per_client = args.messages
+    benchmark.message_sizes = args.message_size
+    benchmark.tmux_latency = args.tmux_latency_ms / 1000
+    benchmark.coalesce = not args.no_coalesce
+
+    results = benchmark.run_all_benchmarks()
+
+    results_file = benchmark.save_results(results, args.commit)
+    print(f"\nResults saved to: {results_file}")
+
+    comparison = benchmark.compare_with_baseline(results, args.baseline)
+
+    print("\n" + benchmark.generate_report(results, comparison))
+
+    if args.update_baseline:
+        benchmark.update_baseline(results_file)
+
+    if comparison.get("regressions"):
+        print("\n⚠️ Performance regressions detected!")
+        sys.exit(1)
+    else:
+        print("\n✅ All performance checks passed!")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -28,11 +28,15 @@ class MockFastMCP:
         pass
 
 
-# Mock the fastmcp module
-mock_fastmcp = MagicMock()
-mock_fastmcp.FastMCP = MockFastMCP
-sys.modules["fastmcp"] = mock_fastmcp
-sys.modules["fastmcp.server"] = MagicMock()
+# Mock the fastmcp module when it isn't installed; replacing a real install
+# breaks every later test in the session that imports the MCP server
+try:
+    import fastmcp  # noqa: F401
+except ImportError:
+    mock_fastmcp = MagicMock()
+    mock_fastmcp.FastMCP = MockFastMCP
+    sys.modules["fastmcp"] = mock_fastmcp
+    sys.modules["fastmcp.server"] = MagicMock()
 
 # Now we can import the MCP server without actual dependencies
 
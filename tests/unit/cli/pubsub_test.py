@@ -0,0 +1,69 @@
+"""Tests for pubsub CLI commands backed by the message store."""
+
+import json
+from datetime import datetime
+
+import pytest
+from click.testing import CliRunner
+
+from tmux_orchestrator.cli.pubsub import pubsub
+from tmux_orchestrator.core.messaging.message_store import MessageStore, default_store_path
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Create Click test runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Seed a message store under a temporary home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    store = MessageStore(default_store_path())
+    now = datetime.now().isoformat()
+    store.add_batch(
+        {
+            "seq": i,
+            "id": f"m{i}",
+            "target": "proj:0",
+            "content": f"update {i}",
+            "priority": priority,
+            "tags": ["status"],
+            "sender": "daemon",
+            "timestamp": now,
+        }
+        for i, priority in enumerate(["normal", "critical", "low", "critical"], start=1)
+    )
+    yield store
+    store.close()
+
+
+def test_query_summary_reports_real_counts(runner, store) -> None:
+    """Test the summary format counts stored messages."""
+    result = runner.invoke(pubsub, ["query", "--session", "proj", "--format", "summary"])
+
+    assert result.exit_code == 0
+    assert "Total messages: 4" in result.output
+    assert "Critical: 2" in result.output
+    assert "status (4)" in result.output
+
+
+def test_query_json_paginates(runner, store) -> None:
+    """Test JSON output returns a cursor for the next page."""
+    first = runner.invoke(pubsub, ["query", "--session", "proj", "--format", "json", "--limit", "3"])
+    page = json.loads(first.output)
+    assert [m["seq"] for m in page["messages"]] == [4, 3, 2]
+
+    second = runner.invoke(
+        pubsub, ["query", "--session", "proj", "--format", "json", "--before", str(page["next_cursor"])]
+    )
+    assert [m["seq"] for m in json.loads(second.output)["messages"]] == [1]
+
+
+def test_filtered_read_uses_store(runner, store) -> None:
+    """Test read with filters queries the store instead of capturing the pane."""
+    result = runner.invoke(pubsub, ["read", "--target", "proj:0", "--filter-priority", "critical", "--json"])
+
+    assert result.exit_code == 0
+    assert [m["seq"] for m in json.loads(result.output)["messages"]] == [4, 2]
@@ -0,0 +1,132 @@
+"""Tests for the shared in-process daemon publisher."""
+
+import asyncio
+import json
+import shutil
+import tempfile
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tmux_orchestrator.core.messaging.daemon_publisher import DaemonPublisher
+from tmux_orchestrator.core.messaging_daemon import HighPerformanceMessagingDaemon
+from tmux_orchestrator.core.monitoring.daemon_pubsub_integration import DaemonPubsubIntegration, MessagePriority
+from tmux_orchestrator.core.monitoring.monitor_pubsub_integration import MonitorPubsubIntegration
+from tmux_orchestrator.utils.tmux.async_operations import AsyncTmuxOperations
+
+
+@pytest.fixture
+def daemon(monkeypatch):
+    """Provide a daemon with tmux mocked, delivery stubbed and storage in a temp dir."""
+    # Short path: Unix socket paths are limited to ~100 characters
+    base_dir = tempfile.mkdtemp(prefix="msgp", dir="/tmp")
+    monkeypatch.setenv("HOME", base_dir)
+    with patch(
+        "tmux_orchestrator.core.messaging_daemon.AsyncTmuxOperations", return_value=Mock(spec=AsyncTmuxOperations)
+    ):
+        daemon = HighPerformanceMessagingDaemon(socket_path=f"{base_dir}/msgd.sock")
+    daemon.running = True
+    daemon._coalesce_window = 0  # record each message's delivery separately
+    daemon.delivered = []
+
+    async def record_delivery(message):
+        daemon.delivered.append(message.content)
+        return True
+
+    with patch.object(daemon, "_deliver_message_fast", side_effect=record_delivery):
+        yield daemon
+    daemon.stop()
+    shutil.rmtree(base_dir, ignore_errors=True)
+
+
+async def _wait_for_delivery(daemon, count: int) -> None:
+    while len(daemon.delivered) < count:
+        await asyncio.sleep(0.01)
+
+
+class TestDaemonPublisher:
+    """Test publishing over the shared connection and spilling while the daemon is down."""
+
+    @pytest.mark.asyncio
+    async def test_publishes_share_one_connection(self, daemon):
+        """Test many publishes reuse a single daemon connection."""
+        connections = 0
+        handle_client = daemon._handle_client
+
+        async def counting_handler(reader, writer):
+            nonlocal connections
+            connections += 1
+            await handle_client(reader, writer)
+
+        daemon._handle_client = counting_handler
+        publisher = DaemonPublisher(daemon.socket_path)
+        server = await daemon.start_server()
+
+        async with server:
+            results = await asyncio.gather(*(publisher.publish_async(f"dev:{i}", f"msg {i}") for i in range(10)))
+            await asyncio.to_thread(publisher.close)
+
+        assert all(results)
+        assert connections == 1
+        assert daemon._message_count == 10
+
+    @pytest.mark.asyncio
+    async def test_spilled_messages_sent_in_order_when_daemon_returns(self, daemon):
+        """Test messages published while the daemon is down are re-sent once it is up."""
+        publisher = DaemonPublisher(daemon.socket_path, retry_delay=0.05)
+
+        assert await publisher.publish_async("pm:0", "first") is False
+        assert await publisher.publish_async("pm:0", "second") is False
+        assert publisher.spilled_count == 2
+
+        server = await daemon.start_server()
+        async with server:
+            await asyncio.wait_for(_wait_for_delivery(daemon, 2), 5)
+            assert await publisher.publish_async("pm:0", "third") is True
+            await asyncio.wait_for(_wait_for_delivery(daemon, 3), 5)
+            await asyncio.to_thread(publisher.close)
+
+        assert publisher.spilled_count == 0
+        assert daemon.delivered == ["first", "second", "third"]
+
+    def test_spill_is_bounded(self):
+        """Test the oldest spilled messages are dropped beyond spill_max."""
+        publisher = DaemonPublisher("/tmp/msgp-missing.sock", spill_max=2, retry_delay=60)
+        try:
+            for i in range(3):
+                assert publisher.publish("pm:0", f"msg {i}") is False
+            assert publisher.get_stats() == {"spilled": 2, "dropped": 1}
+        finally:
+            publisher.close()
+
+
+class TestIntegrationsUsePublisher:
+    """Test the monitor integrations publish in-process instead of spawning the CLI."""
+
+    def test_monitor_integration_publishes_structured_message(self):
+        """Test a crash notification is published through the publisher."""
+        publisher = Mock(spec=DaemonPublisher)
+        publisher.publish.return_value = True
+        integration = MonitorPubsubIntegration(session="monitor", publisher=publisher)
+
+        with patch("subprocess.run") as mock_run:
+            assert integration.publish_agent_crash("dev:2", "timeout", "proj")
+
+        mock_run.assert_not_called()
+        target, message, priority, tags = publisher.publish.call_args.args
+        assert (target, priority) == ("proj:0", "critical")
+        assert json.loads(message)["message"]["category"] == "health"
+        assert "crash" in tags
+
+    @pytest.mark.asyncio
+    async def test_daemon_integration_publishes_async(self):
+        """Test health alerts are awaited through the async publisher."""
+        publisher = Mock(spec=DaemonPublisher)
+        publisher.publish_async.return_value = True
+        integration = DaemonPubsubIntegration(publisher=publisher)
+
+        assert await integration.send_health_alert("dev:2", "idle", {}, MessagePriority.HIGH)
+
+        target, message, priority, _ = publisher.publish_async.call_args.args
+        assert (target, priority) == ("dev:1", "high")
+        assert json.loads(message)["source"]["type"] == "daemon"
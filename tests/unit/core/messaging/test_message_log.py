@@ -0,0 +1,142 @@
+"""Tests for the append-only segmented message log."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from tmux_orchestrator.core.messaging.message_log import MessageLog
+
+
+def _record(target: str, content: str) -> dict:
+    return {"target": target, "content": content, "priority": "normal"}
+
+
+class TestMessageLog:
+    """Test appends, per-target reads, rollover and retention."""
+
+    def test_append_and_read_by_target(self, tmp_path):
+        """Test records are indexed per target and read back in order."""
+        log = MessageLog(tmp_path)
+        sequences = log.append_batch([_record("dev:1", "a"), _record("dev:2", "b"), _record("dev:1", "c")])
+
+        assert sequences == [1, 2, 3]
+        assert [m["content"] for m in log.read_target("dev:1")] == ["a", "c"]
+        assert [m["content"] for m in log.read_target("dev:1", limit=1)] == ["c"]
+        assert [m["seq"] for m in log.read_target("dev:1", since_seq=1)] == [3]
+        assert log.read_target("nope") == []
+
+    def test_reopen_rebuilds_index_and_starts_new_segment(self, tmp_path):
+        """Test a reopened log keeps history and continues the sequence."""
+        log = MessageLog(tmp_path)
+        log.append_batch([_record("dev:1", "a")])
+        log.close()
+
+        reopened = MessageLog(tmp_path)
+        assert reopened.last_sequence == 1
+        reopened.append_batch([_record("dev:1", "b")])
+
+        assert [m["content"] for m in reopened.read_target("dev:1")] == ["a", "b"]
+        assert len(list(tmp_path.glob("*.jsonl"))) == 2
+
+    def test_missing_index_rebuilt_from_segment(self, tmp_path):
+        """Test a segment without an index file is scanned on open."""
+        log = MessageLog(tmp_path)
+        log.append_batch([_record("dev:1", "a"), _record("dev:2", "b")])
+        log.close()
+        for index_file in tmp_path.glob("*.idx"):
+            index_file.unlink()
+
+        assert [m["content"] for m in MessageLog(tmp_path).read_target("dev:2")] == ["b"]
+
+    def test_rollover_and_retention_drop_whole_segments(self, tmp_path):
+        """Test segments roll over by size and the oldest are deleted."""
+        log = MessageLog(tmp_path, segment_max_bytes=200, max_segments=2)
+        for i in range(20):
+            log.append_batch([_record("dev:1", f"message number {i:02d}")])
+
+        assert len(list(tmp_path.glob("*.jsonl"))) == 2
+        retained = log.read_target("dev:1", limit=0)
+        assert retained[-1]["content"] == "message number 19"
+        assert retained[0]["seq"] > 1
+        assert [m["seq"] for m in retained] == list(range(retained[0]["seq"], 21))
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submits_never_lose_writes(self, tmp_path):
+        """Test many concurrent submits to one target are all persisted in order."""
+        log = MessageLog(tmp_path)
+
+        async def producer(start: int):
+            for i in range(start, start + 50):
+                log.submit(_record("pm:0", str(i)))
+                await asyncio.sleep(0)
+
+        await asyncio.gather(producer(0), producer(1000))
+        while log.last_sequence < 100:
+            await asyncio.sleep(0.01)
+        log.close()
+
+        contents = [m["content"] for m in MessageLog(tmp_path).read_target("pm:0", limit=0)]
+        assert len(contents) == 100
+        assert [c for c in contents if int(c) < 1000] == [str(i) for i in range(50)]
+
+
+class TestMessageLogConsistency:
+    """Test readers never see unsynced or torn records."""
+
+    def test_index_published_only_after_fsync(self, tmp_path):
+        """Test records are not readable until their segment has been synced."""
+        log = MessageLog(tmp_path)
+        seen_before_sync = []
+
+        def fsync(fd):
+            seen_before_sync.append(log.read_target("dev:1"))
+            seen_before_sync.append(log.targets())
+            seen_before_sync.append([p.read_text() for p in tmp_path.glob("*.idx")])
+
+        with patch("tmux_orchestrator.core.messaging.message_log.os.fsync", side_effect=fsync):
+            log.append_batch([_record("dev:1", "a")])
+
+        assert seen_before_sync == [[], [], [""]]
+        assert [m["content"] for m in log.read_target("dev:1")] == ["a"]
+
+    def test_torn_trailing_record_is_skipped(self, tmp_path, caplog):
+        """Test an incomplete last line stops the read instead of failing to parse."""
+        log = MessageLog(tmp_path)
+        log.append_batch([_record("dev:1", "a"), _record("dev:1", "b")])
+        log.close()
+        segment = next(tmp_path.glob("*.jsonl"))
+        segment.write_bytes(segment.read_bytes()[:-10])
+
+        assert [m["content"] for m in MessageLog(tmp_path).read_target("dev:1")] == ["a"]
+        assert "Error reading message log" not in caplog.text
+
+    def test_torn_trailing_index_line_is_not_loaded(self, tmp_path):
+        """Test a partially written index line is ignored until it is complete."""
+        log = MessageLog(tmp_path)
+        log.append_batch([_record("dev:1", "a")])
+        log.close()
+        index = next(tmp_path.glob("*.idx"))
+        complete = index.read_text()
+        index.write_text(complete + "2 9")
+
+        reader = MessageLog(tmp_path)
+        assert reader.last_sequence == 1
+        assert reader.targets() == ["dev:1"]
+
+    def test_refresh_picks_up_appends_from_writer(self, tmp_path):
+        """Test a long-lived reader sees new records, rollovers and retention."""
+        writer = MessageLog(tmp_path, segment_max_bytes=200, max_segments=2)
+        writer.append_batch([_record("dev:1", "first")])
+        reader = MessageLog(tmp_path)
+        assert [m["content"] for m in reader.read_target("dev:1")] == ["first"]
+
+        for i in range(20):
+            writer.append_batch([_record("dev:1", f"message number {i:02d}")])
+        reader.refresh()
+
+        assert reader.read_target("dev:1", limit=0) == writer.read_target("dev:1", limit=0)
+        assert reader.last_sequence == writer.last_sequence
+
+        reader.refresh()
+        assert reader.read_target("dev:1", limit=0) == writer.read_target("dev:1", limit=0)
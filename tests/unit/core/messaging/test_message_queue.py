@@ -0,0 +1,89 @@
+"""Tests for the fair, deduplicating message queue."""
+
+from unittest.mock import patch
+
+from tmux_orchestrator.core.messaging.message_queue import MessageQueue
+
+
+def _drain(queue: MessageQueue) -> list[str]:
+    return [msg.content for msg in queue.batch_dequeue(max_count=1000, timeout=0)]
+
+
+class TestMessageQueue:
+    """Test deduplication window, fair queuing and indexed removal."""
+
+    def test_duplicates_suppressed_only_within_window(self):
+        """Test a repeated message is accepted again once the window passes."""
+        queue = MessageQueue(dedupe_window=10)
+        with patch("tmux_orchestrator.core.messaging.message_queue.time.monotonic", return_value=100.0):
+            assert queue.enqueue("status", "monitor")
+            assert not queue.enqueue("status", "monitor")
+            assert queue.enqueue("status", "pm")
+        with patch("tmux_orchestrator.core.messaging.message_queue.time.monotonic", return_value=111.0):
+            assert queue.enqueue("status", "monitor")
+
+        stats = queue.get_stats()
+        assert stats["duplicates"] == 1
+        assert stats["dedupe_cache_size"] == 1
+
+    def test_dedupe_cache_evicts_oldest(self):
+        """Test the cache stays bounded and evicts in insertion order."""
+        queue = MessageQueue(max_size=10, dedupe_max_entries=3)
+        for i in range(4):
+            queue.enqueue(f"msg {i}", "monitor")
+        _drain(queue)
+
+        assert queue.enqueue("msg 0", "monitor")
+        assert not queue.enqueue("msg 3", "monitor")
+
+    def test_chatty_sender_does_not_starve_others(self):
+        """Test senders interleave within a priority level, and priority still wins."""
+        queue = MessageQueue()
+        for i in range(5):
+            queue.enqueue(f"monitor {i}", "monitor")
+        queue.enqueue("pm 0", "pm")
+        queue.enqueue("pm 1", "pm")
+        queue.enqueue("urgent", "monitor", priority=1)
+
+        order = _drain(queue)
+
+        assert order[0] == "urgent"
+        assert order.index("pm 0") <= 2
+        assert order.index("pm 1") <= 4
+        assert [m for m in order if m.startswith("monitor")] == [f"monitor {i}" for i in range(5)]
+
+    def test_sender_weights(self):
+        """Test a heavier sender gets a proportionally larger share."""
+        queue = MessageQueue(sender_weights={"pm": 2.0})
+        for i in range(4):
+            queue.enqueue(f"m{i}", "monitor")
+            queue.enqueue(f"p{i}", "pm")
+
+        assert _drain(queue)[:6] == ["p0", "m0", "p1", "p2", "m1", "p3"]
+
+    def test_remove_by_sender_uses_index(self):
+        """Test removal by sender leaves other messages in order."""
+        queue = MessageQueue()
+        for i in range(3):
+            queue.enqueue(f"monitor {i}", "monitor")
+            queue.enqueue(f"pm {i}", "pm")
+
+        assert [m.content for m in queue.get_messages_by_sender("pm")] == ["pm 0", "pm 1", "pm 2"]
+        assert queue.remove_by_sender("monitor") == 3
+        assert queue.size() == 3
+        assert queue.peek().content == "pm 0"
+        assert queue.get_stats()["sender_distribution"] == {"pm": 3}
+        assert _drain(queue) == ["pm 0", "pm 1", "pm 2"]
+
+    def test_expire_and_requeue(self):
+        """Test old messages expire and requeued messages bypass deduplication."""
+        queue = MessageQueue()
+        with patch("tmux_orchestrator.core.messaging.message_queue.time.time", return_value=1000.0):
+            queue.enqueue("old", "monitor")
+        queue.enqueue("new", "monitor")
+
+        assert queue.expire_old_messages(max_age=60) == 1
+        message = queue.dequeue(timeout=0)
+        assert message.content == "new"
+        assert queue.requeue_message(message, new_priority=1)
+        assert queue.dequeue(timeout=0).priority == 1
@@ -0,0 +1,156 @@
+"""Tests for the indexed SQLite message store."""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+from tmux_orchestrator.core.messaging.message_log import MessageLog
+from tmux_orchestrator.core.messaging.message_store import MessageStore
+
+
+def _structured(msg_id: str, category: str, priority: str, subject: str, requires_ack: bool = False) -> str:
+    return json.dumps(
+        {
+            "id": msg_id,
+            "timestamp": datetime.now().isoformat(),
+            "source": {"type": "monitoring-daemon", "identifier": "monitor"},
+            "message": {
+                "type": "notification",
+                "category": category,
+                "priority": priority,
+                "content": {"subject": subject, "body": f"details about {subject}", "context": {}},
+            },
+            "metadata": {"requires_ack": requires_ack, "tags": ["monitoring", category]},
+        }
+    )
+
+
+def _record(seq: int, target: str, content: str, priority: str = "normal", **extra) -> dict:
+    return {
+        "seq": seq,
+        "id": f"{seq}.0",
+        "target": target,
+        "content": content,
+        "priority": priority,
+        "tags": [],
+        "sender": "daemon",
+        "timestamp": datetime.now().isoformat(),
+        **extra,
+    }
+
+
+class TestMessageStore:
+    """Test indexing, filtering, pagination and acknowledgement."""
+
+    def setup_method(self):
+        """Set up a store seeded with plain and structured messages."""
+        self.records = [
+            _record(1, "proj:0", _structured("crash-1", "health", "critical", "Agent crash dev:2", True)),
+            _record(2, "proj:0", _structured("idle-1", "health", "low", "Agent idle dev:3")),
+            _record(3, "proj:0", _structured("recover-1", "recovery", "high", "Restart backend", True)),
+            _record(4, "proj:2", "plain status update", tags=["status"], sender="pm"),
+            _record(5, "other:0", "unrelated message"),
+        ]
+
+    def test_filters_use_structured_fields(self, tmp_path):
+        """Test structured content is unpacked into filterable columns."""
+        store = MessageStore(tmp_path / "index.db")
+        assert store.add_batch(self.records) == 5
+
+        assert [m["seq"] for m in store.query(session="proj")] == [4, 3, 2, 1]
+        assert [m["seq"] for m in store.query(categories=["health"])] == [2, 1]
+        assert [m["seq"] for m in store.query(priorities=["critical", "high"])] == [3, 1]
+        assert [m["seq"] for m in store.query(source="pm")] == [4]
+        assert [m["seq"] for m in store.query(categories=["status"])] == [4]
+        assert [m["seq"] for m in store.query(tags=["monitoring"], target="proj:0")] == [3, 2, 1]
+        assert [m["seq"] for m in store.query(text="crash")] == [1]
+        assert store.query(since=datetime.now() + timedelta(minutes=1)) == []
+
+        crash = store.query(priorities=["critical"])[0]
+        assert crash["subject"] == "Agent crash dev:2"
+        assert crash["requires_ack"] is True
+
+    def test_keyset_pagination(self, tmp_path):
+        """Test before_seq pages through results without overlap."""
+        store = MessageStore(tmp_path / "index.db")
+        store.add_batch(self.records)
+
+        first = store.query(limit=2)
+        second = store.query(limit=2, before_seq=first[-1]["seq"])
+        third = store.query(limit=2, before_seq=second[-1]["seq"])
+
+        assert [m["seq"] for m in first + second + third] == [5, 4, 3, 2, 1]
+
+    def test_acknowledge_and_summary(self, tmp_path):
+        """Test acknowledging by structured id updates unacked filters and counts."""
+        store = MessageStore(tmp_path / "index.db")
+        store.add_batch(self.records)
+
+        assert [m["seq"] for m in store.query(unacked_only=True)] == [3, 1]
+        assert store.acknowledge("crash-1")
+        assert not store.acknowledge("crash-1")
+        assert [m["seq"] for m in store.query(unacked_only=True)] == [3]
+
+        summary = store.summarize(session="proj")
+        assert summary["total"] == 4
+        assert summary["by_priority"] == {"critical": 1, "high": 1, "normal": 1, "low": 1}
+        assert summary["by_category"] == {"health": 2, "recovery": 1, "status": 1}
+        assert summary["unacknowledged"] == 1
+
+    def test_text_search_treats_punctuation_literally(self, tmp_path):
+        """Test quotes, hyphens and colons in search text are not parsed as FTS5 syntax."""
+        store = MessageStore(tmp_path / "index.db")
+        store.add_batch(
+            [
+                *self.records,
+                _record(6, "proj:1", 'build failed: "pre-commit" hook on backend-api'),
+            ]
+        )
+
+        assert [m["seq"] for m in store.query(text="crash dev:2")] == [1]
+        assert [m["seq"] for m in store.query(text="backend-api")] == [6]
+        assert [m["seq"] for m in store.query(text='"pre-commit"')] == [6]
+        assert [m["seq"] for m in store.query(text='failed: "pre-commit')] == [6]
+        assert store.query(text="NOT AND OR") == []
+        assert len(store.query(text="   ")) == 6
+        assert store.summarize(text="dev:2 crash")["total"] == 1
+
+    def test_replayed_records_skipped_and_pruned(self, tmp_path):
+        """Test already indexed records are ignored and old rows pruned."""
+        store = MessageStore(tmp_path / "index.db", max_messages=3)
+        store.add_batch(self.records[:2])
+        store.add_batch(self.records)
+
+        assert store.last_sequence == 5
+        assert [m["seq"] for m in store.query()] == [5, 4, 3]
+        assert store.query(text="crash") == []
+
+    def test_fed_by_message_log(self, tmp_path):
+        """Test the log's append callback keeps the store in step, including backfill."""
+        store = MessageStore(tmp_path / "index.db")
+        log = MessageLog(tmp_path / "log", on_append=store.add_batch)
+        log.append_batch([{"target": "dev:1", "content": "hello", "priority": "high", "tags": []}])
+        log.close()
+
+        unindexed = MessageLog(tmp_path / "log")
+        unindexed.append_batch([{"target": "dev:1", "content": "missed", "priority": "low", "tags": []}])
+        unindexed.close()
+        store.add_batch(MessageLog(tmp_path / "log").read_since(store.last_sequence))
+
+        assert [m["body"] for m in store.query(target="dev:1")] == ["missed", "hello"]
+
+    def test_filtering_busy_day_is_fast(self, tmp_path):
+        """Test filtered queries over thousands of messages take milliseconds."""
+        store = MessageStore(tmp_path / "index.db")
+        priorities = ["low", "normal", "high", "critical"]
+        store.add_batch(
+            _record(i, f"proj:{i % 8}", f"message {i}", priority=priorities[i % 4], tags=["status"])
+            for i in range(1, 20_001)
+        )
+
+        start = time.perf_counter()
+        page = store.query(target="proj:3", priorities=["critical"], limit=50)
+        elapsed = time.perf_counter() - start
+
+        assert len(page) == 50
+        assert elapsed < 0.05
@@ -0,0 +1,448 @@
+"""Tests for the high-performance messaging daemon."""
+
+import asyncio
+import shutil
+import tempfile
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tmux_orchestrator.core.messaging_daemon import DaemonClient, HighPerformanceMessagingDaemon, Message
+from tmux_orchestrator.utils.rate_limiter import RateLimitConfig, RateLimiter
+from tmux_orchestrator.utils.tmux.async_operations import AsyncTmuxOperations
+
+
+@pytest.fixture
+def daemon(monkeypatch):
+    """Provide a running daemon with tmux mocked and storage in a temp dir."""
+    # Short path: Unix socket paths are limited to ~100 characters
+    base_dir = tempfile.mkdtemp(prefix="msgd", dir="/tmp")
+    monkeypatch.setenv("HOME", base_dir)
+    with patch(
+        "tmux_orchestrator.core.messaging_daemon.AsyncTmuxOperations", return_value=Mock(spec=AsyncTmuxOperations)
+    ):
+        daemon = HighPerformanceMessagingDaemon(socket_path=f"{base_dir}/msgd.sock")
+    daemon.running = True
+    yield daemon
+    daemon.stop()
+    shutil.rmtree(base_dir, ignore_errors=True)
+
+
+def _publish(daemon, target, content, priority="normal"):
+    return daemon._handle_publish({"target": target, "message": content, "priority": priority})
+
+
+class TestDeliveryWorkers:
+    """Test per-target delivery workers."""
+
+    @pytest.mark.asyncio
+    async def test_idle_daemon_has_no_workers(self, daemon):
+        """Test no delivery tasks run until a message is published."""
+        status = await daemon._handle_status({})
+
+        assert status["queue_size"] == 0
+        assert status["active_targets"] == 0
+
+    @pytest.mark.asyncio
+    async def test_targets_delivered_in_parallel(self, daemon):
+        """Test delivery to distinct targets overlaps while each target stays serialized."""
+        daemon._coalesce_window = 0
+        delivered: list[tuple[str, str]] = []
+
+        async def slow_deliver(message: Message) -> bool:
+            await asyncio.sleep(0.1)
+            delivered.append((message.target, message.content))
+            return True
+
+        with patch.object(daemon, "_deliver_message_fast", side_effect=slow_deliver):
+            start = time.monotonic()
+            for i in range(2):
+                for target in ("dev:1", "dev:2", "dev:3"):
+                    await _publish(daemon, target, f"msg{i}")
+
+            while len(delivered) < 6:
+                await asyncio.sleep(0.01)
+            elapsed = time.monotonic() - start
+
+        assert elapsed < 0.45
+        for target in ("dev:1", "dev:2", "dev:3"):
+            assert [c for t, c in delivered if t == target] == ["msg0", "msg1"]
+        assert daemon._queued_count == 0
+
+    @pytest.mark.asyncio
+    async def test_priority_order_within_target(self, daemon):
+        """Test queued critical messages are delivered before earlier normal ones."""
+        daemon._coalesce_window = 0
+        delivered: list[str] = []
+        gate = asyncio.Event()
+
+        async def gated_deliver(message: Message) -> bool:
+            await gate.wait()
+            delivered.append(message.content)
+            return True
+
+        with patch.object(daemon, "_deliver_message_fast", side_effect=gated_deliver):
+            await _publish(daemon, "dev:1", "first")
+            while daemon._queued_count:  # worker picks up "first" and blocks
+                await asyncio.sleep(0.001)
+            await _publish(daemon, "dev:1", "normal")
+            await _publish(daemon, "dev:1", "urgent", priority="critical")
+            gate.set()
+
+            while len(delivered) < 3:
+                await asyncio.sleep(0.01)
+
+        assert delivered == ["first", "urgent", "normal"]
+
+    @pytest.mark.asyncio
+    async def test_idle_worker_retires(self, daemon):
+        """Test a worker exits after its idle timeout and restarts on demand."""
+        daemon._worker_idle_timeout = 0.05
+        daemon._coalesce_window = 0
+
+        with patch.object(daemon, "_deliver_message_fast", return_value=True) as mock_deliver:
+            await _publish(daemon, "dev:1", "hello")
+            await asyncio.sleep(0.15)
+
+            assert "dev:1" not in daemon._target_workers
+
+            await _publish(daemon, "dev:1", "again")
+            await asyncio.sleep(0.01)
+
+        assert mock_deliver.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_delivered_messages_persisted_to_log(self, daemon):
+        """Test delivered messages are appended to the message log and indexed in the store."""
+        with patch.object(daemon, "_deliver_message_fast", return_value=True):
+            for i in range(3):
+                await _publish(daemon, "dev:1", f"msg{i}")
+            while daemon.message_store.last_sequence < 3:
+                await asyncio.sleep(0.01)
+
+        assert [m["content"] for m in daemon.message_log.read_target("dev:1")] == ["msg0", "msg1", "msg2"]
+        assert [m["content"] for m in daemon.message_store.query(target="dev:1")] == ["msg2", "msg1", "msg0"]
+
+    @pytest.mark.asyncio
+    async def test_stats_report_sketch_percentiles(self, daemon):
+        """Test delivery times are summarized from a mergeable sketch."""
+        with patch.object(daemon, "_deliver_message_fast", return_value=True):
+            for i in range(5):
+                await _publish(daemon, f"dev:{i}", "hello")
+            while daemon._delivery_times.snapshot().count < 5:
+                await asyncio.sleep(0.01)
+
+        metrics = (await daemon._handle_stats({}))["performance_metrics"]
+
+        assert set(metrics["delivery_times_ms"]) == {"min", "max", "avg", "p50", "p95", "p99"}
+        assert metrics["delivery_sketch"]["count"] == 5
+
+
+class TestReads:
+    """Test pane reads served through the shared capture cache."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_capture(self, daemon):
+        """Test simultaneous reads of a target cost one tmux capture and don't block the loop."""
+
+        async def slow_capture(target: str, lines: int = 50) -> str:
+            await asyncio.sleep(0.05)
+            return "pane content"
+
+        daemon.tmux.capture_pane.side_effect = slow_capture
+
+        reads = [asyncio.create_task(daemon._handle_read({"target": "dev:1"})) for _ in range(10)]
+        status = await asyncio.wait_for(daemon._handle_status({}), 0.02)  # served while captures are pending
+        responses = await asyncio.gather(*reads)
+
+        assert status["status"] == "active"
+        assert all(r["content"] == "pane content" for r in responses)
+        assert daemon.tmux.capture_pane.call_count == 1
+        assert (await daemon._handle_stats({}))["capture_cache"]["shared"] == 9
+
+
+class TestCoalescing:
+    """Test merging of messages queued for a busy target."""
+
+    @pytest.mark.asyncio
+    async def test_burst_merged_into_one_submission(self, daemon):
+        """Test messages arriving within the batching window share one submission."""
+        delivered: list[Message] = []
+
+        async def record(message: Message) -> bool:
+            delivered.append(message)
+            return True
+
+        with patch.object(daemon, "_deliver_message_fast", side_effect=record):
+            await _publish(daemon, "dev:1", "first")
+            await _publish(daemon, "dev:1", "second", priority="low")
+            await _publish(daemon, "dev:1", "third")
+            while daemon.message_log.last_sequence < 3:
+                await asyncio.sleep(0.01)
+
+        assert len(delivered) == 1
+        content = delivered[0].content
+        assert content.startswith("3 queued messages:")
+        assert content.index("[1/3]") < content.index("first") < content.index("third") < content.index("second")
+        assert [m["content"] for m in daemon.message_log.read_target("dev:1")] == ["first", "third", "second"]
+        assert (await daemon._handle_stats({}))["coalescing"]["submissions_saved"] == 2
+
+    @pytest.mark.asyncio
+    async def test_held_while_busy_and_critical_bypasses(self, daemon):
+        """Test messages are held while the agent works, except critical ones."""
+        daemon._busy_poll_interval = 0.02
+        daemon.tmux.capture_pane.return_value = "✻ Thinking… (esc to interrupt)"
+        delivered: list[Message] = []
+
+        async def record(message: Message) -> bool:
+            delivered.append(message)
+            return True
+
+        with patch.object(daemon, "_deliver_message_fast", side_effect=record):
+            await _publish(daemon, "dev:1", "status update")
+            await asyncio.sleep(0.1)
+            await _publish(daemon, "dev:1", "another update")
+            await _publish(daemon, "dev:1", "stop now", priority="critical")
+            await asyncio.sleep(0.1)
+
+            assert [m.content for m in delivered] == ["stop now"]
+
+            daemon.tmux.capture_pane.return_value = "> "
+            while len(delivered) < 2:
+                await asyncio.sleep(0.01)
+
+        assert "[1/2] 📨 from daemon: status update" in delivered[1].content
+        assert "[2/2] 📨 from daemon: another update" in delivered[1].content
+        assert daemon._queued_count == 0
+
+
+class TestAdmissionControl:
+    """Test rate limits and queue bounds on publish."""
+
+    @pytest.mark.asyncio
+    async def test_target_rate_limit_throttles_with_retry_hint(self, daemon):
+        """Test publishes beyond a target's burst are throttled, except critical ones."""
+        daemon._target_limiter = RateLimiter(RateLimitConfig(max_requests=60, window_seconds=60.0, burst_size=2))
+
+        with patch.object(daemon, "_deliver_message_fast", return_value=True):
+            responses = [await _publish(daemon, "pm:0", f"msg{i}") for i in range(3)]
+            other = await _publish(daemon, "pm:1", "other target")
+            critical = await _publish(daemon, "pm:0", "urgent", priority="critical")
+
+        assert [r["status"] for r in responses] == ["queued", "queued", "throttled"]
+        assert responses[2]["limit"] == "target"
+        assert 0 < responses[2]["retry_after"] <= 1.0
+        assert other["status"] == "queued"
+        assert critical["status"] == "queued"
+
+    @pytest.mark.asyncio
+    async def test_sender_throttle_does_not_spend_target_quota(self, daemon):
+        """Test a publish refused by the sender limit leaves the target's tokens untouched."""
+        daemon._target_limiter = RateLimiter(RateLimitConfig(max_requests=60, window_seconds=60.0, burst_size=2))
+        daemon._sender_limiter = RateLimiter(RateLimitConfig(max_requests=60, window_seconds=60.0, burst_size=1))
+
+        with patch.object(daemon, "_deliver_message_fast", return_value=True):
+            first = await _publish(daemon, "pm:0", "first")
+            throttled = await _publish(daemon, "pm:0", "second")
+            daemon._sender_limiter.reset()
+            retried = await _publish(daemon, "pm:0", "second")
+
+        assert first["status"] == "queued"
+        assert throttled["limit"] == "sender"
+        assert retried["status"] == "queued"
+
+    @pytest.mark.asyncio
+    async def test_full_target_queue_rejected(self, daemon):
+        """Test a target's bounded queue rejects further messages and reports depth in stats."""
+        daemon._max_target_queue_depth = 2
+        gate = asyncio.Event()
+
+        async def gated_deliver(message: Message) -> bool:
+            await gate.wait()
+            return True
+
+        with patch.object(daemon, "_deliver_message_fast", side_effect=gated_deliver):
+            await _publish(daemon, "dev:1", "in flight", priority="critical")
+            while daemon._queued_count:
+                await asyncio.sleep(0.001)
+            statuses = [(await _publish(daemon, "dev:1", f"msg{i}"))["status"] for i in range(3)]
+            admission = (await daemon._handle_stats({}))["admission"]
+            gate.set()
+
+        assert statuses == ["queued", "queued", "rejected"]
+        assert admission["target_depths"] == {"dev:1": 2}
+        assert admission["rejected"] == 1
+
+
+class TestFramedProtocol:
+    """Test newline-delimited framing, persistent connections and pipelining."""
+
+    @pytest.mark.asyncio
+    async def test_large_request_and_response_not_truncated(self, daemon):
+        """Test frames well over 8KB round-trip intact."""
+        daemon.tmux.capture_pane.return_value = "x" * 200 + "\n" + "y" * 50_000
+        server = await daemon.start_server()
+
+        async with server, DaemonClient(daemon.socket_path) as client:
+            with patch.object(daemon, "_deliver_message_fast", return_value=True):
+                published = await client.publish("dev:1", "briefing " * 5000)
+            read = await client.read("dev:1", lines=50)
+
+        assert published["status"] == "queued"
+        assert read["status"] == "success"
+        assert len(read["content"]) == 50_201
+
+    @pytest.mark.asyncio
+    async def test_pipelined_requests_share_one_connection(self, daemon):
+        """Test concurrent commands reuse one connection and get their own responses."""
+        connections = 0
+        handle_client = daemon._handle_client
+
+        async def counting_handler(reader, writer):
+            nonlocal connections
+            connections += 1
+            await handle_client(reader, writer)
+
+        daemon._handle_client = counting_handler
+        server = await daemon.start_server()
+
+        async with server, DaemonClient(daemon.socket_path) as client:
+            with patch.object(daemon, "_deliver_message_fast", return_value=True):
+                responses = await asyncio.gather(
+                    *(client.publish(f"dev:{i % 3}", f"msg {i}") for i in range(20)), client.get_status()
+                )
+
+        assert connections == 1
+        assert all(r["status"] == "queued" for r in responses[:-1])
+        assert len({r["message_id"] for r in responses[:-1]}) == 20
+        assert responses[-1]["status"] == "active"
+        assert all("request_id" not in r for r in responses)
+
+    @pytest.mark.asyncio
+    async def test_publish_many(self, daemon):
+        """Test a batch is queued in one round trip with per-message results."""
+        server = await daemon.start_server()
+
+        async with server, DaemonClient(daemon.socket_path) as client:
+            with patch.object(daemon, "_deliver_message_fast", return_value=True):
+                response = await client.publish_many(
+                    [{"target": "dev:1", "message": "a"}, {"target": "dev:2", "message": "b"}, {"message": "no target"}]
+                )
+
+        assert response["status"] == "partial"
+        assert response["queued"] == 2
+        assert [r["status"] for r in response["results"]] == ["queued", "queued", "error"]
+
+    @pytest.mark.asyncio
+    async def test_client_reconnects_after_daemon_restart(self, daemon):
+        """Test a dropped connection is replaced on the next command."""
+        client = DaemonClient(daemon.socket_path)
+        server = await daemon.start_server()
+        assert (await client.get_status())["status"] == "active"
+
+        server.close()
+        await server.wait_closed()
+        await client.close()
+
+        server = await daemon.start_server()
+        async with server:
+            assert (await client.get_status())["status"] == "active"
+            await client.close()
+
+    def test_client_survives_separate_event_loops(self, daemon):
+        """Test one client can be used from successive asyncio.run calls."""
+        client = DaemonClient(daemon.socket_path)
+
+        async def status_once():
+            server = await daemon.start_server()
+            async with server:
+                return await client.get_status()
+
+        assert asyncio.run(status_once())["status"] == "active"
+        assert asyncio.run(status_once())["status"] == "active"
+
+    @pytest.mark.asyncio
+    async def test_unavailable_daemon_returns_error(self, daemon):
+        """Test connection failures are reported as error responses."""
+        response = await DaemonClient(daemon.socket_path + ".missing").get_status()
+
+        assert response["status"] == "error"
+
+
+async def _collect(stream, count: int) -> list[dict]:
+    messages = []
+    async for message in stream:
+        messages.append(message)
+        if len(messages) == count:
+            break
+    await stream.aclose()
+    return messages
+
+
+class TestSubscriptions:
+    """Test streaming subscriptions with filters and resume."""
+
+    @pytest.mark.asyncio
+    async def test_stream_delivers_matching_messages(self, daemon):
+        """Test subscribers receive only messages matching their filters, live."""
+        daemon._coalesce_window = 0
+        server = await daemon.start_server()
+
+        async with server:
+            with patch.object(daemon, "_deliver_message_fast", return_value=True):
+                client = DaemonClient(daemon.socket_path)
+                stream = client.subscribe(targets=["pm"], priorities=["high", "critical"])
+                collector = asyncio.create_task(_collect(stream, 2))
+                while not daemon._subscriptions:
+                    await asyncio.sleep(0.01)
+
+                await _publish(daemon, "pm:0", "routine", priority="normal")
+                await _publish(daemon, "dev:1", "other target", priority="high")
+                await _publish(daemon, "pm:0", "first alert", priority="high")
+                await _publish(daemon, "pm:1", "second alert", priority="critical")
+
+                messages = await asyncio.wait_for(collector, 5)
+
+        assert [m["content"] for m in messages] == ["first alert", "second alert"]
+        assert messages[0]["seq"] < messages[1]["seq"]
+
+    @pytest.mark.asyncio
+    async def test_resume_from_sequence_replays_missed_messages(self, daemon):
+        """Test since_seq replays logged messages before streaming live ones."""
+        server = await daemon.start_server()
+
+        async with server:
+            with patch.object(daemon, "_deliver_message_fast", return_value=True):
+                for i in range(3):
+                    await _publish(daemon, "pm:0", f"missed {i}")
+                while daemon.message_log.last_sequence < 3:
+                    await asyncio.sleep(0.01)
+
+                stream = DaemonClient(daemon.socket_path).subscribe(targets=["pm:0"], since_seq=1)
+                collector = asyncio.create_task(_collect(stream, 3))
+                while not daemon._subscriptions:
+                    await asyncio.sleep(0.01)
+                await _publish(daemon, "pm:0", "live")
+
+                messages = await asyncio.wait_for(collector, 5)
+
+        assert [m["content"] for m in messages] == ["missed 1", "missed 2", "live"]
+
+    @pytest.mark.asyncio
+    async def test_disconnect_removes_subscription(self, daemon):
+        """Test closing the stream drops the daemon-side subscription."""
+        server = await daemon.start_server()
+
+        async with server:
+            with patch.object(daemon, "_deliver_message_fast", return_value=True):
+                stream = DaemonClient(daemon.socket_path).subscribe(tags=["alert"])
+                collector = asyncio.create_task(_collect(stream, 1))
+                while not daemon._subscriptions:
+                    await asyncio.sleep(0.01)
+                await daemon._handle_publish({"target": "pm:0", "message": "tagged", "tags": ["alert"]})
+                await asyncio.wait_for(collector, 5)
+
+                while daemon._subscriptions:
+                    await asyncio.sleep(0.01)
+                assert (await daemon._handle_status({}))["subscriptions"] == 0
@@ -0,0 +1,67 @@
+"""Tests for PM notification reads from the daemon's message log."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from tmux_orchestrator.core.communication.pm_pubsub import NotificationHandler
+from tmux_orchestrator.core.messaging.message_log import MessageLog
+
+
+def _broadcast(message_id: str, priority: str, tags: list[str]) -> dict:
+    return {
+        "id": message_id,
+        "target": "pm:0",
+        "timestamp": datetime.now().isoformat(),
+        "priority": priority,
+        "tags": tags,
+        "message": f"Broadcast {message_id}",
+        "sender": "daemon",
+    }
+
+
+class TestManagementBroadcasts:
+    """Test management broadcasts are filtered from the daemon's message log."""
+
+    def setup_method(self):
+        """Patch TMUXManager so handlers can be created without tmux."""
+        self.patcher = patch("tmux_orchestrator.core.communication.pm_pubsub.notification_handler.TMUXManager")
+        self.patcher.start()
+
+    def teardown_method(self):
+        """Stop patches."""
+        self.patcher.stop()
+
+    def test_filters_by_priority_and_tags(self, tmp_path):
+        """Test only management-tagged messages of the requested priority are returned."""
+        writer = MessageLog(tmp_path / "log")
+        writer.append_batch(
+            [_broadcast("msg-1", "high", ["monitoring", "management"]), _broadcast("msg-2", "low", ["status"])]
+        )
+        handler = NotificationHandler("pm:0")
+        handler.message_store = tmp_path
+
+        high_messages = handler.get_management_broadcasts("high")
+        assert [m["id"] for m in high_messages] == ["msg-1"]
+        assert handler.get_management_broadcasts("low") == []
+
+    def test_no_log_yet(self, tmp_path):
+        """Test an empty result before the daemon has written a log."""
+        handler = NotificationHandler("pm:0")
+        handler.message_store = tmp_path
+
+        assert handler.get_management_broadcasts() == []
+        assert not (tmp_path / "log").exists()
+
+    def test_reuses_one_log_and_sees_new_appends(self, tmp_path):
+        """Test the handler keeps a single MessageLog and refreshes it per call."""
+        writer = MessageLog(tmp_path / "log")
+        writer.append_batch([_broadcast("msg-1", "high", ["recovery"])])
+        reader = MessageLog(tmp_path / "log")
+        handler = NotificationHandler("pm:0", message_log=reader)
+
+        with patch("tmux_orchestrator.core.communication.pm_pubsub.notification_handler.MessageLog") as mock_log:
+            assert [m["id"] for m in handler.get_management_broadcasts()] == ["msg-1"]
+            writer.append_batch([_broadcast("msg-2", "high", ["management"])])
+            assert [m["id"] for m in handler.get_management_broadcasts()] == ["msg-1", "msg-2"]
+
+        mock_log.assert_not_called()
@@ -13,7 +13,7 @@ import pytest
 
 from tmux_orchestrator.core.config import Config
 from tmux_orchestrator.core.monitoring.component_manager import ComponentManager, MonitorCycleResult
-from tmux_orchestrator.core.monitoring.types import IdleType
+from tmux_orchestrator.core.monitoring.types import IdleType, SessionAggregates
 from tmux_orchestrator.utils.tmux import TMUXManager
 
 # TMUXManager import removed - using comprehensive_mock_tmux fixture
@@ -276,12 +276,11 @@ class TestTeamIdleDetection:
 
     def test_check_team_idle_status_all_idle(self):
         """Test team idle detection when all agents are idle."""
-        # Mock session agents
-        mock_agents = [Mock(target="test:1"), Mock(target="test:2")]
+        # Mock session aggregates
+        aggregates = SessionAggregates(session="test", total=2, idle=2)
 
         with (
-            patch.object(self.component_manager.state_tracker, "get_session_agents", return_value=mock_agents),
-            patch.object(self.component_manager.state_tracker, "is_agent_idle", return_value=True),
+            patch.object(self.component_manager.state_tracker, "get_session_aggregates", return_value=aggregates),
             patch.object(self.component_manager.state_tracker, "is_team_idle", return_value=False),
             patch.object(self.component_manager.state_tracker, "set_team_idle") as mock_set_idle,
             patch.object(self.component_manager.notification_manager, "notify_team_idle") as mock_notify,
@@ -293,16 +292,11 @@ class TestTeamIdleDetection:
 
     def test_check_team_idle_status_mixed(self):
         """Test team idle detection with mixed agent states."""
-        # Mock session agents
-        mock_agents = [Mock(target="test:1"), Mock(target="test:2")]
-
         # One idle, one active
-        def mock_is_idle(target):
-            return target == "test:1"
+        aggregates = SessionAggregates(session="test", total=2, idle=1)
 
         with (
-            patch.object(self.component_manager.state_tracker, "get_session_agents", return_value=mock_agents),
-            patch.object(self.component_manager.state_tracker, "is_agent_idle", side_effect=mock_is_idle),
+            patch.object(self.component_manager.state_tracker, "get_session_aggregates", return_value=aggregates),
             patch.object(self.component_manager.state_tracker, "is_team_idle", return_value=True),
             patch.object(self.component_manager.state_tracker, "clear_team_idle") as mock_clear,
         ):
@@ -312,7 +306,9 @@ class TestTeamIdleDetection:
 
     def test_check_team_idle_status_no_agents(self):
         """Test team idle detection with no agents."""
-        with patch.object(self.component_manager.state_tracker, "get_session_agents", return_value=[]):
+        with patch.object(
+            self.component_manager.state_tracker, "get_session_aggregates", return_value=SessionAggregates("test")
+        ):
             # Should not raise exception
             self.component_manager._check_team_idle_status("test")
 
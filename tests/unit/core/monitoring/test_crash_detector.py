@@ -5,13 +5,14 @@ Tests the context-aware crash detection functionality to ensure accurate
 detection without false positives.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
 import pytest
 
-from tmux_orchestrator.core.monitoring.crash_detector import CrashDetector
+from tmux_orchestrator.core.monitoring.crash_detector import CRASH_PENDING_CONFIRMATION, CrashDetector
 from tmux_orchestrator.core.monitoring.types import AgentInfo
 from tmux_orchestrator.utils.tmux import TMUXManager
 
@@ -280,6 +281,119 @@ class TestObservationPeriod:
         assert len(self.detector._crash_observations[target]) == 1
 
 
+class TestFastPathConfirmation:
+    """Test fast-path crash confirmation via process tree probes."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.tmux = Mock(spec=TMUXManager)
+        self.logger = Mock(spec=logging.Logger)
+        self.detector = CrashDetector(self.tmux, self.logger)
+
+        self.agent = AgentInfo(
+            target="test:1", session="test", window="1", name="test-agent", type="developer", status="active"
+        )
+        self.crash_content = ["Running build...", "Segmentation fault", "$ ls -la"]
+
+    @pytest.mark.asyncio
+    async def test_fast_probe_confirms_on_first_indicator(self):
+        """Test crash confirmed without waiting for three observations."""
+        self.detector._fast_probe_interval = 0.01
+        self.tmux.capture_pane.return_value = "\n".join(self.crash_content)
+
+        with patch.object(self.detector, "_is_claude_process_running", return_value=False):
+            crashed, reason = self.detector.detect_crash(self.agent, self.crash_content)
+            assert not crashed
+            assert reason == CRASH_PENDING_CONFIRMATION
+
+            crashed, reason = await self.detector.confirm_crash_async("test:1")
+
+        assert crashed
+        assert "segmentation fault" in reason
+        assert "test:1" not in self.detector._crash_observations
+
+        stats = self.detector.get_detection_stats()
+        assert stats["incidents"] == 1
+        assert stats["recent"][0]["method"] == "fast_probe"
+        assert stats["max_time_to_detect"] < self.detector._fast_confirm_timeout
+
+    @pytest.mark.asyncio
+    async def test_fast_probe_does_not_block_event_loop(self):
+        """Test other coroutines keep running while a crash is being confirmed."""
+        self.detector._fast_probe_interval = 0.05
+        self.detector._fast_confirm_timeout = 0.2
+        self.tmux.capture_pane.return_value = "Claude is thinking..."
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        with patch.object(self.detector, "_is_claude_process_running", return_value=False):
+            self.detector.detect_crash(self.agent, self.crash_content)
+            task = asyncio.create_task(ticker())
+            crashed, _ = await self.detector.confirm_crash_async("test:1")
+            task.cancel()
+
+        assert not crashed
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_confirm_without_pending_crash(self):
+        """Test confirmation is a no-op when nothing is pending."""
+        assert await self.detector.confirm_crash_async("test:1") == (False, None)
+        self.tmux.capture_pane.assert_not_called()
+
+    def test_running_claude_process_suppresses_indicator(self):
+        """Test indicator ignored while Claude is still in the foreground."""
+        with patch.object(self.detector, "_is_claude_process_running", return_value=True):
+            crashed, reason = self.detector.detect_crash(self.agent, self.crash_content)
+
+        assert not crashed
+        assert reason is None
+        assert "test:1" not in self.detector._crash_observations
+
+    def test_unknown_pane_command_falls_back_to_observation(self):
+        """Test observation-based confirmation when the pane can't be inspected."""
+        self.tmux.get_pane_current_command.return_value = None
+
+        for _ in range(2):
+            crashed, reason = self.detector.detect_crash(self.agent, self.crash_content)
+            assert not crashed
+            assert reason is None
+
+        crashed, reason = self.detector.detect_crash(self.agent, self.crash_content)
+        assert crashed
+        assert self.detector.get_detection_stats()["recent"][0]["method"] == "observation"
+
+    @pytest.mark.asyncio
+    async def test_recovered_agent_not_confirmed(self):
+        """Test no crash when Claude reappears during the follow-up probe."""
+        self.detector._fast_probe_interval = 0.01
+        with patch.object(self.detector, "_is_claude_process_running", side_effect=[False, True]):
+            self.detector.detect_crash(self.agent, self.crash_content)
+            crashed, _ = await self.detector.confirm_crash_async("test:1")
+
+        assert not crashed
+        assert len(self.detector._crash_observations["test:1"]) == 1
+        self.tmux.capture_pane.assert_not_called()
+
+    def test_pane_command_inspection(self):
+        """Test the pane's foreground command decides whether Claude is running."""
+        self.tmux.get_pane_current_command.return_value = "claude"
+        assert self.detector._is_claude_process_running("test:1") is True
+
+        # A path or argument mentioning claude doesn't matter, only the foreground command
+        for shell in ("bash", "-zsh", "sh"):
+            self.tmux.get_pane_current_command.return_value = shell
+            assert self.detector._is_claude_process_running("test:1") is False
+
+        self.tmux.get_pane_current_command.return_value = None
+        assert self.detector._is_claude_process_running("test:1") is None
+
+
 class TestPMCrashDetection:
     """Test PM-specific crash detection."""
 
@@ -11,7 +11,7 @@ from unittest.mock import Mock, patch
 
 from tmux_orchestrator.core.config import Config
 from tmux_orchestrator.core.monitoring.metrics_collector import MetricPoint, MetricsCollector
-from tmux_orchestrator.core.monitoring.types import MonitorStatus
+from tmux_orchestrator.core.monitoring.types import MonitorStatus, SessionAggregates
 
 
 class TestMetricsCollectorInitialization:
@@ -261,6 +261,18 @@ class TestMonitorCycleRecording:
         assert self.collector._gauges["agents.total"] == 5  # active_agents
         assert self.collector._counters["cycles.total"] == 1
 
+    def test_record_session_aggregates(self):
+        """Test per-session counters are exported as gauges."""
+        aggregates = {"dev": SessionAggregates(session="dev", total=4, idle=3, crashed=1, fresh=1, missing=2)}
+
+        self.collector.record_session_aggregates(aggregates)
+
+        assert self.collector._gauges["sessions.dev.agents"] == 4
+        assert self.collector._gauges["sessions.dev.active"] == 1
+        assert self.collector._gauges["sessions.dev.idle"] == 3
+        assert self.collector._gauges["sessions.dev.crashed"] == 1
+        assert self.collector._gauges["sessions.dev.missing"] == 2
+
 
 class TestMetricSummaries:
     """Test metric summary generation."""
@@ -0,0 +1,145 @@
+"""
+Tests for time-windowed PM notification coalescing.
+
+Covers debounce windows, dedupe, priority escalation, busy deferral and the
+notifier integration that reuses cycle snapshots for busy checks.
+"""
+
+import logging
+from unittest.mock import Mock
+
+from tmux_orchestrator.core.monitor.notifier import MonitorNotifier
+from tmux_orchestrator.core.monitoring.notification_coalescer import NotificationCoalescer, classify_message
+from tmux_orchestrator.utils.tmux import TMUXManager
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestNotificationCoalescer:
+    """Test coalescing windows, dedupe and digest formatting."""
+
+    def setup_method(self):
+        """Set up a coalescer with a controllable clock."""
+        self.clock = FakeClock()
+        self.coalescer = NotificationCoalescer(window_seconds=10, max_window_seconds=30, clock=self.clock)
+
+    def test_window_holds_until_quiet_period(self):
+        """Test notifications are held until the debounce window closes."""
+        self.coalescer.add("pm:1", "dev:2", "agent_idle", "💤 AGENT IDLE: dev:2", "low")
+        assert self.coalescer.collect_ready() == []
+
+        self.clock.now += 5
+        self.coalescer.add("pm:1", "dev:3", "agent_idle", "💤 AGENT IDLE: dev:3", "low")
+        self.clock.now += 6
+        assert self.coalescer.collect_ready() == []
+
+        self.clock.now += 4
+        digests = self.coalescer.collect_ready()
+        assert len(digests) == 1
+        assert len(digests[0].notifications) == 2
+        assert "(2 events)" in digests[0].message
+        assert self.coalescer.pending_count() == 0
+
+    def test_max_window_bounds_latency(self):
+        """Test a steady stream cannot postpone delivery past the max window."""
+        for i in range(7):
+            self.coalescer.add("pm:1", f"dev:{i}", "agent_idle", f"idle dev:{i}", "low")
+            self.clock.now += 5
+
+        assert len(self.coalescer.collect_ready()) == 1
+
+    def test_dedupe_by_agent_and_event_type(self):
+        """Test repeats of the same event are merged and counted."""
+        for _ in range(3):
+            self.coalescer.add("pm:1", "dev:2", "agent_idle", "💤 AGENT IDLE: dev:2", "low")
+        self.coalescer.add("pm:1", "dev:2", "agent_fresh", "🌱 FRESH AGENT: dev:2", "normal")
+
+        assert self.coalescer.pending_count("pm:1") == 2
+
+        self.clock.now += 10
+        digest = self.coalescer.collect_ready()[0]
+        assert "💤 AGENT IDLE: dev:2 (x3)" in digest.message
+
+    def test_critical_bypasses_window_and_busy_check(self):
+        """Test critical notifications flush the PM's window immediately."""
+        self.coalescer.add("pm:1", "dev:3", "agent_idle", "💤 AGENT IDLE: dev:3", "low")
+        self.coalescer.add("pm:1", "dev:2", "agent_crash", "🚨 AGENT CRASH: dev:2", "critical")
+
+        digests = self.coalescer.collect_ready(is_busy=lambda pm: True)
+        assert len(digests) == 1
+        assert digests[0].priority == "critical"
+        assert digests[0].message.index("CRITICAL") < digests[0].message.index("LOW PRIORITY")
+
+    def test_priority_escalates_on_repeat(self):
+        """Test a repeated event escalates to the more urgent priority."""
+        self.coalescer.add("pm:1", "dev:2", "recovery_needed", "recover dev:2", "high")
+        assert self.coalescer.collect_ready() == []
+
+        self.coalescer.add("pm:1", "dev:2", "recovery_needed", "recover dev:2 again", "critical")
+        digest = self.coalescer.collect_ready()[0]
+
+        assert digest.priority == "critical"
+        assert digest.notifications[0].count == 2
+
+    def test_busy_pm_deferred_and_requeue(self):
+        """Test busy PMs keep their window and failed digests are requeued."""
+        self.coalescer.add("pm:1", "dev:2", "agent_idle", "idle dev:2", "low")
+        self.clock.now += 10
+
+        assert self.coalescer.collect_ready(is_busy=lambda pm: True) == []
+
+        digest = self.coalescer.collect_ready(is_busy=lambda pm: False)[0]
+        assert digest.message == "idle dev:2"
+
+        self.coalescer.requeue(digest)
+        assert self.coalescer.pending_count("pm:1") == 1
+
+    def test_classify_message(self):
+        """Test pre-formatted notifications are classified by content."""
+        assert classify_message("🚨 AGENT CRASH ALERT: Agent dev:2 has crashed") == ("dev:2", "agent_crash", "critical")
+        assert classify_message("💤 AGENT IDLE: my-proj:3 - idle") == ("my-proj:3", "agent_idle", "low")
+        assert classify_message("😴 TEAM IDLE: dev") == ("", "team_idle", "normal")
+
+
+class TestMonitorNotifierCoalescing:
+    """Test the legacy notifier delivers through the coalescer."""
+
+    def setup_method(self):
+        """Set up notifier with a mocked tmux."""
+        self.tmux = Mock(spec=TMUXManager)
+        self.logger = Mock(spec=logging.Logger)
+        self.notifier = MonitorNotifier()
+        self.clock = FakeClock()
+        self.notifier.coalescer = NotificationCoalescer(window_seconds=10, clock=self.clock)
+
+    def test_cycles_coalesce_into_one_send(self):
+        """Test notifications from several cycles produce one digest."""
+        self.notifier.send_collected_notifications(self.tmux, {"pm:0": ["💤 AGENT IDLE: dev:1"]}, self.logger, {})
+        self.clock.now += 5
+        self.notifier.send_collected_notifications(self.tmux, {"pm:0": ["💤 AGENT IDLE: dev:2"]}, self.logger, {})
+        self.tmux.send_keys.assert_not_called()
+
+        self.clock.now += 10
+        self.notifier.process_pm_message_queues(self.tmux, self.logger, {"pm:0": "│ > "})
+
+        assert self.tmux.send_keys.call_count == 2  # message + Enter
+        self.tmux.capture_pane.assert_not_called()
+
+    def test_busy_check_falls_back_to_capture(self):
+        """Test PMs without a cycle snapshot are captured for the busy check."""
+        self.tmux.capture_pane.return_value = "│ > "
+        self.notifier.queue_pm_message("pm:0", "🔧 RECOVERY NEEDED: dev:1", self.logger)
+        self.clock.now += 10
+
+        self.notifier.process_pm_message_queues(self.tmux, self.logger)
+
+        self.tmux.capture_pane.assert_called_once_with("pm:0", lines=50)
+        assert self.notifier.coalescer.pending_count() == 0
@@ -0,0 +1,143 @@
+"""
+Tests for ServiceContainer injection plans and graph validation.
+"""
+
+import logging
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tmux_orchestrator.core.monitoring.service_container import ServiceContainer
+
+
+class Clock:
+    """Dependency with no injectable parameters."""
+
+
+class Store:
+    """Dependency requiring a Clock."""
+
+    def __init__(self, clock: Clock, name: str = "store"):
+        self.clock = clock
+        self.name = name
+
+
+class Ping:
+    """One half of a dependency cycle."""
+
+
+class Pong:
+    """Other half of a dependency cycle."""
+
+
+class TestInjectionPlans:
+    """Test injection plans are compiled once and reused."""
+
+    def setup_method(self):
+        """Set up a container with a singleton and a transient service."""
+        self.container = ServiceContainer(Mock(spec=logging.Logger))
+        self.clock = Clock()
+        self.container.register(Clock, self.clock)
+
+        def make_store(clock: Clock) -> Store:
+            return Store(clock)
+
+        self.container.register_factory(Store, make_store, singleton=False)
+
+    def test_transient_resolves_inspect_signature_once(self):
+        """Test repeated resolves reuse the cached plan."""
+        with patch(
+            "tmux_orchestrator.core.monitoring.service_container.inspect.signature",
+            wraps=__import__("inspect").signature,
+        ) as mock_signature:
+            first = self.container.resolve(Store)
+            second = self.container.resolve(Store)
+
+        assert first is not second
+        assert first.clock is self.clock and second.clock is self.clock
+        assert mock_signature.call_count == 1
+
+    def test_auto_resolve_uses_plan(self):
+        """Test concrete classes are auto-resolved with defaults preserved."""
+        container = ServiceContainer(Mock(spec=logging.Logger))
+        container.register(Clock, self.clock)
+
+        store = container._auto_resolve(Store)
+
+        assert store.clock is self.clock
+        assert store.name == "store"
+
+    def test_auto_resolve_missing_required_raises(self):
+        """Test auto-resolution still fails for unregistered required parameters."""
+        container = ServiceContainer(Mock(spec=logging.Logger))
+
+        with pytest.raises(ValueError):
+            container._auto_resolve(Store)
+
+
+class TestFreeze:
+    """Test startup validation of the service graph."""
+
+    def setup_method(self):
+        """Set up an empty container."""
+        self.container = ServiceContainer(Mock(spec=logging.Logger))
+
+    def test_freeze_valid_graph_locks_registration(self):
+        """Test a valid graph freezes and rejects further registration."""
+        self.container.register(Clock, Clock())
+        self.container.register_factory(Store, lambda clock: Store(clock))
+
+        self.container.freeze()
+
+        assert self.container.is_frozen
+        with pytest.raises(RuntimeError):
+            self.container.register(Ping, Ping())
+
+        self.container.clear()
+        assert not self.container.is_frozen
+
+    def test_freeze_reports_missing_dependency(self):
+        """Test unregistered required dependencies fail at freeze time."""
+
+        def make_store(clock: Clock) -> Store:
+            return Store(clock)
+
+        self.container.register_factory(Store, make_store)
+
+        with pytest.raises(ValueError, match="Store: required parameter 'clock' \\(Clock\\)"):
+            self.container.freeze()
+        assert not self.container.is_frozen
+
+    def test_freeze_validates_instance_constructors(self):
+        """Test pre-built instances are checked against their class constructor."""
+        self.container.register(Store, Store(Clock()))
+
+        with pytest.raises(ValueError, match="Store: required parameter 'clock' \\(Clock\\)"):
+            self.container.freeze()
+
+        self.container.register(Clock, Clock())
+        self.container.freeze()
+        assert self.container.is_frozen
+
+    def test_freeze_skips_uninspectable_instances(self):
+        """Test instances of builtin types do not block freezing."""
+        self.container.register(dict, {"key": "value"})
+
+        self.container.freeze()
+
+        assert self.container.is_frozen
+
+    def test_freeze_reports_cycles(self):
+        """Test dependency cycles fail at freeze time."""
+
+        def make_ping(pong: Pong) -> Ping:
+            return Ping()
+
+        def make_pong(ping: Ping) -> Pong:
+            return Pong()
+
+        self.container.register_factory(Ping, make_ping)
+        self.container.register_factory(Pong, make_pong)
+
+        with pytest.raises(ValueError, match="Dependency cycle: Ping -> Pong -> Ping"):
+            self.container.freeze()
@@ -589,6 +589,99 @@ class TestUtilityMethods:
         assert summary["agents_with_submissions"] == 1
 
 
+class TestSessionAggregates:
+    """Test incremental per-session counters."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        self.original_env = os.environ.get("TMUX_ORCHESTRATOR_BASE_DIR")
+        os.environ["TMUX_ORCHESTRATOR_BASE_DIR"] = self.test_dir
+
+        self.tmux = Mock(spec=TMUXManager)
+        self.config = Config.load()
+        self.logger = Mock(spec=logging.Logger)
+
+        self.state_tracker = StateTracker(self.tmux, self.config, self.logger)
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        if self.original_env:
+            os.environ["TMUX_ORCHESTRATOR_BASE_DIR"] = self.original_env
+        elif "TMUX_ORCHESTRATOR_BASE_DIR" in os.environ:
+            del os.environ["TMUX_ORCHESTRATOR_BASE_DIR"]
+
+    def _assert_matches_scan(self, session):
+        """Assert the counters equal a full recomputation over tracked agents."""
+        aggregates = self.state_tracker.get_session_aggregates(session)
+        agents = [s for s in self.state_tracker._agent_states.values() if s.session == session]
+        idle_times = [t for target, t in self.state_tracker._idle_agents.items() if target.startswith(f"{session}:")]
+
+        assert aggregates.total == len(agents)
+        assert aggregates.idle == len(idle_times)
+        assert aggregates.fresh == sum(1 for s in agents if s.is_fresh)
+        assert aggregates.earliest_idle == (min(idle_times) if idle_times else None)
+
+    def test_untracked_session_is_empty(self):
+        """Test aggregates for an unknown session are all zero."""
+        aggregates = self.state_tracker.get_session_aggregates("nope")
+
+        assert aggregates.total == 0
+        assert aggregates.all_idle is False
+
+    def test_transitions_update_counters(self):
+        """Test idle, active and fresh transitions keep counters in sync."""
+        self.state_tracker.update_agent_state("test:1", "a")
+        self.state_tracker.update_agent_state("test:2", "b")
+        self.state_tracker.update_agent_state("other:1", "c")
+        self._assert_matches_scan("test")
+
+        aggregates = self.state_tracker.get_session_aggregates("test")
+        assert (aggregates.total, aggregates.fresh, aggregates.active) == (2, 2, 2)
+
+        self.state_tracker.update_agent_state("test:1", "a")
+        first_idle = self.state_tracker._idle_agents["test:1"]
+        self.state_tracker.update_agent_state("test:2", "b")
+        self._assert_matches_scan("test")
+        assert aggregates.all_idle
+        assert aggregates.earliest_idle == first_idle
+
+        self.state_tracker.update_agent_state("test:1", "a2")
+        self._assert_matches_scan("test")
+        assert aggregates.idle == 1
+        assert aggregates.fresh == 1
+        assert aggregates.earliest_idle == self.state_tracker._idle_agents["test:2"]
+
+        self.state_tracker.reset_agent_state("test:2")
+        self._assert_matches_scan("test")
+        assert (aggregates.total, aggregates.idle, aggregates.earliest_idle) == (1, 0, None)
+
+        assert self.state_tracker.get_session_aggregates("other").total == 1
+
+    def test_crashed_and_missing_counters(self):
+        """Test crash and missing marks are counted once per agent."""
+        self.state_tracker.update_agent_state("test:1", "a")
+        self.state_tracker.mark_agent_crashed("test:1")
+        self.state_tracker.mark_agent_crashed("test:1")
+        self.state_tracker.track_missing_agent("test:3")
+        self.state_tracker.track_missing_agent("test:3")
+
+        aggregates = self.state_tracker.get_session_aggregates("test")
+        assert (aggregates.crashed, aggregates.missing) == (1, 1)
+
+        self.state_tracker.clear_agent_crashed("test:1")
+        self.state_tracker.clear_missing_agent("test:3")
+        assert (aggregates.crashed, aggregates.missing) == (0, 0)
+
+    def test_get_session_agents_uses_session_index(self):
+        """Test session agent lookup follows creates and resets."""
+        self.state_tracker.update_agent_state("test:1", "a")
+        self.state_tracker.update_agent_state("test:2", "b")
+        self.state_tracker.reset_agent_state("test:1")
+
+        assert [s.target for s in self.state_tracker.get_session_agents("test")] == ["test:2"]
+
+
 class TestContentCaching:
     """Test content caching and hash computation."""
 
@@ -0,0 +1,128 @@
+"""
+Tests that every monitoring strategy keeps the state tracker's crash marks current.
+
+Per-session crash aggregates are only correct if each strategy marks crashed
+agents and clears the mark once they recover.
+"""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from tmux_orchestrator.core.monitoring.interfaces import CRASH_PENDING_CONFIRMATION
+from tmux_orchestrator.core.monitoring.strategies.async_polling_strategy import AsyncPollingStrategy
+from tmux_orchestrator.core.monitoring.strategies.polling_strategy import PollingMonitoringStrategy
+from tmux_orchestrator.core.monitoring.strategies.priority_based_strategy import PriorityBasedStrategy
+from tmux_orchestrator.core.monitoring.types import AgentInfo, MonitorStatus, SessionAggregates
+
+
+def make_agent() -> AgentInfo:
+    return AgentInfo(target="dev:1", session="dev", window="1", name="dev", type="developer", status="active")
+
+
+def make_status() -> MonitorStatus:
+    return MonitorStatus(
+        is_running=True,
+        active_agents=0,
+        idle_agents=0,
+        last_cycle_time=0.0,
+        uptime=timedelta(0),
+        cycle_count=0,
+        errors_detected=0,
+    )
+
+
+class TestPollingStrategy:
+    """Test crash marking in the polling strategy."""
+
+    @pytest.mark.asyncio
+    async def test_marks_and_clears_crashes(self):
+        """Test crashed agents are marked and healthy agents cleared."""
+        strategy = PollingMonitoringStrategy()
+        agent_monitor = Mock()
+        state_tracker = Mock()
+
+        agent_monitor.check_agent.return_value = (False, "Agent crashed")
+        await strategy._check_single_agent(make_agent(), agent_monitor, state_tracker, None)
+        state_tracker.mark_agent_crashed.assert_called_once_with("dev:1")
+
+        agent_monitor.check_agent.return_value = (True, None)
+        await strategy._check_single_agent(make_agent(), agent_monitor, state_tracker, None)
+        state_tracker.clear_agent_crashed.assert_called_once_with("dev:1")
+
+
+class TestPriorityBasedStrategy:
+    """Test crash marking in the priority-based strategy."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.strategy = PriorityBasedStrategy()
+        self.agent_monitor = Mock()
+        self.agent_monitor.check_agent.return_value = (True, None)
+        self.agent_monitor.get_agent_status.return_value = {"content": "output"}
+        self.state_tracker = Mock()
+        self.state_tracker.get_agent_state.return_value = {}
+        self.crash_detector = Mock()
+        self.crash_detector.confirm_crash_async = AsyncMock(return_value=(True, "Agent process exited"))
+
+    async def check(self) -> None:
+        await self.strategy._perform_agent_check(
+            make_agent(), self.agent_monitor, self.state_tracker, self.crash_detector, Mock(), make_status(), None
+        )
+
+    @pytest.mark.asyncio
+    async def test_confirms_pending_crash(self):
+        """Test a pending crash is confirmed asynchronously and marked."""
+        self.crash_detector.detect_crash.return_value = (False, CRASH_PENDING_CONFIRMATION)
+
+        await self.check()
+
+        self.crash_detector.confirm_crash_async.assert_awaited_once_with("dev:1")
+        self.state_tracker.mark_agent_crashed.assert_called_once_with("dev:1")
+
+    @pytest.mark.asyncio
+    async def test_clears_recovered_agent(self):
+        """Test a healthy agent's crash mark is cleared."""
+        self.crash_detector.detect_crash.return_value = (False, None)
+
+        await self.check()
+
+        self.state_tracker.mark_agent_crashed.assert_not_called()
+        self.state_tracker.clear_agent_crashed.assert_called_once_with("dev:1")
+
+
+class TestAsyncPollingStrategy:
+    """Test crash marking and aggregate export in the async polling strategy."""
+
+    @pytest.mark.asyncio
+    async def test_marks_crash_and_exports_aggregates(self):
+        """Test crashed agents are marked and session aggregates recorded each cycle."""
+        metrics = MagicMock()
+        strategy = AsyncPollingStrategy(metrics=metrics)
+        strategy._async_tmux = None
+        strategy._ensure_async_components = AsyncMock()
+
+        agent_monitor = Mock()
+        agent_monitor.discover_agents.return_value = [make_agent()]
+        agent_monitor.analyze_agent_content.return_value = {"content": "Error"}
+        state_tracker = Mock()
+        state_tracker.get_agent_state.return_value = {}
+        state_tracker.get_idle_duration.return_value = None
+        aggregates = {"dev": SessionAggregates(session="dev", total=1, crashed=1)}
+        state_tracker.get_all_session_aggregates.return_value = aggregates
+        crash_detector = Mock()
+        crash_detector.detect_crash.return_value = (True, "Error")
+
+        await strategy.execute(
+            {
+                "agent_monitor": agent_monitor,
+                "state_tracker": state_tracker,
+                "crash_detector": crash_detector,
+                "notification_manager": Mock(),
+                "pm_recovery_manager": Mock(),
+            }
+        )
+
+        state_tracker.mark_agent_crashed.assert_called_once_with("dev:1")
+        metrics.record_session_aggregates.assert_called_once_with(aggregates)
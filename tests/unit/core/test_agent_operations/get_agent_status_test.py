@@ -0,0 +1,42 @@
+"""Tests for get_agent_status business logic function."""
+
+from unittest.mock import Mock
+
+from tmux_orchestrator.core.agent_operations.get_agent_status import get_agent_status
+from tmux_orchestrator.utils.tmux import TMUXManager
+
+
+def test_get_agent_status_active() -> None:
+    """Test status of an agent that is working."""
+    mock_tmux: Mock = Mock(spec=TMUXManager)
+    mock_tmux.has_session.return_value = True
+    mock_tmux.list_windows.return_value = [{"index": "0", "name": "pm"}, {"index": "1", "name": "claude-dev"}]
+    mock_tmux.capture_pane.return_value = "Implementing the login form\nstill going"
+    mock_tmux._is_idle.return_value = False
+
+    status = get_agent_status(mock_tmux, "project:1")
+
+    assert status is not None
+    assert status["window_name"] == "claude-dev"
+    assert status["status"] == "Active"
+    assert status["pane_lines"] == 2
+    mock_tmux.capture_pane.assert_called_once_with("project:1", 50)
+
+
+def test_get_agent_status_missing_window() -> None:
+    """Test a window that doesn't exist returns None without capturing."""
+    mock_tmux: Mock = Mock(spec=TMUXManager)
+    mock_tmux.has_session.return_value = True
+    mock_tmux.list_windows.return_value = [{"index": "0", "name": "pm"}]
+
+    assert get_agent_status(mock_tmux, "project:5") is None
+    mock_tmux.capture_pane.assert_not_called()
+
+
+def test_get_agent_status_missing_session() -> None:
+    """Test a session that doesn't exist returns None."""
+    mock_tmux: Mock = Mock(spec=TMUXManager)
+    mock_tmux.has_session.return_value = False
+
+    assert get_agent_status(mock_tmux, "gone:0") is None
+    mock_tmux.list_windows.assert_not_called()
@@ -0,0 +1,39 @@
+"""Tests for list_agents business logic function."""
+
+from unittest.mock import Mock
+
+from tmux_orchestrator.core.agent_operations.list_agents import list_agents
+from tmux_orchestrator.utils.tmux import TMUXManager
+
+
+def _mock_tmux() -> Mock:
+    mock_tmux: Mock = Mock(spec=TMUXManager)
+    mock_tmux.list_agents.return_value = [
+        {"session": "frontend", "window": "0", "type": "Pm", "status": "active"},
+        {"session": "frontend", "window": "1", "type": "Developer", "status": "idle"},
+        {"session": "backend", "window": "2", "type": "Qa", "status": "unknown"},
+    ]
+    return mock_tmux
+
+
+def test_list_agents_all_sessions() -> None:
+    """Test listing agents across sessions."""
+    agents = list_agents(_mock_tmux())
+
+    assert [agent["target"] for agent in agents] == ["frontend:0", "frontend:1", "backend:2"]
+    assert [agent["status"] for agent in agents] == ["Active", "Idle", "Unknown"]
+    assert agents[0] == {"target": "frontend:0", "session": "frontend", "window": "0", "type": "Pm", "status": "Active"}
+
+
+def test_list_agents_session_filter() -> None:
+    """Test only agents in the requested session are listed."""
+    agents = list_agents(_mock_tmux(), session="backend")
+
+    assert [agent["target"] for agent in agents] == ["backend:2"]
+
+
+def test_list_agents_exclude_idle() -> None:
+    """Test idle agents are dropped when include_idle is False."""
+    agents = list_agents(_mock_tmux(), include_idle=False)
+
+    assert [agent["target"] for agent in agents] == ["frontend:0", "backend:2"]
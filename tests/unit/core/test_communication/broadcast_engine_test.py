@@ -0,0 +1,85 @@
+"""Tests for the parallel broadcast engine."""
+
+import time
+from unittest.mock import Mock
+
+from tmux_orchestrator.core.communication.broadcast_engine import BroadcastEngine, TopologySnapshot
+from tmux_orchestrator.core.pm_manager import PMManager
+from tmux_orchestrator.utils.tmux import TMUXManager
+
+WINDOWS = [
+    {"session": "proj", "index": "0", "name": "pm"},
+    {"session": "proj", "index": "1", "name": "claude-frontend"},
+    {"session": "proj", "index": "2", "name": "claude-backend"},
+    {"session": "proj", "index": "3", "name": "shell"},
+    {"session": "other", "index": "1", "name": "claude-qa"},
+]
+
+
+def test_snapshot_filters_without_tmux_calls() -> None:
+    """Test recipients are selected by session, role and window from one snapshot."""
+    snapshot = TopologySnapshot(WINDOWS)
+
+    assert [r.target for r in snapshot.agents()] == ["proj:0", "proj:1", "proj:2", "other:1"]
+    assert [r.target for r in snapshot.agents(sessions=["proj"], exclude_roles={"project_manager"})] == [
+        "proj:1",
+        "proj:2",
+    ]
+    assert [r.target for r in snapshot.agents(roles={"qa_engineer"})] == ["other:1"]
+    assert [r.target for r in snapshot.agents(sessions=["proj"], exclude_windows={"1", "PM"})] == ["proj:2"]
+    assert snapshot.sessions == ["proj", "other"]
+
+
+def test_deliveries_run_concurrently() -> None:
+    """Test a broadcast takes about as long as one delivery, with per-recipient results."""
+    tmux = Mock(spec=TMUXManager)
+
+    def slow_send(target: str, message: str) -> bool:
+        time.sleep(0.1)
+        if target == "proj:2":
+            raise RuntimeError("pane gone")
+        return True
+
+    tmux.send_message.side_effect = slow_send
+    recipients = TopologySnapshot(WINDOWS).agents()
+
+    result = BroadcastEngine(tmux, max_parallel=8).deliver(recipients, "hello")
+
+    assert result.elapsed < 0.3
+    assert result.by_target() == {"proj:0": True, "proj:1": True, "proj:2": False, "other:1": True}
+    assert result.failed[0].error == "pane gone"
+    assert all(delivery.latency >= 0.1 for delivery in result.results)
+
+
+def test_parallelism_limit() -> None:
+    """Test no more than max_parallel deliveries are in flight."""
+    tmux = Mock(spec=TMUXManager)
+    in_flight, peak = 0, 0
+
+    def send(target: str, message: str) -> bool:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        time.sleep(0.02)
+        in_flight -= 1
+        return True
+
+    tmux.send_message.side_effect = send
+    recipients = TopologySnapshot([{"session": "s", "index": str(i), "name": f"claude-{i}"} for i in range(10)])
+
+    BroadcastEngine(tmux, max_parallel=3).deliver(recipients.agents(), "hello")
+
+    assert peak <= 3
+
+
+def test_pm_broadcast_uses_one_snapshot() -> None:
+    """Test PM broadcasts skip PMs and other sessions without listing agents."""
+    tmux = Mock(spec=TMUXManager)
+    tmux.list_all_windows.return_value = WINDOWS
+    tmux.send_message.return_value = True
+
+    results = PMManager(tmux).broadcast_to_all_agents("standup", session="proj")
+
+    assert results == {"proj:1": True, "proj:2": True}
+    tmux.list_agents.assert_not_called()
+    tmux.list_all_windows.assert_called_once()
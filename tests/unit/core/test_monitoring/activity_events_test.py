@@ -0,0 +1,141 @@
+"""Tests for event-driven idle detection via tmux silence/activity alerts."""
+
+from unittest.mock import patch
+
+import pytest
+
+from tmux_orchestrator.core.monitor.activity_events import ActivityEventSource
+
+
+@pytest.fixture
+def event_source(tmp_path):
+    """Provide an event source with tmux calls stubbed out."""
+    source = ActivityEventSource(tmp_path / "activity-events.log", silence_threshold=30, reconfirm_interval=300)
+    with patch.object(source, "_run_tmux", return_value=True):
+        source.configure_agents(["dev:1", "dev:2"])
+    return source
+
+
+def _append_events(source: ActivityEventSource, *lines: str) -> None:
+    with open(source.events_file, "a") as f:
+        for line in lines:
+            f.write(f"{line}\n")
+
+
+class TestActivityEventSource:
+    """Test hook configuration and event-driven target selection."""
+
+    def test_configure_installs_hooks_once(self, tmp_path):
+        """Test windows and sessions are configured only once."""
+        source = ActivityEventSource(tmp_path / "events.log", silence_threshold=15)
+
+        with patch.object(source, "_run_tmux", return_value=True) as mock_run:
+            assert source.configure_agents(["dev:1", "dev:2"]) == 2
+            assert source.configure_agents(["dev:1", "dev:2"]) == 0
+
+        commands = [call.args[0] for call in mock_run.call_args_list]
+        assert ["set-option", "-w", "-t", "dev:1", "monitor-silence", "15"] in commands
+        assert sum(1 for cmd in commands if cmd[:2] == ["set-hook", "-w"] and cmd[4] == "alert-silence") == 2
+        assert sum(1 for cmd in commands if "silence-action" in cmd) == 1
+
+        silence_hook = next(cmd[5] for cmd in commands if cmd[:2] == ["set-hook", "-w"] and cmd[4] == "alert-silence")
+        assert str(source.events_file) in silence_hook
+        assert "kill-session -C" in silence_hook
+
+    def test_configure_failure_falls_back_to_polling(self, tmp_path):
+        """Test windows that cannot be configured are always polled."""
+        source = ActivityEventSource(tmp_path / "events.log")
+
+        with patch.object(source, "_run_tmux", return_value=False):
+            assert source.configure_agents(["dev:1"]) == 0
+
+        assert source.targets_to_check(["dev:1"]) == ["dev:1"]
+
+    def test_new_windows_polled_until_confirmed(self, event_source):
+        """Test windows without a confirmed state are polled once."""
+        assert event_source.targets_to_check(["dev:1", "dev:2"]) == ["dev:1", "dev:2"]
+
+        event_source.mark_confirmed("dev:1")
+        event_source.mark_confirmed("dev:2")
+
+        assert event_source.targets_to_check(["dev:1", "dev:2"]) == []
+
+    def test_silence_transition_requests_confirmation(self, event_source):
+        """Test a silence alert after activity triggers one confirmation poll."""
+        for target in ("dev:1", "dev:2"):
+            event_source.mark_confirmed(target)
+
+        _append_events(event_source, "activity dev:1", "silence dev:1")
+        events = event_source.read_events()
+
+        assert [(e.kind, e.target) for e in events] == [("activity", "dev:1"), ("silence", "dev:1")]
+        assert event_source.targets_to_check(["dev:1", "dev:2"]) == ["dev:1"]
+
+        event_source.mark_confirmed("dev:1")
+        _append_events(event_source, "silence dev:1")
+        event_source.read_events()
+
+        # Repeated silence for an already idle agent costs nothing
+        assert event_source.targets_to_check(["dev:1", "dev:2"]) == []
+
+    def test_activity_skips_polling(self, event_source):
+        """Test agents reported active are not polled."""
+        _append_events(event_source, "activity dev:1", "activity dev:2")
+        event_source.read_events()
+
+        assert event_source.get_state("dev:1").state == "active"
+        assert event_source.targets_to_check(["dev:1", "dev:2"]) == []
+
+    def test_silence_gap_detects_missed_activity(self, event_source):
+        """Test a long gap between silence alerts is treated as a transition."""
+        _append_events(event_source, "silence dev:1")
+        event_source.read_events()
+        event_source.mark_confirmed("dev:1")
+        event_source.mark_confirmed("dev:2")
+
+        event_source.get_state("dev:1").last_silence -= event_source.silence_threshold * 3
+        _append_events(event_source, "silence dev:1")
+        event_source.read_events()
+
+        assert event_source.targets_to_check(["dev:1", "dev:2"]) == ["dev:1"]
+
+    def test_idle_agents_reconfirmed_after_interval(self, event_source):
+        """Test idle agents are re-polled after the reconfirm interval."""
+        _append_events(event_source, "silence dev:1")
+        event_source.read_events()
+        event_source.mark_confirmed("dev:1")
+        event_source.mark_confirmed("dev:2")
+
+        event_source.get_state("dev:1").last_confirmed -= event_source.reconfirm_interval + 1
+
+        assert "dev:1" in event_source.targets_to_check(["dev:1", "dev:2"])
+
+    def test_partial_and_unknown_lines_ignored(self, event_source):
+        """Test malformed lines and partial writes are not consumed as events."""
+        with open(event_source.events_file, "a") as f:
+            f.write("garbage\nsilence dev:9\nactivity dev:1\nsilence de")
+
+        events = event_source.read_events()
+        assert [(e.kind, e.target) for e in events] == [("silence", "dev:9"), ("activity", "dev:1")]
+        assert event_source.has_pending_events()
+
+        with open(event_source.events_file, "a") as f:
+            f.write("v:2\n")
+
+        assert [(e.kind, e.target) for e in event_source.read_events()] == [("silence", "dev:2")]
+
+    def test_wait_for_events_returns_early(self, event_source):
+        """Test waiting returns as soon as an event is pending."""
+        _append_events(event_source, "silence dev:1")
+
+        assert event_source.wait_for_events(timeout=5.0)
+
+    def test_removed_windows_forgotten(self, event_source):
+        """Test windows that disappear are reconfigured if the index is reused."""
+        with patch.object(event_source, "_run_tmux", return_value=True) as mock_run:
+            event_source.configure_agents(["dev:1"])
+            assert event_source.get_state("dev:2") is None
+
+            event_source.configure_agents(["dev:1", "dev:2"])
+
+        assert any(call.args[0][3] == "dev:2" for call in mock_run.call_args_list)
@@ -95,41 +95,6 @@ class TestPMPubsubIntegration(unittest.TestCase):
             result = self.pm_integration._suggest_recovery_response(message)
             self.assertIn(expected_response.split()[0].lower(), result.lower(), f"Failed for message: {message}")
 
-    def test_get_management_broadcasts(self):
-        """Test filtering management broadcast messages."""
-        # Create mock message file
-        session_file = self.message_store / "pm_0.json"
-        test_messages = [
-            {
-                "id": "msg-1",
-                "timestamp": datetime.now().isoformat(),
-                "priority": "high",
-                "tags": ["monitoring", "management"],
-                "message": "System alert",
-                "sender": "daemon",
-            },
-            {
-                "id": "msg-2",
-                "timestamp": datetime.now().isoformat(),
-                "priority": "low",
-                "tags": ["status"],
-                "message": "Low priority update",
-                "sender": "daemon",
-            },
-        ]
-
-        with open(session_file, "w") as f:
-            json.dump(test_messages, f)
-
-        # Test high priority filtering
-        high_messages = self.pm_integration.get_management_broadcasts("high")
-        self.assertEqual(len(high_messages), 1)
-        self.assertEqual(high_messages[0]["priority"], "high")
-
-        # Test low priority filtering
-        low_messages = self.pm_integration.get_management_broadcasts("low")
-        self.assertEqual(len(low_messages), 0)  # No management/monitoring tags
-
     @patch("subprocess.run")
     def test_acknowledge_notification(self, mock_subprocess):
         """Test notification acknowledgment."""
@@ -101,8 +101,8 @@ def test_broadcast_to_team_partial_failure() -> None:
     mock_tmux: Mock = Mock(spec=TMUXManager)
     mock_tmux.has_session.return_value = True
 
-    # Mock send_message to succeed for first agent, fail for second
-    mock_tmux.send_message.side_effect = [True, False]
+    # Mock send_message to succeed for first agent, fail for second (delivery is concurrent, so key by target)
+    mock_tmux.send_message.side_effect = lambda target, message: target == "test-session:0"
 
     mock_windows: list[dict[str, str]] = [
         {"index": "0", "name": "claude-frontend"},
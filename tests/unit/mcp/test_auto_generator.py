@@ -0,0 +1,127 @@
+"""Tests for in-process CLI reflection and the MCP schema cache."""
+
+import os
+import sys
+import textwrap
+from unittest.mock import patch
+
+import click
+import pytest
+
+from tmux_orchestrator.cli.lazy_loader import LazyCommandGroup
+from tmux_orchestrator.mcp import auto_generator
+from tmux_orchestrator.mcp.auto_generator import CLICommandIntrospector, cli_fingerprint, reflect_cli
+
+FAKE_CLI = '''
+import click
+
+
+@click.group()
+def cli():
+    """Fake CLI."""
+
+
+@cli.group()
+def agent():
+    """Manage agents."""
+
+
+@agent.command()
+@click.argument("target")
+@click.option("--lines", default=50, help="Lines to capture")
+def status(target, lines):
+    """Show agent status.
+
+    <mcp>Get detailed status of one agent (args: target=session:window)</mcp>
+    """
+
+
+@agent.command()
+def kill():
+    """Terminate an agent."""
+'''
+
+
+@pytest.fixture
+def fake_cli(tmp_path, monkeypatch):
+    package = tmp_path / "fake_cli_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text(textwrap.dedent(FAKE_CLI))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package
+    sys.modules.pop("fake_cli_pkg", None)
+
+
+@pytest.fixture
+def introspector(fake_cli, tmp_path):
+    return CLICommandIntrospector("fake_cli_pkg", cache_path=tmp_path / "cache" / "schema.json")
+
+
+def test_reflect_cli_walks_lazy_groups(fake_cli):
+    root = LazyCommandGroup(name="root")
+    root.add_lazy_command("agent", "fake_cli_pkg", "agent")
+
+    @root.command(hidden=True)
+    def internal():
+        pass
+
+    @root.group()
+    def pubsub():
+        """Messaging."""
+
+    @pubsub.command()
+    @click.option("--json", "as_json", is_flag=True)
+    def stats(as_json):
+        """Show stats."""
+
+    commands = reflect_cli(root)
+
+    assert "internal" not in commands
+    assert set(commands["agent"]["subcommands"]) == {"kill", "status"}
+    stats_info = commands["pubsub"]["subcommands"]["stats"]
+    assert stats_info["type"] == "command"
+    assert stats_info["params"][0]["is_flag"] is True
+
+
+def test_descriptions_from_mcp_tags_and_help(introspector):
+    descriptions = introspector.generate_mcp_descriptions()
+
+    assert descriptions == {
+        "agent": {
+            "kill": "Terminate an agent",
+            "status": "Get detailed status of one agent (args: target=session:window)",
+        }
+    }
+    params = introspector.discover_cli_commands()["agent"]["subcommands"]["status"]["params"]
+    assert [(p["name"], p["kind"], p["default"]) for p in params] == [
+        ("target", "argument", None),
+        ("lines", "option", 50),
+    ]
+
+
+def test_warm_start_uses_cache(introspector, tmp_path):
+    expected = introspector.generate_mcp_descriptions()
+
+    warm = CLICommandIntrospector("fake_cli_pkg", cache_path=introspector.cache_path)
+    with patch.object(auto_generator, "reflect_cli", side_effect=AssertionError("reflected")):
+        assert warm.generate_mcp_descriptions() == expected
+        assert "agent" in warm.discover_cli_commands()
+
+
+def test_cli_change_invalidates_cache(introspector, fake_cli):
+    introspector.generate_mcp_descriptions()
+    module = fake_cli / "__init__.py"
+    stat = module.stat()
+    os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    fresh = CLICommandIntrospector("fake_cli_pkg", cache_path=introspector.cache_path)
+    with patch.object(auto_generator, "reflect_cli", wraps=reflect_cli) as reflect:
+        fresh.generate_mcp_descriptions()
+
+    assert reflect.call_count == 1
+
+
+def test_version_is_part_of_fingerprint(fake_cli):
+    before = cli_fingerprint("fake_cli_pkg")
+    with patch.object(auto_generator, "__version__", "0.0.0-test"):
+        assert cli_fingerprint("fake_cli_pkg") != before
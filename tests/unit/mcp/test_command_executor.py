@@ -0,0 +1,92 @@
+"""Tests for the async CLI command executor used by MCP tools."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from tmux_orchestrator.mcp_tools import shared_logic
+from tmux_orchestrator.mcp_tools.shared_logic import CommandExecutor, ExecutionError, command_timeout
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    """Give each test its own concurrency pool."""
+    shared_logic._command_slots = None
+    yield
+    shared_logic._command_slots = None
+
+
+class TestCommandExecutor:
+    @pytest.mark.asyncio
+    async def test_slow_command_does_not_block_event_loop(self):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        result = await CommandExecutor().execute(["sleep", "0.3"], expect_json=False)
+        ticker_task.cancel()
+
+        assert result["success"] is True
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_streams_stdout_and_parses_json(self):
+        lines = []
+        result = await CommandExecutor(on_output=lines.append).execute(["printf", '{"a":\n1}\n'])
+
+        assert lines == ['{"a":', "1}"]
+        assert result["data"] == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_input_data_is_sent_to_stdin(self):
+        result = await CommandExecutor().execute(["cat"], expect_json=False, input_data="hello")
+
+        assert result["stdout"] == "hello"
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_command(self):
+        start = time.perf_counter()
+        with pytest.raises(ExecutionError, match="timed out"):
+            await CommandExecutor(timeout=0.2).execute(["sleep", "5"], expect_json=False)
+
+        assert time.perf_counter() - start < 2
+
+    @pytest.mark.asyncio
+    async def test_cancellation_kills_command(self):
+        processes = []
+        create = asyncio.create_subprocess_exec
+
+        async def tracking_create(*args, **kwargs):
+            process = await create(*args, **kwargs)
+            processes.append(process)
+            return process
+
+        with patch.object(shared_logic.asyncio, "create_subprocess_exec", tracking_create):
+            task = asyncio.create_task(CommandExecutor().execute(["sleep", "5"], expect_json=False))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert await asyncio.wait_for(processes[0].wait(), 1) != 0
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(shared_logic, "MAX_CONCURRENT_COMMANDS", 1)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(CommandExecutor().execute(["sleep", "0.2"], expect_json=False) for _ in range(2)))
+
+        assert time.perf_counter() - start >= 0.4
+
+    def test_per_command_timeouts(self):
+        assert command_timeout(["tmux-orc", "team", "deploy", "frontend", "3"]) == 300
+        assert command_timeout(["tmux-orc", "context", "show", "orc"]) == 15
+        assert command_timeout(["tmux-orc", "agent", "list"]) == shared_logic.DEFAULT_TIMEOUT
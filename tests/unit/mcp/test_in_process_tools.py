@@ -0,0 +1,69 @@
+"""Tests that native MCP tools call core logic in-process instead of the CLI."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tmux_orchestrator.mcp_tools import agent_list, agent_status, list_contexts, show_context, team_list
+from tmux_orchestrator.mcp_tools.shared_logic import CommandExecutor
+from tmux_orchestrator.utils.tmux import TMUXManager
+
+
+@pytest.fixture
+def mock_tmux():
+    """Patch the shared TMUXManager and fail on any CLI subprocess."""
+    tmux = Mock(spec=TMUXManager)
+    with (
+        patch("tmux_orchestrator.mcp_tools.shared_logic._tmux", tmux),
+        patch.object(CommandExecutor, "execute", side_effect=AssertionError("CLI invoked")),
+    ):
+        yield tmux
+
+
+class TestInProcessTools:
+    """Read-only tools return core results without spawning tmux-orc."""
+
+    @pytest.mark.asyncio
+    async def test_agent_list(self, mock_tmux):
+        mock_tmux.list_agents.return_value = [
+            {"session": "dev", "window": "1", "type": "Developer", "status": "active"},
+            {"session": "ops", "window": "2", "type": "Devops", "status": "idle"},
+        ]
+
+        result = await agent_list(filter_session="dev")
+
+        assert result["success"] is True
+        assert result["data"]["total_count"] == 1
+        assert result["data"]["agents"][0]["target"] == "dev:1"
+        assert result["data"]["summary"] == {"Active": 1}
+
+    @pytest.mark.asyncio
+    async def test_agent_status_not_found(self, mock_tmux):
+        mock_tmux.has_session.return_value = False
+
+        result = await agent_status("missing:0")
+
+        assert result["success"] is False
+        assert "not found" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_team_list_skips_empty_teams(self, mock_tmux):
+        mock_tmux.list_sessions.return_value = [{"name": "team", "attached": "1"}, {"name": "scratch"}]
+        mock_tmux.list_windows.side_effect = lambda session: (
+            [{"index": "0", "name": "claude-dev"}] if session == "team" else [{"index": "0", "name": "shell"}]
+        )
+
+        result = await team_list()
+
+        assert result["success"] is True
+        assert [team["name"] for team in result["data"]["teams"]] == ["team"]
+        assert result["data"]["empty_teams"] == 1
+
+    @pytest.mark.asyncio
+    async def test_contexts(self, mock_tmux):
+        listed = await list_contexts()
+        shown = await show_context("orc")
+
+        assert "orc" in listed["data"]["available_contexts"]
+        assert shown["success"] is True
+        assert shown["data"]["content_length"] == len(shown["data"]["context_content"]) > 0
@@ -0,0 +1,151 @@
+"""Tests for the read-through MCP response cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tmux_orchestrator.mcp.response_cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def topology():
+    return AsyncMock(return_value="gen-1")
+
+
+@pytest.fixture
+def cache(clock, topology):
+    return ResponseCache(topology=topology, topology_check_interval=0, clock=clock)
+
+
+def make_tool(cache: ResponseCache, ttl: float = 2.0):
+    calls = []
+
+    @cache.cached(ttl=ttl)
+    async def list_things(format: str = "table", session: str | None = None):
+        calls.append((format, session))
+        return {"success": True, "data": len(calls)}
+
+    return list_things, calls
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_repeated_calls_hit(self, cache):
+        tool, calls = make_tool(cache)
+
+        first = await tool()
+        second = await tool("table")
+        third = await tool(format="table", session=None)
+
+        assert first == second == third
+        assert len(calls) == 1
+        assert cache.get_stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_arguments_are_part_of_key(self, cache):
+        tool, calls = make_tool(cache)
+
+        await tool(session="a")
+        await tool(session="b")
+
+        assert calls == [("table", "a"), ("table", "b")]
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self, cache, clock):
+        tool, calls = make_tool(cache, ttl=2.0)
+
+        await tool()
+        clock.now = 2.5
+        await tool()
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, cache):
+        calls = []
+
+        @cache.cached(ttl=10)
+        async def flaky():
+            calls.append(1)
+            return {"success": False, "error": "tmux not running"}
+
+        await flaky()
+        await flaky()
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_mutation_invalidates(self, cache):
+        tool, calls = make_tool(cache)
+
+        @cache.invalidates
+        async def create_agent():
+            return {"success": True}
+
+        await tool()
+        await create_agent()
+        await tool()
+
+        assert len(calls) == 2
+        assert cache.get_stats()["invalidations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_topology_change_invalidates(self, cache, topology):
+        tool, calls = make_tool(cache)
+
+        await tool()
+        await tool()
+        topology.return_value = "gen-2"
+        await tool()
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_fetch(self, cache):
+        calls = []
+
+        @cache.cached(ttl=10)
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"success": True}
+
+        results = await asyncio.gather(*(slow() for _ in range(5)))
+
+        assert len(calls) == 1
+        assert all(result == {"success": True} for result in results)
+        assert cache.get_stats()["shared"] == 4
+
+
+class TestServerWiring:
+    @pytest.mark.asyncio
+    async def test_status_polling_is_cached_until_mutation(self):
+        from tmux_orchestrator.mcp import server
+
+        agents = {"success": True, "data": {"agents": []}}
+        with (
+            patch.object(server.response_cache, "_topology", None),
+            patch.object(server.mcp_tools, "agent_list", AsyncMock(return_value=agents)) as agent_list,
+            patch.object(server.mcp_tools, "spawn_agent", AsyncMock(return_value={"success": True})),
+        ):
+            server.response_cache.invalidate()
+            await server.list_agents_tool()
+            await server.list_agents_tool(format="table")
+            await server.create_agent("developer", "dev", "Build the login form")
+            await server.list_agents_tool()
+
+        assert agent_list.await_count == 2
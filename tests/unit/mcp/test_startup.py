@@ -0,0 +1,58 @@
+"""Tests for lazy MCP tool registration and server startup cost."""
+
+import json
+
+import pytest
+
+from tmux_orchestrator.mcp import server
+from tmux_orchestrator.mcp.startup_profile import profile_startup
+from tmux_orchestrator.mcp.tool_manifest import ManifestTool, build_manifest, load_manifest
+
+# Time spent executing tmux_orchestrator modules while importing the server,
+# excluding FastMCP and other dependencies
+STARTUP_BUDGET_SECONDS = 0.15
+
+
+@pytest.fixture(scope="module")
+def startup_profile():
+    return profile_startup()
+
+
+def test_manifest_matches_tool_signatures():
+    expected = build_manifest(server.tools.functions)
+    assert load_manifest() == json.loads(json.dumps(expected)), (
+        "tool_manifest.json is stale; run python -m tmux_orchestrator.mcp.tool_manifest"
+    )
+
+
+@pytest.mark.asyncio
+async def test_tools_are_registered_from_manifest():
+    tools = await server.app.list_tools()
+
+    assert {tool.name for tool in tools} == set(server.tools.functions)
+    assert all(isinstance(tool, ManifestTool) for tool in tools)
+
+
+@pytest.mark.asyncio
+async def test_manifest_tool_validates_and_runs(monkeypatch):
+    async def fake_show_context(context_name):
+        return {"success": True, "data": {"name": context_name}}
+
+    monkeypatch.setattr(server.mcp_tools, "show_context", fake_show_context)
+    monkeypatch.setattr(server.response_cache, "_topology", None)
+    server.response_cache.invalidate()
+
+    result = await server.app.call_tool("get_context", {"context_name": "pm"})
+
+    assert result.structured_content == {"success": True, "data": {"name": "pm"}}
+
+
+def test_import_does_not_load_tool_implementations(startup_profile):
+    loaded = startup_profile["modules"]
+
+    assert not [m for m in loaded if m.startswith("tmux_orchestrator.mcp_tools.")]
+    assert "tmux_orchestrator.sdk" not in loaded
+
+
+def test_startup_budget(startup_profile):
+    assert startup_profile["package_seconds"] < STARTUP_BUDGET_SECONDS, startup_profile["imports"]
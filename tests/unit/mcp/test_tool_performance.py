@@ -0,0 +1,107 @@
+"""Tests for per-tool MCP latency instrumentation."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from tmux_orchestrator.core.mcp.performance_monitor import MCPPerformanceMonitor
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    return MCPPerformanceMonitor(log_path=tmp_path / "mcp_performance.log", in_process=True, summary_interval=3600)
+
+
+class TestInstrument:
+    @pytest.mark.asyncio
+    async def test_records_latency_and_payload(self, monitor):
+        @monitor.instrument
+        async def list_things():
+            return {"success": True, "data": "x" * 100}
+
+        await list_things()
+        await list_things()
+
+        summary = monitor.get_tool_summary()["list_things"]
+        assert summary["calls"] == 2
+        assert summary["errors"] == 0
+        assert summary["latency"]["p95"] >= 0
+        assert summary["payload_bytes"]["max"] == pytest.approx(
+            len(json.dumps({"success": True, "data": "x" * 100})), rel=0.02
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_responses_count_as_errors(self, monitor):
+        @monitor.instrument
+        async def broken():
+            return {"success": False, "error": "no such session"}
+
+        await broken()
+
+        assert monitor.get_tool_summary()["broken"]["success_rate"] == 0
+
+    @pytest.mark.asyncio
+    async def test_exceptions_are_recorded_and_raised(self, monitor):
+        @monitor.instrument
+        async def crashing():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await crashing()
+
+        assert monitor.get_tool_summary()["crashing"]["errors"] == 1
+
+
+class TestSummary:
+    @pytest.mark.asyncio
+    async def test_rolling_summary_is_written(self, tmp_path):
+        monitor = MCPPerformanceMonitor(log_path=tmp_path / "mcp_performance.log", in_process=True, summary_interval=0)
+
+        @monitor.instrument
+        async def status():
+            return {"success": True}
+
+        await status()
+
+        data = json.loads(monitor.summary_path.read_text())
+        assert data["tools"]["status"]["calls"] == 1
+        assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+    @pytest.mark.asyncio
+    async def test_summary_writes_are_rate_limited(self, monitor):
+        @monitor.instrument
+        async def status():
+            return {"success": True}
+
+        with patch.object(monitor, "write_summary") as write_summary:
+            for _ in range(5):
+                await status()
+
+        assert write_summary.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_in_process_monitor_does_not_scan_processes(self, monitor):
+        with patch("psutil.process_iter", side_effect=AssertionError("scanned processes")):
+            processes = await monitor.get_mcp_processes()
+
+        assert [p.pid for p in processes] == [os.getpid()]
+
+
+@pytest.mark.asyncio
+async def test_server_tools_are_instrumented(monkeypatch):
+    from tmux_orchestrator.mcp import server
+
+    async def fake_list_contexts():
+        return {"success": True, "data": {"contexts": []}}
+
+    monkeypatch.setattr(server.mcp_tools, "list_contexts", fake_list_contexts)
+    monkeypatch.setattr(server.response_cache, "_topology", None)
+    server.response_cache.invalidate()
+
+    await server.app.call_tool("get_contexts", {})
+    result = await server.app.call_tool("get_mcp_performance", {})
+
+    tools = result.structured_content["data"]["tools"]
+    assert tools["get_contexts"]["calls"] >= 1
@@ -0,0 +1,108 @@
+"""Tests for async tmux operations and the shared capture cache."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tmux_orchestrator.utils.tmux.async_operations import AsyncTmuxOperations, PaneCaptureCache
+
+
+class TestAsyncTmuxOperations:
+    """Test subprocess handling, timeouts and cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_command(self):
+        """Test a hung command is killed and reported as a failure."""
+        ops = AsyncTmuxOperations(tmux_cmd="sleep", timeout=0.1)
+
+        start = time.monotonic()
+        assert await ops.run("10") is None
+        assert time.monotonic() - start < 2
+
+    @pytest.mark.asyncio
+    async def test_cancellation_propagates(self):
+        """Test cancelling a call stops waiting on the subprocess immediately."""
+        ops = AsyncTmuxOperations(tmux_cmd="sleep", timeout=30)
+        task = asyncio.create_task(ops.run("10"))
+        await asyncio.sleep(0.1)
+
+        start = time.monotonic()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert time.monotonic() - start < 2
+
+    @pytest.mark.asyncio
+    async def test_missing_binary_fails_softly(self):
+        """Test operations report failure when tmux can't be started."""
+        ops = AsyncTmuxOperations(tmux_cmd="/nonexistent/tmux")
+
+        assert await ops.send_text("dev:1", "hello") is False
+        assert await ops.capture_pane("dev:1") == ""
+        assert await ops.capture_pane_with_cursor("dev:1") == ("", None)
+
+    @pytest.mark.asyncio
+    async def test_capture_with_cursor_parses_position(self):
+        """Test the cursor line is split off the captured screen."""
+        ops = AsyncTmuxOperations()
+        ops.run = AsyncMock(return_value="line 1\nline 2\n3 4\n")
+
+        assert await ops.capture_pane_with_cursor("dev:1") == ("line 1\nline 2", (3, 4))
+
+
+class TestPaneCaptureCache:
+    """Test capture sharing, expiry and invalidation."""
+
+    @staticmethod
+    def _tmux(delay: float = 0.0) -> AsyncMock:
+        calls = 0
+
+        async def capture_pane(target: str, lines: int = 50) -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(delay)
+            return f"{target} capture {calls}"
+
+        tmux = AsyncMock(spec=AsyncTmuxOperations)
+        tmux.capture_pane.side_effect = capture_pane
+        return tmux
+
+    @pytest.mark.asyncio
+    async def test_concurrent_readers_share_one_capture(self):
+        """Test readers arriving during a capture wait for it instead of starting their own."""
+        tmux = self._tmux(delay=0.05)
+        cache = PaneCaptureCache(tmux, ttl=1.0)
+
+        results = await asyncio.gather(*(cache.capture("dev:1") for _ in range(5)))
+
+        assert results == ["dev:1 capture 1"] * 5
+        assert tmux.capture_pane.call_count == 1
+        assert cache.get_stats()["shared"] == 4
+
+    @pytest.mark.asyncio
+    async def test_expiry_and_invalidation(self):
+        """Test captures are reused within the TTL and refreshed after it or after invalidation."""
+        tmux = self._tmux()
+        cache = PaneCaptureCache(tmux, ttl=0.05)
+
+        assert await cache.capture("dev:1") == "dev:1 capture 1"
+        assert await cache.capture("dev:1") == "dev:1 capture 1"
+        await asyncio.sleep(0.06)
+        assert await cache.capture("dev:1") == "dev:1 capture 2"
+        cache.invalidate("dev:1")
+        assert await cache.capture("dev:1") == "dev:1 capture 3"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_reader_does_not_cancel_shared_capture(self):
+        """Test one reader giving up leaves the capture running for the others."""
+        tmux = self._tmux(delay=0.05)
+        cache = PaneCaptureCache(tmux, ttl=1.0)
+
+        impatient = asyncio.create_task(cache.capture("dev:1"))
+        patient = asyncio.create_task(cache.capture("dev:1"))
+        await asyncio.sleep(0.01)
+        impatient.cancel()
+
+        assert await patient == "dev:1 capture 1"
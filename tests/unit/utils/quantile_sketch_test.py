@@ -0,0 +1,69 @@
+"""Tests for streaming quantile sketches."""
+
+import random
+
+import pytest
+
+from tmux_orchestrator.utils.quantile_sketch import QuantileSketch, RollingQuantileSketch
+
+
+def _exact(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, int(q * len(ordered) + 0.999999) - 1)]
+
+
+class TestQuantileSketch:
+    """Test accuracy, merging and serialization."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test estimates stay within 1% of the exact quantiles."""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(-3, 1) for _ in range(20000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.95, 0.99, 0.999):
+            assert sketch.quantile(q) == pytest.approx(_exact(values, q), rel=0.011)
+        assert sketch.quantile(0) == min(values)
+        assert sketch.quantile(1) == max(values)
+        assert sketch.mean == pytest.approx(sum(values) / len(values))
+
+    def test_merge_matches_single_sketch(self):
+        """Test sketches built on shards merge to the same result as one sketch."""
+        values = [i / 1000 for i in range(1, 5001)]
+        whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for i, value in enumerate(values):
+            whole.add(value)
+            (left if i % 2 else right).add(value)
+
+        merged = QuantileSketch.from_dict(left.to_dict()).merge(QuantileSketch.from_dict(right.to_dict()))
+
+        assert merged.count == whole.count
+        assert merged.percentiles() == whole.percentiles()
+        with pytest.raises(ValueError):
+            merged.merge(QuantileSketch(relative_accuracy=0.05))
+
+    def test_empty_and_zero_values(self):
+        """Test empty sketches read as zero and non-positive values are counted."""
+        sketch = QuantileSketch()
+        assert sketch.percentiles() == {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+        for value in (0, 0, 0, 5.0):
+            sketch.add(value)
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(0.99) == 5.0
+
+
+def test_rolling_sketch_forgets_old_slices():
+    """Test values age out of the rolling window."""
+    now = [0.0]
+    rolling = RollingQuantileSketch(window_seconds=10, slices=5, clock=lambda: now[0])
+    rolling.add(1.0)
+    now[0] = 6.0
+    rolling.add(3.0)
+
+    assert rolling.snapshot().count == 2
+    now[0] = 12.0
+    assert rolling.snapshot().count == 1
+    assert rolling.quantile(0.5) == 3.0
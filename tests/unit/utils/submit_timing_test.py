@@ -0,0 +1,265 @@
+"""Tests for adaptive submit timing."""
+
+import asyncio
+import itertools
+from unittest.mock import Mock
+
+import pytest
+
+from tmux_orchestrator.utils.tmux import TMUXManager
+from tmux_orchestrator.utils.tmux.messaging import TmuxMessaging
+from tmux_orchestrator.utils.tmux.submit_timing import AdaptiveSubmitter, AsyncAdaptiveSubmitter, parse_prompt_input
+
+
+class FakePane:
+    """Simulated Claude pane that renders keystrokes after a delay."""
+
+    def __init__(self, render_delay: float = 0.03) -> None:
+        self.now = 0.0
+        self.render_delay = render_delay
+        self.prompt = ""
+        self.history: list[str] = []
+        self.pending: list[tuple[float, str, str]] = []
+        self.keys: list[str] = []
+        # Enter presses swallowed without any effect on the pane
+        self.dropped_enters = 0
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+    def _render(self) -> None:
+        for due, action, value in [p for p in self.pending if p[0] <= self.now]:
+            if action == "text":
+                self.prompt += value
+            elif action == "clear":
+                self.prompt = ""
+            elif action == "enter":
+                self.history.append(self.prompt)
+                self.prompt = ""
+            self.pending.remove((due, action, value))
+
+    def _queue(self, action: str, value: str = "") -> bool:
+        self.keys.append(action)
+        self.pending.append((self.now + self.render_delay, action, value))
+        return True
+
+    def send_text(self, target: str, text: str) -> bool:
+        return self._queue("text", text)
+
+    def press_ctrl_u(self, target: str) -> bool:
+        return self._queue("clear")
+
+    def press_enter(self, target: str) -> bool:
+        if self.dropped_enters:
+            self.dropped_enters -= 1
+            self.keys.append("enter")
+            return True
+        return self._queue("enter")
+
+    def capture_pane_with_cursor(self, target: str) -> tuple[str, tuple[int, int]]:
+        self._render()
+        screen = "\n".join([*self.history, "╭────╮", f"│ > {self.prompt} │", "╰────╯"])
+        return screen, (4 + len(self.prompt), len(self.history) + 1)
+
+
+class TestAdaptiveSubmitter:
+    """Test step confirmation, learned timeouts and the unobservable fallback."""
+
+    def test_enter_pressed_only_after_text_renders(self):
+        """Test Enter waits for the paste to show up and the message is submitted intact."""
+        pane = FakePane(render_delay=0.03)
+        submitter = AdaptiveSubmitter(pane, clock=pane.clock, sleep=pane.sleep)
+
+        assert submitter.submit("dev:1", "hello world")
+        pane.sleep(0.1)
+        pane._render()
+
+        assert pane.history == ["hello world"]
+        assert pane.keys == ["text", "enter"]  # empty prompt: no Ctrl-U needed
+        assert 0.03 <= submitter.profile("dev:1").median("paste") < 0.1
+
+    def test_partial_input_is_cleared_first(self):
+        """Test leftover prompt text is cleared before typing."""
+        pane = FakePane(render_delay=0.0)
+        pane.prompt = "half typed"
+        submitter = AdaptiveSubmitter(pane, clock=pane.clock, sleep=pane.sleep)
+
+        assert submitter.submit("dev:1", "new message")
+        pane._render()
+
+        assert pane.keys == ["clear", "text", "enter"]
+        assert pane.history == ["new message"]
+
+    def test_timeouts_learned_from_observed_delays(self):
+        """Test fast panes get tighter step timeouts than the defaults."""
+        pane = FakePane(render_delay=0.02)
+        submitter = AdaptiveSubmitter(pane, clock=pane.clock, sleep=pane.sleep)
+        default = submitter.profile("dev:1").timeout("paste")
+
+        for i in range(10):
+            submitter.submit("dev:1", f"message {i}")
+
+        assert submitter.profile("dev:1").timeout("paste") < default
+        assert submitter.get_stats()["dev:1"]["samples"]["paste"] == 10
+
+    def test_unobservable_pane_falls_back_to_fixed_delay(self):
+        """Test a pane that can't be captured still gets the keystrokes with the fixed delay."""
+        tmux = Mock(spec=TMUXManager)
+        tmux.capture_pane_with_cursor.return_value = ("", None)
+        sleeps: list[float] = []
+        submitter = AdaptiveSubmitter(tmux, sleep=sleeps.append)
+
+        assert submitter.submit("dev:1", "hello", clear=True, fallback_delay=0.5)
+
+        tmux.press_ctrl_u.assert_called_once_with("dev:1")
+        tmux.send_text.assert_called_once_with("dev:1", "hello")
+        tmux.press_enter.assert_called_once_with("dev:1")
+        assert sleeps == [0.05, 0.5]
+
+    def test_enter_pressed_again_when_pane_does_not_react(self):
+        """Test a swallowed Enter is retried and the submission confirmed."""
+        pane = FakePane(render_delay=0.0)
+        pane.dropped_enters = 1
+        submitter = AdaptiveSubmitter(pane, clock=pane.clock, sleep=pane.sleep)
+
+        assert submitter.submit("dev:1", "hello")
+
+        assert pane.keys == ["text", "enter", "enter"]
+        assert pane.history == ["hello"]
+        assert submitter.get_stats()["dev:1"]["timeouts"] == 1
+
+    def test_unconfirmed_submit_returns_false_after_bounded_retries(self):
+        """Test a pane that never reacts gets a bounded number of Enter presses."""
+        pane = FakePane(render_delay=0.0)
+        pane.dropped_enters = 10
+        submitter = AdaptiveSubmitter(pane, clock=pane.clock, sleep=pane.sleep, submit_retries=2)
+
+        assert not submitter.submit("dev:1", "hello")
+
+        assert pane.keys == ["text", "enter", "enter", "enter"]
+
+    def test_late_reaction_is_not_pressed_again(self):
+        """Test Enter is not repeated when the pane reacts just after the timeout."""
+        pane = FakePane(render_delay=0.0)
+        submitter = AdaptiveSubmitter(pane, clock=pane.clock, sleep=pane.sleep)
+        await_change = submitter._await_change
+
+        def submit_times_out(target, step, *args, **kwargs):
+            # The Enter lands, but only after the submit step has given up waiting
+            return False if step == "submit" else await_change(target, step, *args, **kwargs)
+
+        submitter._await_change = submit_times_out
+
+        assert submitter.submit("dev:1", "hello")
+
+        assert pane.keys == ["text", "enter"]
+        assert pane.history == ["hello"]
+
+    def test_wait_until_ready_detects_prompt(self):
+        """Test startup waits for the prompt box instead of a fixed sleep."""
+        pane = FakePane()
+        screens = iter(["$ claude", "Loading...", "Loading..."])
+        pane_capture = pane.capture_pane_with_cursor
+        pane.capture_pane_with_cursor = lambda t: (next(screens), (0, 0)) if pane.now < 0.3 else pane_capture(t)
+        submitter = AdaptiveSubmitter(pane, clock=pane.clock, sleep=pane.sleep)
+
+        assert submitter.wait_until_ready("dev:1", timeout=5)
+        assert pane.now < 1
+
+
+class AsyncFakePane:
+    """Async facade over FakePane that renders keystrokes immediately."""
+
+    def __init__(self) -> None:
+        self.pane = FakePane(render_delay=0.0)
+        self.hang_on_capture = False
+
+    async def capture_pane_with_cursor(self, target: str) -> tuple[str, tuple[int, int]]:
+        if self.hang_on_capture:
+            await asyncio.Event().wait()
+        return self.pane.capture_pane_with_cursor(target)
+
+    async def send_text(self, target: str, text: str) -> bool:
+        return self.pane.send_text(target, text)
+
+    async def press_ctrl_u(self, target: str) -> bool:
+        return self.pane.press_ctrl_u(target)
+
+    async def press_enter(self, target: str) -> bool:
+        return self.pane.press_enter(target)
+
+
+class TestAsyncAdaptiveSubmitter:
+    """Test the event-loop submitter."""
+
+    @pytest.mark.asyncio
+    async def test_submit_confirms_steps(self):
+        """Test the message is typed and submitted with delays learned per target."""
+        fake = AsyncFakePane()
+        submitter = AsyncAdaptiveSubmitter(fake, poll_interval=0.001)
+
+        assert await submitter.submit("dev:1", "hello world")
+        fake.pane._render()
+
+        assert fake.pane.history == ["hello world"]
+        assert fake.pane.keys == ["text", "enter"]
+        assert submitter.get_stats()["dev:1"]["samples"]["paste"] == 1
+
+    @pytest.mark.asyncio
+    async def test_submit_retries_swallowed_enter(self):
+        """Test the async submitter presses Enter again and reports the outcome."""
+        fake = AsyncFakePane()
+        fake.pane.dropped_enters = 1
+        # Each clock read advances 50ms, so step timeouts expire without real waiting
+        submitter = AsyncAdaptiveSubmitter(fake, poll_interval=0, clock=itertools.count(0, 0.05).__next__)
+
+        assert await submitter.submit("dev:1", "hello")
+        assert fake.pane.keys == ["text", "enter", "enter"]
+
+        fake.pane.dropped_enters = 10
+        assert not await submitter.submit("dev:1", "ignored", clear=False)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_submit_stops_before_enter(self):
+        """Test cancelling a delivery mid-step sends no further keystrokes."""
+        fake = AsyncFakePane()
+        submitter = AsyncAdaptiveSubmitter(fake, poll_interval=0.001)
+        await submitter.observe("dev:1")
+        fake.hang_on_capture = True
+
+        task = asyncio.create_task(submitter.submit("dev:1", "never sent"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert fake.pane.keys == []
+
+
+def test_parse_prompt_input():
+    """Test prompt box text extraction."""
+    assert parse_prompt_input("output\n╭──╮\n│ > hello there │\n╰──╯") == "hello there"
+    assert parse_prompt_input("│ >\xa0 │") == ""
+    assert parse_prompt_input("$ ls") is None
+
+
+class TestTmuxMessaging:
+    """Test TMUXManager's delivery path uses the adaptive submitter."""
+
+    def test_send_message_confirms_submission(self):
+        """Test send_message waits for the text, submits it and reports the confirmation."""
+        pane = FakePane(render_delay=0.03)
+        messaging = TmuxMessaging(basic_ops=pane)
+        messaging.send_text = pane.send_text
+        messaging.submitter = AdaptiveSubmitter(messaging, clock=pane.clock, sleep=pane.sleep)
+
+        assert messaging.send_message("dev:1", "hello world")
+        pane.sleep(0.1)
+        pane._render()
+        assert pane.history == ["hello world"]
+
+        pane.dropped_enters = 10
+        assert not messaging.send_message("dev:1", "lost")
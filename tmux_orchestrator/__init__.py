@@ -1,7 +1,16 @@
 """TMUX Orchestrator - AI-powered tmux session management."""
 
-__version__ = "2.1.46"
+from typing import Any
 
-from tmux_orchestrator.sdk import Agent, Message
+__version__ = "2.1.46"
 
 __all__ = ["Agent", "Message"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the SDK on first use; it pulls in httpx, which CLI and MCP startup don't need."""
+    if name in __all__:
+        from tmux_orchestrator import sdk
+
+        return getattr(sdk, name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -6,6 +6,7 @@ import click
 from rich.console import Console
 from rich.table import Table
 
+from tmux_orchestrator.core.agent_operations import get_agent_status
 from tmux_orchestrator.utils.tmux import TMUXManager
 
 console = Console()
@@ -27,31 +28,15 @@ def show_agent_status(ctx: click.Context, target: str, json: bool) -> None:
                     console.print(f"[red]✗ Invalid target format: {target}. Use 'session:window'[/red]")
                 return
 
-            session, window_str = target.split(":", 1)
-            try:
-                window_num = int(window_str)
-                # Check if session exists and get windows
-                windows = tmux.list_windows(session)
-                window_found = any(w["index"] == window_num for w in windows)
+            agent_status = get_agent_status(tmux, target)
 
-                if json:
-                    status_data = {
-                        "target": target,
-                        "session": session,
-                        "window": window_str,
-                        "status": "Active" if window_found else "Not Found",
-                        "timestamp": __import__("time").time(),
-                    }
-                    console.print(json_module.dumps(status_data, indent=2))
-                else:
-                    status = "Active" if window_found else "Not Found"
-                    console.print(f"Agent {target}: {status}")
-            except ValueError:
-                if json:
-                    result = {"success": False, "error": f"Invalid window number in target: {target}"}
-                    console.print(json_module.dumps(result, indent=2))
-                else:
-                    console.print(f"[red]✗ Invalid window number in target: {target}[/red]")
+            if json:
+                status_data = agent_status or {"target": target, "status": "Not Found"}
+                console.print(json_module.dumps(status_data, indent=2))
+            elif agent_status:
+                console.print(f"Agent {target}: {agent_status['status']} ({agent_status['last_activity']})")
+            else:
+                console.print(f"Agent {target}: Not Found")
         else:
             # Show status for all agents
             sessions = tmux.list_sessions()
@@ -9,23 +9,20 @@ console = Console()
 
 def list_all_agents(ctx: click.Context, session: str, json: bool) -> None:
     """List all active agents with filtering options."""
+    from tmux_orchestrator.core.agent_operations import list_agents
     from tmux_orchestrator.utils.tmux import TMUXManager
 
     tmux: TMUXManager = ctx.obj["tmux"]
 
     try:
-        # Get list of sessions, filter by session if specified
-        sessions = tmux.list_sessions()
-
-        if session:
-            sessions = [s for s in sessions if session in s]
+        agents = list_agents(tmux, session=session)
 
         if json:
             import json as json_module
 
             result = {
-                "agents": sessions,
-                "count": len(sessions),
+                "agents": agents,
+                "count": len(agents),
                 "filter": session,
                 "timestamp": __import__("time").time(),
             }
@@ -33,13 +30,14 @@ def list_all_agents(ctx: click.Context, session: str, json: bool) -> None:
         else:
             table = Table(title=f"Active Agents{f' (filtered: {session})' if session else ''}")
             table.add_column("Agent", style="cyan")
+            table.add_column("Type", style="magenta")
             table.add_column("Status", style="green")
 
-            for agent_session in sessions:
-                table.add_row(str(agent_session), "Active")
+            for agent in agents:
+                table.add_row(agent["target"], agent["type"], agent["status"])
 
             console.print(table)
-            console.print(f"\nTotal agents: {len(sessions)}")
+            console.print(f"\nTotal agents: {len(agents)}")
 
     except Exception as e:
         if json:
@@ -7,6 +7,8 @@ from rich.console import Console
 from rich.markdown import Markdown
 from rich.panel import Panel
 
+from tmux_orchestrator.core import context_loader
+
 from .context_utils import get_available_contexts, load_context
 
 console = Console()
@@ -67,9 +69,9 @@ def list_contexts(json: bool) -> None:
 
     <mcp>List available role contexts (no args). Shows all standardized context templates available for agent roles including orchestrator, pm, and specialty roles. Use to discover context options.</mcp>
     """
-    contexts = get_available_contexts()
+    contexts_data = context_loader.list_contexts()
 
-    if not contexts:
+    if not contexts_data:
         if json:
             result = {
                 "success": False,
@@ -82,15 +84,6 @@ def list_contexts(json: bool) -> None:
             console.print("[yellow]No context files found in tmux_orchestrator/data/contexts/[/yellow]")
         return
 
-    contexts_data = []
-    for role, path in contexts.items():
-        # Read first meaningful line as description
-        content = path.read_text()
-        lines = content.strip().split("\n")
-        description = next((line.strip() for line in lines if line.strip() and not line.startswith("#")), "")
-
-        contexts_data.append({"role": role, "description": description, "file_path": str(path)})
-
     if json:
         result = {
             "success": True,
@@ -1,11 +1,10 @@
 """Status command - Display comprehensive system status dashboard."""
 
 import json
-from datetime import datetime, timezone
 
 import click
 
-from tmux_orchestrator.core.monitoring.status_writer import StatusWriter
+from tmux_orchestrator.core.system_status import get_system_status
 from tmux_orchestrator.utils.tmux import TMUXManager
 
 
@@ -42,69 +41,14 @@ def system_status(ctx: click.Context, json_format: bool) -> None:
     tmux_optimized: TMUXManager = ctx.obj["tmux_optimized"]
     use_json: bool = json_format or ctx.obj.get("json_mode", False)
 
-    # Try to read from status file first for better performance
-    status_writer = StatusWriter()
-    status_data = status_writer.read_status()
-
-    using_cached_status = False
-    freshness_warning = None
-
-    if status_data:
-        # Check freshness - warn if status is older than 30 seconds
-        try:
-            last_updated = datetime.fromisoformat(status_data["last_updated"].replace("Z", "+00:00"))
-            age_seconds = (datetime.now(timezone.utc) - last_updated).total_seconds()
-
-            if age_seconds < 30:
-                # Use cached status for better performance
-                using_cached_status = True
-                sessions = tmux_optimized.list_sessions_cached()
-
-                # Convert status file format to expected agent format
-                agents = []
-                for target, agent_info in status_data.get("agents", {}).items():
-                    agents.append(
-                        {
-                            "target": target,
-                            "name": agent_info.get("name", "unknown"),
-                            "type": agent_info.get("type", "unknown"),
-                            "status": agent_info.get("status", "unknown").capitalize(),
-                            "session": agent_info.get("session"),
-                            "window": agent_info.get("window"),
-                        }
-                    )
-            else:
-                freshness_warning = f"Status data is {int(age_seconds)}s old, gathering fresh data..."
-        except Exception:
-            pass
-
-    # Fall back to live query if no cached status or it's stale
-    if not using_cached_status:
-        sessions = tmux_optimized.list_sessions_cached()
-        agents = tmux_optimized.list_agents_ultra_optimized()
+    status_info = get_system_status(tmux_optimized)
+    sessions = status_info["sessions"]
+    agents = status_info["agents"]
+    using_cached_status = status_info.pop("using_cached_status")
+    freshness_warning = status_info.pop("freshness_warning")
 
     if use_json:
-        output_data = {
-            "sessions": sessions,
-            "agents": agents,
-            "summary": {
-                "total_sessions": len(sessions),
-                "total_agents": len(agents),
-                "active_agents": len([a for a in agents if a["status"] == "Active"]),
-            },
-        }
-
-        # Add daemon status if available
-        if using_cached_status and status_data:
-            output_data["daemon_status"] = status_data.get("daemon_status", {})
-            output_data["status_age_seconds"] = int(  # type: ignore[assignment]
-                (
-                    datetime.now(timezone.utc)
-                    - datetime.fromisoformat(status_data["last_updated"].replace("Z", "+00:00"))
-                ).total_seconds()
-            )
-
-        console.print(json.dumps(output_data, indent=2))
+        console.print(json.dumps(status_info, indent=2))
         return
 
     # Display rich status dashboard
@@ -142,8 +86,8 @@ def system_status(ctx: click.Context, json_format: bool) -> None:
         console.print("\n[yellow]No active agents found[/yellow]")
 
     # Show daemon status if available from status file
-    if using_cached_status and status_data:
-        daemon_status = status_data.get("daemon_status", {})
+    if using_cached_status:
+        daemon_status = status_info.get("daemon_status", {})
         if daemon_status:
             console.print("\n[bold]Daemon Status:[/bold]")
 
@@ -65,8 +65,6 @@ class LazyCommandGroup(click.Group):
         cmd_info = self._lazy_commands[cmd_name]
 
         if cmd_info["loaded"]:
-            from typing import cast
-
             return cast(click.Command, cmd_info["command"])
 
         try:
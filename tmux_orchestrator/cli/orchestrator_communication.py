@@ -7,6 +7,7 @@ from typing import Any
 import click
 from rich.console import Console
 
+from tmux_orchestrator.core.communication.broadcast_engine import BroadcastEngine, Recipient, TopologySnapshot
 from tmux_orchestrator.utils.tmux import TMUXManager
 
 console: Console = Console()
@@ -206,48 +207,51 @@ def broadcast(ctx: click.Context, message: str, all_sessions: bool, session_filt
     else:
         console.print(f"[blue]Broadcasting to {len(sessions)} sessions...[/blue]")
 
-    success_count = 0
+    # Pick each session's PM or main agent window from one snapshot, then deliver concurrently
+    snapshot = TopologySnapshot.capture(tmux)
+    session_targets: dict[str, Recipient | None] = {}
     for session in sessions:
-        session_name = session["name"]
-
-        # Find PM or main agent window in session
-        windows = tmux.list_windows(session_name)
-        target_window = None
-
-        for window in windows:
-            window_name = window["name"].lower()
-            if any(keyword in window_name for keyword in ["pm", "manager", "claude"]):
-                target_window = f"{session_name}:{window['index']}"
-                break
-
-        if target_window:
-            if tmux.send_message(target_window, f"🎭 ORCHESTRATOR BROADCAST: {message}"):
-                if json and "session_results" in result:
-                    result["session_results"].append(
-                        {"session": session_name, "success": True, "target_window": target_window}
-                    )
-                else:
-                    console.print(f"  [green]✓ {session_name}[/green]")
-                success_count += 1
-            else:
-                if json and "session_results" in result:
-                    result["session_results"].append(
-                        {
-                            "session": session_name,
-                            "success": False,
-                            "target_window": target_window,
-                            "error": "Failed to send message",
-                        }
-                    )
-                else:
-                    console.print(f"  [red]✗ {session_name}[/red]")
-        else:
+        session_targets[session["name"]] = next(
+            (
+                recipient
+                for recipient in snapshot.recipients
+                if recipient.session == session["name"]
+                and any(keyword in recipient.window_name.lower() for keyword in ["pm", "manager", "claude"])
+            ),
+            None,
+        )
+
+    recipients = [recipient for recipient in session_targets.values() if recipient is not None]
+    delivered = BroadcastEngine(tmux).deliver(recipients, f"🎭 ORCHESTRATOR BROADCAST: {message}").by_target()
+
+    success_count = 0
+    for session_name, recipient in session_targets.items():
+        if recipient is None:
             if json and "session_results" in result:
                 result["session_results"].append(
                     {"session": session_name, "success": False, "error": "No suitable window found"}
                 )
             else:
                 console.print(f"  [yellow]⚠ {session_name} (no suitable window)[/yellow]")
+        elif delivered[recipient.target]:
+            if json and "session_results" in result:
+                result["session_results"].append(
+                    {"session": session_name, "success": True, "target_window": recipient.target}
+                )
+            else:
+                console.print(f"  [green]✓ {session_name}[/green]")
+            success_count += 1
+        elif json and "session_results" in result:
+            result["session_results"].append(
+                {
+                    "session": session_name,
+                    "success": False,
+                    "target_window": recipient.target,
+                    "error": "Failed to send message",
+                }
+            )
+        else:
+            console.print(f"  [red]✗ {session_name}[/red]")
 
     if json:
         result["sessions_succeeded"] = success_count
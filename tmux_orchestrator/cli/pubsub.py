@@ -7,10 +7,13 @@ Replaces slow CLI-based pubsub with daemon IPC for sub-100ms performance.
 import asyncio
 import json
 import sys
+import time
+from datetime import datetime, timedelta
 
 import click
 from rich.console import Console
 
+from tmux_orchestrator.core.messaging.message_store import MESSAGE_CATEGORIES, MessageStore, default_store_path
 from tmux_orchestrator.core.messaging_daemon import DaemonClient
 
 console = Console()
@@ -26,6 +29,7 @@ def pubsub() -> None:
         tmux-orc pubsub publish --target pm:0 "Message"
         tmux-orc pubsub read --target qa:0
         tmux-orc pubsub status
+        tmux-orc pubsub query --session pm --priority critical --unacked
     """
     pass
 
@@ -51,6 +55,12 @@ def publish(message: str, target: str, priority: str, tag: list[str]) -> None:
             console.print(f"[green]✓ Message queued for {target} ({delivery_time_ms:.1f}ms)[/green]")
             if delivery_time_ms > 100:
                 console.print(f"[yellow]⚠️  Delivery time {delivery_time_ms:.1f}ms exceeds 100ms target[/yellow]")
+        elif response["status"] in ("throttled", "rejected"):
+            console.print(
+                f"[yellow]⚠️  Message {response['status']}: {response.get('message')} "
+                f"(retry after {response.get('retry_after', 0):.1f}s)[/yellow]"
+            )
+            sys.exit(1)
         else:
             console.print(f"[red]✗ Failed: {response.get('message', 'Unknown error')}[/red]")
 
@@ -63,7 +73,7 @@ def publish(message: str, target: str, priority: str, tag: list[str]) -> None:
 
 @pubsub.command()
 @click.option("--target", required=True, help="Target session:window")
-@click.option("--lines", type=int, default=50, help="Lines to read")
+@click.option("--lines", type=int, default=50, help="Lines to read (messages per page when filtering)")
 @click.option("--json", "json_output", is_flag=True, help="JSON output")
 @click.option(
     "--filter-priority",
@@ -73,13 +83,14 @@ def publish(message: str, target: str, priority: str, tag: list[str]) -> None:
 )
 @click.option(
     "--filter-category",
-    type=click.Choice(["health", "recovery", "status", "task", "escalation"]),
+    type=click.Choice(list(MESSAGE_CATEGORIES)),
     multiple=True,
     help="Filter by category",
 )
 @click.option("--filter-tag", multiple=True, help="Filter by tag")
 @click.option("--filter-source", help="Filter by source type (daemon, pm, agent)")
 @click.option("--unacked-only", is_flag=True, help="Show only unacknowledged messages")
+@click.option("--before", type=int, help="Pagination cursor from a previous filtered read")
 def read(
     target: str,
     lines: int,
@@ -89,8 +100,30 @@ def read(
     filter_tag: list[str],
     filter_source: str,
     unacked_only: bool,
+    before: int | None,
 ) -> None:
-    """Read from target via daemon with optional filtering."""
+    """Read from target via daemon with optional filtering.
+
+    Filtered reads query the daemon's message store instead of the pane.
+    """
+    if filter_priority or filter_category or filter_tag or filter_source or unacked_only:
+        try:
+            _print_message_page(
+                f"📖 Messages for {target}",
+                json_output,
+                limit=lines,
+                before_seq=before,
+                target=target,
+                priorities=filter_priority,
+                categories=filter_category,
+                tags=filter_tag,
+                source=filter_source,
+                unacked_only=unacked_only,
+            )
+        except Exception as e:
+            console.print(f"[red]✗ Error: {e}[/red]")
+            sys.exit(1)
+        return
 
     async def _read():
         client = DaemonClient()
@@ -104,21 +137,12 @@ def read(
         if response["status"] == "success":
             content = response["content"]
 
-            # Apply filters if content contains structured messages
-            if filter_priority or filter_category or filter_tag or filter_source or unacked_only:
-                filtered_content = _apply_message_filters(
-                    content, filter_priority, filter_category, filter_tag, filter_source, unacked_only
-                )
-                content = filtered_content
-
             if json_output:
                 console.print(
                     json.dumps({"status": "success", "content": content, "read_time_ms": read_time_ms}, indent=2)
                 )
             else:
                 console.print(f"[bold]📖 Reading from {target} ({read_time_ms:.1f}ms)[/bold]")
-                if filter_priority or filter_category or filter_tag or filter_source or unacked_only:
-                    console.print("[dim]Filters applied[/dim]")
                 console.print(content)
         else:
             console.print(f"[red]✗ Failed: {response.get('message', 'Unknown error')}[/red]")
@@ -186,9 +210,18 @@ def stats() -> None:
             console.print("\n[bold]⏱️  Delivery Times (ms)[/bold]")
             console.print(f"Min: {times['min']:.1f}ms")
             console.print(f"Avg: {times['avg']:.1f}ms")
+            console.print(f"P50: {times.get('p50', 0):.1f}ms")
             console.print(f"P95: {times['p95']:.1f}ms")
+            console.print(f"P99: {times.get('p99', 0):.1f}ms")
             console.print(f"Max: {times['max']:.1f}ms")
 
+            admission = response.get("admission")
+            if admission:
+                console.print("\n[bold]🚦 Admission Control[/bold]")
+                console.print(f"Queue Depth: {admission['queue_depth']}/{admission['max_queue_depth']}")
+                console.print(f"Throttled: {admission['throttled']}")
+                console.print(f"Rejected: {admission['rejected']}")
+
             target = metrics["target_performance"]
             meeting = metrics["meeting_target"]
             console.print("\n[bold]🎯 Target Performance[/bold]")
@@ -207,94 +240,65 @@ def stats() -> None:
         sys.exit(1)
 
 
-def _apply_message_filters(
-    content: str,
-    filter_priority: list[str],
-    filter_category: list[str],
-    filter_tag: list[str],
-    filter_source: str,
-    unacked_only: bool,
-) -> str:
-    """Apply filters to message content.
+def _print_message_page(title: str, json_output: bool, limit: int, before_seq: int | None, **filters) -> None:
+    """Query the message store and print one page of results.
 
     Args:
-        content: Raw message content
-        filter_priority: Priority levels to include
-        filter_category: Categories to include
-        filter_tag: Tags to include
-        filter_source: Source type to include
-        unacked_only: Only show unacknowledged messages
-
-    Returns:
-        Filtered content
+        title: Heading for pretty output
+        json_output: Print JSON instead of formatted messages
+        limit: Page size
+        before_seq: Pagination cursor
+        **filters: MessageStore.query filters
     """
-    # Parse lines and try to identify structured messages
-    lines = content.split("\n")
-    filtered_lines = []
+    store = MessageStore(default_store_path())
+    try:
+        start_time = time.perf_counter()
+        messages = store.query(limit=limit, before_seq=before_seq, **filters)
+        query_time_ms = (time.perf_counter() - start_time) * 1000
+    finally:
+        store.close()
 
-    for line in lines:
-        # Try to parse as JSON structured message
-        try:
-            if line.strip().startswith("{"):
-                msg = json.loads(line)
-
-                # Check if it's a structured message
-                if all(key in msg for key in ["id", "timestamp", "source", "message", "metadata"]):
-                    # Apply filters
-                    if filter_priority and msg["message"]["priority"] not in filter_priority:
-                        continue
-                    if filter_category and msg["message"]["category"] not in filter_category:
-                        continue
-                    if filter_source and msg["source"]["type"] != filter_source:
-                        continue
-                    if filter_tag:
-                        msg_tags = msg["metadata"].get("tags", [])
-                        if not any(tag in msg_tags for tag in filter_tag):
-                            continue
-                    if unacked_only and not msg["metadata"].get("requires_ack", False):
-                        continue
-
-                    # Format structured message for display
-                    formatted = _format_structured_message(msg)
-                    filtered_lines.append(formatted)
-                else:
-                    # Not a structured message, include if no filters
-                    if not (filter_priority or filter_category or filter_tag or filter_source or unacked_only):
-                        filtered_lines.append(line)
-            else:
-                # Regular line, include if no filters
-                if not (filter_priority or filter_category or filter_tag or filter_source or unacked_only):
-                    filtered_lines.append(line)
-        except json.JSONDecodeError:
-            # Not JSON, include if no filters
-            if not (filter_priority or filter_category or filter_tag or filter_source or unacked_only):
-                filtered_lines.append(line)
+    next_cursor = messages[-1]["seq"] if len(messages) == limit else None
+
+    if json_output:
+        console.print(
+            json.dumps(
+                {"status": "success", "messages": messages, "next_cursor": next_cursor, "query_time_ms": query_time_ms},
+                indent=2,
+            )
+        )
+        return
 
-    return "\n".join(filtered_lines)
+    console.print(f"[bold]{title} ({len(messages)} shown, {query_time_ms:.1f}ms)[/bold]")
+    for message in messages:
+        console.print(_format_stored_message(message))
+    if next_cursor is not None:
+        console.print(f"[dim]More: --before {next_cursor}[/dim]")
 
 
-def _format_structured_message(msg: dict) -> str:
-    """Format structured message for display.
+def _format_stored_message(message: dict) -> str:
+    """Format a stored message for display.
 
     Args:
-        msg: Structured message dict
+        message: Row from MessageStore.query
 
     Returns:
         Formatted string
     """
-    priority = msg["message"]["priority"]
-    category = msg["message"]["category"]
-    subject = msg["message"]["content"]["subject"]
-    body = msg["message"]["content"]["body"]
-    source = msg["source"]["identifier"]
-    timestamp = msg["timestamp"]
+    priority = message["priority"]
+    category = message["category"] or "uncategorized"
+    subject = message["subject"] or message["body"]
+    ack = " | ✓ acked" if message["acked_at"] else (" | ack required" if message["requires_ack"] else "")
 
     # Priority indicators
     priority_icons = {"critical": "🚨", "high": "⚠️", "normal": "📨", "low": "💬"}
 
     icon = priority_icons.get(priority, "📨")
 
-    return f"{icon} [{priority.upper()}] {subject}\n   From: {source} | Category: {category}\n   {body}\n   Time: {timestamp}"
+    formatted = f"{icon} [{priority.upper()}] {subject}\n   From: {message['source']} | Category: {category}{ack}"
+    if message["subject"]:
+        formatted += f"\n   {message['body']}"
+    return f"{formatted}\n   Time: {message['timestamp']} | Seq: {message['seq']}"
 
 
 @pubsub.command()
@@ -304,44 +308,88 @@ def _format_structured_message(msg: dict) -> str:
 )
 @click.option(
     "--category",
-    type=click.Choice(["health", "recovery", "status", "task", "escalation"]),
+    type=click.Choice(list(MESSAGE_CATEGORIES)),
     multiple=True,
     help="Filter by category",
 )
 @click.option("--source", help="Filter by source (daemon, pm, agent)")
+@click.option("--tag", multiple=True, help="Filter by tag")
+@click.option("--search", help="Full-text search of subject and body")
 @click.option("--since", type=int, default=30, help="Minutes to look back")
 @click.option("--unacked", is_flag=True, help="Only unacknowledged messages")
+@click.option("--limit", type=int, default=50, help="Messages per page")
+@click.option("--before", type=int, help="Pagination cursor from a previous query")
 @click.option("--format", "output_format", type=click.Choice(["pretty", "json", "summary"]), default="pretty")
 def query(
-    session: str, priority: list[str], category: list[str], source: str, since: int, unacked: bool, output_format: str
+    session: str,
+    priority: list[str],
+    category: list[str],
+    source: str,
+    tag: list[str],
+    search: str,
+    since: int,
+    unacked: bool,
+    limit: int,
+    before: int | None,
+    output_format: str,
 ) -> None:
     """Query structured messages with advanced filtering."""
-
-    async def _query():
-        # For now, simulate querying message store
-        # In production, this would query the actual message store
-        console.print(f"[bold]🔍 Querying messages for session: {session}[/bold]")
-        console.print(f"Filters: priority={priority or 'all'}, category={category or 'all'}, source={source or 'all'}")
-        console.print(f"Time range: last {since} minutes")
-
-        if unacked:
-            console.print("[yellow]Showing only unacknowledged messages[/yellow]")
-
-        # Example output
-        if output_format == "summary":
-            console.print("\n[bold]Summary:[/bold]")
-            console.print("• Total messages: 42")
-            console.print("• Critical: 2")
-            console.print("• High priority: 5")
-            console.print("• Unacknowledged: 3")
-            console.print("• Categories: health (15), status (20), recovery (7)")
+    filters = {
+        "session": session,
+        "priorities": priority,
+        "categories": category,
+        "source": source,
+        "tags": tag,
+        "text": search,
+        "since": datetime.now() - timedelta(minutes=since),
+        "unacked_only": unacked,
+    }
 
     try:
-        asyncio.run(_query())
+        if output_format != "summary":
+            _print_message_page(
+                f"🔍 Messages for session {session} (last {since} minutes)",
+                output_format == "json",
+                limit=limit,
+                before_seq=before,
+                **filters,
+            )
+            return
+
+        store = MessageStore(default_store_path())
+        try:
+            summary = store.summarize(**filters)
+        finally:
+            store.close()
+
+        console.print(f"[bold]🔍 Summary for session {session} (last {since} minutes)[/bold]")
+        console.print(f"• Total messages: {summary['total']}")
+        for level, count in summary["by_priority"].items():
+            console.print(f"• {level.capitalize()}: {count}")
+        console.print(f"• Unacknowledged: {summary['unacknowledged']}")
+        if summary["by_category"]:
+            categories = ", ".join(f"{name} ({count})" for name, count in summary["by_category"].items())
+            console.print(f"• Categories: {categories}")
     except Exception as e:
         console.print(f"[red]✗ Error: {e}[/red]")
         sys.exit(1)
 
 
+@pubsub.command()
+@click.argument("message_id")
+def ack(message_id: str) -> None:
+    """Acknowledge a message by its daemon or structured message id."""
+    store = MessageStore(default_store_path())
+    try:
+        acknowledged = store.acknowledge(message_id)
+    finally:
+        store.close()
+
+    if acknowledged:
+        console.print(f"[green]✓ Acknowledged {message_id}[/green]")
+    else:
+        console.print(f"[yellow]No unacknowledged message with id {message_id}[/yellow]")
+
+
 if __name__ == "__main__":
     pubsub()
@@ -44,7 +44,8 @@ def server():
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 @click.option("--test", is_flag=True, help="Run in test mode with sample output")
 @click.option("--force", is_flag=True, help="Force start even if another instance exists")
-def start(verbose, test, force):
+@click.option("--profile-startup", is_flag=True, help="Report server import timings and exit")
+def start(verbose, test, force, profile_startup):
     """Start MCP server for Claude Code CLI integration.
 
     This command is registered with Claude Code CLI and will be
@@ -73,6 +74,10 @@ def start(verbose, test, force):
         click.echo('{"status": "ready", "tools": ["list", "spawn", "status"], "mode": "claude_code_cli"}')
         return
 
+    if profile_startup:
+        _report_startup_profile()
+        return
+
     # Clean up any stale files first
     check_and_cleanup_stale()
 
@@ -105,6 +110,18 @@ def start(verbose, test, force):
             logger.info("MCP server singleton released")
 
 
+def _report_startup_profile() -> None:
+    """Print how long the server takes to import, and where the time goes."""
+    from tmux_orchestrator.mcp.startup_profile import profile_startup
+
+    profile = profile_startup()
+    console.print(f"[bold]MCP server import: {profile['total_seconds'] * 1000:.0f}ms[/bold]")
+    console.print(f"tmux-orchestrator modules: {profile['package_seconds'] * 1000:.0f}ms (excluding dependencies)\n")
+    console.print(f"{'cumulative':>12} {'self':>10}  module")
+    for entry in profile["imports"]:
+        console.print(f"{entry['cumulative_ms']:>10.1f}ms {entry['self_ms']:>8.1f}ms  {entry['module']}")
+
+
 @server.command()
 def status():
     """Check MCP server registration status with Claude."""
@@ -1,5 +1,7 @@
 """Agent operations business logic."""
 
+from .get_agent_status import get_agent_status
+from .list_agents import list_agents
 from .restart_agent import restart_agent
 
-__all__ = ["restart_agent"]
+__all__ = ["get_agent_status", "list_agents", "restart_agent"]
@@ -0,0 +1,42 @@
+"""Business logic for getting a single agent's status."""
+
+from datetime import datetime
+from typing import Any
+
+from tmux_orchestrator.core.team_operations.get_team_status import _determine_window_status
+from tmux_orchestrator.utils.tmux import TMUXManager
+
+
+def get_agent_status(tmux: TMUXManager, target: str, lines: int = 50) -> dict[str, Any] | None:
+    """Get the status of the agent in a window.
+
+    Args:
+        tmux: TMUXManager instance
+        target: Target in format session:window
+        lines: Pane lines to inspect
+
+    Returns:
+        Dictionary with agent status or None if the window doesn't exist
+    """
+    session, _, window = target.partition(":")
+    if not session or not window or not tmux.has_session(session):
+        return None
+
+    window_info = next((w for w in tmux.list_windows(session) if str(w["index"]) == window), None)
+    if window_info is None:
+        return None
+
+    pane_content: str = tmux.capture_pane(target, lines)
+    status, last_activity, health_score = _determine_window_status(tmux, pane_content)
+
+    return {
+        "target": target,
+        "session": session,
+        "window": window,
+        "window_name": window_info.get("name", ""),
+        "status": status,
+        "last_activity": last_activity,
+        "health_score": health_score,
+        "pane_lines": len(pane_content.splitlines()),
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+    }
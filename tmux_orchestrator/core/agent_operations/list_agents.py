@@ -0,0 +1,40 @@
+"""Business logic for listing agents across sessions."""
+
+from typing import Any
+
+from tmux_orchestrator.utils.tmux import TMUXManager
+
+
+def list_agents(tmux: TMUXManager, session: str | None = None, include_idle: bool = True) -> list[dict[str, Any]]:
+    """List agent windows with their current status.
+
+    Args:
+        tmux: TMUXManager instance
+        session: Only list agents in this session
+        include_idle: Include agents that are waiting for work
+
+    Returns:
+        List of agent dictionaries with target, session, window, type and status
+    """
+    agents: list[dict[str, Any]] = []
+
+    for agent in tmux.list_agents():
+        agent_session = str(agent["session"])
+        if session and agent_session != session:
+            continue
+
+        status = str(agent.get("status", "unknown")).capitalize()
+        if not include_idle and status == "Idle":
+            continue
+
+        agents.append(
+            {
+                "target": f"{agent_session}:{agent['window']}",
+                "session": agent_session,
+                "window": str(agent["window"]),
+                "type": agent.get("type", "Unknown"),
+                "status": status,
+            }
+        )
+
+    return agents
@@ -0,0 +1,208 @@
+"""Parallel fan-out delivery for broadcasts.
+
+Recipients are resolved from a single topology snapshot (one ``tmux
+list-windows -a`` call) and filtered by session, role and window in memory.
+Deliveries then run concurrently, bounded by ``max_parallel``, so a broadcast
+takes roughly as long as its slowest single delivery rather than the sum.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from tmux_orchestrator.utils.tmux import TMUXManager
+
+
+def agent_role(window_name: str) -> str:
+    """Determine an agent's role from its window name.
+
+    Args:
+        window_name: Window name
+
+    Returns:
+        Role string ("unknown" for non-agent windows)
+    """
+    window_name_lower = window_name.lower()
+
+    if "pm" in window_name_lower:
+        return "project_manager"
+    elif "qa" in window_name_lower:
+        return "qa_engineer"
+    elif "frontend" in window_name_lower:
+        return "frontend_developer"
+    elif "backend" in window_name_lower:
+        return "backend_developer"
+    elif "devops" in window_name_lower:
+        return "devops_engineer"
+    elif "reviewer" in window_name_lower:
+        return "code_reviewer"
+    elif "researcher" in window_name_lower:
+        return "researcher"
+    elif "docs" in window_name_lower:
+        return "documentation_writer"
+    elif "claude" in window_name_lower:
+        return "developer"
+    else:
+        return "unknown"
+
+
+@dataclass(frozen=True)
+class Recipient:
+    """A window a broadcast is delivered to."""
+
+    session: str
+    window_index: str
+    window_name: str
+
+    @property
+    def target(self) -> str:
+        return f"{self.session}:{self.window_index}"
+
+    @property
+    def role(self) -> str:
+        return agent_role(self.window_name)
+
+
+@dataclass
+class DeliveryResult:
+    """Outcome of delivering to one recipient."""
+
+    recipient: Recipient
+    success: bool
+    latency: float
+    error: Optional[str] = None
+
+
+@dataclass
+class BroadcastResult:
+    """Outcome of a broadcast, in recipient order."""
+
+    results: list[DeliveryResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def success_count(self) -> int:
+        return sum(1 for result in self.results if result.success)
+
+    @property
+    def failed(self) -> list[DeliveryResult]:
+        return [result for result in self.results if not result.success]
+
+    def by_target(self) -> dict[str, bool]:
+        """Map each target to whether delivery succeeded."""
+        return {result.recipient.target: result.success for result in self.results}
+
+
+class TopologySnapshot:
+    """Windows across sessions, captured once and filtered in memory."""
+
+    def __init__(self, windows: list[dict[str, Any]]) -> None:
+        """Initialize from window dicts with session, index and name keys."""
+        self.recipients = [
+            Recipient(session=str(w["session"]), window_index=str(w["index"]), window_name=str(w.get("name", "")))
+            for w in windows
+        ]
+
+    @classmethod
+    def capture(cls, tmux: TMUXManager) -> "TopologySnapshot":
+        """Capture every window in every session with one tmux call."""
+        return cls(tmux.list_all_windows())
+
+    @property
+    def sessions(self) -> list[str]:
+        """Session names, in tmux order."""
+        return list(dict.fromkeys(recipient.session for recipient in self.recipients))
+
+    def agents(
+        self,
+        sessions: Optional[list[str]] = None,
+        roles: Optional[set[str]] = None,
+        exclude_roles: Optional[set[str]] = None,
+        exclude_windows: Optional[set[str]] = None,
+    ) -> list[Recipient]:
+        """Select agent windows.
+
+        Args:
+            sessions: Only these sessions (default all)
+            roles: Only these roles (see agent_role)
+            exclude_roles: Skip these roles
+            exclude_windows: Skip windows matching these names or indices
+
+        Returns:
+            Matching recipients in tmux order
+        """
+        excluded = {w.lower() for w in exclude_windows or ()}
+        selected = []
+        for recipient in self.recipients:
+            role = recipient.role
+            if role == "unknown":
+                continue
+            if sessions is not None and recipient.session not in sessions:
+                continue
+            if (roles and role not in roles) or (exclude_roles and role in exclude_roles):
+                continue
+            if recipient.window_name.lower() in excluded or recipient.window_index in excluded:
+                continue
+            selected.append(recipient)
+        return selected
+
+
+class BroadcastEngine:
+    """Delivers one message to many recipients concurrently."""
+
+    def __init__(
+        self,
+        tmux: TMUXManager,
+        max_parallel: int = 8,
+        send: Optional[Callable[[str, str], tuple[bool, str]]] = None,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            tmux: TMUXManager used for delivery
+            max_parallel: Maximum deliveries in flight at once
+            send: Optional delivery function returning (success, detail), used instead of tmux.send_message
+        """
+        self.tmux = tmux
+        self.max_parallel = max(1, max_parallel)
+        self._send = send
+        self._logger = logging.getLogger(__name__)
+
+    def _deliver_one(self, recipient: Recipient, message: str) -> DeliveryResult:
+        start = time.perf_counter()
+        try:
+            if self._send is not None:
+                success, detail = self._send(recipient.target, message)
+                error = None if success else detail
+            else:
+                success = bool(self.tmux.send_message(recipient.target, message))
+                error = None if success else "Failed to send message"
+        except Exception as e:
+            success, error = False, str(e)
+        return DeliveryResult(recipient, success, time.perf_counter() - start, error)
+
+    def deliver(self, recipients: list[Recipient], message: str) -> BroadcastResult:
+        """Send a message to every recipient.
+
+        Args:
+            recipients: Recipients to deliver to
+            message: Message text
+
+        Returns:
+            Per-recipient results (in recipient order) and total elapsed time
+        """
+        start = time.perf_counter()
+        if len(recipients) <= 1 or self.max_parallel == 1:
+            results = [self._deliver_one(recipient, message) for recipient in recipients]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_parallel, len(recipients))) as executor:
+                results = list(executor.map(lambda r: self._deliver_one(r, message), recipients))
+
+        result = BroadcastResult(results, time.perf_counter() - start)
+        self._logger.debug(
+            f"Broadcast to {len(recipients)} recipients: {result.success_count} delivered in {result.elapsed:.3f}s"
+        )
+        return result
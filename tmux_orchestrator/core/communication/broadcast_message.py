@@ -2,6 +2,7 @@
 
 from typing import Optional
 
+from tmux_orchestrator.core.communication.broadcast_engine import BroadcastEngine, Recipient
 from tmux_orchestrator.core.communication.send_message import send_message
 from tmux_orchestrator.utils.tmux import TMUXManager
 
@@ -70,19 +71,13 @@ def broadcast_message(
         if not target_windows:
             return False, f"No target windows found matching criteria in session '{session}'"
 
-        # Send message to each target window
-        success_count = 0
-        failed_targets = []
+        # Send message to all target windows concurrently
+        recipients = [Recipient(session, str(w.get("index", "")), w.get("name", "")) for w in target_windows]
+        engine = BroadcastEngine(tmux, send=lambda target, text: send_message(tmux, target, text))
+        broadcast = engine.deliver(recipients, message)
 
-        for window in target_windows:
-            window_index = window.get("index", "")
-            target = f"{session}:{window_index}"
-
-            success, error_msg = send_message(tmux, target, message)
-            if success:
-                success_count += 1
-            else:
-                failed_targets.append(f"{target}: {error_msg}")
+        success_count = broadcast.success_count
+        failed_targets = [f"{result.recipient.target}: {result.error}" for result in broadcast.failed]
 
         # Generate summary
         total_targets = len(target_windows)
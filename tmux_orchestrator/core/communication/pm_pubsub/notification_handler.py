@@ -2,25 +2,47 @@
 
 import json
 import subprocess
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
+from tmux_orchestrator.core.messaging.message_log import MessageLog
+from tmux_orchestrator.core.messaging.message_store import MessageStore, default_store_path, parse_structured
+from tmux_orchestrator.core.messaging_daemon import DaemonClient
 from tmux_orchestrator.utils.tmux import TMUXManager
 
 
 class NotificationHandler:
     """Handles PM notification processing and daemon communication."""
 
-    def __init__(self, session: str = "pm:0"):
+    def __init__(self, session: str = "pm:0", message_log: MessageLog | None = None):
         """Initialize notification handler.
 
         Args:
             session: PM session identifier (default: pm:0)
+            message_log: Daemon message log to read (opened on first use if None)
         """
         self.session = session
         self.tmux = TMUXManager()
         self.message_store = Path.home() / ".tmux_orchestrator" / "messages"
+        self._message_log = message_log
+
+    def _get_message_log(self) -> MessageLog | None:
+        """Get the daemon's message log, opening it once it exists.
+
+        Returns:
+            MessageLog refreshed with the daemon's latest appends, or None if
+            the daemon has not written a log yet
+        """
+        if self._message_log is None:
+            log_dir = self.message_store / "log"
+            if not log_dir.exists():
+                return None
+            self._message_log = MessageLog(log_dir)
+        else:
+            self._message_log.refresh()
+        return self._message_log
 
     def get_daemon_notifications(self, since_minutes: int = 30) -> list[dict[str, Any]]:
         """Get daemon notifications from the last N minutes.
@@ -33,25 +55,38 @@ class NotificationHandler:
         """
         try:
             since_time = datetime.now() - timedelta(minutes=since_minutes)
-            since_iso = since_time.isoformat()
-
-            # Use tmux-orc read to get messages with daemon filter
-            result = subprocess.run(
-                ["tmux-orc", "read", "--session", self.session, "--since", since_iso, "--filter", "daemon", "--json"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            scope = {"target": self.session} if ":" in self.session else {"session": self.session}
 
-            if result.stdout:
-                data = json.loads(result.stdout)
-                return self._parse_daemon_messages(data.get("stored_messages", []))
+            store = MessageStore(default_store_path())
+            try:
+                messages = store.query(limit=1000, since=since_time, **scope)
+            finally:
+                store.close()
+            return self._parse_daemon_messages(messages)
 
-        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
+        except Exception as e:
             print(f"Error retrieving daemon notifications: {e}")
 
         return []
 
+    async def stream_daemon_notifications(
+        self, since_seq: Optional[int] = None, reconnect_delay: float = 1.0
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream notifications for this session as the daemon logs them.
+
+        Args:
+            since_seq: Replay notifications after this sequence number (live only if None)
+            reconnect_delay: Seconds to wait before reconnecting to the daemon
+
+        Yields:
+            Parsed notifications (with ``seq`` for resuming)
+        """
+        client = DaemonClient()
+        async for record in client.subscribe(
+            targets=[self.session], since_seq=since_seq, reconnect_delay=reconnect_delay
+        ):
+            yield self._parse_daemon_messages([record])[0]
+
     def get_management_broadcasts(self, priority: str = "high") -> list[dict[str, Any]]:
         """Get management group broadcasts of specified priority.
 
@@ -62,14 +97,12 @@ class NotificationHandler:
             List of management broadcast messages
         """
         try:
-            # Read management group messages
-            session_file = self.message_store / f"{self.session.replace(':', '_')}.json"
-
-            if not session_file.exists():
+            # Read management group messages from the daemon's message log
+            message_log = self._get_message_log()
+            if message_log is None:
                 return []
 
-            with open(session_file) as f:
-                messages = json.load(f)
+            messages = message_log.read_target(self.session, limit=1000)
 
             # Filter for management messages with specified priority
             filtered_messages = []
@@ -201,11 +234,14 @@ class NotificationHandler:
         parsed = []
         for msg in messages:
             try:
+                structured = parse_structured(msg.get("content", ""))
+                category = msg.get("category") or (structured and structured["message"].get("category"))
                 parsed_msg = {
                     "id": msg.get("id", "unknown"),
+                    "seq": msg.get("seq"),
                     "timestamp": msg.get("timestamp", "unknown"),
                     "priority": msg.get("priority", "normal"),
-                    "category": msg.get("category", "status"),
+                    "category": category or "status",
                     "content": msg.get("content", ""),
                     "tags": msg.get("tags", []),
                     "source": "daemon",
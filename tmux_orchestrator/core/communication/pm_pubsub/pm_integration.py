@@ -1,6 +1,5 @@
 """PM-specific pubsub integration operations."""
 
-import asyncio
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -47,40 +46,26 @@ class PMPubsubIntegration:
         return self.notification_handler.monitor_pubsub_health()
 
     async def start_notification_monitoring(self, check_interval: int = 30):
-        """Start async monitoring loop for notifications.
+        """Handle notifications as the daemon streams them.
 
         Args:
-            check_interval: How often to check for notifications (seconds)
+            check_interval: Seconds to wait before reconnecting if the daemon is unavailable
         """
-        print(f"PM {self.session} starting notification monitoring (every {check_interval}s)")
+        print(f"PM {self.session} subscribing to daemon notifications")
 
-        while True:
+        async for notification in self.notification_handler.stream_daemon_notifications(reconnect_delay=check_interval):
             try:
-                # Check for high-priority notifications
-                notifications = self.get_daemon_notifications(since_minutes=5)
-                high_priority_notifications = [
-                    n
-                    for n in notifications
-                    if n.get("priority") in [MessagePriority.CRITICAL.value, MessagePriority.HIGH.value]
-                ]
-
-                if high_priority_notifications:
-                    print(f"PM {self.session} received {len(high_priority_notifications)} high-priority notifications")
-                    for notification in high_priority_notifications:
-                        await self._handle_high_priority_notification(notification)
-
-                # Check for recovery actions
-                recovery_actions = self.check_for_recovery_actions()
-                if recovery_actions:
-                    print(f"PM {self.session} found {len(recovery_actions)} recovery actions")
-                    for action in recovery_actions:
-                        await self._handle_recovery_action(action)
+                if notification.get("priority") in [MessagePriority.CRITICAL.value, MessagePriority.HIGH.value]:
+                    print(f"PM {self.session} received high-priority notification {notification['id']}")
+                    await self._handle_high_priority_notification(notification)
+
+                for action in self.notification_handler._parse_recovery_messages([notification]):
+                    print(f"PM {self.session} found recovery action {action['id']}")
+                    await self._handle_recovery_action(action)
 
             except Exception as e:
                 print(f"Error in notification monitoring: {e}")
 
-            await asyncio.sleep(check_interval)
-
     async def _handle_high_priority_notification(self, notification: dict[str, Any]):
         """Handle a high-priority notification.
 
@@ -13,7 +13,12 @@ class Config:
     DEFAULT_CONFIG = {
         "project": {"name": None, "path": None},
         "team": {"pm": {"enabled": True, "window": 2}, "agents": []},
-        "monitoring": {"idle_check_interval": 10, "notification_cooldown": 300},
+        "monitoring": {
+            "idle_check_interval": 10,
+            "notification_cooldown": 300,
+            "event_driven_idle": False,
+            "silence_threshold": 30,
+        },
         "orchestrator": {"auto_commit_interval": 1800, "health_check_interval": 60},
         "server": {"host": "127.0.0.1", "port": 8000},
     }
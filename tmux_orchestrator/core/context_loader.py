@@ -0,0 +1,78 @@
+"""Loading of the standardized role contexts shipped with the package."""
+
+import importlib.resources as resources
+from pathlib import Path
+from typing import Any
+
+try:
+    # Try to use package data first (using importlib for modern Python)
+    try:
+        # Python 3.9+ with files() API
+        contexts_ref = resources.files("tmux_orchestrator").joinpath("data/contexts")
+        CONTEXTS_DIR = Path(str(contexts_ref))
+    except AttributeError:
+        # Python 3.7-3.8 fallback
+        with resources.path("tmux_orchestrator.data", "contexts") as p:
+            CONTEXTS_DIR = Path(p)
+except Exception:
+    # Fallback for development
+    CONTEXTS_DIR = Path(__file__).parent.parent / "data" / "contexts"
+
+
+def get_available_contexts() -> dict[str, Path]:
+    """Get list of available context files."""
+    if not CONTEXTS_DIR.exists():
+        return {}
+
+    contexts = {}
+    for file in CONTEXTS_DIR.glob("*.md"):
+        role = file.stem
+        contexts[role] = file
+
+    return contexts
+
+
+def read_context(role: str) -> str | None:
+    """Read a role's context.
+
+    Args:
+        role: Context name (e.g. "orc", "pm")
+
+    Returns:
+        Context markdown, or None if there is no context for the role
+
+    Raises:
+        OSError: If the context file exists but can't be read
+    """
+    path = get_available_contexts().get(role)
+    if path is None:
+        return None
+    return path.read_text()
+
+
+def load_context(role: str) -> str:
+    """Load context from file."""
+    try:
+        content = read_context(role)
+    except Exception as e:
+        return f"Error loading context: {e}"
+
+    if content is None:
+        return f"Context for role '{role}' not found"
+    return content
+
+
+def list_contexts() -> list[dict[str, Any]]:
+    """List available contexts with a one-line description of each.
+
+    Returns:
+        List of dictionaries with role, description and file_path
+    """
+    contexts: list[dict[str, Any]] = []
+    for role, path in get_available_contexts().items():
+        # Read first meaningful line as description
+        lines = path.read_text().strip().split("\n")
+        description = next((line.strip() for line in lines if line.strip() and not line.startswith("#")), "")
+        contexts.append({"role": role, "description": description, "file_path": str(path)})
+
+    return contexts
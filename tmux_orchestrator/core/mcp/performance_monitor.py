@@ -5,16 +5,24 @@ Real-time performance tracking and analysis during comprehensive testing
 """
 
 import asyncio
+import functools
 import json
 import logging
+import os
 import sys
+import tempfile
 import time
+from collections.abc import Awaitable, Callable
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import psutil
 
+from tmux_orchestrator.utils.quantile_sketch import QuantileSketch
+
+ToolFunc = Callable[..., Awaitable[Dict[str, Any]]]
+
 
 @dataclass
 class MCPPerformanceMetrics:
@@ -34,11 +42,33 @@ class MCPPerformanceMetrics:
 class MCPPerformanceMonitor:
     """Real-time MCP server performance monitoring during QA testing"""
 
-    def __init__(self, log_path: Optional[Path] = None):
+    def __init__(
+        self,
+        log_path: Optional[Path] = None,
+        in_process: bool = False,
+        summary_path: Path | None = None,
+        summary_interval: float = 10.0,
+    ):
+        """Initialize the monitor.
+
+        Args:
+            log_path: Performance log file
+            in_process: Monitor the current process (the MCP server itself) instead of
+                scanning for server processes
+            summary_path: Rolling per-tool summary written by instrumented tools
+            summary_interval: Minimum seconds between summary writes
+        """
         self.log_path = log_path or Path(".tmux_orchestrator/logs/mcp_performance.log")
+        self.in_process = in_process
+        self.summary_path = summary_path or self.log_path.parent / "mcp_tool_summary.json"
+        self.summary_interval = summary_interval
+        self._summary_written_at = 0.0
         self.metrics_history: List[MCPPerformanceMetrics] = []
         self.start_time = time.time()
         self.tool_timings: Dict[str, List[float]] = {}
+        self.tool_sketches: Dict[str, QuantileSketch] = {}
+        self.payload_sketches: Dict[str, QuantileSketch] = {}
+        self.tool_errors: Dict[str, int] = {}
         self.error_log: List[Dict] = []
 
         # Performance thresholds for QA validation
@@ -53,7 +83,7 @@ class MCPPerformanceMonitor:
 
     def setup_logging(self):
         """Setup performance logging"""
-        self.log_path.parent.mkdir(exist_ok=True)
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
         logging.basicConfig(
             level=logging.INFO,
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -63,6 +93,9 @@ class MCPPerformanceMonitor:
 
     async def get_mcp_processes(self) -> List[psutil.Process]:
         """Find all MCP server processes"""
+        if self.in_process:
+            return [psutil.Process()]
+
         mcp_processes = []
         for proc in psutil.process_iter(["pid", "name", "cmdline"]):
             try:
@@ -99,7 +132,7 @@ class MCPPerformanceMonitor:
             avg_response_time = sum(recent_timings) / len(recent_timings) if recent_timings else 0.0
 
             # Calculate success rate
-            total_tests = sum(len(times) for times in self.tool_timings.values())
+            total_tests = sum(sketch.count for sketch in self.tool_sketches.values())
             success_rate = max(0, (total_tests - len(self.error_log)) / total_tests) if total_tests > 0 else 1.0
 
             metrics = MCPPerformanceMetrics(
@@ -136,18 +169,27 @@ class MCPPerformanceMonitor:
                 concurrent_requests=0,
             )
 
-    def record_tool_timing(self, tool_name: str, response_time: float, success: bool = True):
+    def record_tool_timing(
+        self, tool_name: str, response_time: float, success: bool = True, payload_bytes: int | None = None
+    ):
         """Record timing for a specific tool call"""
         if tool_name not in self.tool_timings:
             self.tool_timings[tool_name] = []
+            self.tool_sketches[tool_name] = QuantileSketch()
+            self.payload_sketches[tool_name] = QuantileSketch()
+            self.tool_errors[tool_name] = 0
 
         self.tool_timings[tool_name].append(response_time)
+        self.tool_sketches[tool_name].add(response_time)
+        if payload_bytes is not None:
+            self.payload_sketches[tool_name].add(payload_bytes)
 
         # Keep only last 100 timings per tool
         if len(self.tool_timings[tool_name]) > 100:
             self.tool_timings[tool_name] = self.tool_timings[tool_name][-100:]
 
         if not success:
+            self.tool_errors[tool_name] += 1
             self.error_log.append(
                 {"timestamp": time.time(), "tool": tool_name, "response_time": response_time, "error": True}
             )
@@ -156,6 +198,77 @@ class MCPPerformanceMonitor:
         if response_time > self.thresholds["max_response_time"]:
             self.logger.warning(f"Tool {tool_name} exceeded response time threshold: {response_time:.2f}s")
 
+    def instrument(self, func: ToolFunc) -> ToolFunc:
+        """Decorate a tool to record its latency, success and response size."""
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            start = time.perf_counter()
+            success = False
+            payload_bytes = None
+            try:
+                response = await func(*args, **kwargs)
+                success = not isinstance(response, dict) or response.get("success", True) is not False
+                payload_bytes = len(json.dumps(response, default=str))
+                return response
+            finally:
+                self.record_tool_timing(func.__name__, time.perf_counter() - start, success, payload_bytes)
+                self.maybe_write_summary()
+
+        return wrapper
+
+    def get_tool_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Get call counts, error rates, latency and response size percentiles per tool."""
+        summary = {}
+        for tool, sketch in self.tool_sketches.items():
+            if not sketch.count:
+                continue
+            payload = self.payload_sketches[tool]
+            summary[tool] = {
+                "calls": sketch.count,
+                "errors": self.tool_errors[tool],
+                "success_rate": 1 - self.tool_errors[tool] / sketch.count,
+                "latency": {"mean": sketch.mean, "max": sketch.max, **sketch.percentiles()},
+                "payload_bytes": {
+                    "mean": payload.mean,
+                    "max": payload.max if payload.count else 0,
+                    **payload.percentiles(),
+                },
+            }
+        return summary
+
+    def maybe_write_summary(self) -> None:
+        """Write the rolling summary if ``summary_interval`` has passed since the last write."""
+        now = time.monotonic()
+        if now - self._summary_written_at < self.summary_interval:
+            return
+        self._summary_written_at = now
+        try:
+            self.write_summary()
+        except OSError as e:
+            self.logger.debug(f"Could not write tool summary: {e}")
+
+    def write_summary(self) -> None:
+        """Atomically write the per-tool summary to ``summary_path``."""
+        data = {
+            "timestamp": time.time(),
+            "uptime_seconds": time.time() - self.start_time,
+            "tools": self.get_tool_summary(),
+        }
+        self.summary_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(dir=self.summary_path.parent, prefix=".summary_", suffix=".tmp")
+        try:
+            with os.fdopen(temp_fd, "w") as f:
+                json.dump(data, f, indent=2)
+                f.write("\n")
+            os.replace(temp_path, self.summary_path)
+        except Exception:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
     async def analyze_performance(self) -> Dict:
         """Analyze current performance against QA criteria"""
         if not self.metrics_history:
@@ -186,7 +299,7 @@ class MCPPerformanceMonitor:
             "summary": {
                 "runtime_minutes": total_runtime / 60,
                 "tools_tested": current.tools_tested,
-                "total_tests": sum(len(times) for times in self.tool_timings.values()),
+                "total_tests": sum(sketch.count for sketch in self.tool_sketches.values()),
                 "success_rate": current.tool_success_rate,
                 "avg_response_time": current.tool_response_time,
                 "current_memory_mb": current.memory_usage_mb,
@@ -195,13 +308,14 @@ class MCPPerformanceMonitor:
             },
             "tool_performance": {
                 tool: {
-                    "avg_time": sum(times) / len(times),
-                    "max_time": max(times),
-                    "min_time": min(times),
-                    "call_count": len(times),
+                    "avg_time": sketch.mean,
+                    "max_time": sketch.max,
+                    "min_time": sketch.min,
+                    "call_count": sketch.count,
+                    **sketch.percentiles(),
                 }
-                for tool, times in self.tool_timings.items()
-                if times
+                for tool, sketch in self.tool_sketches.items()
+                if sketch.count
             },
         }
 
@@ -247,7 +361,10 @@ class MCPPerformanceMonitor:
         if tool_performance:
             for tool, perf in tool_performance.items():
                 status = "✅" if perf["avg_time"] < 1.0 else "⚠️"
-                report += f"- {status} **{tool}**: {perf['avg_time']:.3f}s avg, {perf['call_count']} calls\n"
+                report += (
+                    f"- {status} **{tool}**: {perf['avg_time']:.3f}s avg, {perf['p95']:.3f}s p95, "
+                    f"{perf['call_count']} calls\n"
+                )
         else:
             report += "- ℹ️ No tool performance data available yet\n"
 
@@ -0,0 +1,218 @@
+"""Shared in-process publisher for the messaging daemon.
+
+Monitoring integrations publish many small notifications from both sync and
+async code. Rather than spawning ``tmux-orc pubsub publish`` per message, they
+share one ``DaemonClient`` whose persistent connection lives on a background
+event loop thread. Messages that can't reach the daemon are kept in a bounded
+local spill queue and re-sent in order, via ``publish_many``, once it is back.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import Any, Optional
+
+from tmux_orchestrator.core.messaging_daemon import DaemonClient
+
+
+class DaemonPublisher:
+    """Publishes to the messaging daemon over one shared connection."""
+
+    def __init__(
+        self,
+        socket_path: str = "/tmp/tmux-orc-msgd.sock",
+        timeout: float = 2.0,
+        spill_max: int = 1000,
+        retry_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
+    ) -> None:
+        """Initialize the publisher (the loop thread starts on first publish).
+
+        Args:
+            socket_path: Messaging daemon socket
+            timeout: Seconds to wait for the daemon to acknowledge a publish
+            spill_max: Messages kept while the daemon is down (oldest dropped first)
+            retry_delay: Initial delay before re-sending spilled messages
+            retry_max_delay: Upper bound for the retry backoff
+        """
+        self.client = DaemonClient(socket_path, timeout=timeout)
+        self.timeout = timeout
+        self.spill_max = spill_max
+        self.retry_delay = retry_delay
+        self.retry_max_delay = retry_max_delay
+        self.logger = logging.getLogger(__name__)
+
+        self._spill: deque[dict[str, Any]] = deque()
+        self._dropped = 0
+        self._next_retry_delay = retry_delay
+        self._retry_task: Optional[asyncio.Task] = None
+        self._drain_lock: Optional[asyncio.Lock] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    @property
+    def spilled_count(self) -> int:
+        """Messages waiting for the daemon to come back."""
+        return len(self._spill)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get spill queue statistics."""
+        return {"spilled": len(self._spill), "dropped": self._dropped}
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="daemon-publisher", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def publish(
+        self,
+        target: str,
+        message: str,
+        priority: str = "normal",
+        tags: Optional[list[str]] = None,
+        sender: str = "daemon",
+    ) -> bool:
+        """Publish from synchronous code.
+
+        Args:
+            target: Target session:window
+            message: Message content
+            priority: Message priority
+            tags: Message tags
+            sender: Sender identifier
+
+        Returns:
+            True if the daemon queued the message, False if it was spilled or rejected
+        """
+        item = {"target": target, "message": message, "priority": priority, "tags": tags or [], "sender": sender}
+        future = asyncio.run_coroutine_threadsafe(self._publish(item), self._ensure_loop())
+        try:
+            return future.result(self.timeout + 1)
+        except Exception as e:
+            self.logger.warning(f"Publish to {target} did not complete: {e}")
+            return False
+
+    async def publish_async(
+        self,
+        target: str,
+        message: str,
+        priority: str = "normal",
+        tags: Optional[list[str]] = None,
+        sender: str = "daemon",
+    ) -> bool:
+        """Publish from any event loop without blocking it.
+
+        Args:
+            target: Target session:window
+            message: Message content
+            priority: Message priority
+            tags: Message tags
+            sender: Sender identifier
+
+        Returns:
+            True if the daemon queued the message, False if it was spilled or rejected
+        """
+        item = {"target": target, "message": message, "priority": priority, "tags": tags or [], "sender": sender}
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._publish(item), self._ensure_loop()))
+
+    async def _publish(self, item: dict[str, Any]) -> bool:
+        """Send one message on the publisher loop, spilling it if the daemon is unreachable."""
+        if self._spill:
+            # Keep ordering: earlier spilled messages go first
+            self._add_to_spill(item)
+            return await self._drain_spill()
+
+        response = await self.client.send_command({"command": "publish", **item})
+        if response.get("status") == "queued":
+            return True
+        if self.client.connected:
+            retry_hint = f" (retry after {response['retry_after']}s)" if "retry_after" in response else ""
+            self.logger.error(
+                f"Daemon {response.get('status', 'rejected')} message for {item['target']}: "
+                f"{response.get('message')}{retry_hint}"
+            )
+            return False
+
+        self.logger.warning(f"Messaging daemon unavailable, spilling message for {item['target']}")
+        self._add_to_spill(item)
+        self._schedule_retry()
+        return False
+
+    def _add_to_spill(self, item: dict[str, Any]) -> None:
+        if len(self._spill) >= self.spill_max:
+            self._spill.popleft()
+            self._dropped += 1
+            self.logger.warning(f"Spill queue full ({self.spill_max}), dropped oldest message")
+        self._spill.append(item)
+
+    async def _drain_spill(self) -> bool:
+        """Re-send spilled messages in batches; returns True once the spill is empty."""
+        if self._drain_lock is None:
+            self._drain_lock = asyncio.Lock()
+
+        async with self._drain_lock:
+            while self._spill:
+                batch = [self._spill[i] for i in range(min(len(self._spill), 100))]
+                response = await self.client.publish_many(batch)
+                if "results" not in response:
+                    self._schedule_retry()
+                    return False
+                for _ in batch:
+                    self._spill.popleft()
+
+            self._next_retry_delay = self.retry_delay
+            return True
+
+    def _schedule_retry(self) -> None:
+        if self._retry_task is None or self._retry_task.done():
+            self._retry_task = asyncio.create_task(self._retry_later())
+
+    async def _retry_later(self) -> None:
+        delay = self._next_retry_delay
+        self._next_retry_delay = min(delay * 2, self.retry_max_delay)
+        await asyncio.sleep(delay)
+        self._retry_task = None
+        if await self._drain_spill():
+            self.logger.info("Messaging daemon reachable again, spilled messages sent")
+
+    async def _shutdown(self) -> None:
+        if self._retry_task is not None:
+            self._retry_task.cancel()
+            self._retry_task = None
+        await self.client.close()
+
+    def close(self) -> None:
+        """Close the connection and stop the loop thread (spilled messages are discarded)."""
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(self.timeout)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(self.timeout)
+        loop.close()
+
+
+_shared_publisher: Optional[DaemonPublisher] = None
+_shared_lock = threading.Lock()
+
+
+def get_daemon_publisher() -> DaemonPublisher:
+    """Get the process-wide publisher shared by monitoring integrations."""
+    global _shared_publisher
+    with _shared_lock:
+        if _shared_publisher is None:
+            _shared_publisher = DaemonPublisher()
+        return _shared_publisher
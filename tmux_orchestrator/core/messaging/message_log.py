@@ -0,0 +1,351 @@
+"""Append-only segmented message log with a per-target offset index.
+
+Messages are appended as JSON lines to size-bounded segment files named after
+the sequence number of their first record. Each segment has a companion
+``.idx`` file of ``<seq> <offset> <target>`` lines so readers can seek straight
+to a target's messages. A single writer task batches appends and fsyncs once
+per batch; index lines are only written once their records are synced, so a
+reader never follows an index entry to a torn record. Read-only instances in
+other processes pick up new appends with :meth:`MessageLog.refresh`.
+Retention deletes whole segments. An optional ``on_append`` callback receives
+each written batch (with sequence numbers) so secondary indexes can be fed
+from the same writer.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+SEGMENT_SUFFIX = ".jsonl"
+INDEX_SUFFIX = ".idx"
+
+
+class MessageLog:
+    """Segmented append-only message store."""
+
+    def __init__(
+        self,
+        directory: Path,
+        segment_max_bytes: int = 8 * 1024 * 1024,
+        max_segments: int = 16,
+        max_batch: int = 256,
+        on_append: Optional[Callable[[list[dict[str, Any]]], Any]] = None,
+    ) -> None:
+        """Open (or create) a message log.
+
+        Args:
+            directory: Directory holding the segment and index files
+            segment_max_bytes: Size at which the active segment rolls over
+            max_segments: Number of segments kept before the oldest is deleted
+            max_batch: Maximum records written per fsync
+            on_append: Called from the writer with each batch after it is synced
+        """
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.max_segments = max_segments
+        self.max_batch = max_batch
+        self.on_append = on_append
+        self.logger = logging.getLogger(__name__)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # target -> (seq, segment base, byte offset), oldest first
+        self._index: dict[str, deque[tuple[int, int, int]]] = {}
+        self._segments: list[int] = []
+        # segment base -> bytes of its index file already loaded
+        self._index_positions: dict[int, int] = {}
+        self._last_seq = 0
+
+        self._active_base: Optional[int] = None
+        self._active_file: Any = None
+        self._active_index: Any = None
+        self._active_size = 0
+
+        self._queue: Optional[asyncio.Queue[dict[str, Any]]] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        # Appends run in a worker thread; serialize them with close()
+        self._write_lock = threading.Lock()
+
+        self._load()
+
+    @property
+    def last_sequence(self) -> int:
+        """Sequence number of the most recently assigned record."""
+        return self._last_seq
+
+    def _segment_path(self, base: int) -> Path:
+        return self.directory / f"{base:020d}{SEGMENT_SUFFIX}"
+
+    def _index_path(self, base: int) -> Path:
+        return self.directory / f"{base:020d}{INDEX_SUFFIX}"
+
+    def _load(self) -> None:
+        """Rebuild the in-memory index from segment index files."""
+        self._segments = sorted(int(path.stem) for path in self.directory.glob(f"*{SEGMENT_SUFFIX}"))
+        for base in self._segments:
+            self._load_segment_index(base)
+
+    def refresh(self) -> None:
+        """Load records appended by another process since this log was opened or last refreshed.
+
+        Only needed for read-only instances; the writing instance indexes its own
+        appends. New index lines are read incrementally, and segments deleted by
+        the writer's retention are dropped.
+        """
+        with self._write_lock:
+            on_disk = sorted(int(path.stem) for path in self.directory.glob(f"*{SEGMENT_SUFFIX}"))
+            for base in [base for base in self._segments if base not in on_disk]:
+                self._segments.remove(base)
+                self._drop_segment(base)
+            for base in on_disk:
+                if base not in self._segments:
+                    self._segments.append(base)
+                self._load_segment_index(base)
+
+    def _load_segment_index(self, base: int) -> None:
+        """Index the entries of a segment's index file not loaded yet."""
+        for seq, offset, target in self._read_segment_index(base):
+            self._index.setdefault(target, deque()).append((seq, base, offset))
+            self._last_seq = max(self._last_seq, seq)
+
+    def _read_segment_index(self, base: int) -> list[tuple[int, int, str]]:
+        """Read a segment's unread index lines, rebuilding the index from the segment if missing."""
+        entries = []
+        index_path = self._index_path(base)
+        try:
+            if index_path.exists():
+                position = self._index_positions.get(base, 0)
+                with open(index_path, "rb") as f:
+                    f.seek(position)
+                    for raw in f:
+                        # A trailing line without a newline is still being written
+                        if not raw.endswith(b"\n"):
+                            break
+                        position += len(raw)
+                        parts = raw.decode().rstrip("\n").split(" ", 2)
+                        if len(parts) == 3:
+                            entries.append((int(parts[0]), int(parts[1]), parts[2]))
+                self._index_positions[base] = position
+                return entries
+
+            offset = 0
+            with open(self._segment_path(base), "rb") as f:
+                for raw in f:
+                    if raw.endswith(b"\n"):
+                        record = json.loads(raw)
+                        entries.append((record["seq"], offset, record["target"]))
+                    offset += len(raw)
+            with open(index_path, "w") as f:
+                f.writelines(f"{seq} {off} {target}\n" for seq, off, target in entries)
+            self._index_positions[base] = index_path.stat().st_size
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning(f"Skipping unreadable message log segment {base}: {e}")
+        return entries
+
+    def submit(self, record: dict[str, Any]) -> None:
+        """Queue a record for the background writer (must be called from the event loop).
+
+        Args:
+            record: JSON-serializable message with a ``target`` key
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer_loop(self._queue))
+        self._queue.put_nowait(record)
+
+    async def _writer_loop(self, queue: asyncio.Queue[dict[str, Any]]) -> None:
+        """Drain queued records in batches, one fsync per batch."""
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await asyncio.to_thread(self.append_batch, batch)
+            except Exception as e:
+                self.logger.error(f"Failed to persist {len(batch)} messages: {e}")
+
+    def append_batch(self, records: list[dict[str, Any]]) -> list[int]:
+        """Append records to the log synchronously and fsync once.
+
+        Args:
+            records: JSON-serializable messages with a ``target`` key
+
+        Returns:
+            Sequence numbers assigned to the records
+        """
+        with self._write_lock:
+            return self._append_locked(records)
+
+    def _append_locked(self, records: list[dict[str, Any]]) -> list[int]:
+        if self._active_file is None:
+            self._open_segment(self._last_seq + 1)
+
+        sequences = []
+        written = []
+        # (seq, segment base, offset, target) of records not yet synced
+        pending: list[tuple[int, int, int, str]] = []
+        for record in records:
+            if self._active_size >= self.segment_max_bytes:
+                self._publish(pending)
+                pending = []
+                self._roll_segment()
+
+            self._last_seq += 1
+            entry = {**record, "seq": self._last_seq}
+            data = json.dumps(entry).encode() + b"\n"
+            assert self._active_base is not None
+            pending.append((self._last_seq, self._active_base, self._active_size, record["target"]))
+            self._active_file.write(data)
+            self._active_size += len(data)
+
+            sequences.append(self._last_seq)
+            written.append(entry)
+
+        self._publish(pending)
+
+        if self.on_append is not None:
+            try:
+                self.on_append(written)
+            except Exception as e:
+                self.logger.error(f"Message log append callback failed: {e}")
+        return sequences
+
+    def _publish(self, pending: list[tuple[int, int, int, str]]) -> None:
+        """Sync the active segment, then index its pending records.
+
+        Index entries (on disk and in memory) only appear once the records they
+        point at are durable, so readers never see a partially written record.
+        """
+        if not pending:
+            return
+        self._active_file.flush()
+        os.fsync(self._active_file.fileno())
+
+        lines = "".join(f"{seq} {offset} {target}\n" for seq, _, offset, target in pending)
+        self._active_index.write(lines)
+        self._active_index.flush()
+        assert self._active_base is not None
+        self._index_positions[self._active_base] = self._index_positions.get(self._active_base, 0) + len(lines.encode())
+
+        for seq, base, offset, target in pending:
+            self._index.setdefault(target, deque()).append((seq, base, offset))
+
+    def _open_segment(self, base: int) -> None:
+        """Start a new active segment (never appends to a segment from a previous run)."""
+        self._active_base = base
+        self._active_file = open(self._segment_path(base), "ab")
+        self._active_index = open(self._index_path(base), "a")
+        self._active_size = self._active_file.tell()
+        self._index_positions[base] = self._index_path(base).stat().st_size
+        if base not in self._segments:
+            self._segments.append(base)
+        self._apply_retention()
+
+    def _roll_segment(self) -> None:
+        self._close_active()
+        self._open_segment(self._last_seq + 1)
+
+    def _close_active(self) -> None:
+        for handle in (self._active_file, self._active_index):
+            if handle is not None:
+                handle.close()
+        self._active_file = self._active_index = None
+        self._active_base = None
+
+    def _apply_retention(self) -> None:
+        """Delete the oldest segments beyond max_segments and their index entries."""
+        while len(self._segments) > self.max_segments:
+            base = self._segments.pop(0)
+            for path in (self._segment_path(base), self._index_path(base)):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            self._drop_segment(base)
+
+    def _drop_segment(self, base: int) -> None:
+        """Remove a deleted segment's entries from the in-memory index."""
+        self._index_positions.pop(base, None)
+        for target in list(self._index):
+            entries = self._index[target]
+            while entries and entries[0][1] == base:
+                entries.popleft()
+            if not entries:
+                del self._index[target]
+
+    def read_target(self, target: str, limit: int = 100, since_seq: int = 0) -> list[dict[str, Any]]:
+        """Read a target's most recent messages.
+
+        Args:
+            target: Message target
+            limit: Maximum number of messages (most recent kept)
+            since_seq: Only return messages with a greater sequence number
+
+        Returns:
+            Messages oldest first
+        """
+        # Snapshot first: the writer thread may append concurrently
+        entries = [entry for entry in tuple(self._index.get(target, ())) if entry[0] > since_seq]
+        return self._read_entries(entries[-limit:] if limit else entries)
+
+    def read_since(self, since_seq: int) -> list[dict[str, Any]]:
+        """Read every retained message after a sequence number, across targets.
+
+        Args:
+            since_seq: Only return messages with a greater sequence number
+
+        Returns:
+            Messages in sequence order
+        """
+        entries = [
+            entry
+            for target_entries in tuple(self._index.values())
+            for entry in tuple(target_entries)
+            if entry[0] > since_seq
+        ]
+        return self._read_entries(sorted(entries))
+
+    def _read_entries(self, entries: list[tuple[int, int, int]]) -> list[dict[str, Any]]:
+        records = []
+        handles: dict[int, Any] = {}
+        try:
+            for _, base, offset in entries:
+                if base not in handles:
+                    handles[base] = open(self._segment_path(base), "rb")
+                handle = handles[base]
+                handle.seek(offset)
+                line = handle.readline()
+                if not line.endswith(b"\n"):
+                    # Torn write at the end of a segment; later entries are newer still
+                    break
+                records.append(json.loads(line))
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Error reading message log: {e}")
+        finally:
+            for handle in handles.values():
+                handle.close()
+        return records
+
+    def targets(self) -> list[str]:
+        """Get all targets with retained messages."""
+        return list(self._index)
+
+    def close(self) -> None:
+        """Write any queued records and close the active segment."""
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            self._writer_task = None
+
+        pending = []
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        with self._write_lock:
+            if pending:
+                self._append_locked(pending)
+            self._close_active()
@@ -3,6 +3,7 @@
 import heapq
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -20,25 +21,145 @@ class PriorityMessage:
 
 
 class MessageQueue:
-    """Thread-safe priority queue for ordered message delivery."""
-
-    def __init__(self, max_size: int = 1000, enable_deduplication: bool = True):
+    """Thread-safe priority queue for ordered message delivery.
+
+    Within a priority level, senders share delivery by weighted fair queuing:
+    each message gets a virtual finish time of ``max(V, sender's last finish)
+    + 1 / weight``, where ``V`` advances as messages are dequeued, so a chatty
+    sender's backlog interleaves with other senders instead of starving them.
+    Messages live in one heap ordered by (priority, finish, sequence). Removal
+    is lazy, and per-sender and per-priority indexes avoid heap scans.
+    Duplicate detection uses an insertion-ordered cache that forgets entries
+    after ``dedupe_window`` seconds.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        enable_deduplication: bool = True,
+        dedupe_window: float = 300.0,
+        dedupe_max_entries: int = 10000,
+        sender_weights: Optional[Dict[str, float]] = None,
+    ):
         """Initialize MessageQueue.
 
         Args:
             max_size: Maximum queue size
             enable_deduplication: Enable duplicate message detection
+            dedupe_window: Seconds a (content, sender) pair is considered a duplicate
+            dedupe_max_entries: Maximum entries kept in the deduplication cache
+            sender_weights: Relative share of delivery per sender (default 1.0)
         """
         self.max_size = max_size
         self.enable_deduplication = enable_deduplication
-        self.queue: List[PriorityMessage] = []
+        self.dedupe_window = dedupe_window
+        self.dedupe_max_entries = dedupe_max_entries
+        self.sender_weights: Dict[str, float] = dict(sender_weights or {})
         self.lock = threading.Lock()
         self.not_empty = threading.Condition(self.lock)
         self.not_full = threading.Condition(self.lock)
         self.sequence_counter = 0
-        self.seen_messages: set[int] = set()
         self.stats: Dict[str, int] = {"enqueued": 0, "dequeued": 0, "dropped": 0, "duplicates": 0, "peak_size": 0}
 
+        # (priority, virtual finish, sequence, message); entries not in _live are stale
+        self._heap: List[Tuple[int, float, int, PriorityMessage]] = []
+        self._live: Dict[int, PriorityMessage] = {}  # sequence -> message, in enqueue order
+        self._by_sender: Dict[str, Dict[int, PriorityMessage]] = {}
+        self._by_priority: Dict[int, Dict[int, PriorityMessage]] = {}
+        self._virtual_time: Dict[int, float] = {}
+        self._last_finish: Dict[Tuple[int, str], float] = {}
+        self._seen: OrderedDict[int, float] = OrderedDict()  # message hash -> expiry
+
+    def set_sender_weight(self, sender: str, weight: float) -> None:
+        """Set a sender's relative share of delivery within a priority level.
+
+        Args:
+            sender: Sender identification
+            weight: Relative weight (must be positive)
+        """
+        if weight <= 0:
+            raise ValueError("Sender weight must be positive")
+        with self.lock:
+            self.sender_weights[sender] = weight
+
+    def _is_duplicate(self, content: str, sender: str) -> bool:
+        """Check and record a message in the deduplication cache (lock held)."""
+        now = time.monotonic()
+        seen = self._seen
+
+        # Entries are in expiry order, so expired ones are always at the front
+        while seen:
+            expiry = next(iter(seen.values()))
+            if expiry > now:
+                break
+            seen.popitem(last=False)
+
+        msg_hash = hash((content, sender))
+        if msg_hash in seen:
+            return True
+
+        seen[msg_hash] = now + self.dedupe_window
+        if len(seen) > self.dedupe_max_entries:
+            seen.popitem(last=False)
+        return False
+
+    def _push(self, content: str, sender: str, priority: int, metadata: Optional[Dict]) -> PriorityMessage:
+        """Add a message to the heap and indexes (lock held)."""
+        self.sequence_counter += 1
+        message = PriorityMessage(
+            priority=priority,
+            sequence=self.sequence_counter,
+            timestamp=time.time(),
+            content=content,
+            sender=sender,
+            metadata=metadata or {},
+        )
+
+        flow = (priority, sender)
+        start = max(self._virtual_time.get(priority, 0.0), self._last_finish.get(flow, 0.0))
+        finish = start + 1.0 / self.sender_weights.get(sender, 1.0)
+        self._last_finish[flow] = finish
+
+        heapq.heappush(self._heap, (priority, finish, message.sequence, message))
+        self._live[message.sequence] = message
+        self._by_sender.setdefault(sender, {})[message.sequence] = message
+        self._by_priority.setdefault(priority, {})[message.sequence] = message
+        return message
+
+    def _unindex(self, message: PriorityMessage) -> None:
+        """Remove a message from the live set and indexes (lock held)."""
+        del self._live[message.sequence]
+        for index, key in ((self._by_sender, message.sender), (self._by_priority, message.priority)):
+            bucket = index[key]
+            del bucket[message.sequence]
+            if not bucket:
+                del index[key]
+
+    def _discard_stale(self) -> None:
+        """Drop removed entries from the top of the heap, compacting when mostly stale (lock held)."""
+        heap = self._heap
+        while heap and heap[0][2] not in self._live:
+            heapq.heappop(heap)
+        if len(heap) > 2 * len(self._live) + 64:
+            self._heap = [entry for entry in heap if entry[2] in self._live]
+            heapq.heapify(self._heap)
+
+    def _pop(self) -> Optional[PriorityMessage]:
+        """Pop the next message in fair priority order (lock held)."""
+        self._discard_stale()
+        if not self._heap:
+            return None
+
+        priority, finish, _, message = heapq.heappop(self._heap)
+        self._unindex(message)
+        self._virtual_time[priority] = finish
+
+        # A flow whose last finish is behind virtual time adds nothing to max(); forget it
+        flow = (priority, message.sender)
+        if self._last_finish.get(flow, 0.0) <= finish:
+            self._last_finish.pop(flow, None)
+        return message
+
     def enqueue(self, content: str, sender: str, priority: int = 5, metadata: Optional[Dict] = None) -> bool:
         """Add a message to the queue.
 
@@ -52,40 +173,26 @@ class MessageQueue:
             True if enqueued successfully, False if queue full or duplicate
         """
         with self.lock:
-            # Check for duplicates
-            if self.enable_deduplication:
-                msg_hash = hash((content, sender))
-                if msg_hash in self.seen_messages:
-                    self.stats["duplicates"] += 1
-                    return False
-                self.seen_messages.add(msg_hash)
-
-                # Limit deduplication cache size
-                if len(self.seen_messages) > 10000:
-                    self.seen_messages = set(list(self.seen_messages)[-5000:])
-
-            # Check queue capacity
-            if len(self.queue) >= self.max_size:
-                self.stats["dropped"] += 1
-                return False
-
-            # Create and add message
-            self.sequence_counter += 1
-            message = PriorityMessage(
-                priority=priority,
-                sequence=self.sequence_counter,
-                timestamp=time.time(),
-                content=content,
-                sender=sender,
-                metadata=metadata or {},
-            )
+            return self._enqueue_locked(content, sender, priority, metadata, dedupe=self.enable_deduplication)
 
-            heapq.heappush(self.queue, message)
-            self.stats["enqueued"] += 1
-            self.stats["peak_size"] = max(self.stats["peak_size"], len(self.queue))
+    def _enqueue_locked(self, content: str, sender: str, priority: int, metadata: Optional[Dict], dedupe: bool) -> bool:
+        """Enqueue a message (lock held)."""
+        # Check queue capacity
+        if len(self._live) >= self.max_size:
+            self.stats["dropped"] += 1
+            return False
 
-            self.not_empty.notify()
-            return True
+        # Check for duplicates
+        if dedupe and self._is_duplicate(content, sender):
+            self.stats["duplicates"] += 1
+            return False
+
+        self._push(content, sender, priority, metadata)
+        self.stats["enqueued"] += 1
+        self.stats["peak_size"] = max(self.stats["peak_size"], len(self._live))
+
+        self.not_empty.notify()
+        return True
 
     def dequeue(self, timeout: Optional[float] = None) -> Optional[PriorityMessage]:
         """Remove and return the highest priority message.
@@ -99,18 +206,18 @@ class MessageQueue:
         with self.not_empty:
             if timeout is not None:
                 end_time = time.time() + timeout
-                while not self.queue:
+                while not self._live:
                     remaining = end_time - time.time()
                     if remaining <= 0:
                         return None
                     if not self.not_empty.wait(remaining):
                         return None
             else:
-                while not self.queue:
+                while not self._live:
                     self.not_empty.wait()
 
-            if self.queue:
-                message = heapq.heappop(self.queue)
+            message = self._pop()
+            if message is not None:
                 self.stats["dequeued"] += 1
                 self.not_full.notify()
                 return message
@@ -124,8 +231,9 @@ class MessageQueue:
             Message or None if empty
         """
         with self.lock:
-            if self.queue:
-                return self.queue[0]
+            self._discard_stale()
+            if self._heap:
+                return self._heap[0][3]
             return None
 
     def size(self) -> int:
@@ -135,7 +243,7 @@ class MessageQueue:
             Number of messages in queue
         """
         with self.lock:
-            return len(self.queue)
+            return len(self._live)
 
     def is_empty(self) -> bool:
         """Check if queue is empty.
@@ -144,7 +252,7 @@ class MessageQueue:
             True if empty, False otherwise
         """
         with self.lock:
-            return len(self.queue) == 0
+            return len(self._live) == 0
 
     def is_full(self) -> bool:
         """Check if queue is full.
@@ -153,7 +261,7 @@ class MessageQueue:
             True if at capacity, False otherwise
         """
         with self.lock:
-            return len(self.queue) >= self.max_size
+            return len(self._live) >= self.max_size
 
     def clear(self) -> int:
         """Clear all messages from the queue.
@@ -162,9 +270,14 @@ class MessageQueue:
             Number of messages cleared
         """
         with self.lock:
-            count = len(self.queue)
-            self.queue.clear()
-            self.seen_messages.clear()
+            count = len(self._live)
+            self._heap.clear()
+            self._live.clear()
+            self._by_sender.clear()
+            self._by_priority.clear()
+            self._virtual_time.clear()
+            self._last_finish.clear()
+            self._seen.clear()
             self.not_full.notify_all()
             return count
 
@@ -178,7 +291,7 @@ class MessageQueue:
             List of messages with the specified priority
         """
         with self.lock:
-            return [msg for msg in self.queue if msg.priority == priority]
+            return list(self._by_priority.get(priority, {}).values())
 
     def get_messages_by_sender(self, sender: str) -> List[PriorityMessage]:
         """Get all messages from a specific sender.
@@ -190,7 +303,7 @@ class MessageQueue:
             List of messages from the sender
         """
         with self.lock:
-            return [msg for msg in self.queue if msg.sender == sender]
+            return list(self._by_sender.get(sender, {}).values())
 
     def remove_by_sender(self, sender: str) -> int:
         """Remove all messages from a specific sender.
@@ -202,15 +315,15 @@ class MessageQueue:
             Number of messages removed
         """
         with self.lock:
-            original_size = len(self.queue)
-            self.queue = [msg for msg in self.queue if msg.sender != sender]
-            heapq.heapify(self.queue)
-            removed = original_size - len(self.queue)
+            messages = list(self._by_sender.get(sender, {}).values())
+            for message in messages:
+                self._unindex(message)
+            self._discard_stale()
 
-            if removed > 0:
+            if messages:
                 self.not_full.notify()
 
-            return removed
+            return len(messages)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get queue statistics.
@@ -220,23 +333,22 @@ class MessageQueue:
         """
         with self.lock:
             stats: Dict[str, Any] = self.stats.copy()
-            stats["current_size"] = len(self.queue)
+            stats["current_size"] = len(self._live)
             stats["max_size"] = self.max_size
-            stats["utilization"] = float(len(self.queue) / self.max_size * 100) if self.max_size > 0 else 0.0
+            stats["utilization"] = float(len(self._live) / self.max_size * 100) if self.max_size > 0 else 0.0
+            stats["dedupe_cache_size"] = len(self._seen)
 
-            # Priority distribution
-            priority_dist: Dict[int, int] = {}
-            for msg in self.queue:
-                priority_dist[msg.priority] = priority_dist.get(msg.priority, 0) + 1
-            stats["priority_distribution"] = priority_dist
+            # Priority and sender distribution
+            stats["priority_distribution"] = {p: len(msgs) for p, msgs in self._by_priority.items()}
+            stats["sender_distribution"] = {s: len(msgs) for s, msgs in self._by_sender.items()}
 
-            # Age statistics
-            if self.queue:
+            # Age statistics (live messages are kept in enqueue order)
+            if self._live:
                 current_time = time.time()
-                ages = [current_time - msg.timestamp for msg in self.queue]
-                stats["oldest_message_age"] = float(max(ages))
-                stats["newest_message_age"] = float(min(ages))
-                stats["average_message_age"] = float(sum(ages) / len(ages))
+                timestamps = [msg.timestamp for msg in self._live.values()]
+                stats["oldest_message_age"] = float(current_time - timestamps[0])
+                stats["newest_message_age"] = float(current_time - timestamps[-1])
+                stats["average_message_age"] = float(current_time - sum(timestamps) / len(timestamps))
             else:
                 stats["oldest_message_age"] = 0.0
                 stats["newest_message_age"] = 0.0
@@ -303,7 +415,7 @@ class MessageQueue:
                     "metadata": msg.metadata,
                     "age": time.time() - msg.timestamp,
                 }
-                for msg in sorted(self.queue)
+                for *_, msg in sorted(entry for entry in self._heap if entry[2] in self._live)
             ]
 
     def requeue_message(self, message: PriorityMessage, new_priority: Optional[int] = None) -> bool:
@@ -319,9 +431,11 @@ class MessageQueue:
         if new_priority is not None:
             message.priority = new_priority
 
-        return self.enqueue(
-            content=message.content, sender=message.sender, priority=message.priority, metadata=message.metadata
-        )
+        # A requeued message has already been seen, so skip deduplication
+        with self.lock:
+            return self._enqueue_locked(
+                message.content, message.sender, message.priority, message.metadata, dedupe=False
+            )
 
     def expire_old_messages(self, max_age: float) -> int:
         """Remove messages older than specified age.
@@ -334,12 +448,17 @@ class MessageQueue:
         """
         with self.lock:
             current_time = time.time()
-            original_size = len(self.queue)
+            expired = 0
 
-            self.queue = [msg for msg in self.queue if current_time - msg.timestamp <= max_age]
-            heapq.heapify(self.queue)
+            # Live messages are in enqueue order, so only the expired prefix is visited
+            while self._live:
+                oldest = next(iter(self._live.values()))
+                if current_time - oldest.timestamp <= max_age:
+                    break
+                self._unindex(oldest)
+                expired += 1
+            self._discard_stale()
 
-            expired = original_size - len(self.queue)
             if expired > 0:
                 self.not_full.notify()
 
@@ -0,0 +1,364 @@
+"""Indexed SQLite store for querying delivered pubsub messages.
+
+The messaging daemon feeds every record it appends to the message log into
+this store, so ``tmux-orc pubsub query`` and ``pubsub read --filter-*`` can
+filter by target, priority, category, source, tag, time and ack state (and
+search content with FTS5 where available) without scraping pane text.
+
+Structured messages (JSON content with ``message``/``metadata`` sections) are
+unpacked into their category, source type, subject and ack requirement; plain
+messages fall back to the daemon's sender and a category tag if present.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+MESSAGE_CATEGORIES = ("health", "recovery", "status", "task", "escalation")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    seq INTEGER PRIMARY KEY,
+    id TEXT,
+    ref TEXT,
+    target TEXT NOT NULL,
+    session TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    category TEXT,
+    source TEXT,
+    sender TEXT,
+    timestamp TEXT NOT NULL,
+    requires_ack INTEGER NOT NULL DEFAULT 0,
+    acked_at TEXT,
+    subject TEXT,
+    body TEXT,
+    tags TEXT NOT NULL DEFAULT '[]',
+    content TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS message_tags (
+    tag TEXT NOT NULL,
+    seq INTEGER NOT NULL REFERENCES messages(seq) ON DELETE CASCADE,
+    PRIMARY KEY (tag, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_message_tags_seq ON message_tags(seq);
+CREATE INDEX IF NOT EXISTS idx_messages_target ON messages(target, seq);
+CREATE INDEX IF NOT EXISTS idx_messages_session ON messages(session, seq);
+CREATE INDEX IF NOT EXISTS idx_messages_priority ON messages(priority, seq);
+CREATE INDEX IF NOT EXISTS idx_messages_category ON messages(category, seq);
+CREATE INDEX IF NOT EXISTS idx_messages_source ON messages(source, seq);
+CREATE INDEX IF NOT EXISTS idx_messages_timestamp ON messages(timestamp);
+CREATE INDEX IF NOT EXISTS idx_messages_id ON messages(id);
+CREATE INDEX IF NOT EXISTS idx_messages_ref ON messages(ref);
+CREATE INDEX IF NOT EXISTS idx_messages_unacked ON messages(seq) WHERE requires_ack = 1 AND acked_at IS NULL;
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    subject, body, content='messages', content_rowid='seq'
+);
+"""
+
+
+def default_store_path() -> Path:
+    """Get the store the messaging daemon writes to."""
+    return Path.home() / ".tmux_orchestrator" / "messages" / "index.db"
+
+
+def parse_structured(content: str) -> Optional[dict[str, Any]]:
+    """Parse a structured pubsub message from message content.
+
+    Args:
+        content: Raw message content
+
+    Returns:
+        Structured message dict, or None for plain text
+    """
+    if not content.lstrip().startswith("{"):
+        return None
+    try:
+        msg = json.loads(content)
+    except ValueError:
+        return None
+    if isinstance(msg, dict) and all(key in msg for key in ("id", "timestamp", "source", "message", "metadata")):
+        return msg
+    return None
+
+
+def fts_query(text: str) -> str:
+    """Build an FTS5 query matching every whitespace-separated term of free text.
+
+    Each term is quoted as an FTS5 string, so punctuation such as quotes,
+    hyphens and colons is matched literally instead of parsed as query syntax.
+
+    Args:
+        text: Search text as typed by the user
+
+    Returns:
+        FTS5 MATCH expression
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in text.split())
+
+
+class MessageStore:
+    """SQLite-backed message index with keyset pagination."""
+
+    def __init__(self, path: Path, max_messages: int = 200_000) -> None:
+        """Open (or create) a message store.
+
+        Args:
+            path: SQLite database file
+            max_messages: Rows kept before the oldest are pruned
+        """
+        self.path = path
+        self.max_messages = max_messages
+        self.logger = logging.getLogger(__name__)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # The daemon writes from its log writer thread while readers use their own connections
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=5.0)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(_SCHEMA)
+            try:
+                self._conn.executescript(_FTS_SCHEMA)
+                self.fts_enabled = True
+            except sqlite3.OperationalError:
+                self.logger.warning("SQLite FTS5 unavailable; content search falls back to LIKE")
+                self.fts_enabled = False
+
+    def add_batch(self, records: Iterable[dict[str, Any]]) -> int:
+        """Index a batch of logged messages in one transaction.
+
+        Args:
+            records: Message log records (with ``seq``, ``target`` and ``content``)
+
+        Returns:
+            Number of messages indexed
+        """
+        with self._lock:
+            last_seq = self._last_seq()
+        # Skip records already indexed (e.g. replayed from the log after a restart)
+        rows = [self._to_row(record) for record in records if record["seq"] > last_seq]
+        if not rows:
+            return 0
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO messages (seq, id, ref, target, session, priority, category, source, sender,"
+                " timestamp, requires_ack, subject, body, tags, content)"
+                " VALUES (:seq, :id, :ref, :target, :session, :priority, :category, :source, :sender,"
+                " :timestamp, :requires_ack, :subject, :body, :tags, :content)",
+                rows,
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO message_tags (tag, seq) VALUES (?, ?)",
+                [(tag, row["seq"]) for row in rows for tag in json.loads(row["tags"])],
+            )
+            if self.fts_enabled:
+                self._conn.executemany(
+                    "INSERT INTO messages_fts (rowid, subject, body) VALUES (:seq, :subject, :body)", rows
+                )
+            self._prune()
+        return len(rows)
+
+    def _to_row(self, record: dict[str, Any]) -> dict[str, Any]:
+        content = str(record.get("content", ""))
+        target = record["target"]
+        tags = list(record.get("tags") or [])
+        row: dict[str, Any] = {
+            "seq": record["seq"],
+            "id": record.get("id"),
+            "ref": None,
+            "target": target,
+            "session": target.split(":", 1)[0],
+            "priority": record.get("priority", "normal"),
+            "category": next((tag for tag in tags if tag in MESSAGE_CATEGORIES), None),
+            "source": record.get("sender", "daemon"),
+            "sender": record.get("sender", "daemon"),
+            "timestamp": record.get("timestamp") or datetime.now().isoformat(),
+            "requires_ack": 0,
+            "subject": None,
+            "body": content,
+            "content": content,
+        }
+
+        structured = parse_structured(content)
+        if structured is not None:
+            section = structured.get("message") or {}
+            body = section.get("content") or {}
+            metadata = structured.get("metadata") or {}
+            row["ref"] = structured.get("id")
+            row["category"] = section.get("category", row["category"])
+            row["priority"] = section.get("priority", row["priority"])
+            row["source"] = (structured.get("source") or {}).get("type", row["source"])
+            row["requires_ack"] = int(bool(metadata.get("requires_ack", False)))
+            row["subject"] = body.get("subject")
+            row["body"] = body.get("body", "")
+            tags.extend(tag for tag in metadata.get("tags", []) if tag not in tags)
+
+        row["tags"] = json.dumps(tags)
+        return row
+
+    @property
+    def last_sequence(self) -> int:
+        """Sequence number of the newest indexed message (0 when empty)."""
+        with self._lock:
+            return self._last_seq()
+
+    def _last_seq(self) -> int:
+        (seq,) = self._conn.execute("SELECT MAX(seq) FROM messages").fetchone()
+        return seq or 0
+
+    def _prune(self) -> None:
+        """Drop rows more than max_messages sequence numbers old (caller holds the lock)."""
+        oldest, newest = self._conn.execute("SELECT MIN(seq), MAX(seq) FROM messages").fetchone()
+        cutoff = (newest or 0) - self.max_messages + 1
+        if oldest is None or oldest >= cutoff:
+            return
+        if self.fts_enabled:
+            self._conn.execute(
+                "INSERT INTO messages_fts (messages_fts, rowid, subject, body)"
+                " SELECT 'delete', seq, subject, body FROM messages WHERE seq < ?",
+                (cutoff,),
+            )
+        self._conn.execute("DELETE FROM messages WHERE seq < ?", (cutoff,))
+
+    def _where(
+        self,
+        target: Optional[str] = None,
+        session: Optional[str] = None,
+        priorities: Iterable[str] = (),
+        categories: Iterable[str] = (),
+        tags: Iterable[str] = (),
+        source: Optional[str] = None,
+        since: Optional[datetime] = None,
+        unacked_only: bool = False,
+        text: Optional[str] = None,
+    ) -> tuple[list[str], list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+
+        for column, value in (("target", target), ("session", session), ("source", source)):
+            if value:
+                clauses.append(f"m.{column} = ?")
+                params.append(value)
+        for column, values in (("priority", list(priorities)), ("category", list(categories))):
+            if values:
+                clauses.append(f"m.{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+
+        tag_list = list(tags)
+        if tag_list:
+            clauses.append(f"m.seq IN (SELECT seq FROM message_tags WHERE tag IN ({', '.join('?' * len(tag_list))}))")
+            params.extend(tag_list)
+        if since is not None:
+            clauses.append("m.timestamp >= ?")
+            params.append(since.isoformat())
+        if unacked_only:
+            clauses.append("m.requires_ack = 1 AND m.acked_at IS NULL")
+        if text and text.strip():
+            if self.fts_enabled:
+                clauses.append("m.seq IN (SELECT rowid FROM messages_fts WHERE messages_fts MATCH ?)")
+                params.append(fts_query(text))
+            else:
+                clauses.append("(m.subject LIKE ? OR m.body LIKE ?)")
+                params.extend([f"%{text}%"] * 2)
+
+        return clauses, params
+
+    def query(self, limit: int = 50, before_seq: Optional[int] = None, **filters: Any) -> list[dict[str, Any]]:
+        """Find messages matching filters, newest first.
+
+        Args:
+            limit: Page size
+            before_seq: Cursor from the previous page (only older messages are returned)
+            **filters: target, session, priorities, categories, tags, source,
+                since, unacked_only, text
+
+        Returns:
+            Matching messages; pass the last ``seq`` as ``before_seq`` for the next page
+        """
+        clauses, params = self._where(**filters)
+        if before_seq is not None:
+            clauses.append("m.seq < ?")
+            params.append(before_seq)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT m.* FROM messages m {where} ORDER BY m.seq DESC LIMIT ?", [*params, limit]
+            ).fetchall()
+
+        messages = []
+        for row in rows:
+            message = dict(row)
+            message["tags"] = json.loads(message["tags"])
+            message["requires_ack"] = bool(message["requires_ack"])
+            messages.append(message)
+        return messages
+
+    def summarize(self, **filters: Any) -> dict[str, Any]:
+        """Count messages matching filters by priority and category.
+
+        Args:
+            **filters: Same filters as query()
+
+        Returns:
+            Totals, per-priority and per-category counts and unacknowledged count
+        """
+        clauses, params = self._where(**filters)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            by_priority = self._conn.execute(
+                f"SELECT m.priority, COUNT(*) FROM messages m {where} GROUP BY m.priority", params
+            ).fetchall()
+            by_category = self._conn.execute(
+                f"SELECT m.category, COUNT(*) FROM messages m {where} GROUP BY m.category", params
+            ).fetchall()
+            unacked_clause = " AND ".join([*clauses, "m.requires_ack = 1 AND m.acked_at IS NULL"])
+            (unacked,) = self._conn.execute(
+                f"SELECT COUNT(*) FROM messages m WHERE {unacked_clause}", params
+            ).fetchone()
+
+        # Import here to avoid circular imports (the daemon feeds this store)
+        from tmux_orchestrator.core.messaging_daemon import PRIORITY_RANK
+
+        priorities = {priority: count for priority, count in by_priority}
+        return {
+            "total": sum(priorities.values()),
+            "by_priority": dict(sorted(priorities.items(), key=lambda item: PRIORITY_RANK.get(item[0], 99))),
+            "by_category": {category or "uncategorized": count for category, count in by_category},
+            "unacknowledged": unacked,
+        }
+
+    def acknowledge(self, message_id: str) -> bool:
+        """Mark a message as acknowledged.
+
+        Args:
+            message_id: Daemon message id or structured message id
+
+        Returns:
+            True if an unacknowledged message was updated
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE messages SET acked_at = ? WHERE acked_at IS NULL AND (id = ? OR ref = ?)",
+                (datetime.now().isoformat(), message_id, message_id),
+            )
+        return cursor.rowcount > 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -9,6 +9,8 @@ from typing import Deque, Dict, List, Tuple
 
 import psutil
 
+from tmux_orchestrator.utils.quantile_sketch import RollingQuantileSketch
+
 
 @dataclass
 class PerformanceMetrics:
@@ -54,6 +56,8 @@ class PerformanceMonitor:
 
         # Metrics storage
         self.latencies: Deque[float] = deque(maxlen=window_size)
+        # Percentiles cover a time window rather than the last window_size samples
+        self.latency_sketch = RollingQuantileSketch()
         self.memory_usage: Deque[float] = deque(maxlen=window_size)
         # Reassembly times removed - no chunking
         self.throughput_samples: Deque[Tuple[float, int]] = deque(maxlen=100)
@@ -82,6 +86,7 @@ class PerformanceMonitor:
             message_size_bytes: Size of message in bytes
         """
         self.latencies.append(latency_ms)
+        self.latency_sketch.add(latency_ms)
         self.message_count += 1
 
         # Update max latency
@@ -161,19 +166,8 @@ class PerformanceMonitor:
         return 0.0
 
     def get_percentiles(self) -> Dict[str, float]:
-        """Get latency percentiles."""
-        if not self.latencies:
-            return {"p50": 0, "p95": 0, "p99": 0, "p999": 0}
-
-        sorted_latencies = sorted(self.latencies)
-        n = len(sorted_latencies)
-
-        return {
-            "p50": sorted_latencies[int(n * 0.5)],
-            "p95": sorted_latencies[int(n * 0.95)] if n > 20 else sorted_latencies[-1],
-            "p99": sorted_latencies[int(n * 0.99)] if n > 100 else sorted_latencies[-1],
-            "p999": sorted_latencies[int(n * 0.999)] if n > 1000 else sorted_latencies[-1],
-        }
+        """Get latency percentiles over the last five minutes."""
+        return self.latency_sketch.percentiles((0.5, 0.95, 0.99, 0.999))
 
     def get_summary(self) -> Dict:
         """Get comprehensive performance summary."""
@@ -232,6 +226,7 @@ class PerformanceMonitor:
     def reset(self):
         """Reset all metrics."""
         self.latencies.clear()
+        self.latency_sketch.clear()
         self.memory_usage.clear()
         # Reassembly times removed - no chunking
         self.throughput_samples.clear()
@@ -3,6 +3,33 @@
 
 Replaces CLI-based pubsub with persistent daemon using Unix socket IPC.
 Target: <100ms message delivery vs current 5000ms CLI overhead.
+
+Protocol: newline-delimited JSON over a persistent connection. Each request
+may carry a ``request_id`` which is echoed in its response, so clients can
+pipeline several requests and match responses as they complete.
+
+A ``subscribe`` request turns its connection into a stream: after the
+``subscribed`` response the daemon pushes ``{"event": "message", ...}`` frames
+for every logged message matching the subscription's filters. Messages carry
+their log sequence number so a reconnecting client can resume with
+``since_seq``.
+
+Messages piling up for one target are coalesced: after a short batching
+window, and for as long as the target pane shows the agent working, queued
+messages of a compatible priority are merged into one submission with
+numbered sections in delivery order. Critical messages are never merged and
+are delivered as soon as they arrive.
+
+Publishing is admission-controlled: each target and each sender has a token
+bucket, and the queue is bounded per target and overall. A publish that would
+exceed a bucket is answered ``throttled`` and one that would overflow a queue
+``rejected``; both carry a ``retry_after`` hint in seconds, so overload shows
+up at the publisher instead of as a growing delivery backlog.
+
+All tmux interaction is async: tmux runs as asyncio subprocesses that are
+killed when a delivery or read is cancelled, so a slow tmux call never stalls
+other clients. Reads are served from a short-lived per-target capture cache
+shared between concurrent readers.
 """
 
 import asyncio
@@ -10,13 +37,43 @@ import json
 import logging
 import threading
 import time
-from collections import defaultdict, deque
+from collections import defaultdict
+from collections.abc import AsyncIterator
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional, cast
 
-from tmux_orchestrator.utils.tmux import TMUXManager
+from tmux_orchestrator.core.messaging.message_log import MessageLog
+from tmux_orchestrator.core.messaging.message_store import MessageStore, default_store_path
+from tmux_orchestrator.utils.quantile_sketch import RollingQuantileSketch
+from tmux_orchestrator.utils.rate_limiter import RateLimitConfig, RateLimiter
+from tmux_orchestrator.utils.tmux.async_operations import AsyncTmuxOperations, PaneCaptureCache
+from tmux_orchestrator.utils.tmux.submit_timing import AsyncAdaptiveSubmitter
+
+# Delivery order within a target's queue (lower is delivered first)
+PRIORITY_RANK = {"critical": 0, "high": 1, "normal": 2, "low": 3}
+
+PRIORITY_PREFIXES = {"critical": "🚨 CRITICAL", "high": "⚠️  HIGH PRIORITY", "normal": "📨", "low": "💬"}
+
+# Priorities that may be merged into one submission (critical is never coalesced)
+COALESCE_GROUPS = {"high": "high", "normal": "routine", "low": "routine"}
+
+# Pane text shown by Claude while it is working on a turn
+BUSY_MARKERS = ("esc to interrupt", "compacting conversation")
+BUSY_WORDS = ("thinking", "pondering", "divining", "musing", "elucidating")
+
+# Largest request or response frame accepted on the socket
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+
+# Live messages buffered per subscriber before it is cut off to resume later
+SUBSCRIPTION_BUFFER = 1000
+
+# Admission control defaults: sustained rate and burst per target and per sender
+TARGET_RATE_LIMIT = RateLimitConfig(max_requests=120, window_seconds=60.0, burst_size=30)
+SENDER_RATE_LIMIT = RateLimitConfig(max_requests=300, window_seconds=60.0, burst_size=60)
+MAX_QUEUE_DEPTH = 5000
+MAX_TARGET_QUEUE_DEPTH = 200
 
 
 @dataclass
@@ -38,23 +95,123 @@ class Message:
             self.timestamp = datetime.now().isoformat()
 
 
+@dataclass
+class Subscription:
+    """A client's filtered stream of logged messages."""
+
+    id: int
+    writer: asyncio.StreamWriter
+    write_lock: asyncio.Lock
+    targets: list[str]
+    tags: set[str]
+    priorities: set[str]
+    last_seq: int
+    replay: list[dict[str, Any]]
+    queue: "asyncio.Queue[Optional[dict[str, Any]]]"
+    task: Optional[asyncio.Task] = None
+
+    def matches(self, record: dict[str, Any]) -> bool:
+        """Check a logged message against the filters (a target may name a whole session)."""
+        target = record.get("target", "")
+        if self.targets and not any(target == t or target.startswith(f"{t}:") for t in self.targets):
+            return False
+        if self.priorities and record.get("priority") not in self.priorities:
+            return False
+        return not self.tags or bool(self.tags.intersection(record.get("tags") or ()))
+
+
+def is_agent_busy(content: str) -> bool:
+    """Check pane content for signs that Claude is working on a turn.
+
+    Args:
+        content: Recent lines of the target pane
+
+    Returns:
+        True if the agent appears busy
+    """
+    content_lower = content.lower()
+    if any(marker in content_lower for marker in BUSY_MARKERS):
+        return True
+    return "…" in content and any(word in content_lower for word in BUSY_WORDS)
+
+
+def merge_messages(batch: list[Message]) -> Message:
+    """Merge queued messages for one target into a single message.
+
+    Sections keep the batch order and each carries its own priority prefix and
+    sender, so the agent can still tell the messages apart.
+
+    Args:
+        batch: Messages for the same target, in delivery order
+
+    Returns:
+        Message with the first message's id and priority and a sectioned body
+    """
+    first = batch[0]
+    total = len(batch)
+    sections = [
+        f"[{i}/{total}] {PRIORITY_PREFIXES.get(m.priority, '📨')} from {m.sender}: {m.content}"
+        for i, m in enumerate(batch, start=1)
+    ]
+    tags = list(dict.fromkeys(tag for m in batch for tag in m.tags or []))
+    senders = list(dict.fromkeys(m.sender for m in batch))
+    return Message(
+        id=first.id,
+        target=first.target,
+        content=f"{total} queued messages:\n\n" + "\n\n".join(sections),
+        priority=first.priority,
+        tags=tags,
+        sender=senders[0] if len(senders) == 1 else "daemon",
+    )
+
+
 class HighPerformanceMessagingDaemon:
     """Ultra-fast messaging daemon with sub-100ms delivery target."""
 
-    def __init__(self, socket_path: str = "/tmp/tmux-orc-msgd.sock"):
+    def __init__(
+        self,
+        socket_path: str = "/tmp/tmux-orc-msgd.sock",
+        target_rate_limit: RateLimitConfig = TARGET_RATE_LIMIT,
+        sender_rate_limit: RateLimitConfig = SENDER_RATE_LIMIT,
+        max_queue_depth: int = MAX_QUEUE_DEPTH,
+        max_target_queue_depth: int = MAX_TARGET_QUEUE_DEPTH,
+    ):
         self.socket_path = socket_path
         self.running = False
-        self.tmux = TMUXManager()
-
-        # Performance optimizations
-        self._message_queue: deque[dict[str, Any]] = deque()
+        self.tmux = AsyncTmuxOperations()
+        self.submitter = AsyncAdaptiveSubmitter(self.tmux)
+        self.capture_cache = PaneCaptureCache(self.tmux, ttl=0.25)
+
+        # Per-target delivery queues, each drained by its own worker task so
+        # delivery is serialized per target and parallel across targets
+        self._target_queues: dict[str, asyncio.PriorityQueue[tuple[int, int, Message]]] = {}
+        self._target_workers: dict[str, asyncio.Task] = {}
+        self._queued_count = 0
+        self._enqueue_seq = 0
+        self._worker_idle_timeout = 60.0
+
+        # Coalescing: wait this long for more messages, then keep holding while
+        # the target is busy (polling its pane) up to the maximum hold
+        self._coalesce_window = 0.05
+        self._coalesce_max_hold = 5.0
+        self._coalesce_max_messages = 20
+        self._busy_poll_interval = 0.25
+        self._coalesced_batches = 0
+        self._coalesced_messages = 0
+
+        # Admission control (critical messages skip the rate limits, not the queue bounds)
+        self._target_limiter = RateLimiter(target_rate_limit)
+        self._sender_limiter = RateLimiter(sender_rate_limit)
+        self._max_queue_depth = max_queue_depth
+        self._max_target_queue_depth = max_target_queue_depth
+        self._throttled_count = 0
+        self._rejected_count = 0
         self._delivery_stats: defaultdict[str, list[float]] = defaultdict(list)
         self._session_cache: dict[str, Any] = {}
         self._cache_lock = threading.Lock()
 
         # Async processing
         self._loop = None
-        self._delivery_task = None
 
         # Logging
         self.logger = logging.getLogger(__name__)
@@ -62,59 +219,108 @@ class HighPerformanceMessagingDaemon:
         # Message persistence (optimized)
         self.storage_dir = Path.home() / ".tmux_orchestrator" / "messages"
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        # Queryable index fed by the log's writer; catch up on anything logged before a crash
+        self.message_store = MessageStore(default_store_path())
+        self.message_log = MessageLog(self.storage_dir / "log", on_append=self._on_log_append)
+        self.message_store.add_batch(self.message_log.read_since(self.message_store.last_sequence))
+
+        # Streaming subscriptions, fed from the log writer
+        self._subscriptions: dict[int, Subscription] = {}
+        self._next_subscription_id = 0
 
         # Performance tracking
         self._start_time = time.time()
         self._message_count = 0
-        self._delivery_times: deque[float] = deque(maxlen=1000)  # Last 1000 delivery times
+        self._delivery_times = RollingQuantileSketch(window_seconds=300)  # Last 5 minutes of delivery times
 
     async def start(self):
         """Start the high-performance daemon."""
         self.running = True
         self.logger.info("Starting high-performance messaging daemon")
 
+        server = await self.start_server()
+
+        async with server:
+            await server.serve_forever()
+
+    async def start_server(self) -> asyncio.AbstractServer:
+        """Create the Unix socket server (delivery workers start on first message per target)."""
         # Remove existing socket
         try:
             Path(self.socket_path).unlink()
         except FileNotFoundError:
             pass
 
-        # Create Unix socket server
-        server = await asyncio.start_unix_server(self._handle_client, path=self.socket_path)
-
-        # Start async message delivery task
-        self._delivery_task = asyncio.create_task(self._delivery_loop())
-
+        self._loop = asyncio.get_running_loop()
+        server = await asyncio.start_unix_server(self._handle_client, path=self.socket_path, limit=MAX_FRAME_BYTES)
         self.logger.info(f"Daemon listening on {self.socket_path}")
-
-        async with server:
-            await server.serve_forever()
+        return server
 
     async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
-        """Handle client requests with minimal latency."""
-        try:
-            # Read command (expecting JSON)
-            data = await reader.read(8192)
-            if not data:
-                return
-
-            request = json.loads(data.decode())
+        """Serve newline-delimited JSON requests until the client disconnects."""
+        write_lock = asyncio.Lock()
+        in_flight: set[asyncio.Task] = set()
 
-            # Process command
-            response = await self._process_command(request)
-
-            # Send response
-            writer.write(json.dumps(response).encode())
-            await writer.drain()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Frame exceeded MAX_FRAME_BYTES; the stream can't be resynchronized
+                    await self._write_response(writer, write_lock, {"status": "error", "message": "Request too large"})
+                    break
+
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                # Serve each request as its own task so a slow read doesn't stall pipelined publishes
+                task = asyncio.create_task(self._serve_request(line, writer, write_lock))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
 
         except Exception as e:
             self.logger.error(f"Error handling client: {e}")
-            error_response = {"status": "error", "message": str(e)}
-            writer.write(json.dumps(error_response).encode())
-            await writer.drain()
         finally:
+            for subscription in list(self._subscriptions.values()):
+                if subscription.writer is writer:
+                    self._remove_subscription(subscription.id)
             writer.close()
-            await writer.wait_closed()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+    async def _serve_request(self, line: bytes, writer: asyncio.StreamWriter, write_lock: asyncio.Lock):
+        """Process one framed request and write its response."""
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("request_id")
+            if request.get("command") == "subscribe":
+                # Subscriptions own the connection's writer, so they respond themselves
+                await self._start_subscription(request, writer, write_lock)
+                return
+            response = await self._process_command(request)
+        except Exception as e:
+            response = {"status": "error", "message": str(e)}
+
+        if request_id is not None:
+            response = {**response, "request_id": request_id}
+        await self._write_response(writer, write_lock, response)
+
+    async def _write_response(self, writer: asyncio.StreamWriter, write_lock: asyncio.Lock, response: dict[str, Any]):
+        """Write one response frame."""
+        try:
+            async with write_lock:
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, RuntimeError) as e:
+            self.logger.debug(f"Client went away before response was written: {e}")
 
     async def _process_command(self, request: dict[str, Any]) -> dict[str, Any]:
         """Process client commands with performance tracking."""
@@ -124,6 +330,8 @@ class HighPerformanceMessagingDaemon:
 
         if command == "publish":
             return await self._handle_publish(request)
+        elif command == "publish_many":
+            return await self._handle_publish_many(request)
         elif command == "read":
             return await self._handle_read(request)
         elif command == "status":
@@ -134,7 +342,11 @@ class HighPerformanceMessagingDaemon:
             return {"status": "error", "message": f"Unknown command: {command}"}
 
     async def _handle_publish(self, request: dict[str, Any]) -> dict[str, Any]:
-        """Handle publish command - queue message for async delivery."""
+        """Handle publish command - queue message for async delivery.
+
+        Admission is decided without awaiting, so concurrently served publishes
+        are checked and enqueued in the order they are handled.
+        """
         try:
             message = Message(
                 id=f"{time.time():.6f}",
@@ -145,23 +357,84 @@ class HighPerformanceMessagingDaemon:
                 sender=request.get("sender", "daemon"),
             )
 
+            refusal = self._admit(message)
+            if refusal is not None:
+                return refusal
+
             # Queue for async delivery (immediate return)
-            self._message_queue.append(asdict(message))
+            self._enqueue_message(message)
             self._message_count += 1
 
-            return {"status": "queued", "message_id": message.id, "queue_size": len(self._message_queue)}
+            return {"status": "queued", "message_id": message.id, "queue_size": self._queued_count}
 
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
+    def _admit(self, message: Message) -> Optional[dict[str, Any]]:
+        """Apply queue bounds and rate limits to a message about to be queued.
+
+        Returns:
+            None if the message may be queued, otherwise the throttled/rejected response
+        """
+        queue = self._target_queues.get(message.target)
+        target_depth = queue.qsize() if queue is not None else 0
+        if self._queued_count >= self._max_queue_depth or target_depth >= self._max_target_queue_depth:
+            self._rejected_count += 1
+            depth = max(target_depth, self._queued_count / max(1, len(self._target_workers)))
+            return {
+                "status": "rejected",
+                "message": f"Delivery queue full for {message.target}",
+                "retry_after": round(max(1.0, depth * (self._delivery_times.snapshot().mean or 0.1)), 3),
+                "queue_size": self._queued_count,
+            }
+
+        if message.priority == "critical":
+            return None
+
+        limits = (
+            ("target", self._target_limiter, message.target),
+            ("sender", self._sender_limiter, message.sender),
+        )
+        # Check every limit before consuming, so a throttled message spends no tokens
+        for limit, limiter, key in limits:
+            retry_after = limiter.time_until_available(key)
+            if retry_after:
+                self._throttled_count += 1
+                return {
+                    "status": "throttled",
+                    "message": f"Rate limit exceeded for {limit} {key}",
+                    "limit": limit,
+                    "retry_after": round(retry_after, 3),
+                    "queue_size": self._queued_count,
+                }
+        for _, limiter, key in limits:
+            limiter.try_acquire(key)
+        return None
+
+    async def _handle_publish_many(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Handle publish_many command - queue a batch of messages in one round trip."""
+        messages = request.get("messages")
+        if not isinstance(messages, list):
+            return {"status": "error", "message": "publish_many requires a 'messages' list"}
+
+        results = [await self._handle_publish(message) for message in messages]
+        queued = sum(1 for result in results if result.get("status") == "queued")
+
+        return {
+            "status": "queued" if queued == len(results) else "partial",
+            "queued": queued,
+            "results": results,
+            "queue_size": self._queued_count,
+        }
+
     async def _handle_read(self, request: dict[str, Any]) -> dict[str, Any]:
         """Handle read command - fast pane capture."""
         try:
             target = request["target"]
             lines = request.get("lines", 50)
 
-            # Fast pane capture (cached if possible)
-            content = self.tmux.capture_pane(target, lines)
+            # Served from a short-lived capture shared with concurrent readers
+            content = await self.capture_cache.capture(target, lines)
 
             return {"status": "success", "target": target, "content": content, "timestamp": datetime.now().isoformat()}
 
@@ -171,13 +444,15 @@ class HighPerformanceMessagingDaemon:
     async def _handle_status(self, request: dict[str, Any]) -> dict[str, Any]:
         """Handle status command - current daemon state."""
         uptime = time.time() - self._start_time
-        avg_delivery = sum(self._delivery_times) / len(self._delivery_times) if self._delivery_times else 0
+        avg_delivery = self._delivery_times.snapshot().mean
 
         return {
             "status": "active",
             "uptime_seconds": uptime,
             "messages_processed": self._message_count,
-            "queue_size": len(self._message_queue),
+            "queue_size": self._queued_count,
+            "active_targets": len(self._target_workers),
+            "subscriptions": len(self._subscriptions),
             "avg_delivery_time_ms": avg_delivery * 1000,
             "performance_target": "< 100ms",
             "current_performance": "OK" if avg_delivery < 0.1 else "DEGRADED",
@@ -185,146 +460,392 @@ class HighPerformanceMessagingDaemon:
 
     async def _handle_stats(self, request: dict[str, Any]) -> dict[str, Any]:
         """Handle stats command - detailed performance metrics."""
-        recent_times = list(self._delivery_times)[-100:]  # Last 100 deliveries
-
-        if recent_times:
-            min_time = min(recent_times) * 1000
-            max_time = max(recent_times) * 1000
-            avg_time = sum(recent_times) / len(recent_times) * 1000
-            p95_time = sorted(recent_times)[int(0.95 * len(recent_times))] * 1000
+        recent = self._delivery_times.snapshot()
+        times_ms = {key: value * 1000 for key, value in recent.percentiles().items()}
+        if recent.count:
+            times_ms.update(min=recent.min * 1000, max=recent.max * 1000, avg=recent.mean * 1000)
         else:
-            min_time = max_time = avg_time = p95_time = 0
+            times_ms.update(min=0, max=0, avg=0)
 
         return {
             "performance_metrics": {
                 "total_messages": self._message_count,
-                "queue_depth": len(self._message_queue),
-                "delivery_times_ms": {"min": min_time, "max": max_time, "avg": avg_time, "p95": p95_time},
+                "queue_depth": self._queued_count,
+                "active_targets": len(self._target_workers),
+                "delivery_times_ms": times_ms,
+                "delivery_sketch": recent.to_dict(),  # mergeable across daemons
                 "target_performance": 100,  # 100ms target
-                "meeting_target": avg_time < 100,
-            }
+                "meeting_target": times_ms["avg"] < 100,
+            },
+            "admission": {
+                "queue_depth": self._queued_count,
+                "max_queue_depth": self._max_queue_depth,
+                "max_target_queue_depth": self._max_target_queue_depth,
+                "target_depths": {target: queue.qsize() for target, queue in self._target_queues.items()},
+                "throttled": self._throttled_count,
+                "rejected": self._rejected_count,
+            },
+            "coalescing": {
+                "batches": self._coalesced_batches,
+                "messages": self._coalesced_messages,
+                "submissions_saved": self._coalesced_messages - self._coalesced_batches,
+            },
+            "capture_cache": self.capture_cache.get_stats(),
+            "submit_timing": self.submitter.get_stats(),
         }
 
-    async def _delivery_loop(self):
-        """High-performance async message delivery loop."""
+    async def _start_subscription(
+        self, request: dict[str, Any], writer: asyncio.StreamWriter, write_lock: asyncio.Lock
+    ) -> None:
+        """Register a subscription, replay history after ``since_seq`` and start streaming."""
+        request_id = request.get("request_id")
+        since_seq = request.get("since_seq")
+        self._loop = asyncio.get_running_loop()
+
+        self._next_subscription_id += 1
+        subscription = Subscription(
+            id=self._next_subscription_id,
+            writer=writer,
+            write_lock=write_lock,
+            targets=list(request.get("targets") or []),
+            tags=set(request.get("tags") or []),
+            priorities=set(request.get("priorities") or []),
+            last_seq=self.message_log.last_sequence if since_seq is None else int(since_seq),
+            replay=[],
+            queue=asyncio.Queue(),
+        )
+        start_seq = subscription.last_seq
+
+        if since_seq is not None:
+            # No await between the replay snapshot and registration, so fan-out
+            # picks up exactly where the replay ends
+            history = self.message_log.read_since(subscription.last_seq)
+            subscription.replay = [record for record in history if subscription.matches(record)]
+            subscription.last_seq = max([subscription.last_seq, *(record["seq"] for record in history)])
+        self._subscriptions[subscription.id] = subscription
+
+        response: dict[str, Any] = {"status": "subscribed", "subscription_id": subscription.id, "last_seq": start_seq}
+        if request_id is not None:
+            response["request_id"] = request_id
+        await self._write_response(writer, write_lock, response)
+
+        if subscription.id in self._subscriptions:
+            subscription.task = asyncio.create_task(self._subscription_pump(subscription))
+
+    async def _subscription_pump(self, subscription: Subscription) -> None:
+        """Write a subscription's replayed and live messages to its connection."""
+
+        async def send(record: dict[str, Any]) -> None:
+            event = {"event": "message", "subscription_id": subscription.id, "message": record}
+            await self._write_response(subscription.writer, subscription.write_lock, event)
+
+        try:
+            for record in subscription.replay:
+                await send(record)
+            subscription.replay = []
+
+            while True:
+                record = await subscription.queue.get()
+                if record is None:
+                    # Fell too far behind; the client resumes from its last sequence
+                    event = {"event": "overflow", "subscription_id": subscription.id}
+                    await self._write_response(subscription.writer, subscription.write_lock, event)
+                    subscription.writer.close()
+                    return
+                await send(record)
+        finally:
+            self._subscriptions.pop(subscription.id, None)
+
+    def _remove_subscription(self, subscription_id: int) -> None:
+        subscription = self._subscriptions.pop(subscription_id, None)
+        if subscription is not None and subscription.task is not None:
+            subscription.task.cancel()
+
+    def _on_log_append(self, records: list[dict[str, Any]]) -> None:
+        """Index a logged batch and hand it to subscribers (runs on the log writer thread)."""
+        try:
+            self.message_store.add_batch(records)
+        finally:
+            loop = self._loop
+            if self._subscriptions and loop is not None and not loop.is_closed():
+                loop.call_soon_threadsafe(self._fan_out, records)
+
+    def _fan_out(self, records: list[dict[str, Any]]) -> None:
+        """Queue logged messages for each matching subscription."""
+        for subscription in list(self._subscriptions.values()):
+            for record in records:
+                if record["seq"] <= subscription.last_seq:
+                    continue
+                subscription.last_seq = record["seq"]
+                if not subscription.matches(record):
+                    continue
+                if subscription.queue.qsize() >= SUBSCRIPTION_BUFFER:
+                    subscription.queue.put_nowait(None)
+                    self._subscriptions.pop(subscription.id, None)
+                    break
+                subscription.queue.put_nowait(record)
+
+    def _enqueue_message(self, message: Message) -> None:
+        """Queue a message on its target's queue, starting the target's worker if needed."""
+        target = message.target
+        queue = self._target_queues.get(target)
+        if queue is None:
+            queue = self._target_queues[target] = asyncio.PriorityQueue()
+            self._target_workers[target] = asyncio.create_task(self._target_delivery_worker(target, queue))
+
+        self._enqueue_seq += 1
+        queue.put_nowait((PRIORITY_RANK.get(message.priority, PRIORITY_RANK["normal"]), self._enqueue_seq, message))
+        self._queued_count += 1
+
+    async def _target_delivery_worker(self, target: str, queue: asyncio.PriorityQueue[tuple[int, int, Message]]):
+        """Deliver one target's messages in order, sleeping on the queue while idle."""
         while self.running:
             try:
-                if self._message_queue:
-                    message = self._message_queue.popleft()
-                    start_time = time.time()
+                _, _, message = await asyncio.wait_for(queue.get(), timeout=self._worker_idle_timeout)
+            except TimeoutError:
+                if queue.empty():
+                    # Retire idle workers; the next publish for this target starts a new one
+                    self._target_queues.pop(target, None)
+                    self._target_workers.pop(target, None)
+                    return
+                continue
+
+            self._queued_count -= 1
+            try:
+                batch = await self._collect_batch(target, queue, message)
+                await self._deliver_batch(batch)
+            except Exception as e:
+                self.logger.error(f"Error delivering to {target}: {e}")
+
+    async def _collect_batch(
+        self, target: str, queue: asyncio.PriorityQueue[tuple[int, int, Message]], first: Message
+    ) -> list[Message]:
+        """Gather queued messages that can share a submission with ``first``.
+
+        Waits out the batching window, then keeps collecting while the target is
+        busy, until the maximum hold or batch size is reached or a message that
+        outranks the batch is waiting. Critical messages arriving meanwhile are
+        delivered immediately on their own.
+        """
+        group = COALESCE_GROUPS.get(first.priority)
+        batch = [first]
+        if group is None or self._coalesce_window <= 0:
+            return batch
+
+        loop = asyncio.get_running_loop()
+        hold_until = loop.time() + self._coalesce_max_hold
+        await asyncio.sleep(self._coalesce_window)
+
+        while len(batch) < self._coalesce_max_messages:
+            outranked = False
+            while not queue.empty() and len(batch) < self._coalesce_max_messages:
+                entry = queue.get_nowait()
+                message = entry[2]
+                if message.priority == "critical":
+                    self._queued_count -= 1
+                    await self._deliver_batch([message])
+                elif COALESCE_GROUPS.get(message.priority) == group:
+                    self._queued_count -= 1
+                    batch.append(message)
+                else:
+                    # Different group: put it back; only a higher priority ends the hold early
+                    queue.put_nowait(entry)
+                    outranked = PRIORITY_RANK.get(message.priority, PRIORITY_RANK["normal"]) < PRIORITY_RANK.get(
+                        first.priority, PRIORITY_RANK["normal"]
+                    )
+                    break
 
-                    # Deliver message using optimized tmux operations
-                    success = await self._deliver_message_fast(message)
+            if outranked or loop.time() >= hold_until or not await self._target_busy(target):
+                break
+            await asyncio.sleep(self._busy_poll_interval)
 
-                    delivery_time = time.time() - start_time
-                    self._delivery_times.append(delivery_time)
+        return batch
 
-                    if delivery_time > 0.1:  # Log slow deliveries
-                        self.logger.warning(f"Slow delivery: {delivery_time * 1000:.1f}ms for {message.target}")
+    async def _target_busy(self, target: str) -> bool:
+        """Check whether the agent in ``target`` is working on a turn."""
+        try:
+            content = await self.capture_cache.capture(target, 15)
+        except Exception:
+            return False
+        return isinstance(content, str) and is_agent_busy(content)
 
-                    # Persist message (async, non-blocking)
-                    if success:
-                        asyncio.create_task(self._persist_message(message))
+    async def _deliver_batch(self, batch: list[Message]) -> bool:
+        """Deliver one message, or several merged into one submission, and persist each."""
+        message = batch[0] if len(batch) == 1 else merge_messages(batch)
+        start_time = time.time()
 
-                else:
-                    # No messages - brief sleep to prevent busy waiting
-                    await asyncio.sleep(0.001)  # 1ms sleep
+        # Deliver message using optimized tmux operations
+        success = await self._deliver_message_fast(message)
+        self.capture_cache.invalidate(message.target)
 
-            except Exception as e:
-                self.logger.error(f"Error in delivery loop: {e}")
-                await asyncio.sleep(0.01)  # Brief recovery pause
+        delivery_time = time.time() - start_time
+        self._delivery_times.add(delivery_time)
+
+        if delivery_time > 0.1:  # Log slow deliveries
+            self.logger.warning(f"Slow delivery: {delivery_time * 1000:.1f}ms for {message.target}")
+
+        if len(batch) > 1:
+            self._coalesced_batches += 1
+            self._coalesced_messages += len(batch)
+
+        # Persist each original message (batched by the log's writer task)
+        if success:
+            for original in batch:
+                self._persist_message(original)
+        return success
 
     async def _deliver_message_fast(self, message: Message) -> bool:
         """Ultra-optimized message delivery with aggressive performance tuning."""
         try:
             # Format message with priority prefix
-            priority_prefixes = {"critical": "🚨 CRITICAL", "high": "⚠️  HIGH PRIORITY", "normal": "📨", "low": "💬"}
-
-            formatted_msg = f"{priority_prefixes[message.priority]} {message.content}"
+            formatted_msg = f"{PRIORITY_PREFIXES[message.priority]} {message.content}"
             target = message.target
 
-            # PERFORMANCE OPTIMIZATION: Parallel operations where possible
-            # Clear existing input + send text in quick succession
-            # DISABLED: self.tmux.press_ctrl_c(target)  # This kills Claude when multiple messages arrive
-            # await asyncio.sleep(0.05)  # Minimal 50ms delay
-
-            self.tmux.press_ctrl_u(target)
-            await asyncio.sleep(0.05)  # Minimal 50ms delay
-
-            # Send message text
-            self.tmux.send_text(target, formatted_msg)
-
-            # CRITICAL PERFORMANCE BOOST: Reduce Claude processing wait
-            # Most agents respond within 200ms, not 3000ms
-            await asyncio.sleep(0.2)  # Reduced from 0.5s to 200ms
-
-            # Submit with Enter
-            self.tmux.press_enter(target)
-
-            return True
+            # Each step is confirmed by observing the pane (cursor + prompt box)
+            # instead of fixed sleeps; observed delays are learned per target.
+            # Never press Ctrl-C here: it kills Claude when multiple messages arrive.
+            return await self.submitter.submit(target, formatted_msg, clear=True)
 
         except Exception as e:
             self.logger.error(f"Failed to deliver message to {message.target}: {e}")
             return False
 
-    async def _persist_message(self, message: Message):
-        """Async message persistence to avoid blocking delivery."""
+    def _persist_message(self, message: Message):
+        """Queue a delivered message for the append-only message log."""
         try:
-            target_file = self.storage_dir / f"{message.target.replace(':', '_')}.json"
-
-            # Load existing messages
-            if target_file.exists():
-                with open(target_file) as f:
-                    messages = json.load(f)
-            else:
-                messages = []
-
-            # Add new message
-            messages.append(asdict(message))
-
-            # Keep only last 1000 messages
-            if len(messages) > 1000:
-                messages = messages[-1000:]
-
-            # Write back atomically
-            with open(target_file, "w") as f:
-                json.dump(messages, f, indent=2)
-
+            self.message_log.submit(asdict(message))
         except Exception as e:
             self.logger.error(f"Failed to persist message: {e}")
 
     def stop(self):
         """Stop the daemon gracefully."""
         self.running = False
-        if self._delivery_task:
-            self._delivery_task.cancel()
+        for worker in self._target_workers.values():
+            worker.cancel()
+        self._target_workers.clear()
+        self._target_queues.clear()
+        for subscription_id in list(self._subscriptions):
+            self._remove_subscription(subscription_id)
+        self.message_log.close()
+        self.message_store.close()
 
 
 class DaemonClient:
-    """Fast client for communicating with messaging daemon."""
+    """Fast client for communicating with messaging daemon.
+
+    Keeps one persistent connection per event loop and pipelines concurrent
+    commands over it, matching responses by request id.
+    """
 
-    def __init__(self, socket_path: str = "/tmp/tmux-orc-msgd.sock"):
+    def __init__(self, socket_path: str = "/tmp/tmux-orc-msgd.sock", timeout: float = 10.0):
         self.socket_path = socket_path
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._next_request_id = 0
+
+    async def __aenter__(self) -> "DaemonClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    @property
+    def connected(self) -> bool:
+        """Whether a usable connection exists for the running event loop."""
+        return (
+            self._writer is not None
+            and not self._writer.is_closing()
+            and self._loop is asyncio.get_running_loop()
+            and self._reader_task is not None
+            and not self._reader_task.done()
+        )
+
+    async def _ensure_connected(self) -> asyncio.StreamWriter:
+        """Open the persistent connection if needed (reconnecting after loss or loop change)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Connections are bound to the loop that opened them (e.g. across asyncio.run calls)
+            self._drop_connection()
+            self._loop = loop
+            self._connect_lock = asyncio.Lock()
+
+        assert self._connect_lock is not None
+        async with self._connect_lock:
+            if not self.connected:
+                self._drop_connection()
+                self._reader, self._writer = await asyncio.open_unix_connection(self.socket_path, limit=MAX_FRAME_BYTES)
+                self._reader_task = loop.create_task(self._read_responses(self._reader))
+
+        assert self._writer is not None
+        return self._writer
+
+    async def _read_responses(self, reader: asyncio.StreamReader) -> None:
+        """Dispatch response frames to their waiting requests."""
+        error: Exception = ConnectionError("Daemon closed the connection")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self._pending.pop(response.pop("request_id", None), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except Exception as e:
+            error = e
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
+    def _drop_connection(self) -> None:
+        """Forget the current connection without awaiting its shutdown."""
+        try:
+            if self._reader_task is not None and not self._reader_task.done():
+                self._reader_task.cancel()
+            if self._writer is not None:
+                self._writer.close()
+        except Exception:
+            # The owning event loop may already be closed
+            pass
+        self._reader = self._writer = self._reader_task = None
+
+    async def close(self) -> None:
+        """Close the persistent connection."""
+        writer = self._writer
+        self._drop_connection()
+        if writer is not None:
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
 
     async def send_command(self, command: dict[str, Any]) -> dict[str, Any]:
         """Send command to daemon with minimal latency."""
+        request_id = None
         try:
-            reader, writer = await asyncio.open_unix_connection(self.socket_path)
+            writer = await self._ensure_connected()
 
-            # Send command
-            writer.write(json.dumps(command).encode())
-            await writer.drain()
+            self._next_request_id += 1
+            request_id = self._next_request_id
+            future = asyncio.get_running_loop().create_future()
+            self._pending[request_id] = future
 
-            # Read response
-            data = await reader.read(8192)
-            response = json.loads(data.decode())
-
-            writer.close()
-            await writer.wait_closed()
+            writer.write(json.dumps({**command, "request_id": request_id}).encode() + b"\n")
+            await writer.drain()
 
+            response = await asyncio.wait_for(future, self.timeout)
             return cast(dict[str, Any], response)
 
         except Exception as e:
+            if request_id is not None:
+                self._pending.pop(request_id, None)
             return {"status": "error", "message": f"Daemon communication failed: {e}"}
 
     async def publish(
@@ -334,6 +855,74 @@ class DaemonClient:
         command = {"command": "publish", "target": target, "message": message, "priority": priority, "tags": tags or []}
         return await self.send_command(command)
 
+    async def publish_many(self, messages: list[dict[str, Any]]) -> dict[str, Any]:
+        """Publish a batch of messages in one round trip.
+
+        Args:
+            messages: Dicts with ``target`` and ``message`` and optional ``priority``, ``tags``, ``sender``
+
+        Returns:
+            Batch response with a per-message ``results`` list
+        """
+        return await self.send_command({"command": "publish_many", "messages": messages})
+
+    async def subscribe(
+        self,
+        targets: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        priorities: Optional[list[str]] = None,
+        since_seq: Optional[int] = None,
+        reconnect_delay: float = 1.0,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream logged messages matching filters as they arrive.
+
+        Uses a dedicated connection and reconnects after errors, resuming from
+        the last sequence number seen so no messages are missed or repeated.
+
+        Args:
+            targets: Targets or session names to include (all if empty)
+            tags: Include messages carrying any of these tags
+            priorities: Priorities to include
+            since_seq: Replay retained messages after this sequence (live only if None)
+            reconnect_delay: Seconds to wait before reconnecting
+
+        Yields:
+            Message records including their ``seq``
+        """
+        last_seq = since_seq
+        while True:
+            writer = None
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.socket_path, limit=MAX_FRAME_BYTES)
+                request = {
+                    "command": "subscribe",
+                    "targets": targets or [],
+                    "tags": tags or [],
+                    "priorities": priorities or [],
+                    "since_seq": last_seq,
+                }
+                writer.write(json.dumps(request).encode() + b"\n")
+                await writer.drain()
+
+                response = json.loads(await reader.readline() or b"{}")
+                if response.get("status") != "subscribed":
+                    raise RuntimeError(f"Subscription rejected: {response.get('message', response)}")
+                if last_seq is None:
+                    last_seq = response["last_seq"]
+
+                while line := await reader.readline():
+                    frame = json.loads(line)
+                    if frame.get("event") == "message":
+                        last_seq = frame["message"]["seq"]
+                        yield frame["message"]
+            except (OSError, ValueError):
+                pass
+            finally:
+                if writer is not None:
+                    writer.close()
+
+            await asyncio.sleep(reconnect_delay)
+
     async def read(self, target: str, lines: int = 50) -> dict[str, Any]:
         """Read from target via daemon."""
         command = {"command": "read", "target": target, "lines": lines}
@@ -0,0 +1,278 @@
+"""Event-driven idle detection using tmux silence/activity alerts.
+
+Instead of polling every agent each cycle, agent windows are configured with
+``monitor-silence`` and ``monitor-activity``. The ``alert-silence`` and
+``alert-activity`` hooks append one line per transition to an event file that
+the monitor daemon reads, so the daemon only polls agents to confirm a
+transition it was told about.
+"""
+
+import logging
+import os
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass
+class ActivityEvent:
+    """A silence or activity alert reported by a tmux hook."""
+
+    kind: str  # "silence" or "activity"
+    target: str
+    timestamp: float
+
+
+@dataclass
+class WindowActivityState:
+    """Event-derived activity state for one agent window."""
+
+    state: str = "unknown"  # "unknown", "active" or "idle"
+    last_event: float = 0.0
+    last_silence: float = 0.0
+    last_confirmed: float = 0.0
+    needs_confirm: bool = True
+
+
+class ActivityEventSource:
+    """Routes tmux silence/activity alerts into the monitor daemon."""
+
+    EVENT_KINDS = ("silence", "activity")
+    MAX_EVENT_FILE_BYTES = 1024 * 1024
+
+    def __init__(
+        self,
+        events_file: Path,
+        silence_threshold: int = 30,
+        reconfirm_interval: float = 300.0,
+        tmux_cmd: str = "tmux",
+    ) -> None:
+        """Initialize the event source.
+
+        Args:
+            events_file: File the tmux hooks append events to
+            silence_threshold: Seconds without output before tmux reports silence
+            reconfirm_interval: Seconds between confirmation polls of idle agents
+            tmux_cmd: TMUX command to use (default: "tmux")
+        """
+        self.events_file = events_file
+        self.silence_threshold = silence_threshold
+        self.reconfirm_interval = reconfirm_interval
+        self.tmux_cmd = tmux_cmd
+        self._logger = logging.getLogger(__name__)
+
+        self._offset = 0
+        self._configured_targets: set[str] = set()
+        self._configured_sessions: set[str] = set()
+        self._states: dict[str, WindowActivityState] = {}
+
+        self.events_file.parent.mkdir(parents=True, exist_ok=True)
+        self.events_file.touch(exist_ok=True)
+        self._offset = self.events_file.stat().st_size
+
+    def configure_agents(self, targets: list[str]) -> int:
+        """Install silence/activity monitoring on agent windows not yet configured.
+
+        Args:
+            targets: Agent targets in "session:window" format
+
+        Returns:
+            Number of newly configured windows
+        """
+        configured = 0
+        for target in targets:
+            if target in self._configured_targets:
+                continue
+            if self._configure_window(target):
+                self._configured_targets.add(target)
+                self._states.setdefault(target, WindowActivityState())
+                configured += 1
+
+        # Forget windows that no longer exist so a reused index is reconfigured
+        for target in self._configured_targets - set(targets):
+            self._configured_targets.discard(target)
+            self._states.pop(target, None)
+
+        if configured:
+            self._logger.info(f"Configured tmux activity alerts on {configured} agent windows")
+        return configured
+
+    def _configure_window(self, target: str) -> bool:
+        """Set monitor options and alert hooks on one window."""
+        session = target.split(":")[0]
+        events_path = str(self.events_file).replace("'", "")
+
+        silence_hook = (
+            f"run-shell -b \"echo silence #{{session_name}}:#{{window_index}} >> '{events_path}' ; "
+            f"{self.tmux_cmd} kill-session -C -t '#{{session_name}}'\""
+        )
+        activity_hook = f"run-shell -b \"echo activity #{{session_name}}:#{{window_index}} >> '{events_path}'\""
+
+        commands = [
+            ["set-option", "-w", "-t", target, "monitor-silence", str(self.silence_threshold)],
+            ["set-option", "-w", "-t", target, "monitor-activity", "on"],
+            ["set-hook", "-w", "-t", target, "alert-silence", silence_hook],
+            ["set-hook", "-w", "-t", target, "alert-activity", activity_hook],
+        ]
+        if session not in self._configured_sessions:
+            # Alerts for a session's current window are suppressed with the default "other" action
+            commands.extend(
+                [
+                    ["set-option", "-t", session, "silence-action", "any"],
+                    ["set-option", "-t", session, "activity-action", "any"],
+                ]
+            )
+
+        if not all(self._run_tmux(command) for command in commands):
+            self._logger.warning(f"Could not configure activity alerts for {target} - falling back to polling")
+            return False
+
+        self._configured_sessions.add(session)
+        return True
+
+    def remove_hooks(self) -> None:
+        """Remove alert hooks and monitoring options from configured windows."""
+        for target in list(self._configured_targets):
+            self._run_tmux(["set-hook", "-uw", "-t", target, "alert-silence"])
+            self._run_tmux(["set-hook", "-uw", "-t", target, "alert-activity"])
+            self._run_tmux(["set-option", "-uw", "-t", target, "monitor-silence"])
+        self._configured_targets.clear()
+        self._configured_sessions.clear()
+
+    def _run_tmux(self, args: list[str]) -> bool:
+        """Run a tmux command, returning True on success."""
+        try:
+            result = subprocess.run([self.tmux_cmd] + args, capture_output=True, text=True, timeout=2)
+            if result.returncode != 0:
+                self._logger.debug(f"tmux {' '.join(args[:2])} failed: {result.stderr.strip()}")
+            return result.returncode == 0
+        except Exception as e:
+            self._logger.debug(f"tmux {' '.join(args[:2])} error: {e}")
+            return False
+
+    def has_pending_events(self) -> bool:
+        """Check whether hooks have appended events since the last read."""
+        try:
+            return self.events_file.stat().st_size != self._offset
+        except OSError:
+            return False
+
+    def wait_for_events(self, timeout: float, check_interval: float = 0.25) -> bool:
+        """Sleep until an event arrives or the timeout expires.
+
+        Args:
+            timeout: Maximum seconds to wait
+            check_interval: Seconds between checks of the event file size
+
+        Returns:
+            True if events are pending
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.has_pending_events():
+                return True
+            time.sleep(min(check_interval, max(0.0, deadline - time.monotonic())))
+        return self.has_pending_events()
+
+    def read_events(self) -> list[ActivityEvent]:
+        """Read new events from the event file and apply them to window states.
+
+        Returns:
+            Events read since the previous call
+        """
+        events: list[ActivityEvent] = []
+        try:
+            size = self.events_file.stat().st_size
+            if size < self._offset:
+                # File was truncated or replaced
+                self._offset = 0
+            if size == self._offset:
+                return events
+
+            with open(self.events_file) as f:
+                f.seek(self._offset)
+                data = f.read()
+            # Only consume complete lines; a partial line is finished by its writer
+            consumed = data.rfind("\n") + 1
+            self._offset += len(data[:consumed].encode())
+            lines = data[:consumed].splitlines()
+
+            # Rotate once fully consumed; an append racing the truncate is caught
+            # by the next confirmation poll
+            if self._offset >= self.MAX_EVENT_FILE_BYTES and self._offset == size:
+                os.truncate(self.events_file, 0)
+                self._offset = 0
+        except OSError as e:
+            self._logger.debug(f"Error reading activity events: {e}")
+            return events
+
+        now = time.time()
+        for line in lines:
+            parts = line.split()
+            if len(parts) != 2 or parts[0] not in self.EVENT_KINDS:
+                continue
+            event = ActivityEvent(kind=parts[0], target=parts[1], timestamp=now)
+            self._apply_event(event)
+            events.append(event)
+
+        return events
+
+    def _apply_event(self, event: ActivityEvent) -> None:
+        """Update window state for an event."""
+        state = self._states.get(event.target)
+        if state is None:
+            # Events for windows we don't track (e.g. non-agent windows)
+            return
+
+        if event.kind == "activity":
+            state.state = "active"
+            state.needs_confirm = False
+        else:
+            # While a window stays quiet, tmux re-reports silence every threshold;
+            # a longer gap means output happened in between even if the activity
+            # alert was not delivered.
+            gap = event.timestamp - state.last_silence
+            if state.state != "idle" or gap > self.silence_threshold * 2:
+                state.state = "idle"
+                state.needs_confirm = True
+            state.last_silence = event.timestamp
+
+        state.last_event = event.timestamp
+
+    def targets_to_check(self, targets: list[str]) -> list[str]:
+        """Select the agents that need a confirmation poll this cycle.
+
+        Args:
+            targets: All discovered agent targets
+
+        Returns:
+            Targets that are unconfigured, have an unconfirmed transition, are
+            due for reconfirmation, or have gone quiet without any events
+        """
+        now = time.time()
+        stale_after = max(60.0, self.silence_threshold * 4)
+        selected = []
+
+        for target in targets:
+            state = self._states.get(target)
+            if target not in self._configured_targets or state is None or state.needs_confirm:
+                selected.append(target)
+            elif state.state == "idle" and now - state.last_confirmed >= self.reconfirm_interval:
+                selected.append(target)
+            elif now - state.last_event >= stale_after and now - state.last_confirmed >= stale_after:
+                # Safety net in case alerts stop arriving for this window
+                selected.append(target)
+
+        return selected
+
+    def mark_confirmed(self, target: str) -> None:
+        """Record that a target's state was confirmed by polling."""
+        state = self._states.get(target)
+        if state is not None:
+            state.needs_confirm = False
+            state.last_confirmed = time.time()
+
+    def get_state(self, target: str) -> WindowActivityState | None:
+        """Get the event-derived state for a target."""
+        return self._states.get(target)
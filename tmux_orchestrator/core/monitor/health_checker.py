@@ -29,6 +29,8 @@ class HealthChecker:
         self._idle_notifications: dict[str, datetime] = {}
         self._restart_attempts: dict[str, datetime] = {}
         self._terminal_caches: dict[str, "TerminalCache"] = {}
+        # Latest pane content per target for the current cycle, reused for PM busy checks
+        self.cycle_snapshots: dict[str, str] = {}
 
     def check_agent_status(
         self, tmux: TMUXManager, target: str, logger: logging.Logger, pm_notifications: dict[str, list[str]]
@@ -55,6 +57,7 @@ class HealthChecker:
 
             # Use last snapshot for state detection
             content = snapshots[-1]
+            self.cycle_snapshots[target] = content
 
             # Step 2: Detect if terminal is actively changing
             is_active = False
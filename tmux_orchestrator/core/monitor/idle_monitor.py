@@ -14,6 +14,7 @@ from pathlib import Path
 from tmux_orchestrator.core.config import Config
 from tmux_orchestrator.utils.tmux import TMUXManager
 
+from .activity_events import ActivityEventSource
 from .agent_discovery import AgentDiscovery
 from .daemon import DaemonAlreadyRunningError, DaemonManager
 from .health_checker import HealthChecker
@@ -103,6 +104,15 @@ class IdleMonitor:
         # Message queues
         self._pm_message_queues: dict[str, list[str]] = {}
 
+        # Optional event-driven idle detection via tmux silence/activity alerts
+        self.activity_events: ActivityEventSource | None = None
+        if config.get("monitoring.event_driven_idle", False):
+            self.activity_events = ActivityEventSource(
+                project_dir / "activity-events.log",
+                silence_threshold=int(config.get("monitoring.silence_threshold", 30)),
+                reconfirm_interval=float(config.notification_cooldown),
+            )
+
     def is_running(self) -> bool:
         """Check if monitor daemon is running with robust validation."""
         return self.daemon_manager.is_running()
@@ -224,8 +234,11 @@ class IdleMonitor:
                 # Run monitoring cycle
                 self._monitor_cycle(self.tmux, logger)
 
-                # Sleep until next cycle
-                time.sleep(interval)
+                # Sleep until next cycle (or until a tmux alert arrives)
+                if self.activity_events:
+                    self.activity_events.wait_for_events(interval)
+                else:
+                    time.sleep(interval)
 
         except KeyboardInterrupt:
             logger.info("Received interrupt signal, shutting down gracefully")
@@ -249,19 +262,31 @@ class IdleMonitor:
 
             # Track notifications for batching
             pm_notifications: dict[str, list[str]] = {}
+            self.health_checker.cycle_snapshots.clear()
+
+            # With tmux alerts enabled, only poll agents to confirm reported transitions
+            targets = agents
+            if self.activity_events:
+                self.activity_events.configure_agents(agents)
+                self.activity_events.read_events()
+                targets = self.activity_events.targets_to_check(agents)
+                logger.debug(f"Event-driven idle detection: polling {len(targets)}/{len(agents)} agents")
 
             # Check each agent's status
-            for target in agents:
+            for target in targets:
                 try:
                     self.health_checker.check_agent_status(tmux, target, logger, pm_notifications)
+                    if self.activity_events:
+                        self.activity_events.mark_confirmed(target)
                 except Exception as e:
                     logger.error(f"Error checking agent {target}: {e}")
 
             # Send collected notifications
-            self.notifier.send_collected_notifications(tmux, pm_notifications, logger)
+            snapshots = self.health_checker.cycle_snapshots
+            self.notifier.send_collected_notifications(tmux, pm_notifications, logger, snapshots)
 
-            # Process queued PM messages
-            self.notifier.process_pm_message_queues(tmux, logger)
+            # Deliver coalesced PM digests whose window has closed
+            self.notifier.process_pm_message_queues(tmux, logger, snapshots)
 
             # Check for PM recovery needs
             self.recovery_manager.check_pm_recovery(tmux, agents, self.agent_discovery, logger)
@@ -325,6 +350,10 @@ class IdleMonitor:
         except OSError as e:
             logger.error(f"Failed to remove PID file: {e}")
 
+        # Remove tmux alert hooks so windows stop reporting to a dead daemon
+        if self.activity_events:
+            self.activity_events.remove_hooks()
+
         # Remove graceful stop flag if it exists
         try:
             if self.graceful_stop_file.exists():
@@ -4,6 +4,7 @@ import logging
 from datetime import datetime
 
 from tmux_orchestrator.core.monitor_helpers import is_pm_busy
+from tmux_orchestrator.core.monitoring.notification_coalescer import NotificationCoalescer
 from tmux_orchestrator.utils.tmux import TMUXManager
 
 
@@ -12,7 +13,7 @@ class MonitorNotifier:
 
     def __init__(self) -> None:
         """Initialize the notifier."""
-        self._pm_message_queues: dict[str, list[str]] = {}
+        self.coalescer = NotificationCoalescer()
 
     def notify_crash(
         self, tmux: TMUXManager, target: str, logger: logging.Logger, pm_notifications: dict[str, list[str]]
@@ -192,25 +193,29 @@ Copy and paste the command above to restart the agent."""
             logger.error(f"Failed to notify team of PM recovery: {e}")
 
     def send_collected_notifications(
-        self, tmux: TMUXManager, pm_notifications: dict[str, list[str]], logger: logging.Logger
+        self,
+        tmux: TMUXManager,
+        pm_notifications: dict[str, list[str]],
+        logger: logging.Logger,
+        snapshots: dict[str, str] | None = None,
     ) -> None:
-        """Send collected notifications to PMs.
+        """Add notifications collected this cycle to the PM coalescing windows.
+
+        Critical notifications are delivered right away; everything else is
+        sent as a digest once the PM's window closes.
 
         Args:
             tmux: TMUXManager instance
             pm_notifications: Dictionary of PM targets to their notification lists
             logger: Logger instance
+            snapshots: Pane content captured this cycle, used for PM busy checks
         """
         try:
             for pm_target, messages in pm_notifications.items():
-                if not messages:
-                    continue
-
-                # Combine messages into a single notification
-                combined_message = "📊 MONITORING UPDATE:\n\n" + "\n\n".join(messages)
+                for message in messages:
+                    self.coalescer.add_message(pm_target, message)
 
-                # Send to PM with busy check
-                self._send_pm_message_with_busy_check(tmux, pm_target, combined_message, logger)
+            self.process_pm_message_queues(tmux, logger, snapshots)
 
         except Exception as e:
             logger.error(f"Failed to send collected notifications: {e}")
@@ -224,45 +229,44 @@ Copy and paste the command above to restart the agent."""
             logger: Logger instance
         """
         try:
-            if pm_target not in self._pm_message_queues:
-                self._pm_message_queues[pm_target] = []
-
-            self._pm_message_queues[pm_target].append(message)
+            self.coalescer.add_message(pm_target, message)
             logger.debug(f"Queued message for PM {pm_target}")
 
         except Exception as e:
             logger.error(f"Failed to queue PM message: {e}")
 
-    def process_pm_message_queues(self, tmux: TMUXManager, logger: logging.Logger) -> None:
-        """Process queued PM messages.
+    def process_pm_message_queues(
+        self, tmux: TMUXManager, logger: logging.Logger, snapshots: dict[str, str] | None = None
+    ) -> None:
+        """Deliver digests for PMs whose coalescing window has closed.
 
         Args:
             tmux: TMUXManager instance
             logger: Logger instance
+            snapshots: Pane content captured this cycle, used for PM busy checks
         """
         try:
-            for pm_target, messages in list(self._pm_message_queues.items()):
-                if not messages:
-                    continue
-
-                # Combine messages
-                combined_message = "\n\n".join(messages)
-
-                # Send with busy check
-                success = self._send_pm_message_with_busy_check(tmux, pm_target, combined_message, logger)
-
-                if success:
-                    # Clear sent messages
-                    self._pm_message_queues[pm_target] = []
-                    logger.info(f"Sent {len(messages)} queued messages to PM {pm_target}")
+            busy_cache: dict[str, bool] = {}
+
+            def pm_is_busy(pm_target: str) -> bool:
+                if pm_target not in busy_cache:
+                    content = (snapshots or {}).get(pm_target)
+                    if content is None:
+                        content = tmux.capture_pane(pm_target, lines=50)
+                    busy_cache[pm_target] = is_pm_busy(content)
+                return busy_cache[pm_target]
+
+            for digest in self.coalescer.collect_ready(is_busy=pm_is_busy):
+                if self._send_pm_message(tmux, digest.pm_target, digest.message, logger):
+                    logger.info(f"Sent {len(digest.notifications)} coalesced notifications to PM {digest.pm_target}")
+                else:
+                    self.coalescer.requeue(digest)
 
         except Exception as e:
             logger.error(f"Failed to process PM message queues: {e}")
 
-    def _send_pm_message_with_busy_check(
-        self, tmux: TMUXManager, pm_target: str, message: str, logger: logging.Logger
-    ) -> bool:
-        """Send message to PM with busy check.
+    def _send_pm_message(self, tmux: TMUXManager, pm_target: str, message: str, logger: logging.Logger) -> bool:
+        """Send message to PM.
 
         Args:
             tmux: TMUXManager instance
@@ -274,14 +278,6 @@ Copy and paste the command above to restart the agent."""
             bool: True if message was sent successfully
         """
         try:
-            # Check if PM is busy
-            content = tmux.capture_pane(pm_target, lines=50)
-
-            if is_pm_busy(content):
-                logger.debug(f"PM {pm_target} is busy, deferring message")
-                return False
-
-            # Send message
             tmux.send_keys(pm_target, message, literal=True)
             tmux.send_keys(pm_target, "Enter")
 
@@ -90,6 +90,9 @@ class AsyncMonitorService(MonitorService):
 
     def _register_services(self) -> None:
         """Register all services with the dependency injection container."""
+        if self.service_container.is_frozen:
+            return
+
         # Register core services
         self.service_container.register(TMUXManager, self.tmux)
         self.service_container.register(Config, self.config)
@@ -108,6 +111,9 @@ class AsyncMonitorService(MonitorService):
         self.service_container.register(TMuxConnectionPool, self.tmux_pool)
         self.service_container.register(LayeredCache, self.cache)
 
+        # Validate the service graph now so wiring errors fail startup, not a later cycle
+        self.service_container.freeze()
+
     async def _load_plugins(self) -> None:
         """Load monitoring strategy plugins."""
         # Discover and load plugins
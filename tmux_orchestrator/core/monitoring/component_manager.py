@@ -250,7 +250,10 @@ class ComponentManager:
 
                 # Handle error states
                 if analysis.error_detected:
+                    self.state_tracker.mark_agent_crashed(agent.target)
                     self._handle_agent_error(agent, analysis)
+                else:
+                    self.state_tracker.clear_agent_crashed(agent.target)
 
                 # Handle fresh agents
                 if analysis.idle_type == IdleType.FRESH_AGENT:
@@ -314,18 +317,15 @@ class ComponentManager:
     def _check_team_idle_status(self, session: str) -> None:
         """Check if entire team in session is idle."""
         try:
-            session_agents = self.state_tracker.get_session_agents(session)
-            if not session_agents:
+            aggregates = self.state_tracker.get_session_aggregates(session)
+            if not aggregates.total:
                 return
 
-            # Count idle agents in session
-            idle_count = sum(1 for agent in session_agents if self.state_tracker.is_agent_idle(agent.target))
-
             # If all agents are idle, mark team as idle
-            if idle_count == len(session_agents) and idle_count > 0:
+            if aggregates.all_idle:
                 if not self.state_tracker.is_team_idle(session):
                     self.state_tracker.set_team_idle(session)
-                    self.notification_manager.notify_team_idle(session=session, agent_count=idle_count)
+                    self.notification_manager.notify_team_idle(session=session, agent_count=aggregates.idle)
             else:
                 # Team is not idle anymore
                 if self.state_tracker.is_team_idle(session):
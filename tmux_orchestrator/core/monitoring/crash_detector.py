@@ -5,15 +5,22 @@ This module provides sophisticated crash detection that prevents false positives
 when agents are discussing failures, errors, or killed processes in normal conversation.
 """
 
+import asyncio
 import logging
 import re
+import time
+from collections import deque
 from datetime import datetime, timedelta
+from typing import Any
 
 from tmux_orchestrator.utils.tmux import TMUXManager
 
-from .interfaces import CrashDetectorInterface
+from .interfaces import CRASH_PENDING_CONFIRMATION, CrashDetectorInterface
 from .types import AgentInfo
 
+# Foreground commands that mean the agent has exited to its shell
+SHELL_COMMANDS = frozenset({"bash", "zsh", "sh", "dash", "fish", "ksh", "tcsh", "csh"})
+
 
 class CrashDetector(CrashDetectorInterface):
     """Context-aware crash detection system."""
@@ -32,6 +39,15 @@ class CrashDetector(CrashDetectorInterface):
         self._crash_observations: dict[str, list[datetime]] = {}
         self._crash_observation_window = 30  # seconds
 
+        # Fast-path confirmation: re-probe a suspect agent on a short timer
+        # instead of waiting for two more monitor cycles
+        self._fast_probe_interval = 0.5  # seconds between follow-up probes
+        self._fast_confirm_timeout = 2.0  # seconds before falling back to observation
+        self._fast_probe_lines = 50
+        self._pending_fast_confirmations: dict[str, str] = {}
+        self._first_indicator_seen: dict[str, float] = {}
+        self._detection_incidents: deque[dict[str, Any]] = deque(maxlen=100)
+
         # Focused crash indicators - only actual process crashes
         self._crash_indicators = [
             "claude: command not found",  # Claude binary missing
@@ -118,10 +134,13 @@ class CrashDetector(CrashDetectorInterface):
         # Convert list of strings to single string for analysis
         content = "\n".join(window_content)
         content_lower = content.lower()
+        target = agent_info.target
 
         # PRIORITY 1: Check for shell prompt at the end of content (immediate crash detection)
         if self._check_shell_prompt_at_end(content):
-            self.logger.warning(f"Agent {agent_info.target} shows shell prompt at end - likely crashed")
+            self.logger.warning(f"Agent {target} shows shell prompt at end - likely crashed")
+            self._first_indicator_seen.setdefault(target, time.monotonic())
+            self._record_detection(target, "shell prompt", "shell_prompt")
             return True, "Shell prompt detected at terminal end"
 
         # PRIORITY 2: Check for crash indicators
@@ -134,26 +153,173 @@ class CrashDetector(CrashDetectorInterface):
                     )
                     continue
 
-                self.logger.warning(f"Crash indicator found: '{indicator}' in {agent_info.target}")
+                self.logger.warning(f"Crash indicator found: '{indicator}' in {target}")
+                self._first_indicator_seen.setdefault(target, time.monotonic())
+
+                # Fast path: check what is running in the pane
+                claude_running = self._is_claude_process_running(target)
+                if claude_running:
+                    self.logger.debug(f"Claude process still running in {target} - ignoring '{indicator}'")
+                    self._clear_crash_tracking(target)
+                    return False, None
 
                 # Use observation period for confirmation
-                if self._confirm_crash_with_observation(agent_info.target, indicator):
+                if self._confirm_crash_with_observation(target, indicator):
+                    self._pending_fast_confirmations.pop(target, None)
+                    self._record_detection(target, indicator, "observation")
                     return True, f"Confirmed crash: {indicator}"
-                else:
-                    # Still observing, not confirmed yet
-                    return False, None
+
+                if claude_running is False:
+                    # Claude is gone; let the caller probe again shortly instead of waiting for observations
+                    self._pending_fast_confirmations[target] = indicator
+                    return False, CRASH_PENDING_CONFIRMATION
+
+                # Still observing, not confirmed yet
+                return False, None
 
         # PRIORITY 3: Check if Claude interface is present (only for extremely minimal content)
         # Only flag as crash if content is very short and empty-looking
         # This prevents false positives on normal conversation content
         if len(content.strip()) < 10 and not self._is_claude_interface_present(content):
-            self.logger.warning(
-                f"Agent {agent_info.target} missing Claude interface in minimal content - likely crashed"
-            )
+            self.logger.warning(f"Agent {target} missing Claude interface in minimal content - likely crashed")
             return True, "Missing Claude interface"
 
+        # No indicators left on screen - any earlier sighting was transient
+        self._first_indicator_seen.pop(target, None)
         return False, None
 
+    def _content_shows_crash(self, content: str) -> bool:
+        """Check whether captured content still carries a real crash indicator.
+
+        Args:
+            content: Terminal content to check
+
+        Returns:
+            True if a shell prompt or an unignored crash indicator is present
+        """
+        if self._check_shell_prompt_at_end(content):
+            return True
+
+        content_lower = content.lower()
+        return any(
+            indicator in content_lower and not self._should_ignore_crash_indicator(indicator, content, content_lower)
+            for indicator in self._crash_indicators
+        )
+
+    def _is_claude_process_running(self, target: str) -> bool | None:
+        """Check whether the pane's foreground command is still the agent rather than its shell.
+
+        Args:
+            target: Agent target identifier
+
+        Returns:
+            True if a non-shell command is in the foreground, False if the pane
+            is back at a shell, None if the pane could not be inspected
+        """
+        command = self.tmux.get_pane_current_command(target)
+        if not isinstance(command, str) or not command:
+            return None
+
+        # Login shells are reported with a leading dash ("-bash")
+        return command.lstrip("-") not in SHELL_COMMANDS
+
+    async def confirm_crash_async(self, target: str) -> tuple[bool, str | None]:
+        """Confirm a crash reported as ``CRASH_PENDING_CONFIRMATION`` with quick follow-up probes.
+
+        Re-probes the pane every ``_fast_probe_interval`` seconds, without
+        blocking the event loop, so a crash is confirmed within
+        ``_fast_confirm_timeout`` seconds instead of after three monitor cycles.
+
+        Args:
+            target: Agent target identifier
+
+        Returns:
+            Tuple of (crashed: bool, crash_reason: str | None)
+        """
+        indicator = self._pending_fast_confirmations.pop(target, None)
+        if indicator is None:
+            return False, None
+
+        deadline = time.monotonic() + self._fast_confirm_timeout
+        while time.monotonic() + self._fast_probe_interval <= deadline:
+            await asyncio.sleep(self._fast_probe_interval)
+
+            crashed = await asyncio.to_thread(self._probe_crash, target)
+            if crashed is None:
+                continue
+            if crashed:
+                self.logger.error(f"Crash confirmed by fast probe for {target}")
+                self._clear_crash_tracking(target, keep_first_seen=True)
+                self._record_detection(target, indicator, "fast_probe")
+                return True, f"Confirmed crash: {indicator}"
+            # Claude came back or the pane vanished - let observation decide
+            return False, None
+
+        return False, None
+
+    def _probe_crash(self, target: str) -> bool | None:
+        """Probe a suspect agent once.
+
+        Args:
+            target: Agent target identifier
+
+        Returns:
+            True if the crash is confirmed, False if the agent is back (or the
+            pane can't be inspected), None if it is still undecided
+        """
+        if self._is_claude_process_running(target) is not False:
+            return False
+
+        content = self.tmux.capture_pane(target, lines=self._fast_probe_lines)
+        if isinstance(content, str) and self._content_shows_crash(content):
+            return True
+        return None
+
+    def _clear_crash_tracking(self, target: str, keep_first_seen: bool = False) -> None:
+        """Drop observation state for a target."""
+        self._crash_observations.pop(target, None)
+        self._pending_fast_confirmations.pop(target, None)
+        if not keep_first_seen:
+            self._first_indicator_seen.pop(target, None)
+
+    def _record_detection(self, target: str, indicator: str, method: str) -> None:
+        """Record time-to-detect for a confirmed crash incident.
+
+        Args:
+            target: Agent target identifier
+            indicator: Indicator that triggered detection
+            method: How the crash was confirmed (shell_prompt, fast_probe, observation)
+        """
+        first_seen = self._first_indicator_seen.pop(target, time.monotonic())
+        time_to_detect = time.monotonic() - first_seen
+
+        self._detection_incidents.append(
+            {
+                "target": target,
+                "indicator": indicator,
+                "method": method,
+                "time_to_detect": time_to_detect,
+                "detected_at": datetime.now().isoformat(),
+            }
+        )
+        self.logger.info(f"Crash in {target} detected via {method} in {time_to_detect:.2f}s")
+
+    def get_detection_stats(self) -> dict[str, Any]:
+        """Get time-to-detect statistics for recent crash incidents.
+
+        Returns:
+            Dictionary with incident count, average/max latency and recent incidents
+        """
+        incidents = list(self._detection_incidents)
+        latencies = [incident["time_to_detect"] for incident in incidents]
+
+        return {
+            "incidents": len(incidents),
+            "avg_time_to_detect": sum(latencies) / len(latencies) if latencies else 0.0,
+            "max_time_to_detect": max(latencies) if latencies else 0.0,
+            "recent": incidents[-10:],
+        }
+
     def _should_ignore_crash_indicator(self, indicator: str, content: str, content_lower: str) -> bool:
         """Determine if a crash indicator should be ignored based on context.
 
@@ -5,12 +5,13 @@ notifications through the pubsub messaging system instead of direct tmux command
 """
 
 import json
-import subprocess
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 from uuid import uuid4
 
+from tmux_orchestrator.core.messaging.daemon_publisher import DaemonPublisher, get_daemon_publisher
+
 
 class MessagePriority(Enum):
     """Message priority levels."""
@@ -34,9 +35,14 @@ class MessageCategory(Enum):
 class DaemonPubsubIntegration:
     """Handles daemon integration with pubsub messaging system."""
 
-    def __init__(self):
-        """Initialize daemon pubsub integration."""
+    def __init__(self, publisher: Optional[DaemonPublisher] = None):
+        """Initialize daemon pubsub integration.
+
+        Args:
+            publisher: Daemon publisher (defaults to the shared process-wide one)
+        """
         self.source_id = "daemon-monitor"
+        self.publisher = publisher or get_daemon_publisher()
 
     async def send_health_alert(
         self,
@@ -265,36 +271,11 @@ class DaemonPubsubIntegration:
             priority: Message priority
 
         Returns:
-            True if sent successfully
+            True if the daemon queued it (False if spilled for retry)
         """
-        try:
-            # Serialize message
-            message_json = json.dumps(message)
-
-            # Build tmux-orc publish command
-            cmd = [
-                "tmux-orc",
-                "pubsub",
-                "publish",
-                message_json,
-                "--target",
-                target,
-                "--priority",
-                priority.value,
-            ]
-
-            # Add tags
-            for tag in message["metadata"]["tags"]:
-                cmd.extend(["--tag", tag])
-
-            # Send via subprocess (async would require daemon client)
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-
-            return "queued" in result.stdout
-
-        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
-            print(f"Error sending pubsub message: {e}")
-            return False
+        return await self.publisher.publish_async(
+            target, json.dumps(message), priority.value, message["metadata"]["tags"], sender=self.source_id
+        )
 
     def _get_pm_target(self, agent_target: str) -> str:
         """Get PM target for given agent.
@@ -19,7 +19,7 @@ The interfaces have been decomposed into focused modules following SRP:
 
 # Re-export all interfaces for backwards compatibility
 from .agent_monitor import AgentMonitorInterface
-from .crash_detector import CrashDetectorInterface
+from .crash_detector import CRASH_PENDING_CONFIRMATION, CrashDetectorInterface
 from .daemon_manager import DaemonManagerInterface
 from .health_checker import HealthCheckerInterface
 from .monitor_service import MonitorServiceInterface
@@ -32,6 +32,7 @@ from .state_tracker import StateTrackerInterface
 # Export all classes for convenience
 __all__ = [
     "CrashDetectorInterface",
+    "CRASH_PENDING_CONFIRMATION",
     "PMRecoveryManagerInterface",
     "DaemonManagerInterface",
     "HealthCheckerInterface",
@@ -4,6 +4,10 @@ from abc import ABC, abstractmethod
 
 from ..types import AgentInfo
 
+# Reason returned (with is_crashed=False) when a crash is suspected and can be
+# confirmed quickly with confirm_crash_async() instead of more monitor cycles
+CRASH_PENDING_CONFIRMATION = "pending fast confirmation"
+
 
 class CrashDetectorInterface(ABC):
     """Interface for crash detection services."""
@@ -35,3 +39,14 @@ class CrashDetectorInterface(ABC):
             Tuple of (is_crashed, pm_target)
         """
         pass
+
+    async def confirm_crash_async(self, target: str) -> tuple[bool, str | None]:
+        """Confirm a crash that ``detect_crash`` reported as pending confirmation.
+
+        Args:
+            target: Agent target identifier
+
+        Returns:
+            Tuple of (is_crashed, crash_reason)
+        """
+        return False, None
@@ -3,6 +3,8 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from ..types import SessionAggregates
+
 
 class StateTrackerInterface(ABC):
     """Interface for state tracking operations."""
@@ -80,3 +82,25 @@ class StateTrackerInterface(ABC):
             state: State dictionary to update
         """
         pass
+
+    def mark_agent_crashed(self, target: str) -> None:
+        """Mark an agent as crashed so it is counted in its session's aggregates.
+
+        Args:
+            target: Agent target identifier
+        """
+
+    def clear_agent_crashed(self, target: str) -> None:
+        """Clear an agent's crashed mark.
+
+        Args:
+            target: Agent target identifier
+        """
+
+    def get_all_session_aggregates(self) -> dict[str, SessionAggregates]:
+        """Get agent counters for every tracked session.
+
+        Returns:
+            Session name to SessionAggregates (empty if not tracked)
+        """
+        return {}
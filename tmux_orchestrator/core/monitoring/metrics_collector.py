@@ -14,7 +14,7 @@ from typing import Deque, Optional
 
 from tmux_orchestrator.core.config import Config
 
-from .types import MonitorComponent, MonitorStatus
+from .types import MonitorComponent, MonitorStatus, SessionAggregates
 
 
 @dataclass
@@ -203,6 +203,20 @@ class MetricsCollector(MonitorComponent):
                 agents_per_second = status.active_agents / duration
                 self.set_gauge("monitoring.agents_per_second", agents_per_second)
 
+    def record_session_aggregates(self, aggregates: dict[str, SessionAggregates]) -> None:
+        """Export per-session agent counters as gauges.
+
+        Args:
+            aggregates: Session name to SessionAggregates, e.g. from StateTracker
+        """
+        for session, counts in aggregates.items():
+            self.set_gauge(f"sessions.{session}.agents", counts.total)
+            self.set_gauge(f"sessions.{session}.active", counts.active)
+            self.set_gauge(f"sessions.{session}.idle", counts.idle)
+            self.set_gauge(f"sessions.{session}.crashed", counts.crashed)
+            self.set_gauge(f"sessions.{session}.fresh", counts.fresh)
+            self.set_gauge(f"sessions.{session}.missing", counts.missing)
+
     def get_metric_summary(self, name: str, window_minutes: int | None = None) -> MetricSummary | None:
         """Get summary statistics for a metric.
 
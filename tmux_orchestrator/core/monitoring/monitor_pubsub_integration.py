@@ -7,25 +7,32 @@ notifications through the pubsub system with proper priorities and categories.
 
 import json
 import logging
-import subprocess
 from datetime import datetime
 from typing import Optional
 
-from tmux_orchestrator.core.communication.pm_pubsub_integration import MessageCategory, MessagePriority
+from tmux_orchestrator.core.communication.pm_pubsub import MessageCategory, MessagePriority
+from tmux_orchestrator.core.messaging.daemon_publisher import DaemonPublisher, get_daemon_publisher
 
 
 class MonitorPubsubIntegration:
     """Handles monitor daemon integration with pubsub messaging."""
 
-    def __init__(self, session: str = "monitoring-daemon", logger: logging.Logger | None = None):
+    def __init__(
+        self,
+        session: str = "monitoring-daemon",
+        logger: logging.Logger | None = None,
+        publisher: DaemonPublisher | None = None,
+    ):
         """Initialize monitor pubsub integration.
 
         Args:
             session: Monitor daemon session identifier
             logger: Optional logger instance
+            publisher: Daemon publisher (defaults to the shared process-wide one)
         """
         self.session = session
         self.logger = logger or logging.getLogger(__name__)
+        self.publisher = publisher or get_daemon_publisher()
         self._message_queue: list[dict] = []
         self._batch_threshold = 10  # Batch low priority messages
 
@@ -396,21 +403,10 @@ class MonitorPubsubIntegration:
         Returns:
             Success status
         """
-        try:
-            cmd = ["tmux-orc", "pubsub", "publish", message, "--target", target, "--priority", priority]
-
-            for tag in tags:
-                cmd.extend(["--tag", tag])
-
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-
+        queued = self.publisher.publish(target, message, priority, tags, sender=self.session)
+        if queued:
             self.logger.debug(f"Published {priority} message to {target}")
-            return "queued" in result.stdout.lower()
-
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to publish message: {e}")
-            self.logger.error(f"stderr: {e.stderr}")
-            return False
+        return queued
 
     def _queue_message(self, message: dict, agent: str, session_name: str) -> None:
         """Queue low-priority message for batching.
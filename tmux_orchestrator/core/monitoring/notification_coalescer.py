@@ -0,0 +1,237 @@
+"""
+Time-windowed notification coalescing for PM notifications.
+
+Notifications for a PM are held for a short debounce window, deduplicated by
+(agent, event type) and delivered as a single digest. Critical notifications
+bypass the window so crashes still reach the PM immediately.
+"""
+
+import re
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from tmux_orchestrator.core.monitor_helpers.state_types import PM_MESSAGE_QUEUE_MAX_SIZE
+
+PRIORITY_ORDER = {"critical": 0, "high": 1, "normal": 2, "low": 3}
+
+PRIORITY_HEADINGS = {
+    "critical": "🚨 CRITICAL",
+    "high": "🔧 HIGH PRIORITY",
+    "normal": "📋 NORMAL PRIORITY",
+    "low": "💤 LOW PRIORITY",
+}
+
+# Ordered (marker, event type, priority) rules for classifying pre-formatted messages
+_MESSAGE_RULES = [
+    ("CRASH", "agent_crash", "critical"),
+    ("FAILURE", "agent_crash", "critical"),
+    ("RESTART NEEDED", "restart_needed", "high"),
+    ("RECOVERY NEEDED", "recovery_needed", "high"),
+    ("ESCALATION", "pm_escalation", "high"),
+    ("FRESH AGENT", "agent_fresh", "normal"),
+    ("TEAM IDLE", "team_idle", "normal"),
+    ("IDLE", "agent_idle", "low"),
+]
+
+_TARGET_PATTERN = re.compile(r"([\w.-]+:\d+)")
+
+
+def classify_message(message: str) -> tuple[str, str, str]:
+    """Derive (agent, event type, priority) from a formatted notification.
+
+    Args:
+        message: Notification text such as "🚨 AGENT CRASH: dev:2 - error"
+
+    Returns:
+        Tuple of agent target (or "" if none), event type and priority
+    """
+    match = _TARGET_PATTERN.search(message)
+    agent = match.group(1) if match else ""
+
+    upper = message.upper()
+    for marker, event_type, priority in _MESSAGE_RULES:
+        if marker in upper:
+            return agent, event_type, priority
+
+    return agent, "message", "normal"
+
+
+@dataclass
+class PendingNotification:
+    """A deduplicated notification waiting in a PM's window."""
+
+    agent: str
+    event_type: str
+    message: str
+    priority: str
+    first_seen: float
+    last_seen: float
+    count: int = 1
+
+
+@dataclass
+class CoalescedDigest:
+    """A digest ready to be delivered to one PM."""
+
+    pm_target: str
+    message: str
+    priority: str
+    notifications: list[PendingNotification] = field(default_factory=list)
+
+
+class NotificationCoalescer:
+    """Per-PM debounce windows with dedupe, priority escalation and digests."""
+
+    def __init__(
+        self,
+        window_seconds: float = 15.0,
+        max_window_seconds: float = 60.0,
+        max_pending: int = PM_MESSAGE_QUEUE_MAX_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            window_seconds: Quiet period after the latest notification before a digest is due
+            max_window_seconds: Upper bound on how long the first notification can wait
+            max_pending: Maximum distinct notifications held per PM
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.window_seconds = window_seconds
+        self.max_window_seconds = max_window_seconds
+        self.max_pending = max_pending
+        self._clock = clock
+        self._pending: dict[str, dict[tuple[str, str], PendingNotification]] = {}
+        self._stats = {"added": 0, "deduplicated": 0, "digests": 0, "dropped": 0}
+
+    def add(self, pm_target: str, agent: str, event_type: str, message: str, priority: str = "normal") -> None:
+        """Add a notification to a PM's window.
+
+        A repeat of the same (agent, event type) replaces the message, bumps the
+        count and escalates to the higher of the two priorities.
+        """
+        now = self._clock()
+        priority = priority if priority in PRIORITY_ORDER else "normal"
+        window = self._pending.setdefault(pm_target, {})
+        key = (agent, event_type)
+        self._stats["added"] += 1
+
+        existing = window.get(key)
+        if existing:
+            existing.message = message
+            existing.last_seen = now
+            existing.count += 1
+            if PRIORITY_ORDER[priority] < PRIORITY_ORDER[existing.priority]:
+                existing.priority = priority
+            self._stats["deduplicated"] += 1
+            return
+
+        window[key] = PendingNotification(agent, event_type, message, priority, first_seen=now, last_seen=now)
+
+        if len(window) > self.max_pending:
+            # Drop the least important, oldest notification
+            victim = max(window, key=lambda k: (PRIORITY_ORDER[window[k].priority], -window[k].first_seen))
+            del window[victim]
+            self._stats["dropped"] += 1
+
+    def add_message(self, pm_target: str, message: str, priority: str | None = None) -> None:
+        """Add a pre-formatted notification, classifying it from its text."""
+        agent, event_type, derived_priority = classify_message(message)
+        if not agent:
+            # Keep distinct free-form messages apart
+            agent = message
+        self.add(pm_target, agent, event_type, message, priority or derived_priority)
+
+    def pending_count(self, pm_target: str | None = None) -> int:
+        """Get the number of pending notifications for one PM or all PMs."""
+        if pm_target is not None:
+            return len(self._pending.get(pm_target, {}))
+        return sum(len(window) for window in self._pending.values())
+
+    def pending_targets(self) -> list[str]:
+        """Get PMs with pending notifications."""
+        return [pm for pm, window in self._pending.items() if window]
+
+    def _has_critical(self, pm_target: str) -> bool:
+        return any(n.priority == "critical" for n in self._pending.get(pm_target, {}).values())
+
+    def is_due(self, pm_target: str, now: float | None = None) -> bool:
+        """Check whether a PM's window has closed (or holds a critical notification)."""
+        window = self._pending.get(pm_target)
+        if not window:
+            return False
+        if self._has_critical(pm_target):
+            return True
+
+        now = self._clock() if now is None else now
+        first_seen = min(n.first_seen for n in window.values())
+        last_seen = max(n.last_seen for n in window.values())
+        return now - last_seen >= self.window_seconds or now - first_seen >= self.max_window_seconds
+
+    def collect_ready(self, is_busy: Callable[[str], bool] | None = None) -> list[CoalescedDigest]:
+        """Pop digests for every PM whose window is due.
+
+        Args:
+            is_busy: Optional busy check; busy PMs keep their window unless it
+                contains a critical notification
+
+        Returns:
+            Digests ready for delivery
+        """
+        now = self._clock()
+        digests = []
+
+        for pm_target in self.pending_targets():
+            if not self.is_due(pm_target, now):
+                continue
+            if is_busy and not self._has_critical(pm_target) and is_busy(pm_target):
+                continue
+
+            notifications = list(self._pending.pop(pm_target).values())
+            digests.append(self._build_digest(pm_target, notifications))
+
+        self._stats["digests"] += len(digests)
+        return digests
+
+    def requeue(self, digest: CoalescedDigest) -> None:
+        """Return an undelivered digest's notifications to its PM's window."""
+        window = self._pending.setdefault(digest.pm_target, {})
+        for notification in digest.notifications:
+            window.setdefault((notification.agent, notification.event_type), notification)
+
+    def clear(self) -> None:
+        """Drop all pending notifications."""
+        self._pending.clear()
+
+    def _build_digest(self, pm_target: str, notifications: list[PendingNotification]) -> CoalescedDigest:
+        notifications.sort(key=lambda n: (PRIORITY_ORDER[n.priority], n.first_seen))
+        priority = notifications[0].priority
+        return CoalescedDigest(pm_target, self.format_digest(notifications), priority, notifications)
+
+    @staticmethod
+    def format_digest(notifications: list[PendingNotification]) -> str:
+        """Format notifications as a digest grouped by priority.
+
+        A lone notification is delivered as-is.
+        """
+        if len(notifications) == 1 and notifications[0].count == 1:
+            return notifications[0].message
+
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        sections = []
+        for priority, heading in PRIORITY_HEADINGS.items():
+            lines = [
+                f"{n.message} (x{n.count})" if n.count > 1 else n.message
+                for n in notifications
+                if n.priority == priority
+            ]
+            if lines:
+                sections.append(f"{heading}:\n" + "\n".join(lines))
+
+        return f"📊 MONITORING UPDATE - {timestamp} ({len(notifications)} events)\n\n" + "\n\n".join(sections)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get coalescing statistics."""
+        return {**self._stats, "pending": self.pending_count()}
@@ -7,7 +7,6 @@ with fallback to direct tmux commands for reliability.
 
 import asyncio
 import logging
-from collections import defaultdict
 from datetime import datetime
 from typing import Any, Optional
 
@@ -15,6 +14,7 @@ from tmux_orchestrator.core.config import Config
 from tmux_orchestrator.core.messaging_daemon import DaemonClient
 from tmux_orchestrator.utils.tmux import TMUXManager
 
+from .notification_coalescer import PRIORITY_ORDER, NotificationCoalescer, classify_message
 from .types import IdleType, NotificationEvent, NotificationManagerInterface, NotificationType
 
 
@@ -25,7 +25,7 @@ class PubsubNotificationManager(NotificationManagerInterface):
         """Initialize the pubsub-enabled notification manager."""
         super().__init__(tmux, config, logger)
         self._queued_notifications: list[NotificationEvent] = []
-        self._pm_notifications: dict[str, list[str]] = defaultdict(list)
+        self._coalescer = NotificationCoalescer()
         self._last_notification_times: dict[str, datetime] = {}
         self._notification_cooldown = 300  # 5 minutes between duplicate notifications
         self._daemon_client: Optional[DaemonClient] = None
@@ -65,7 +65,7 @@ class PubsubNotificationManager(NotificationManagerInterface):
         """Clean up notification manager resources."""
         self.logger.info("Cleaning up PubsubNotificationManager")
         self._queued_notifications.clear()
-        self._pm_notifications.clear()
+        self._coalescer.clear()
         self._last_notification_times.clear()
 
     def queue_notification(self, event: NotificationEvent) -> None:
@@ -91,14 +91,14 @@ class PubsubNotificationManager(NotificationManagerInterface):
 
     def send_queued_notifications(self) -> int:
         """
-        Send all queued notifications using pubsub daemon for performance.
+        Send PM digests whose coalescing window has closed.
+
+        Queued notifications join their PM's window first; critical ones are
+        delivered immediately.
 
         Returns:
-            Number of notifications sent
+            Number of digests sent
         """
-        if not self._queued_notifications:
-            return 0
-
         # Group notifications by PM/session for batching
         for event in self._queued_notifications:
             self._collect_notification_for_pm(event)
@@ -221,80 +221,34 @@ class PubsubNotificationManager(NotificationManagerInterface):
             self.logger.warning(f"No PM found in session {event.session} for notification")
             return
 
-        # Add message to PM's collection with priority metadata
-        self._pm_notifications[pm_target].append(event.formatted_message)
+        # Escalate to whichever is more urgent: declared priority or message content
+        priority = event.metadata.get("priority", "normal")
+        derived_priority = classify_message(event.message)[2]
+        if PRIORITY_ORDER.get(derived_priority, 2) < PRIORITY_ORDER.get(priority, 2):
+            priority = derived_priority
+
+        self._coalescer.add(pm_target, event.target, event.type.value, event.formatted_message, priority)
         self.logger.debug(f"Collected notification for PM {pm_target}: {event.message}")
 
     def _send_collected_notifications(self) -> int:
-        """Send all collected notifications using pubsub daemon for performance."""
+        """Send ready PM digests using pubsub daemon for performance."""
         sent_count = 0
 
-        for pm_target, messages in self._pm_notifications.items():
-            if not messages:
-                continue
-
+        for digest in self._coalescer.collect_ready():
             try:
-                # Build consolidated report
-                timestamp = datetime.now().strftime("%H:%M:%S UTC")
-                report_header = f"🔔 MONITORING REPORT - {timestamp}\\n"
-
-                # Group messages by type and priority
-                critical_messages = []
-                high_priority = []
-                normal_priority = []
-                low_priority = []
-
-                for msg in messages:
-                    if "CRASH" in msg or "FAILURE" in msg:
-                        critical_messages.append(msg)
-                    elif "RECOVERY NEEDED" in msg:
-                        high_priority.append(msg)
-                    elif "FRESH AGENT" in msg or "TEAM IDLE" in msg:
-                        normal_priority.append(msg)
-                    elif "IDLE" in msg:
-                        low_priority.append(msg)
-                    else:
-                        normal_priority.append(msg)
-
-                # Build report sections
-                report_sections = []
-
-                if critical_messages:
-                    report_sections.append("🚨 CRITICAL - Agent Crashes:\\n" + "\\n".join(critical_messages))
-
-                if high_priority:
-                    report_sections.append("🔧 HIGH PRIORITY - Recovery Needed:\\n" + "\\n".join(high_priority))
-
-                if normal_priority:
-                    report_sections.append("📋 NORMAL PRIORITY:\\n" + "\\n".join(normal_priority))
-
-                if low_priority:
-                    report_sections.append("💤 LOW PRIORITY - Idle Agents:\\n" + "\\n".join(low_priority))
-
-                # Send consolidated report via pubsub or fallback
-                if report_sections:
-                    full_report = report_header + "\\n\\n".join(report_sections)
-
-                    # Determine priority based on content
-                    priority = "normal"
-                    if critical_messages:
-                        priority = "critical"
-                    elif high_priority:
-                        priority = "high"
-
-                    success = self._send_notification(pm_target, full_report, priority)
-                    if success:
-                        sent_count += 1
-                        self.logger.info(
-                            f"Sent consolidated report to PM {pm_target} "
-                            f"with {len(messages)} notifications via {'daemon' if self._use_daemon else 'tmux'}"
-                        )
+                success = self._send_notification(digest.pm_target, digest.message, digest.priority)
+                if success:
+                    sent_count += 1
+                    self.logger.info(
+                        f"Sent digest to PM {digest.pm_target} "
+                        f"with {len(digest.notifications)} notifications via {'daemon' if self._use_daemon else 'tmux'}"
+                    )
+                else:
+                    self._coalescer.requeue(digest)
 
             except Exception as e:
-                self.logger.error(f"Failed to send notifications to PM {pm_target}: {e}")
-
-        # Clear sent notifications
-        self._pm_notifications.clear()
+                self.logger.error(f"Failed to send notifications to PM {digest.pm_target}: {e}")
+                self._coalescer.requeue(digest)
 
         return sent_count
 
@@ -333,8 +287,9 @@ class PubsubNotificationManager(NotificationManagerInterface):
         """Get notification statistics including daemon performance."""
         stats = {
             "queued_notifications": len(self._queued_notifications),
-            "pm_collections": len(self._pm_notifications),
-            "total_pm_messages": sum(len(msgs) for msgs in self._pm_notifications.values()),
+            "pm_collections": len(self._coalescer.pending_targets()),
+            "total_pm_messages": self._coalescer.pending_count(),
+            "coalescing": self._coalescer.get_stats(),
             "delivery_method": "daemon" if self._use_daemon else "direct_tmux",
         }
 
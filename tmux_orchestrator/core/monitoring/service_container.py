@@ -8,12 +8,36 @@ that supports singleton and factory patterns for managing component lifecycles.
 import asyncio
 import inspect
 import logging
-from typing import Any, Callable, Optional, TypeVar
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar, cast
 
 from .interfaces import ServiceContainerInterface
 
 T = TypeVar("T")
 
+# Parameter types that are never injected
+_BASIC_TYPES = (str, int, float, bool, dict, list, tuple, set)
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class InjectionParameter:
+    """A parameter the container will try to inject."""
+
+    name: str
+    param_type: Any
+    required: bool
+
+
+@dataclass(frozen=True)
+class InjectionPlan:
+    """Precompiled injection parameters for a factory or class."""
+
+    target: Callable
+    parameters: tuple[InjectionParameter, ...]
+    is_async: bool
+
 
 class ServiceContainer(ServiceContainerInterface):
     """Dependency injection container for managing service instances."""
@@ -33,6 +57,17 @@ class ServiceContainer(ServiceContainerInterface):
         self._plugin_metadata: dict[str, dict[str, Any]] = {}  # Plugin metadata
         self._async_factories: dict[type, Callable] = {}  # Async factory functions
         self._async_singletons: dict[type, Any] = {}  # Async singleton instances
+        self._plans: dict[Any, InjectionPlan] = {}  # Compiled injection plans per factory/class
+        self._frozen = False
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether the service graph has been validated and locked."""
+        return self._frozen
+
+    def _check_not_frozen(self, interface_type: type) -> None:
+        if self._frozen:
+            raise RuntimeError(f"Cannot register {interface_type.__name__}: service container is frozen")
 
     def register(self, interface_type: type[T], implementation: T | Callable[..., T], singleton: bool = True) -> None:
         """Register a service implementation.
@@ -42,6 +77,7 @@ class ServiceContainer(ServiceContainerInterface):
             implementation: Implementation instance or factory function
             singleton: Whether to use singleton pattern
         """
+        self._check_not_frozen(interface_type)
         self._singleton_flags[interface_type] = singleton
 
         if callable(implementation) and not isinstance(implementation, type):
@@ -63,6 +99,7 @@ class ServiceContainer(ServiceContainerInterface):
             factory: Factory function that creates instances
             singleton: Whether to cache created instances
         """
+        self._check_not_frozen(interface_type)
         self._factories[interface_type] = factory
         self._singleton_flags[interface_type] = singleton
         self.logger.debug(f"Registered factory for {interface_type.__name__}")
@@ -81,8 +118,6 @@ class ServiceContainer(ServiceContainerInterface):
         """
         # Check if we have a singleton instance
         if interface_type in self._singletons:
-            from typing import cast
-
             return cast(T, self._singletons[interface_type])
 
         # Check if we have a direct service registration
@@ -111,8 +146,6 @@ class ServiceContainer(ServiceContainerInterface):
                 service = self._auto_resolve(interface_type)
                 if self._singleton_flags.get(interface_type, True):
                     self._singletons[interface_type] = service
-                from typing import cast
-
                 return cast(T, service)
             except Exception as e:
                 self.logger.debug(f"Auto-resolution failed for {interface_type.__name__}: {e}")
@@ -142,8 +175,109 @@ class ServiceContainer(ServiceContainerInterface):
         self._plugin_metadata.clear()
         self._async_factories.clear()
         self._async_singletons.clear()
+        self._plans.clear()
+        self._frozen = False
         self.logger.debug("Cleared all service registrations")
 
+    def freeze(self) -> None:
+        """Compile injection plans for every registration and validate the service graph.
+
+        Factories are checked against the parameters they will be called with;
+        instances are checked against their class constructor, so a service
+        registered pre-built still declares dependencies the container can
+        satisfy. Call once at startup so wiring errors surface at boot rather
+        than on a later resolve. Registration is rejected once frozen;
+        ``clear()`` unfreezes.
+
+        Raises:
+            ValueError: If a required dependency is unregistered or the graph has a cycle
+        """
+        factories: dict[type, Callable] = {**self._factories, **self._async_factories}
+        targets: dict[type, Callable] = {
+            interface_type: service if inspect.isclass(service) else type(service)
+            for interface_type, service in self._services.items()
+        }
+        targets.update(factories)
+        errors = []
+
+        for interface_type, target in targets.items():
+            try:
+                plan = self._get_plan(target)
+            except (TypeError, ValueError):
+                # Builtin and extension types have no inspectable constructor
+                continue
+            for param in plan.parameters:
+                if param.required and not self.has(param.param_type):
+                    type_name = getattr(param.param_type, "__name__", str(param.param_type))
+                    errors.append(
+                        f"{interface_type.__name__}: required parameter '{param.name}' ({type_name}) is not registered"
+                    )
+
+        errors.extend(self._find_cycles(factories))
+
+        if errors:
+            raise ValueError("Invalid service graph:\n  " + "\n  ".join(errors))
+
+        self._frozen = True
+        self.logger.info(f"Service container frozen with {len(factories)} factories and {len(self._services)} services")
+
+    def _find_cycles(self, factories: dict[type, Callable]) -> list[str]:
+        """Find dependency cycles between factory-built services."""
+        cycles = []
+        visited: set[type] = set()
+
+        def visit(interface_type: type, path: list[type]) -> None:
+            if interface_type in path:
+                cycle = path[path.index(interface_type) :] + [interface_type]
+                cycles.append("Dependency cycle: " + " -> ".join(t.__name__ for t in cycle))
+                return
+            if interface_type in visited or interface_type not in factories:
+                return
+            visited.add(interface_type)
+            for param in self._get_plan(factories[interface_type]).parameters:
+                visit(param.param_type, path + [interface_type])
+
+        for interface_type in factories:
+            visit(interface_type, [])
+        return cycles
+
+    def _get_plan(self, target: Callable) -> InjectionPlan:
+        """Get the cached injection plan for a factory or class, compiling it once."""
+        plan = self._plans.get(target)
+        if plan is None:
+            plan = self._compile_plan(target)
+            self._plans[target] = plan
+        return plan
+
+    def _compile_plan(self, target: Callable) -> InjectionPlan:
+        """Inspect a factory or class signature into an injection plan."""
+        is_class = inspect.isclass(target)
+        if is_class:
+            sig = inspect.signature(cast(type, target).__init__)
+        else:
+            sig = inspect.signature(target)
+
+        parameters = []
+        for param_name, param in sig.parameters.items():
+            if is_class and param_name == "self":
+                continue
+            if param.annotation == inspect.Parameter.empty or param.annotation in _BASIC_TYPES:
+                continue
+            if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+                continue
+            parameters.append(
+                InjectionParameter(param_name, param.annotation, required=param.default == inspect.Parameter.empty)
+            )
+
+        return InjectionPlan(target, tuple(parameters), is_async=asyncio.iscoroutinefunction(target))
+
+    def _resolve_parameter(self, param: InjectionParameter) -> Any:
+        """Resolve one planned parameter, returning _MISSING if it is not registered."""
+        instance = self._singletons.get(param.param_type, _MISSING)
+        if instance is _MISSING and self.has(param.param_type):
+            instance = self.resolve(param.param_type)
+        return instance
+
     def register_async(self, interface_type: type[T], factory: Callable[..., T], singleton: bool = True) -> None:
         """Register an async factory for a service.
 
@@ -152,6 +286,7 @@ class ServiceContainer(ServiceContainerInterface):
             factory: Async factory function
             singleton: Whether to cache the instance
         """
+        self._check_not_frozen(interface_type)
         if not asyncio.iscoroutinefunction(factory):
             raise ValueError(f"Factory for {interface_type.__name__} must be async")
 
@@ -170,8 +305,6 @@ class ServiceContainer(ServiceContainerInterface):
         """
         # Check async singletons first
         if interface_type in self._async_singletons:
-            from typing import cast
-
             return cast(T, self._async_singletons[interface_type])
 
         # Check if we have an async factory
@@ -242,30 +375,20 @@ class ServiceContainer(ServiceContainerInterface):
         Returns:
             Created instance
         """
+        plan = self._get_plan(factory)
+
         # Check if it's an async factory
-        if asyncio.iscoroutinefunction(factory):
+        if plan.is_async:
             return self._call_async_with_injection(factory)
 
-        sig = inspect.signature(factory)
         kwargs = {}
-
-        for param_name, param in sig.parameters.items():
-            if param.annotation == inspect.Parameter.empty:
-                continue
-
-            # Try to resolve the parameter type
-            param_type = param.annotation
-
-            # Skip basic types
-            if param_type in (str, int, float, bool, dict, list, tuple, set):
-                continue
-
+        for param in plan.parameters:
             try:
-                # Try to resolve from container
-                if self.has(param_type):
-                    kwargs[param_name] = self.resolve(param_type)
+                instance = self._resolve_parameter(param)
+                if instance is not _MISSING:
+                    kwargs[param.name] = instance
             except Exception as e:
-                self.logger.debug(f"Could not inject {param_name}: {e}")
+                self.logger.debug(f"Could not inject {param.name}: {e}")
 
         return factory(**kwargs)
 
@@ -278,31 +401,19 @@ class ServiceContainer(ServiceContainerInterface):
         Returns:
             Created instance
         """
-        sig = inspect.signature(factory)
         kwargs = {}
-
-        for param_name, param in sig.parameters.items():
-            if param.annotation == inspect.Parameter.empty:
-                continue
-
-            # Try to resolve the parameter type
-            param_type = param.annotation
-
-            # Skip basic types
-            if param_type in (str, int, float, bool, dict, list, tuple, set):
-                continue
-
+        for param in self._get_plan(factory).parameters:
             try:
-                # Try to resolve from container
-                if self.has(param_type):
-                    resolved = self.resolve(param_type)
-                    # If the resolved value is a coroutine, await it
-                    if asyncio.iscoroutine(resolved):
-                        kwargs[param_name] = await resolved
-                    else:
-                        kwargs[param_name] = resolved
+                resolved = self._resolve_parameter(param)
+                if resolved is _MISSING:
+                    continue
+                # If the resolved value is a coroutine, await it
+                if asyncio.iscoroutine(resolved):
+                    kwargs[param.name] = await resolved
+                else:
+                    kwargs[param.name] = resolved
             except Exception as e:
-                self.logger.debug(f"Could not inject {param_name}: {e}")
+                self.logger.debug(f"Could not inject {param.name}: {e}")
 
         return await factory(**kwargs)
 
@@ -318,32 +429,18 @@ class ServiceContainer(ServiceContainerInterface):
         if not hasattr(cls, "__init__"):
             return cls()
 
-        sig = inspect.signature(cls.__init__)
         kwargs = {}
-
-        for param_name, param in sig.parameters.items():
-            if param_name == "self":
-                continue
-
-            if param.annotation == inspect.Parameter.empty:
-                continue
-
-            param_type = param.annotation
-
-            # Skip basic types
-            if param_type in (str, int, float, bool, dict, list, tuple, set):
-                continue
-
+        for param in self._get_plan(cls).parameters:
             try:
-                # Try to resolve from container
-                if self.has(param_type):
-                    kwargs[param_name] = self.resolve(param_type)
-                elif param.default == inspect.Parameter.empty:
+                instance = self._resolve_parameter(param)
+                if instance is not _MISSING:
+                    kwargs[param.name] = instance
+                elif param.required:
                     # Required parameter we can't resolve
-                    raise ValueError(f"Cannot resolve required parameter {param_name}")
+                    raise ValueError(f"Cannot resolve required parameter {param.name}")
             except Exception as e:
-                self.logger.debug(f"Could not inject {param_name}: {e}")
-                if param.default == inspect.Parameter.empty:
+                self.logger.debug(f"Could not inject {param.name}: {e}")
+                if param.required:
                     raise
 
         return cls(**kwargs)
@@ -12,7 +12,7 @@ from datetime import datetime
 from tmux_orchestrator.core.config import Config
 from tmux_orchestrator.utils.tmux import TMUXManager
 
-from .types import AgentInfo, AgentState, StateTrackerInterface
+from .types import AgentInfo, AgentState, SessionAggregates, StateTrackerInterface
 
 
 class StateTracker(StateTrackerInterface):
@@ -46,6 +46,15 @@ class StateTracker(StateTrackerInterface):
         self._content_cache: dict[str, str] = {}
         self._content_hashes: dict[str, str] = {}
 
+        # Crash tracking
+        self._crashed_agents: set[str] = set()
+
+        # Per-session aggregates, updated on every state transition
+        self._session_aggregates: dict[str, SessionAggregates] = {}
+        self._session_targets: dict[str, dict[str, None]] = {}
+        # Idle start times per session; insertion order is chronological
+        self._session_idle: dict[str, dict[str, datetime]] = {}
+
     def initialize(self) -> bool:
         """Initialize the state tracker."""
         try:
@@ -68,6 +77,32 @@ class StateTracker(StateTrackerInterface):
         self._missing_agent_notifications.clear()
         self._content_cache.clear()
         self._content_hashes.clear()
+        self._crashed_agents.clear()
+        self._session_aggregates.clear()
+        self._session_targets.clear()
+        self._session_idle.clear()
+
+    def _aggregates_for(self, session: str) -> SessionAggregates:
+        """Get or create the aggregates for a session."""
+        if session not in self._session_aggregates:
+            self._session_aggregates[session] = SessionAggregates(session=session)
+        return self._session_aggregates[session]
+
+    def _set_idle(self, target: str, session: str, idle: bool) -> None:
+        """Record an idle/active transition in the agent and session idle tracking."""
+        aggregates = self._aggregates_for(session)
+        session_idle = self._session_idle.setdefault(session, {})
+
+        if idle and target not in self._idle_agents:
+            self._idle_agents[target] = session_idle[target] = datetime.now()
+            aggregates.idle += 1
+            if aggregates.earliest_idle is None:
+                aggregates.earliest_idle = self._idle_agents[target]
+        elif not idle and target in self._idle_agents:
+            del self._idle_agents[target]
+            session_idle.pop(target, None)
+            aggregates.idle -= 1
+            aggregates.earliest_idle = next(iter(session_idle.values()), None)
 
     def update_agent_state(self, target: str, content: str) -> AgentState:
         """
@@ -86,6 +121,10 @@ class StateTracker(StateTrackerInterface):
         # Get or create agent state
         if target not in self._agent_states:
             self._agent_states[target] = AgentState(target=target, session=session, window=window, is_fresh=True)
+            self._session_targets.setdefault(session, {})[target] = None
+            aggregates = self._aggregates_for(session)
+            aggregates.total += 1
+            aggregates.fresh += 1
             self.logger.debug(f"Created new state tracking for {target}")
 
         state = self._agent_states[target]
@@ -104,12 +143,13 @@ class StateTracker(StateTrackerInterface):
             state.last_activity = datetime.now()
             state.consecutive_idle_count = 0
             # Only mark as not fresh if this is not the first content update
-            if previous_content is not None:
+            if previous_content is not None and state.is_fresh:
                 state.is_fresh = False
+                self._aggregates_for(session).fresh -= 1
 
             # Remove from idle tracking if was idle
             if target in self._idle_agents:
-                del self._idle_agents[target]
+                self._set_idle(target, session, idle=False)
                 self.logger.debug(f"Agent {target} became active - removed from idle tracking")
         else:
             # Content hasn't changed - increment idle count
@@ -117,7 +157,7 @@ class StateTracker(StateTrackerInterface):
 
             # Track when agent first became idle
             if target not in self._idle_agents:
-                self._idle_agents[target] = datetime.now()
+                self._set_idle(target, session, idle=True)
                 self.logger.debug(f"Agent {target} became idle - started tracking")
 
         # Cache content for future comparisons
@@ -146,10 +186,17 @@ class StateTracker(StateTrackerInterface):
             target: Agent target identifier
         """
         # Reset all tracking for this agent
-        if target in self._agent_states:
-            del self._agent_states[target]
+        session = target.split(":", 1)[0]
         if target in self._idle_agents:
-            del self._idle_agents[target]
+            self._set_idle(target, session, idle=False)
+        if target in self._agent_states:
+            state = self._agent_states.pop(target)
+            aggregates = self._aggregates_for(state.session)
+            aggregates.total -= 1
+            if state.is_fresh:
+                aggregates.fresh -= 1
+            self._session_targets.get(state.session, {}).pop(target, None)
+        self.clear_agent_crashed(target)
         if target in self._submission_attempts:
             del self._submission_attempts[target]
         if target in self._last_submission_time:
@@ -171,11 +218,57 @@ class StateTracker(StateTrackerInterface):
         Returns:
             List of AgentState objects for agents in the session
         """
-        session_agents = []
-        for target, state in self._agent_states.items():
-            if state.session == session:
-                session_agents.append(state)
-        return session_agents
+        return [self._agent_states[target] for target in self._session_targets.get(session, {})]
+
+    def get_session_aggregates(self, session: str) -> SessionAggregates:
+        """
+        Get incrementally maintained agent counters for a session.
+
+        Args:
+            session: Session name
+
+        Returns:
+            SessionAggregates for the session (all zero if untracked)
+        """
+        return self._session_aggregates.get(session) or SessionAggregates(session=session)
+
+    def get_all_session_aggregates(self) -> dict[str, SessionAggregates]:
+        """Get agent counters for every tracked session."""
+        return dict(self._session_aggregates)
+
+    def mark_agent_crashed(self, target: str) -> None:
+        """
+        Mark an agent as crashed.
+
+        Args:
+            target: Agent target identifier
+        """
+        if target not in self._crashed_agents:
+            self._crashed_agents.add(target)
+            self._aggregates_for(target.split(":", 1)[0]).crashed += 1
+
+    def clear_agent_crashed(self, target: str) -> None:
+        """
+        Clear crashed status for an agent.
+
+        Args:
+            target: Agent target identifier
+        """
+        if target in self._crashed_agents:
+            self._crashed_agents.discard(target)
+            self._aggregates_for(target.split(":", 1)[0]).crashed -= 1
+
+    def is_agent_crashed(self, target: str) -> bool:
+        """
+        Check if agent is marked as crashed.
+
+        Args:
+            target: Agent target identifier
+
+        Returns:
+            True if agent is crashed
+        """
+        return target in self._crashed_agents
 
     def track_session_agent(self, agent_info: AgentInfo) -> None:
         """
@@ -355,6 +448,7 @@ class StateTracker(StateTrackerInterface):
         """
         if target not in self._missing_agent_grace:
             self._missing_agent_grace[target] = datetime.now()
+            self._aggregates_for(target.split(":", 1)[0]).missing += 1
             self.logger.warning(f"Started tracking missing agent {target}")
 
     def clear_missing_agent(self, target: str) -> None:
@@ -366,6 +460,7 @@ class StateTracker(StateTrackerInterface):
         """
         if target in self._missing_agent_grace:
             del self._missing_agent_grace[target]
+            self._aggregates_for(target.split(":", 1)[0]).missing -= 1
         if target in self._missing_agent_notifications:
             del self._missing_agent_notifications[target]
         self.logger.debug(f"Cleared missing agent tracking for {target}")
@@ -400,10 +495,7 @@ class StateTracker(StateTrackerInterface):
 
     def get_all_sessions(self) -> set[str]:
         """Get all tracked sessions."""
-        sessions = set()
-        for state in self._agent_states.values():
-            sessions.add(state.session)
-        return sessions
+        return {session for session, targets in self._session_targets.items() if targets}
 
     def get_state_summary(self) -> dict[str, int]:
         """Get summary of current state tracking."""
@@ -412,5 +504,7 @@ class StateTracker(StateTrackerInterface):
             "idle_agents": len(self._idle_agents),
             "sessions": len(self._session_agents),
             "missing_agents": len(self._missing_agent_grace),
+            "crashed_agents": len(self._crashed_agents),
+            "fresh_agents": sum(a.fresh for a in self._session_aggregates.values()),
             "agents_with_submissions": len(self._submission_attempts),
         }
@@ -12,6 +12,7 @@ from typing import Any
 
 from ..cache_layer import AgentContentCache, CacheEntryStatus, TMuxCommandCache
 from ..interfaces import (
+    CRASH_PENDING_CONFIRMATION,
     AgentMonitorInterface,
     CrashDetectorInterface,
     MonitoringStrategyInterface,
@@ -127,6 +128,7 @@ class AsyncPollingStrategy(MonitoringStrategyInterface):
             if self.metrics:
                 _cycle_duration = self.metrics.stop_timer("monitoring.cycle")
                 self.metrics.record_monitor_cycle(status)
+                self.metrics.record_session_aggregates(state_tracker.get_all_session_aggregates())
 
                 # Record cache statistics
                 if self.agent_cache:
@@ -290,9 +292,12 @@ class AsyncPollingStrategy(MonitoringStrategyInterface):
                     content.split("\n") if content else [],
                     idle_duration,
                 )
+                if crash_reason == CRASH_PENDING_CONFIRMATION:
+                    is_crashed, crash_reason = await crash_detector.confirm_crash_async(agent_info.target)
 
                 if is_crashed:
                     status.errors_detected += 1
+                    state_tracker.mark_agent_crashed(agent_info.target)
                     notification_manager.notify_agent_crash(
                         agent_target=agent_info.target,
                         error_message=crash_reason or "Unknown error",
@@ -300,6 +305,7 @@ class AsyncPollingStrategy(MonitoringStrategyInterface):
                     )
                 elif idle_duration and idle_duration > 30.0:  # Check if agent is idle based on duration
                     status.idle_agents += 1
+                    state_tracker.clear_agent_crashed(agent_info.target)
 
                     # Update cache with longer TTL for idle agents
                     if self.agent_cache and not cache_hit:
@@ -312,6 +318,7 @@ class AsyncPollingStrategy(MonitoringStrategyInterface):
                         notification_manager.notify_fresh_agent(agent_target=agent_info.target)
                 else:
                     status.active_agents += 1
+                    state_tracker.clear_agent_crashed(agent_info.target)
 
             except Exception as e:
                 if logger:
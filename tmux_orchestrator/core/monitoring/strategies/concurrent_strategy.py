@@ -10,6 +10,7 @@ from datetime import timedelta
 from typing import Any
 
 from ..interfaces import (
+    CRASH_PENDING_CONFIRMATION,
     AgentMonitorInterface,
     CrashDetectorInterface,
     MonitoringStrategyInterface,
@@ -169,15 +170,19 @@ class ConcurrentMonitoringStrategy(MonitoringStrategyInterface):
             is_crashed, crash_reason = crash_detector.detect_crash(
                 agent_info, idle_analysis.content.split("\n"), state_tracker.get_idle_duration(target)
             )
+            if crash_reason == CRASH_PENDING_CONFIRMATION:
+                is_crashed, crash_reason = await crash_detector.confirm_crash_async(target)
 
             if is_crashed:
                 result["crashed"] = True
+                state_tracker.mark_agent_crashed(target)
                 notification_manager.notify_agent_crash(
                     target=target, error_type=crash_reason or "Unknown error", session=agent_info.session
                 )
 
             elif idle_analysis.is_idle:
                 result["idle"] = True
+                state_tracker.clear_agent_crashed(target)
 
                 if agent_state.is_fresh:
                     notification_manager.notify_fresh_agent(target=target, session=agent_info.session)
@@ -190,6 +195,7 @@ class ConcurrentMonitoringStrategy(MonitoringStrategyInterface):
                     )
             else:
                 result["healthy"] = True
+                state_tracker.clear_agent_crashed(target)
 
             # Check team idle status
             await self._check_team_idle_async(agent_info.session, state_tracker, notification_manager)
@@ -224,14 +230,12 @@ class ConcurrentMonitoringStrategy(MonitoringStrategyInterface):
 
     async def _check_team_idle_async(self, session, state_tracker, notification_manager):
         """Asynchronously check team idle status."""
-        session_agents = state_tracker.get_session_agents(session)
-        total_agents = len(session_agents)
-        idle_agents = sum(1 for a in session_agents if state_tracker.is_agent_idle(a.target))
+        aggregates = state_tracker.get_session_aggregates(session)
 
-        if total_agents > 0 and idle_agents == total_agents:
+        if aggregates.all_idle:
             if not state_tracker.is_team_idle(session):
                 state_tracker.set_team_idle(session)
-                notification_manager.notify_team_idle(session=session, agent_count=idle_agents)
+                notification_manager.notify_team_idle(session=session, agent_count=aggregates.idle)
         else:
             state_tracker.clear_team_idle(session)
 
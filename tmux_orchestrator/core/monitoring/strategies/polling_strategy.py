@@ -240,6 +240,10 @@ class PollingMonitoringStrategy(BaseMonitoringStrategy):
                     "last_checked": datetime.now(),
                 },
             )
+            if is_crashed:
+                state_tracker.mark_agent_crashed(agent.target)
+            else:
+                state_tracker.clear_agent_crashed(agent.target)
 
             return is_idle, is_crashed
 
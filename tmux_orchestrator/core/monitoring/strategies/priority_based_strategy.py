@@ -14,6 +14,7 @@ from enum import IntEnum
 from typing import Any, Optional
 
 from ..interfaces import (
+    CRASH_PENDING_CONFIRMATION,
     AgentMonitorInterface,
     CrashDetectorInterface,
     MonitoringStrategyInterface,
@@ -216,6 +217,7 @@ class PriorityBasedStrategy(MonitoringStrategyInterface):
                 cycle_duration = (status.end_time - status.start_time).total_seconds()
                 metrics.record_histogram("priority.cycle_duration", cycle_duration)
                 metrics.set_gauge("priority.agents_skipped", len(agents) - status.active_agents)
+                metrics.record_session_aggregates(state_tracker.get_all_session_aggregates())
 
             return status
 
@@ -383,10 +385,13 @@ class PriorityBasedStrategy(MonitoringStrategyInterface):
         is_crashed, crash_reason = crash_detector.detect_crash(
             agent_info, content.split("\n") if content else [], state_tracker.get_idle_duration(agent_info.target)
         )
+        if crash_reason == CRASH_PENDING_CONFIRMATION:
+            is_crashed, crash_reason = await crash_detector.confirm_crash_async(agent_info.target)
 
         if is_crashed:
             status.errors_detected += 1
             self._record_crash(agent_info.target)
+            state_tracker.mark_agent_crashed(agent_info.target)
 
             notification_manager.notify_agent_crash(
                 agent_target=agent_info.target,
@@ -395,11 +400,13 @@ class PriorityBasedStrategy(MonitoringStrategyInterface):
             )
         elif not is_healthy and issue and "idle" in issue.lower():
             status.idle_agents += 1
+            state_tracker.clear_agent_crashed(agent_info.target)
 
             if agent_state.get("is_fresh"):
                 notification_manager.notify_fresh_agent(agent_target=agent_info.target)
         else:
             status.active_agents += 1
+            state_tracker.clear_agent_crashed(agent_info.target)
 
             # Track stable agents
             if self.adaptive_mode and agent_info.target not in self.false_positive_agents:
@@ -125,6 +125,29 @@ class AgentState:
     last_error_time: datetime | None = None
 
 
+@dataclass
+class SessionAggregates:
+    """Incrementally maintained agent counters for a session."""
+
+    session: str
+    total: int = 0
+    idle: int = 0
+    crashed: int = 0
+    fresh: int = 0
+    missing: int = 0
+    earliest_idle: datetime | None = None
+
+    @property
+    def active(self) -> int:
+        """Number of tracked agents that are not idle."""
+        return self.total - self.idle
+
+    @property
+    def all_idle(self) -> bool:
+        """Whether every tracked agent in the session is idle."""
+        return self.total > 0 and self.idle == self.total
+
+
 @dataclass
 class PluginInfo:
     """Information about a discovered plugin."""
@@ -235,3 +258,8 @@ class StateTrackerInterface(MonitorComponent):
     def get_session_agents(self, session: str) -> list[AgentState]:
         """Get all agents in a session."""
         pass
+
+    @abstractmethod
+    def get_session_aggregates(self, session: str) -> SessionAggregates:
+        """Get agent counters for a session."""
+        pass
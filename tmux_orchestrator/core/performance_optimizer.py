@@ -6,6 +6,7 @@ from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
+from tmux_orchestrator.utils.quantile_sketch import QuantileSketch
 from tmux_orchestrator.utils.tmux import TMUXManager
 
 
@@ -51,6 +52,7 @@ class PerformanceOptimizer:
         self._batch_queue: list[dict[str, Any]] = []
         self._executor = ThreadPoolExecutor(max_workers=self.config.connection_pool_size)
         self._metrics = PerformanceMetrics()
+        self._response_times = QuantileSketch()
 
     def optimize_list_operations(self) -> dict[str, list[dict[str, Any]]]:
         """Optimize listing operations with caching and batching."""
@@ -178,6 +180,10 @@ class PerformanceOptimizer:
         if self._metrics.batch_operations_count > 0:
             self._metrics.error_rate = (self._metrics.error_rate / self._metrics.batch_operations_count) * 100
 
+        # Response time statistics are computed on read, not per recorded sample
+        self._metrics.response_time_avg = self._response_times.mean
+        self._metrics.response_time_p95 = self._response_times.quantile(0.95)
+
         return self._metrics
 
     def clear_cache(self) -> None:
@@ -270,15 +276,7 @@ class PerformanceOptimizer:
 
     def _update_response_metrics(self, response_time: float) -> None:
         """Update response time metrics."""
-        # Simple moving average for demo - in production use proper statistics
-        if self._metrics.response_time_avg == 0:
-            self._metrics.response_time_avg = response_time
-        else:
-            self._metrics.response_time_avg = (self._metrics.response_time_avg * 0.9) + (response_time * 0.1)
-
-        # Update P95 (simplified)
-        if response_time > self._metrics.response_time_p95:
-            self._metrics.response_time_p95 = response_time
+        self._response_times.add(response_time)
 
 
 # Connection pool for MCP operations
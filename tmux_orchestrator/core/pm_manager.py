@@ -5,6 +5,7 @@ import time
 from datetime import datetime
 from pathlib import Path
 
+from tmux_orchestrator.core.communication.broadcast_engine import BroadcastEngine, TopologySnapshot
 from tmux_orchestrator.utils.tmux import TMUXManager
 
 
@@ -237,19 +238,10 @@ Remember: Quality over speed. No shortcuts."""
                     # If we can't determine session, return empty results
                     return {}
 
-        agents = self.tmux.list_agents()
-        results = {}
-
-        for agent in agents:
-            # Skip PMs and agents not in our session
-            if agent["type"] == "PM" or agent.get("session") != session:
-                continue
-
-            target = f"{agent['session']}:{agent['window']}"
-            success = self.tmux.send_message(target, message)
-            results[target] = success
-
-        return results
+        # Resolve non-PM agents from one snapshot and deliver to them concurrently
+        snapshot = TopologySnapshot.capture(self.tmux)
+        recipients = snapshot.agents(sessions=[session], exclude_roles={"project_manager"})
+        return BroadcastEngine(self.tmux).deliver(recipients, message).by_target()
 
     def custom_checkin(self, custom_message: str) -> dict[str, bool]:
         """Send custom check-in message to all agents."""
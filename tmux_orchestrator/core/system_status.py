@@ -0,0 +1,73 @@
+"""Business logic for the system status overview."""
+
+from datetime import UTC, datetime
+from typing import Any
+
+from tmux_orchestrator.core.monitoring.status_writer import StatusWriter
+from tmux_orchestrator.utils.tmux import TMUXManager
+
+
+def get_system_status(tmux: TMUXManager, max_status_age: float = 30.0) -> dict[str, Any]:
+    """Get sessions, agents and daemon health.
+
+    Agent states come from the monitoring daemon's status file when it is
+    fresher than ``max_status_age`` seconds, and from a live tmux query
+    otherwise.
+
+    Args:
+        tmux: TMUXManager instance
+        max_status_age: Oldest status file (in seconds) that is still used
+
+    Returns:
+        Dictionary with sessions, agents, summary and, when the status file
+        was used, daemon_status and status_age_seconds
+    """
+    status_data = StatusWriter().read_status()
+    status_age: float | None = None
+    freshness_warning: str | None = None
+
+    if status_data:
+        try:
+            last_updated = datetime.fromisoformat(status_data["last_updated"].replace("Z", "+00:00"))
+            status_age = (datetime.now(UTC) - last_updated).total_seconds()
+        except Exception:
+            status_age = None
+
+        if status_age is not None and status_age >= max_status_age:
+            freshness_warning = f"Status data is {int(status_age)}s old, gathering fresh data..."
+            status_age = None
+
+    sessions: list[dict[str, str]] = tmux.list_sessions_cached()
+    if status_data and status_age is not None:
+        # Convert status file format to expected agent format
+        agents: list[dict[str, Any]] = [
+            {
+                "target": target,
+                "name": agent_info.get("name", "unknown"),
+                "type": agent_info.get("type", "unknown"),
+                "status": agent_info.get("status", "unknown").capitalize(),
+                "session": agent_info.get("session"),
+                "window": agent_info.get("window"),
+            }
+            for target, agent_info in status_data.get("agents", {}).items()
+        ]
+    else:
+        agents = tmux.list_agents_ultra_optimized()
+
+    result: dict[str, Any] = {
+        "sessions": sessions,
+        "agents": agents,
+        "summary": {
+            "total_sessions": len(sessions),
+            "total_agents": len(agents),
+            "active_agents": len([a for a in agents if a["status"] == "Active"]),
+        },
+        "using_cached_status": status_age is not None,
+        "freshness_warning": freshness_warning,
+    }
+
+    if status_data and status_age is not None:
+        result["daemon_status"] = status_data.get("daemon_status", {})
+        result["status_age_seconds"] = int(status_age)
+
+    return result
@@ -3,6 +3,7 @@
 from datetime import datetime
 from typing import Any, Optional
 
+from tmux_orchestrator.core.communication.broadcast_engine import BroadcastEngine, Recipient
 from tmux_orchestrator.utils.tmux import TMUXManager
 
 
@@ -13,6 +14,7 @@ def broadcast_to_team(
     exclude_windows: Optional[list[str | None]] = None,
     priority: str = "normal",
     agent_types: Optional[list[str | None]] = None,
+    max_parallel: int = 8,
 ) -> tuple[bool, str, list[dict[str, Any]]]:
     """Broadcast a message to all agents in a session.
 
@@ -23,6 +25,7 @@ def broadcast_to_team(
         exclude_windows: Optional list of window names/indices to exclude
         priority: Message priority (low, normal, high, urgent)
         agent_types: Optional list of specific agent types to target
+        max_parallel: Maximum deliveries in flight at once
 
     Returns:
         Tuple of (success, summary_message, detailed_results)
@@ -65,51 +68,27 @@ def broadcast_to_team(
     # Format message with priority if needed
     formatted_message = _format_broadcast_message(message, priority)
 
-    # Send message to each agent
-    results: list[dict[str, Any]] = []
-    success_count: int = 0
-    failed_count: int = 0
+    # Deliver to all agents concurrently
+    recipients = [Recipient(session, str(window["index"]), window["name"]) for window in agent_windows]
+    broadcast = BroadcastEngine(tmux, max_parallel=max_parallel).deliver(recipients, formatted_message)
     timestamp = datetime.utcnow().isoformat() + "Z"
 
-    for window in agent_windows:
-        target: str = f"{session}:{window['index']}"
-
-        try:
-            success: bool = tmux.send_message(target, formatted_message)
-            agent_type = _determine_agent_type(window["name"])
-
-            results.append(
-                {
-                    "target": target,
-                    "window_name": window["name"],
-                    "window_index": window["index"],
-                    "agent_type": agent_type,
-                    "success": success,
-                    "timestamp": timestamp,
-                    "priority": priority,
-                    "error": None if success else "Failed to send message",
-                }
-            )
-
-            if success:
-                success_count += 1
-            else:
-                failed_count += 1
-
-        except Exception as e:
-            results.append(
-                {
-                    "target": target,
-                    "window_name": window["name"],
-                    "window_index": window["index"],
-                    "agent_type": _determine_agent_type(window["name"]),
-                    "success": False,
-                    "timestamp": timestamp,
-                    "priority": priority,
-                    "error": str(e),
-                }
-            )
-            failed_count += 1
+    results: list[dict[str, Any]] = [
+        {
+            "target": delivery.recipient.target,
+            "window_name": delivery.recipient.window_name,
+            "window_index": delivery.recipient.window_index,
+            "agent_type": delivery.recipient.role,
+            "success": delivery.success,
+            "timestamp": timestamp,
+            "priority": priority,
+            "latency_ms": round(delivery.latency * 1000, 1),
+            "error": delivery.error,
+        }
+        for delivery in broadcast.results
+    ]
+    success_count: int = broadcast.success_count
+    failed_count: int = len(broadcast.failed)
 
     total_agents: int = len(agent_windows)
     summary_parts = [f"Broadcast complete: {success_count}/{total_agents} agents reached"]
@@ -140,36 +119,3 @@ def _format_broadcast_message(message: str, priority: str) -> str:
 
     prefix = priority_prefixes.get(priority, "")
     return f"{prefix}{message}" if prefix else message
-
-
-def _determine_agent_type(window_name: str) -> str:
-    """Determine agent type from window name.
-
-    Args:
-        window_name: Window name
-
-    Returns:
-        Agent type string
-    """
-    window_name_lower = window_name.lower()
-
-    if "pm" in window_name_lower:
-        return "project_manager"
-    elif "qa" in window_name_lower:
-        return "qa_engineer"
-    elif "frontend" in window_name_lower:
-        return "frontend_developer"
-    elif "backend" in window_name_lower:
-        return "backend_developer"
-    elif "devops" in window_name_lower:
-        return "devops_engineer"
-    elif "reviewer" in window_name_lower:
-        return "code_reviewer"
-    elif "researcher" in window_name_lower:
-        return "researcher"
-    elif "docs" in window_name_lower:
-        return "documentation_writer"
-    elif "claude" in window_name_lower:
-        return "developer"
-    else:
-        return "unknown"
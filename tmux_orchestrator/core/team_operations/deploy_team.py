@@ -1,10 +1,10 @@
 """Business logic for deploying teams of agents."""
 
-import time
 from pathlib import Path
 
 from tmux_orchestrator.core.agent_operations.restart_agent import restart_agent
 from tmux_orchestrator.utils.tmux import TMUXManager
+from tmux_orchestrator.utils.tmux.submit_timing import AdaptiveSubmitter
 
 
 def deploy_standard_team(tmux: TMUXManager, team_type: str, size: int, project_name: str) -> tuple[bool, str]:
@@ -169,12 +169,11 @@ def _start_claude_agent(tmux: TMUXManager, target: str, role: str) -> bool:
     if not tmux.send_keys(target, "claude --dangerously-skip-permissions"):
         return False
 
-    time.sleep(0.5)
     if not tmux.send_keys(target, "Enter"):
         return False
 
-    # Wait for Claude to start
-    time.sleep(3)
+    # Wait for Claude's prompt box rather than a fixed startup delay
+    AdaptiveSubmitter(tmux).wait_until_ready(target, timeout=15.0)
 
     # Send role-specific briefing
     briefing = _get_role_briefing(role)
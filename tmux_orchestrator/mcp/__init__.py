@@ -4,6 +4,15 @@ This module provides the CLI-reflection based MCP server that auto-generates
 tools from tmux-orc CLI commands for Claude integration.
 """
 
-from tmux_orchestrator.mcp.server import EnhancedCLIToMCPServer
+from typing import Any
 
 __all__ = ["EnhancedCLIToMCPServer"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the server on first use so its helper modules load without FastMCP."""
+    if name in __all__:
+        from tmux_orchestrator.mcp import server
+
+        return getattr(server, name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -7,13 +7,21 @@ to automatically generate MCP tool descriptions, replacing the manual COMPLETE_A
 """
 
 import argparse
+import hashlib
 import importlib
+import importlib.util
 import inspect
 import json
 import logging
+import os
 import re
-import subprocess
-from typing import Any, Dict, List, Optional, cast
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, cast
+
+import click
+
+from tmux_orchestrator import __version__
 
 logger = logging.getLogger(__name__)
 
@@ -107,36 +115,40 @@ class CLICommandIntrospector:
         "spawn-orc": "spawn_orc",
     }
 
-    def __init__(self, cli_package: str = "tmux_orchestrator.cli"):
+    # Reflected commands and descriptions, reused until the package version or a CLI module changes
+    DEFAULT_CACHE_PATH = Path(".tmux_orchestrator/cache/mcp_cli_schema.json")
+
+    def __init__(self, cli_package: str = "tmux_orchestrator.cli", cache_path: Path | None = None):
         """Initialize the introspector.
 
         Args:
             cli_package: The CLI package to introspect
+            cache_path: Schema cache file (defaults to DEFAULT_CACHE_PATH)
         """
         self.cli_package = cli_package
+        self.cache_path = cache_path or self.DEFAULT_CACHE_PATH
         self.parser = MCPTagParser()
+        self._cache: Dict[str, Any] | None = None
 
     def discover_cli_commands(self) -> Dict[str, Any]:
-        """Discover all CLI commands using tmux-orc reflect.
+        """Discover all CLI commands by walking the click command tree in-process.
 
         Returns:
-            Dictionary of command metadata
+            Dictionary of command metadata, in the format of ``tmux-orc reflect --format json``
+            plus parameters and nested groups
         """
-        try:
-            result = subprocess.run(
-                ["tmux-orc", "reflect", "--format", "json"], capture_output=True, text=True, timeout=30
-            )
-
-            if result.returncode != 0:
-                logger.error(f"CLI reflection failed: {result.stderr}")
+        cache = self._load_cache()
+        if "commands" not in cache:
+            try:
+                root = getattr(importlib.import_module(self.cli_package), "cli")
+                cache["commands"] = reflect_cli(root)
+            except Exception as e:
+                logger.error(f"Failed to discover CLI commands: {e}")
                 return {}
+            self._save_cache()
 
-            parsed_result: Dict[str, Any] = json.loads(result.stdout)
-            return parsed_result
-
-        except Exception as e:
-            logger.error(f"Failed to discover CLI commands: {e}")
-            return {}
+        commands: Dict[str, Any] = cache["commands"]
+        return commands
 
     def extract_command_docstrings(self, command_name: str) -> Dict[str, str | None]:
         """Extract docstrings for command and subcommands.
@@ -182,6 +194,11 @@ class CLICommandIntrospector:
         Returns:
             Dictionary in the same format as COMPLETE_ACTION_DESCRIPTIONS
         """
+        cache = self._load_cache()
+        if "descriptions" in cache:
+            cached: Dict[str, Dict[str, str]] = cache["descriptions"]
+            return cached
+
         cli_structure = self.discover_cli_commands()
         mcp_descriptions = {}
 
@@ -192,18 +209,23 @@ class CLICommandIntrospector:
             logger.info(f"Processing command group: {command_name}")
 
             # Get subcommands for this group
-            subcommands = self._get_subcommands(command_name)
+            subcommands = command_info.get("subcommands", {})
             if not subcommands:
                 continue
 
-            # Extract docstrings from the CLI module
-            docstrings = self.extract_command_docstrings(command_name)
+            # Module docstrings are only needed for commands without help text
+            module_docstrings: Dict[str, str | None] | None = None
 
             group_descriptions = {}
 
-            for subcmd in subcommands:
+            for subcmd, subcmd_info in subcommands.items():
                 # Look for MCP description in docstring
-                docstring = docstrings.get(subcmd)
+                docstring = subcmd_info.get("help") or None
+                if docstring is None:
+                    if module_docstrings is None:
+                        module_docstrings = self.extract_command_docstrings(command_name)
+                    docstring = module_docstrings.get(subcmd)
+
                 if docstring is not None:
                     mcp_desc = self.parser.extract_mcp_description(docstring)
                 else:
@@ -229,60 +251,111 @@ class CLICommandIntrospector:
             if group_descriptions:
                 mcp_descriptions[command_name] = group_descriptions
 
+        if cli_structure:
+            cache["descriptions"] = mcp_descriptions
+            self._save_cache()
+
         return mcp_descriptions
 
-    def _get_subcommands(self, group_name: str) -> List[str]:
-        """Get subcommands for a command group.
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load the schema cache, discarding it if the CLI changed since it was written."""
+        key = cli_fingerprint(self.cli_package)
+        if self._cache is not None and self._cache.get("key") == key:
+            return self._cache
 
-        Args:
-            group_name: Name of the command group
-
-        Returns:
-            List of subcommand names
-        """
         try:
-            result = subprocess.run(["tmux-orc", group_name, "--help"], capture_output=True, text=True, timeout=30)
+            with open(self.cache_path) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = None
 
-            if result.returncode != 0:
-                return []
+        if not isinstance(cache, dict) or cache.get("key") != key:
+            logger.debug("CLI schema cache is missing or stale; reflecting CLI")
+            cache = {"key": key}
 
-            return self._parse_subcommands_from_help(result.stdout)
+        self._cache = cache
+        return cache
 
-        except Exception as e:
-            logger.error(f"Failed to get subcommands for {group_name}: {e}")
-            return []
-
-    def _parse_subcommands_from_help(self, help_text: str) -> List[str]:
-        """Parse subcommand names from CLI help output.
-
-        Args:
-            help_text: Raw help text from CLI
-
-        Returns:
-            List of subcommand names
-        """
-        subcommands = []
-        in_commands_section = False
-
-        for line in help_text.split("\n"):
-            # Check for Commands: section
-            if line.strip().lower() == "commands:":
-                in_commands_section = True
-                continue
-
-            # Stop when we hit another section
-            if in_commands_section and line.strip().startswith("Options:"):
-                break
-
-            # Extract command names (format: "  command_name  Description...")
-            if in_commands_section and line.startswith("  ") and not line.startswith("    "):
-                parts = line[2:].split()
-                if parts:
-                    cmd_name = parts[0]
-                    if cmd_name and not cmd_name.startswith("-"):
-                        subcommands.append(cmd_name)
-
-        return subcommands
+    def _save_cache(self) -> None:
+        """Atomically write the schema cache."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_fd, temp_path = tempfile.mkstemp(dir=self.cache_path.parent, prefix=".schema_", suffix=".tmp")
+            try:
+                with os.fdopen(temp_fd, "w") as f:
+                    json.dump(self._cache, f)
+                os.replace(temp_path, self.cache_path)
+            except Exception:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write CLI schema cache {self.cache_path}: {e}")
+
+
+def cli_fingerprint(cli_package: str = "tmux_orchestrator.cli") -> str:
+    """Hash the package version and the mtimes of the CLI modules, without importing them.
+
+    Args:
+        cli_package: The CLI package
+
+    Returns:
+        Hex digest that changes whenever a CLI module is edited, added or removed
+    """
+    digest = hashlib.sha1(__version__.encode())
+    spec = importlib.util.find_spec(cli_package)
+    for location in (spec.submodule_search_locations or []) if spec else []:
+        root = Path(location)
+        for path in sorted(root.rglob("*.py")):
+            digest.update(f"{path.relative_to(root)}:{path.stat().st_mtime_ns};".encode())
+    return digest.hexdigest()
+
+
+def reflect_cli(group: click.Group, include_hidden: bool = False) -> Dict[str, Any]:
+    """Describe a click command tree, loading lazy command groups.
+
+    Args:
+        group: Root command group
+        include_hidden: Include hidden commands
+
+    Returns:
+        Dictionary mapping command names to their type, help, short_help,
+        params and (for groups) subcommands
+    """
+    return _describe_commands(click.Context(group, info_name="tmux-orc"), group, include_hidden)
+
+
+def _describe_commands(ctx: click.Context, group: click.Group, include_hidden: bool) -> Dict[str, Any]:
+    commands: Dict[str, Any] = {}
+    for name in group.list_commands(ctx):
+        command = group.get_command(ctx, name)
+        if command is None or (command.hidden and not include_hidden):
+            continue
+
+        info: Dict[str, Any] = {
+            "type": "group" if isinstance(command, click.Group) else "command",
+            "help": command.help or "",
+            "short_help": command.short_help or "",
+            "params": [_describe_param(param) for param in command.params],
+        }
+        if isinstance(command, click.Group):
+            sub_ctx = click.Context(command, info_name=name, parent=ctx)
+            info["subcommands"] = _describe_commands(sub_ctx, command, include_hidden)
+        commands[name] = info
+    return commands
+
+
+def _describe_param(param: click.Parameter) -> Dict[str, Any]:
+    default = param.default if isinstance(param.default, (str, int, float, bool, type(None))) else None
+    return {
+        "name": param.name,
+        "kind": "argument" if isinstance(param, click.Argument) else "option",
+        "type": param.type.name,
+        "required": param.required,
+        "multiple": param.multiple,
+        "is_flag": getattr(param, "is_flag", False),
+        "default": default,
+        "help": getattr(param, "help", None) or "",
+    }
 
 
 class MCPAutoGenerator:
@@ -0,0 +1,172 @@
+"""Read-through cache for read-only MCP tool responses.
+
+Claude agents poll status tools several times per turn. Responses are cached
+per tool and normalized arguments for a short TTL, dropped whenever a
+mutating tool runs, and dropped when the tmux topology (sessions, windows and
+their names) changes underneath us.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from tmux_orchestrator.utils.tmux.async_operations import AsyncTmuxOperations
+
+ToolFunc = Callable[..., Awaitable[dict[str, Any]]]
+
+TOPOLOGY_FORMAT = "#{session_id}#{window_id}#{window_name}"
+
+
+async def tmux_topology_generation(tmux: AsyncTmuxOperations | None = None) -> str:
+    """Fingerprint the current tmux sessions and windows with one tmux call."""
+    output = await (tmux or AsyncTmuxOperations()).run("list-windows", "-a", "-F", TOPOLOGY_FORMAT)
+    return hashlib.sha1((output or "").encode()).hexdigest()
+
+
+class ResponseCache:
+    """Tool responses keyed by tool name and normalized arguments."""
+
+    def __init__(
+        self,
+        topology: Callable[[], Awaitable[str]] | None = tmux_topology_generation,
+        topology_check_interval: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            topology: Coroutine returning a token that changes with the tmux topology (None disables the check)
+            topology_check_interval: Seconds between topology checks
+            clock: Time source
+        """
+        self._topology = topology
+        self._topology_check_interval = topology_check_interval
+        self._clock = clock
+        self._entries: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self._epoch = 0
+        self._generation: str | None = None
+        self._topology_checked_at = float("-inf")
+        self._logger = logging.getLogger(__name__)
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(tool: str, func: Callable[..., Any], args: tuple, kwargs: dict[str, Any]) -> tuple[str, str]:
+        """Build a cache key with defaults applied, so equivalent calls share an entry."""
+        bound = inspect.signature(func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        return tool, json.dumps(bound.arguments, sort_keys=True, default=str)
+
+    def cached(self, ttl: float) -> Callable[[ToolFunc], ToolFunc]:
+        """Decorate a read-only tool so its successful responses are reused for ``ttl`` seconds."""
+
+        def decorator(func: ToolFunc) -> ToolFunc:
+            @functools.wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+                key = self.make_key(func.__name__, func, args, kwargs)
+                return await self._get(key, ttl, lambda: func(*args, **kwargs))
+
+            return wrapper
+
+        return decorator
+
+    def invalidates(self, func: ToolFunc) -> ToolFunc:
+        """Decorate a mutating tool so the cache is cleared when it runs."""
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            self.invalidate()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                # Drop anything read while the mutation was in progress
+                self._clear()
+
+        return wrapper
+
+    async def _get(
+        self, key: tuple[str, str], ttl: float, fetch: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        await self._check_topology()
+
+        entry = self._entries.get(key)
+        if entry is not None and self._clock() - entry[0] < ttl:
+            self.hits += 1
+            return entry[1]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.shared += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        epoch = self._epoch
+        try:
+            response = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved when nobody else was waiting on it
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            if response.get("success") and epoch == self._epoch:
+                self._entries[key] = (self._clock(), response)
+            return response
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _check_topology(self) -> None:
+        if self._topology is None:
+            return
+        now = self._clock()
+        if now - self._topology_checked_at < self._topology_check_interval:
+            return
+        self._topology_checked_at = now
+
+        try:
+            generation = await self._topology()
+        except Exception as e:
+            self._logger.debug(f"Topology check failed: {e}")
+            self.invalidate()
+            return
+
+        if self._generation is not None and generation != self._generation:
+            self.invalidate()
+        self._generation = generation
+
+    def invalidate(self) -> None:
+        """Drop every cached response."""
+        self.invalidations += 1
+        self._clear()
+
+    def _clear(self) -> None:
+        # Responses fetched before a clear must not be stored after it
+        self._epoch += 1
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit, miss and invalidation counts."""
+        lookups = self.hits + self.misses + self.shared
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self.shared,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+            "hit_rate": (self.hits + self.shared) / lookups if lookups else 0.0,
+        }
@@ -8,94 +8,83 @@ previous auto-generated kwargs-based approach.
 
 import asyncio
 import logging
-import sys
 from typing import Any, Dict, List, Optional
 
 from fastmcp import FastMCP
 
+from .. import mcp_tools
+from ..core.mcp.performance_monitor import MCPPerformanceMonitor
+from .response_cache import ResponseCache
+from .tool_manifest import LazyToolRegistry
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Import native MCP tools
-try:
-    from ..mcp_tools import (
-        agent_attach,
-        agent_kill,
-        agent_list,
-        agent_restart,
-        agent_send_message,
-        agent_status,
-        get_monitor_logs,
-        health_check,
-        list_contexts,
-        monitor_dashboard,
-        quick_deploy,
-        show_context,
-        spawn_agent,
-        spawn_orchestrator,
-        spawn_pm,
-        system_status,
-        team_broadcast,
-        team_deploy,
-        team_list,
-        team_status,
-    )
-
-    logger.info("✅ Successfully imported all native MCP tools")
-except ImportError as e:
-    logger.error(f"❌ Failed to import native MCP tools: {e}")
-    sys.exit(1)
-
 # Create FastMCP application
 app = FastMCP("tmux-orchestrator-native")
 
+# Latency, success and response size of every tool call; see get_mcp_performance
+performance = MCPPerformanceMonitor(in_process=True)
+
+# Tool schemas come from tool_manifest.json; implementations are imported on first call
+tools = LazyToolRegistry(middleware=performance.instrument)
+
+# Read-only tools are served from here until a mutating tool runs or tmux topology changes
+response_cache = ResponseCache()
+
 # =============================================================================
 # NATIVE MCP TOOLS
 # =============================================================================
 
 
-@app.tool()
+@tools.register
+@response_cache.cached(ttl=2)
 async def list_agents_tool(
     format: str = "table", filter_session: Optional[str] = None, include_idle: bool = True
 ) -> Dict[str, Any]:
     """List all active agents across sessions with filtering options."""
-    return await agent_list(format, filter_session, include_idle)
+    return await mcp_tools.agent_list(format, filter_session, include_idle)
 
 
-@app.tool()
+@tools.register
+@response_cache.cached(ttl=2)
 async def get_agent_status(target: str, include_metrics: bool = False) -> Dict[str, Any]:
     """Get detailed status of a specific agent (session:window format)."""
-    return await agent_status(target, include_metrics)
+    return await mcp_tools.agent_status(target, include_metrics)
 
 
-@app.tool()
+@tools.register
+@response_cache.invalidates
 async def send_agent_message(
     target: str, message: str, priority: str = "normal", expect_response: bool = False
 ) -> Dict[str, Any]:
     """Send message to a specific agent with priority levels."""
-    return await agent_send_message(target, message, priority, expect_response)
+    return await mcp_tools.agent_send_message(target, message, priority, expect_response)
 
 
-@app.tool()
+@tools.register
+@response_cache.invalidates
 async def restart_agent_tool(target: str, preserve_context: bool = True, force: bool = False) -> Dict[str, Any]:
     """Restart a specific agent with context preservation options."""
-    return await agent_restart(target, preserve_context, force)
+    return await mcp_tools.agent_restart(target, preserve_context, force)
 
 
-@app.tool()
+@tools.register
+@response_cache.invalidates
 async def kill_agent_tool(target: str, graceful: bool = True, timeout: int = 30) -> Dict[str, Any]:
     """Terminate a specific agent with graceful shutdown."""
-    return await agent_kill(target, graceful, timeout)
+    return await mcp_tools.agent_kill(target, graceful, timeout)
 
 
-@app.tool()
+@tools.register
 async def attach_to_agent(target: str, read_only: bool = False) -> Dict[str, Any]:
     """Attach to an agent's terminal session."""
-    return await agent_attach(target, read_only)
+    return await mcp_tools.agent_attach(target, read_only)
 
 
-@app.tool()
+@tools.register
+@response_cache.invalidates
 async def create_agent(
     role: str,
     session_name: str,
@@ -104,100 +93,137 @@ async def create_agent(
     technology_stack: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """Spawn a new agent with specified role and context."""
-    return await spawn_agent(role, session_name, briefing, window, technology_stack)
+    return await mcp_tools.spawn_agent(role, session_name, briefing, window, technology_stack)
 
 
-@app.tool()
+@tools.register
+@response_cache.invalidates
 async def create_project_manager(
     session_name: str, window: int = 1, project_context: Optional[str] = None, team_size: Optional[int] = None
 ) -> Dict[str, Any]:
     """Spawn a project manager agent."""
-    return await spawn_pm(session_name, window, project_context, team_size)
+    return await mcp_tools.spawn_pm(session_name, window, project_context, team_size)
 
 
-@app.tool()
+@tools.register
+@response_cache.invalidates
 async def create_orchestrator(session_name: str, window: int = 0, scope: str = "project") -> Dict[str, Any]:
     """Spawn an orchestrator agent."""
-    return await spawn_orchestrator(session_name, window, scope)
+    return await mcp_tools.spawn_orchestrator(session_name, window, scope)
 
 
-@app.tool()
+@tools.register
+@response_cache.invalidates
 async def deploy_team_quickly(
     team_type: str, team_size: int, project_name: Optional[str] = None, technology_focus: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """Rapidly deploy optimized team configurations."""
-    return await quick_deploy(team_type, team_size, project_name, technology_focus)
+    return await mcp_tools.quick_deploy(team_type, team_size, project_name, technology_focus)
 
 
-@app.tool()
+@tools.register
+@response_cache.invalidates
 async def broadcast_to_team(
     team_name: str, message: str, priority: str = "normal", exclude_roles: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """Broadcast message to all team members."""
-    return await team_broadcast(team_name, message, priority, exclude_roles)
+    return await mcp_tools.team_broadcast(team_name, message, priority, exclude_roles)
 
 
-@app.tool()
+@tools.register
+@response_cache.cached(ttl=3)
 async def get_team_status(
     team_name: Optional[str] = None, include_agents: bool = True, format: str = "table"
 ) -> Dict[str, Any]:
     """Get status of team or all teams."""
-    return await team_status(team_name, include_agents, format)
+    return await mcp_tools.team_status(team_name, include_agents, format)
 
 
-@app.tool()
+@tools.register
+@response_cache.invalidates
 async def deploy_new_team(
     team_name: str, team_type: str, team_size: int, project_context: Optional[str] = None
 ) -> Dict[str, Any]:
     """Deploy a new team."""
-    return await team_deploy(team_name, team_type, team_size, project_context)
+    return await mcp_tools.team_deploy(team_name, team_type, team_size, project_context)
 
 
-@app.tool()
+@tools.register
+@response_cache.cached(ttl=5)
 async def list_teams_tool(format: str = "table", include_empty: bool = False) -> Dict[str, Any]:
     """List all active teams."""
-    return await team_list(format, include_empty)
+    return await mcp_tools.team_list(format, include_empty)
 
 
-@app.tool()
+@tools.register
+@response_cache.cached(ttl=3)
 async def get_system_status(format: str = "dashboard", include_performance: bool = False) -> Dict[str, Any]:
     """Get comprehensive system status."""
-    return await system_status(format, include_performance)
+    return await mcp_tools.system_status(format, include_performance)
 
 
-@app.tool()
+@tools.register
 async def show_monitoring_dashboard(refresh_interval: int = 15, focus_team: Optional[str] = None) -> Dict[str, Any]:
     """Display interactive monitoring dashboard."""
-    return await monitor_dashboard(refresh_interval, focus_team)
+    return await mcp_tools.monitor_dashboard(refresh_interval, focus_team)
 
 
-@app.tool()
+@tools.register
+@response_cache.invalidates
 async def run_health_check(
     target: Optional[str] = None, deep_check: bool = False, auto_fix: bool = False
 ) -> Dict[str, Any]:
     """Perform comprehensive health check."""
-    return await health_check(target, deep_check, auto_fix)
+    return await mcp_tools.health_check(target, deep_check, auto_fix)
 
 
-@app.tool()
+@tools.register
 async def get_monitoring_logs(
     lines: int = 50, follow: bool = False, filter_level: Optional[str] = None
 ) -> Dict[str, Any]:
     """Get monitoring system logs."""
-    return await get_monitor_logs(lines, follow, filter_level)
+    return await mcp_tools.get_monitor_logs(lines, follow, filter_level)
 
 
-@app.tool()
+@tools.register
+@response_cache.cached(ttl=60)
 async def get_context(context_name: str) -> Dict[str, Any]:
     """Show context information (orc, pm, mcp, tmux-comms)."""
-    return await show_context(context_name)
+    return await mcp_tools.show_context(context_name)
 
 
-@app.tool()
+@tools.register
+@response_cache.cached(ttl=60)
 async def get_contexts() -> Dict[str, Any]:
     """List all available contexts."""
-    return await list_contexts()
+    return await mcp_tools.list_contexts()
+
+
+@tools.register
+async def get_response_cache_stats() -> Dict[str, Any]:
+    """Get hit/miss statistics for cached read-only tool responses."""
+    return {"success": True, "data": response_cache.get_stats()}
+
+
+@tools.register
+async def get_mcp_performance() -> Dict[str, Any]:
+    """Get per-tool latency, success rate and response size, slowest tools first."""
+    metrics = await performance.collect_metrics()
+    tool_summary = sorted(
+        performance.get_tool_summary().items(), key=lambda item: item[1]["latency"]["p95"], reverse=True
+    )
+    return {
+        "success": True,
+        "data": {
+            "uptime_seconds": metrics.timestamp - performance.start_time,
+            "memory_mb": metrics.memory_usage_mb,
+            "cpu_percent": metrics.cpu_percent,
+            "tools": dict(tool_summary),
+        },
+    }
+
 
+tools.install(app)
 
 # =============================================================================
 # SERVER MANAGEMENT
@@ -208,8 +234,6 @@ async def main():
     """Run the native MCP tools server."""
     logger.info("🚀 Starting Native MCP Tools Server...")
 
-    # Get tool count from tool manager
-    tools = app._tool_manager.list_tools()
     tool_count = len(tools)
     logger.info(f"📊 Registered {tool_count} native MCP tools")
 
@@ -0,0 +1,58 @@
+"""Import-time profiling for MCP server startup."""
+
+import subprocess
+import sys
+from typing import Any
+
+SERVER_MODULE = "tmux_orchestrator.mcp.server"
+PACKAGE_PREFIX = "tmux_orchestrator"
+
+
+def profile_startup(module: str = SERVER_MODULE, top: int = 15) -> dict[str, Any]:
+    """Import ``module`` in a fresh interpreter and collect ``-X importtime`` timings.
+
+    Args:
+        module: Module to import
+        top: Number of slowest imports (by cumulative time) to report
+
+    Returns:
+        Dictionary with total_seconds, package_seconds (time spent executing
+        tmux_orchestrator modules themselves), modules (every module imported,
+        in import order) and imports (the slowest imports)
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed: {result.stderr.strip().splitlines()[-1:]}")
+
+    imports: list[dict[str, Any]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:") :].split("|")
+            imports.append(
+                {"module": name.strip(), "self_ms": int(self_us) / 1000, "cumulative_ms": int(cumulative_us) / 1000}
+            )
+        except ValueError:
+            # Header line
+            continue
+
+    target = next((i for i in reversed(imports) if i["module"] == module), None)
+    package_ms = sum(
+        i["self_ms"] for i in imports if i["module"] == PACKAGE_PREFIX or i["module"].startswith(PACKAGE_PREFIX + ".")
+    )
+    return {
+        "module": module,
+        "total_seconds": target["cumulative_ms"] / 1000 if target else 0.0,
+        "package_seconds": package_ms / 1000,
+        "modules": [i["module"] for i in imports],
+        "imports": sorted(imports, key=lambda i: i["cumulative_ms"], reverse=True)[:top],
+    }
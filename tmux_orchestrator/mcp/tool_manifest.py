@@ -0,0 +1,140 @@
+"""Lazy MCP tool registration from a precomputed schema manifest.
+
+FastMCP builds each tool's JSON schema from its signature when the tool is
+registered, and the server is started for every Claude session. Instead, the
+schemas are generated once into ``tool_manifest.json`` and registered from
+there; argument validation for a tool is only built the first time it is
+called, and tool implementation modules are imported lazily by
+``tmux_orchestrator.mcp_tools``.
+
+Regenerate the manifest after changing a tool's signature or docstring::
+
+    python -m tmux_orchestrator.mcp.tool_manifest
+"""
+
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from fastmcp import FastMCP
+from fastmcp.tools import FunctionTool, Tool, ToolResult
+from pydantic import PrivateAttr
+
+ToolFunc = Callable[..., Awaitable[dict[str, Any]]]
+
+MANIFEST_PATH = Path(__file__).with_name("tool_manifest.json")
+
+# Tool fields that are stored in the manifest
+MANIFEST_FIELDS = ("name", "description", "parameters", "output_schema")
+
+logger = logging.getLogger(__name__)
+
+
+class ManifestTool(Tool):
+    """Tool registered from a manifest entry; validation is built on first call."""
+
+    _fn: ToolFunc = PrivateAttr()
+    _delegate: FunctionTool | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_manifest(cls, fn: ToolFunc, entry: dict[str, Any]) -> "ManifestTool":
+        """Create a tool from its manifest entry and implementation."""
+        tool = cls(
+            name=str(entry["name"]),
+            description=entry.get("description"),
+            parameters=dict(entry.get("parameters") or {}),
+            output_schema=entry.get("output_schema"),
+        )
+        tool._fn = fn
+        return tool
+
+    async def run(self, arguments: dict[str, Any]) -> ToolResult:
+        """Run the tool, building its argument validation on first use."""
+        if self._delegate is None:
+            self._delegate = FunctionTool.from_function(
+                self._fn, name=self.name, description=self.description, output_schema=self.output_schema
+            )
+        return await self._delegate.run(arguments)
+
+
+class LazyToolRegistry:
+    """Collects tool functions and installs them on a FastMCP app from the manifest."""
+
+    def __init__(
+        self, manifest_path: Path = MANIFEST_PATH, middleware: Callable[[ToolFunc], ToolFunc] | None = None
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            manifest_path: Manifest to register tool schemas from
+            middleware: Decorator applied to every registered tool
+        """
+        self.manifest_path = manifest_path
+        self.middleware = middleware
+        self.functions: dict[str, ToolFunc] = {}
+
+    def __len__(self) -> int:
+        return len(self.functions)
+
+    def register(self, func: ToolFunc) -> ToolFunc:
+        """Decorate a tool function to be installed by :meth:`install`."""
+        if self.middleware is not None:
+            func = self.middleware(func)
+        self.functions[func.__name__] = func
+        return func
+
+    def install(self, app: FastMCP) -> None:
+        """Register every tool on ``app``.
+
+        Tools missing from the manifest are registered from their signature,
+        which is slower but keeps the server working until it is regenerated.
+        """
+        manifest = load_manifest(self.manifest_path)
+        for name, func in self.functions.items():
+            entry = manifest.get(name)
+            if entry is None:
+                logger.warning(f"Tool {name} is not in {self.manifest_path.name}; regenerate the manifest")
+                app.add_tool(func)
+            else:
+                app.add_tool(ManifestTool.from_manifest(func, entry))
+
+
+def build_manifest(functions: dict[str, ToolFunc]) -> dict[str, dict[str, Any]]:
+    """Generate manifest entries from tool function signatures."""
+    manifest = {}
+    for name, func in functions.items():
+        tool = FunctionTool.from_function(func, name=name)
+        manifest[name] = {field: getattr(tool, field) for field in MANIFEST_FIELDS}
+    return manifest
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict[str, dict[str, Any]]:
+    """Load the manifest, or an empty one if it is missing or unreadable."""
+    try:
+        with open(path) as f:
+            return {entry["name"]: entry for entry in json.load(f)["tools"]}
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Could not load tool manifest {path}: {e}")
+        return {}
+
+
+def write_manifest(functions: dict[str, ToolFunc], path: Path = MANIFEST_PATH) -> None:
+    """Write the manifest for ``functions`` to ``path``."""
+    manifest = build_manifest(functions)
+    with open(path, "w") as f:
+        json.dump({"tools": list(manifest.values())}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main() -> None:
+    """Regenerate the manifest from the server's tools."""
+    from tmux_orchestrator.mcp.server import tools
+
+    write_manifest(tools.functions)
+    print(f"Wrote {len(tools)} tool schemas to {MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,82 +12,142 @@ Key Features:
 - Cleaner integration with FastMCP
 """
 
-# Agent Management Tools
-from .agent_tools import (
-    agent_attach,
-    agent_kill,
-    agent_list,
-    agent_restart,
-    agent_send_message,
-    agent_status,
-)
-
-# Communication Tools
-from .communication_tools import (
-    broadcast_message,
-    send_message,
-    send_urgent_message,
-    team_broadcast,
-    team_notification,
-)
-
-# Context Tools
-from .context_tools import (
-    context_diff,
-    context_validate,
-    list_contexts,
-    search_context,
-    show_context,
-)
-
-# Core backward compatibility
-from .core_tools import (
-    get_status,
-)
-
-# Monitoring Tools
-from .monitoring_tools import (
-    get_monitor_logs,
-    health_check,
-    monitor_dashboard,
-    system_status,
-)
-
-# Session Management Tools
-from .session_tools import (
-    session_attach,
-    session_create,
-    session_info,
-    session_kill,
-    session_list,
-)
-
-# Shared utilities
-from .shared_logic import (
-    CommandExecutor,
-    execute_command,
-    format_error_response,
-    format_success_response,
-    parse_target,
-    validate_session_format,
-)
-
-# Spawning Tools
-from .spawn_tools import (
-    quick_deploy,
-    spawn_agent,
-    spawn_orchestrator,
-    spawn_pm,
-)
-
-# Team Management Tools
-from .team_tools import (
-    team_deploy,
-    team_kill,
-    team_list,
-    team_scale,
-    team_status,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Tool modules are imported on first attribute access so that importing this
+# package (e.g. from the MCP server) doesn't load every tool implementation.
+_EXPORTS = {
+    # Agent Management Tools
+    "agent_attach": "agent_tools",
+    "agent_kill": "agent_tools",
+    "agent_list": "agent_tools",
+    "agent_restart": "agent_tools",
+    "agent_send_message": "agent_tools",
+    "agent_status": "agent_tools",
+    # Communication Tools
+    "broadcast_message": "communication_tools",
+    "send_message": "communication_tools",
+    "send_urgent_message": "communication_tools",
+    "team_broadcast": "communication_tools",
+    "team_notification": "communication_tools",
+    # Context Tools
+    "context_diff": "context_tools",
+    "context_validate": "context_tools",
+    "list_contexts": "context_tools",
+    "search_context": "context_tools",
+    "show_context": "context_tools",
+    # Core backward compatibility
+    "get_status": "core_tools",
+    # Monitoring Tools
+    "get_monitor_logs": "monitoring_tools",
+    "health_check": "monitoring_tools",
+    "monitor_dashboard": "monitoring_tools",
+    "system_status": "monitoring_tools",
+    # Session Management Tools
+    "session_attach": "session_tools",
+    "session_create": "session_tools",
+    "session_info": "session_tools",
+    "session_kill": "session_tools",
+    "session_list": "session_tools",
+    # Shared utilities
+    "CommandExecutor": "shared_logic",
+    "execute_command": "shared_logic",
+    "format_error_response": "shared_logic",
+    "format_success_response": "shared_logic",
+    "parse_target": "shared_logic",
+    "validate_session_format": "shared_logic",
+    # Spawning Tools
+    "quick_deploy": "spawn_tools",
+    "spawn_agent": "spawn_tools",
+    "spawn_orchestrator": "spawn_tools",
+    "spawn_pm": "spawn_tools",
+    # Team Management Tools
+    "team_deploy": "team_tools",
+    "team_kill": "team_tools",
+    "team_list": "team_tools",
+    "team_scale": "team_tools",
+    "team_status": "team_tools",
+}
+
+# Static imports for type checkers; at runtime names resolve through __getattr__
+if TYPE_CHECKING:
+    # Agent Management Tools
+    from .agent_tools import (
+        agent_attach,
+        agent_kill,
+        agent_list,
+        agent_restart,
+        agent_send_message,
+        agent_status,
+    )
+
+    # Communication Tools
+    from .communication_tools import (
+        broadcast_message,
+        send_message,
+        send_urgent_message,
+        team_broadcast,
+        team_notification,
+    )
+
+    # Context Tools
+    from .context_tools import (
+        context_diff,
+        context_validate,
+        list_contexts,
+        search_context,
+        show_context,
+    )
+
+    # Core backward compatibility
+    from .core_tools import (
+        get_status,
+    )
+
+    # Monitoring Tools
+    from .monitoring_tools import (
+        get_monitor_logs,
+        health_check,
+        monitor_dashboard,
+        system_status,
+    )
+
+    # Session Management Tools
+    from .session_tools import (
+        session_attach,
+        session_create,
+        session_info,
+        session_kill,
+        session_list,
+    )
+
+    # Shared utilities
+    from .shared_logic import (
+        CommandExecutor,
+        execute_command,
+        format_error_response,
+        format_success_response,
+        parse_target,
+        validate_session_format,
+    )
+
+    # Spawning Tools
+    from .spawn_tools import (
+        quick_deploy,
+        spawn_agent,
+        spawn_orchestrator,
+        spawn_pm,
+    )
+
+    # Team Management Tools
+    from .team_tools import (
+        team_deploy,
+        team_kill,
+        team_list,
+        team_scale,
+        team_status,
+    )
 
 __all__ = [
     # Agent Management (6 tools)
@@ -140,3 +200,13 @@ __all__ = [
     "format_error_response",
     "format_success_response",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module providing ``name`` on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -64,7 +64,7 @@ async def agent_send_message(
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
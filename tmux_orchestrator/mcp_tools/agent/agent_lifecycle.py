@@ -46,7 +46,7 @@ async def agent_restart(target: str, preserve_context: bool = True, force: bool
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
@@ -124,7 +124,7 @@ async def agent_kill(target: str, graceful: bool = True, timeout: int = 30) -> D
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
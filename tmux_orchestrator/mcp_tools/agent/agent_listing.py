@@ -4,11 +4,13 @@ import logging
 import re
 from typing import Any, Dict, Optional
 
+from tmux_orchestrator.core.agent_operations import list_agents
+
 from ..shared_logic import (
-    CommandExecutor,
-    ExecutionError,
     format_error_response,
     format_success_response,
+    get_tmux,
+    run_in_process,
 )
 
 logger = logging.getLogger(__name__)
@@ -51,57 +53,24 @@ async def agent_list(
                     f"agent list --filter-session {filter_session}",
                 )
 
-        # Build command
-        cmd = ["tmux-orc", "agent", "list"]
-
-        # Add format if not default
-        if format != "table":
-            cmd.extend(["--format", format])
-
-        # Add session filter
-        if filter_session:
-            cmd.extend(["--filter-session", filter_session])
-
-        # Add include-idle flag (default is true, so only add if false)
-        if not include_idle:
-            cmd.append("--exclude-idle")
+        command = "agent list" + (f" --session {filter_session}" if filter_session else "")
+        agents = await run_in_process(list_agents, get_tmux(), filter_session, include_idle)
 
-        # Execute command
-        executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=(format == "json"))
+        status_counts: Dict[str, int] = {}
+        for agent in agents:
+            status_counts[agent["status"]] = status_counts.get(agent["status"], 0) + 1
 
-        if result["success"]:
-            # Enhance response with metadata
-            data = result["data"]
+        response_data = {
+            "agents": agents,
+            "format": format,
+            "filter_applied": filter_session,
+            "include_idle": include_idle,
+            "total_count": len(agents),
+            "summary": status_counts,
+        }
 
-            # Add call metadata
-            response_data = {
-                "agents": data.get("agents", []) if isinstance(data, dict) else [],
-                "format": format,
-                "filter_applied": filter_session,
-                "include_idle": include_idle,
-                "total_count": (len(data.get("agents", [])) if isinstance(data, dict) else 0),
-            }
-
-            # Add summary statistics if available
-            if isinstance(data, dict) and "summary" in data:
-                response_data["summary"] = data["summary"]
-
-            return format_success_response(
-                response_data, result["command"], f"Retrieved {response_data['total_count']} agents"
-            )
-        else:
-            return format_error_response(
-                result.get("stderr", "Failed to list agents"),
-                result["command"],
-                [
-                    "Check if tmux-orc service is running",
-                    "Verify session access permissions",
-                ],
-            )
+        return format_success_response(response_data, command, f"Retrieved {len(agents)} agents")
 
-    except ExecutionError as e:
-        return format_error_response(str(e), "agent list")
     except Exception as e:
         logger.error(f"Unexpected error in agent_list: {e}")
         return format_error_response(f"Unexpected error: {e}", "agent list")
@@ -41,7 +41,7 @@ async def agent_attach(target: str, read_only: bool = False) -> Dict[str, Any]:
 
         # Execute command (attach is typically non-blocking in MCP context)
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
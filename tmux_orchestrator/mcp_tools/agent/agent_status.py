@@ -3,12 +3,14 @@
 import logging
 from typing import Any, Dict
 
+from tmux_orchestrator.core.agent_operations import get_agent_status
+
 from ..shared_logic import (
-    CommandExecutor,
-    ExecutionError,
     ValidationError,
     format_error_response,
     format_success_response,
+    get_tmux,
+    run_in_process,
     validate_session_format,
 )
 
@@ -32,44 +34,31 @@ async def agent_status(target: str, include_metrics: bool = False) -> Dict[str,
         # Validate target format using shared logic
         validate_session_format(target)
 
-        # Build command
-        cmd = ["tmux-orc", "agent", "status", target]
-
-        # Add metrics flag if requested
-        if include_metrics:
-            cmd.append("--metrics")
-
-        # Execute command
-        executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
-
-        if result["success"]:
-            data = result["data"]
-
-            # Enhance response with call metadata
-            response_data = {
-                "target": target,
-                "include_metrics": include_metrics,
-                "status": data if isinstance(data, dict) else {"raw_status": data},
-                "timestamp": None,  # Could add timestamp if CLI provides it
-            }
-
-            return format_success_response(response_data, result["command"], f"Status retrieved for {target}")
-        else:
+        agent = await run_in_process(get_agent_status, get_tmux(), target)
+        if agent is None:
             return format_error_response(
-                result.get("stderr", f"Failed to get status for {target}"),
-                result["command"],
+                f"Agent '{target}' not found",
+                f"agent status {target}",
                 [
                     f"Check that target '{target}' exists",
-                    "Verify agent is responsive",
                     "Use 'tmux-orc agent list' to see available targets",
                 ],
             )
 
+        metrics = {key: agent.pop(key) for key in ("health_score", "pane_lines")}
+        response_data = {
+            "target": target,
+            "include_metrics": include_metrics,
+            "status": agent,
+            "timestamp": agent["timestamp"],
+        }
+        if include_metrics:
+            response_data["metrics"] = metrics
+
+        return format_success_response(response_data, f"agent status {target}", f"Status retrieved for {target}")
+
     except ValidationError as e:
         return format_error_response(str(e), f"agent status {target}")
-    except ExecutionError as e:
-        return format_error_response(str(e), f"agent status {target}")
     except Exception as e:
         logger.error(f"Unexpected error in agent_status: {e}")
         return format_error_response(f"Unexpected error: {e}", f"agent status {target}")
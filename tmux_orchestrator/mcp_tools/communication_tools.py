@@ -102,7 +102,7 @@ async def team_broadcast(
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
@@ -195,7 +195,7 @@ async def broadcast_message(
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
@@ -277,7 +277,7 @@ async def send_urgent_message(target: str, message: str, timeout: int = 30) -> D
         # Execute command
         # Add buffer to executor timeout
         executor = CommandExecutor(timeout=timeout + 5)
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
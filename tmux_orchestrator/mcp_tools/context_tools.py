@@ -8,6 +8,8 @@ signatures from API Designer's specifications.
 import logging
 from typing import Any, Dict, Optional
 
+from tmux_orchestrator.core import context_loader
+
 from .shared_logic import (
     CommandExecutor,
     ContextValidator,
@@ -15,6 +17,7 @@ from .shared_logic import (
     ValidationError,
     format_error_response,
     format_success_response,
+    run_in_process,
 )
 
 logger = logging.getLogger(__name__)
@@ -36,40 +39,27 @@ async def show_context(context_name: str) -> Dict[str, Any]:
         # Validate context name using shared validator
         ContextValidator.validate_context_name(context_name)
 
-        # Build command
-        cmd = ["tmux-orc", "context", "show", context_name]
-
-        # Execute command (context show returns markdown, not JSON)
-        executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=False)
-
-        if result["success"]:
-            # Structure response with metadata
-            response_data = {
-                "context_name": context_name,
-                "context_content": result["stdout"],
-                "content_length": len(result["stdout"]) if result["stdout"] else 0,
-                "format": "markdown",
-            }
-
-            return format_success_response(
-                response_data, result["command"], f"Context {context_name} retrieved successfully"
-            )
-        else:
+        content = await run_in_process(context_loader.read_context, context_name)
+        if content is None:
             return format_error_response(
-                result.get("stderr", f"Failed to show context {context_name}"),
-                result["command"],
-                [
-                    f"Check that context '{context_name}' exists",
-                    "Verify context files are accessible",
-                    "Ensure tmux-orc service has proper permissions",
-                ],
+                f"Context '{context_name}' not found",
+                f"context show {context_name}",
+                [f"Check that context '{context_name}' exists", "Use list_contexts to see available contexts"],
             )
 
+        response_data = {
+            "context_name": context_name,
+            "context_content": content,
+            "content_length": len(content),
+            "format": "markdown",
+        }
+
+        return format_success_response(
+            response_data, f"context show {context_name}", f"Context {context_name} retrieved successfully"
+        )
+
     except ValidationError as e:
         return format_error_response(str(e), f"show context {context_name}")
-    except ExecutionError as e:
-        return format_error_response(str(e), f"show context {context_name}")
     except Exception as e:
         logger.error(f"Unexpected error in show_context: {e}")
         return format_error_response(f"Unexpected error: {e}", f"show context {context_name}")
@@ -85,40 +75,17 @@ async def list_contexts() -> Dict[str, Any]:
         Structured response with context list
     """
     try:
-        # Build command
-        cmd = ["tmux-orc", "context", "list"]
+        contexts = await run_in_process(context_loader.list_contexts)
 
-        # Execute command
-        executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        response_data = {
+            "contexts": contexts,
+            "context_count": len(contexts),
+            "available_contexts": [context["role"] for context in contexts],
+            "format": "json",
+        }
 
-        if result["success"]:
-            data = result["data"]
-
-            # Structure response with metadata
-            response_data = {
-                "contexts": data.get("contexts", []) if isinstance(data, dict) else [],
-                "context_count": len(data.get("contexts", [])) if isinstance(data, dict) else 0,
-                "available_contexts": ["orc", "pm", "mcp", "tmux-comms"],  # Known contexts
-                "format": "json",
-            }
+        return format_success_response(response_data, "context list", f"Retrieved {len(contexts)} contexts")
 
-            return format_success_response(
-                response_data, result["command"], f"Retrieved {response_data['context_count']} contexts"
-            )
-        else:
-            return format_error_response(
-                result.get("stderr", "Failed to list contexts"),
-                result["command"],
-                [
-                    "Check if context files are accessible",
-                    "Verify tmux-orc service is running",
-                    "Ensure proper file permissions",
-                ],
-            )
-
-    except ExecutionError as e:
-        return format_error_response(str(e), "list contexts")
     except Exception as e:
         logger.error(f"Unexpected error in list_contexts: {e}")
         return format_error_response(f"Unexpected error: {e}", "list contexts")
@@ -164,7 +131,7 @@ async def search_context(
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
@@ -243,7 +210,7 @@ async def context_diff(context1: str, context2: str, format: str = "unified") ->
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=False)  # Diff output is typically text
+        result = await executor.execute(cmd, expect_json=False)  # Diff output is typically text
 
         if result["success"]:
             # Structure response with metadata
@@ -310,7 +277,7 @@ async def context_validate(context_name: str, check_links: bool = True, check_sy
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
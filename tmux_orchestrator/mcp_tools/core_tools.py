@@ -57,7 +57,7 @@ async def spawn_agent(session: str, role: str, briefing: str, window: Optional[i
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             return format_success_response(result["data"], result["command"], f"Agent {role} spawned successfully")
@@ -108,7 +108,7 @@ async def spawn_pm(session: str, briefing: Optional[str] = None, window: Optiona
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             return format_success_response(result["data"], result["command"], "Project Manager spawned successfully")
@@ -144,7 +144,7 @@ async def kill_agent(target: str, force: bool = False) -> Dict[str, Any]:
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             kill_type = "window" if ":" in target else "session"
@@ -188,7 +188,7 @@ async def send_message(target: str, message: str, urgent: bool = False) -> Dict[
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             return format_success_response(result["data"], result["command"], f"Message sent to {target}")
@@ -221,7 +221,7 @@ async def list_agents() -> Dict[str, Any]:
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             return format_success_response(result["data"], result["command"], "Agent list retrieved successfully")
@@ -255,7 +255,7 @@ async def get_status(target: Optional[str] = None) -> Dict[str, Any]:
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             status_type = f"for {target}" if target else "system"
@@ -287,7 +287,7 @@ async def monitor_dashboard() -> Dict[str, Any]:
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             return format_success_response(result["data"], result["command"], "Dashboard data retrieved successfully")
@@ -326,7 +326,7 @@ async def show_context(context_name: str) -> Dict[str, Any]:
 
         # Execute command (context show returns markdown, not JSON)
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=False)
+        result = await executor.execute(cmd, expect_json=False)
 
         if result["success"]:
             return format_success_response(
@@ -7,14 +7,19 @@ signatures from API Designer's specifications.
 
 import logging
 import re
+from datetime import UTC, datetime
 from typing import Any, Dict, Optional
 
+from tmux_orchestrator.core.system_status import get_system_status
+
 from .shared_logic import (
     CommandExecutor,
     ExecutionError,
     ValidationError,
     format_error_response,
     format_success_response,
+    get_tmux,
+    run_in_process,
     validate_session_format,
 )
 
@@ -44,51 +49,18 @@ async def system_status(format: str = "dashboard", include_performance: bool = F
                 ["Use 'dashboard', 'json', or 'summary' format"],
             )
 
-        # Build command
-        cmd = ["tmux-orc", "status"]
-
-        # Add format if not default
-        if format != "dashboard":
-            cmd.extend(["--format", format])
-
-        # Add performance metrics flag
-        if include_performance:
-            cmd.append("--performance")
-
-        # Execute command
-        executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=(format == "json"))
+        status = await run_in_process(get_system_status, get_tmux())
 
-        if result["success"]:
-            data = result["data"]
+        response_data = {
+            "format": format,
+            "include_performance": include_performance,
+            "system_status": status,
+            "status_timestamp": datetime.now(UTC).isoformat(),
+            "system_health": "healthy" if status["summary"]["total_agents"] else "idle",
+        }
 
-            # Structure response with metadata
-            response_data = {
-                "format": format,
-                "include_performance": include_performance,
-                "system_status": (data if isinstance(data, dict) else {"raw_status": data}),
-                "status_timestamp": None,  # Could add if CLI provides it
-                "system_health": (data.get("health", "unknown") if isinstance(data, dict) else "unknown"),
-            }
+        return format_success_response(response_data, "status", "System status retrieved successfully")
 
-            return format_success_response(
-                response_data,
-                result["command"],
-                "System status retrieved successfully",
-            )
-        else:
-            return format_error_response(
-                result.get("stderr", "Failed to get system status"),
-                result["command"],
-                [
-                    "Check if tmux-orc daemon is running",
-                    "Verify system permissions",
-                    "Ensure monitoring services are active",
-                ],
-            )
-
-    except ExecutionError as e:
-        return format_error_response(str(e), "system status")
     except Exception as e:
         logger.error(f"Unexpected error in system_status: {e}")
         return format_error_response(f"Unexpected error: {e}", "system status")
@@ -140,7 +112,7 @@ async def monitor_dashboard(refresh_interval: int = 15, focus_team: Optional[str
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
@@ -223,7 +195,7 @@ async def health_check(
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
@@ -328,7 +300,7 @@ async def get_monitor_logs(lines: int = 50, follow: bool = False, filter_level:
 
         # Execute command
         executor = CommandExecutor(timeout=10)  # Shorter timeout for logs
-        result = executor.execute(cmd, expect_json=False)  # Logs are typically text
+        result = await executor.execute(cmd, expect_json=False)  # Logs are typically text
 
         if result["success"]:
             # Structure response with metadata
@@ -56,7 +56,7 @@ async def session_list(format: str = "table", include_empty: bool = True) -> Dic
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=(format == "json"))
+        result = await executor.execute(cmd, expect_json=(format == "json"))
 
         if result["success"]:
             data = result["data"]
@@ -133,7 +133,7 @@ async def session_attach(session_name: str, window: Optional[int] = None, read_o
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
@@ -203,7 +203,7 @@ async def session_kill(session_name: str, force: bool = False) -> Dict[str, Any]
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
@@ -287,7 +287,7 @@ async def session_create(
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
@@ -356,7 +356,7 @@ async def session_info(session_name: str, include_windows: bool = True) -> Dict[
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
@@ -5,14 +5,19 @@ This module contains common functionality used across multiple MCP tools,
 extracted and refactored from the existing CLI implementations.
 """
 
+import asyncio
 import json
 import logging
 import re
-import subprocess
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from tmux_orchestrator.utils.tmux import TMUXManager
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class ValidationError(Exception):
     """Custom exception for parameter validation errors."""
@@ -64,7 +69,7 @@ def validate_session_format(target: str) -> bool:
     return True
 
 
-def parse_target(target: str) -> Tuple[str, int]:
+def parse_target(target: str) -> tuple[str, int]:
     """
     Parse target string into session and window.
 
@@ -82,7 +87,7 @@ def parse_target(target: str) -> Tuple[str, int]:
     return session, int(window_str)
 
 
-def build_command(base_command: List[str], options: Optional[Dict[str, Any]] = None) -> List[str]:
+def build_command(base_command: list[str], options: dict[str, Any] | None = None) -> list[str]:
     """
     Build command list with options.
 
@@ -105,21 +110,76 @@ def build_command(base_command: List[str], options: Optional[Dict[str, Any]] = N
     return cmd
 
 
+# Seconds allowed per CLI command, matched on the longest subcommand prefix
+TOOL_TIMEOUTS: dict[str, int] = {
+    "agent kill": 60,
+    "agent restart": 120,
+    "context": 15,
+    "monitor": 30,
+    "quick-deploy": 300,
+    "session": 30,
+    "spawn": 120,
+    "status": 15,
+    "team deploy": 300,
+}
+DEFAULT_TIMEOUT = 60
+
+# CLI subprocesses allowed to run at once; further calls wait for a slot
+MAX_CONCURRENT_COMMANDS = 4
+
+_command_slots: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
+
+
+def _get_command_slots() -> asyncio.Semaphore:
+    """Get the concurrency pool for the running event loop."""
+    global _command_slots
+    loop = asyncio.get_running_loop()
+    if _command_slots is None or _command_slots[0] is not loop:
+        _command_slots = (loop, asyncio.Semaphore(MAX_CONCURRENT_COMMANDS))
+    return _command_slots[1]
+
+
+def command_timeout(command: list[str]) -> int:
+    """
+    Get the timeout for a CLI command.
+
+    Args:
+        command: Command to run (e.g. ["tmux-orc", "team", "deploy", ...])
+
+    Returns:
+        Timeout in seconds from TOOL_TIMEOUTS, or DEFAULT_TIMEOUT
+    """
+    for length in range(len(command) - 1, 0, -1):
+        key = " ".join(command[1 : length + 1])
+        if key in TOOL_TIMEOUTS:
+            return TOOL_TIMEOUTS[key]
+    return DEFAULT_TIMEOUT
+
+
 class CommandExecutor:
     """
     Centralized command execution with consistent error handling and output parsing.
+
+    Commands run as asyncio subprocesses so a slow CLI call never blocks the
+    MCP event loop. At most MAX_CONCURRENT_COMMANDS run at once, and
+    cancelling the calling tool (e.g. the MCP request was cancelled) kills the
+    subprocess.
     """
 
-    def __init__(self, timeout: int = 60):
+    def __init__(self, timeout: float | None = None, on_output: Callable[[str], None] | None = None):
         """
         Initialize command executor.
 
         Args:
-            timeout: Command timeout in seconds
+            timeout: Command timeout in seconds (default: per-command TOOL_TIMEOUTS)
+            on_output: Optional callback receiving each stdout line as it arrives
         """
         self.timeout = timeout
+        self.on_output = on_output
 
-    def execute(self, command: List[str], expect_json: bool = True, input_data: Optional[str] = None) -> Dict[str, Any]:
+    async def execute(
+        self, command: list[str], expect_json: bool = True, input_data: str | None = None
+    ) -> dict[str, Any]:
         """
         Execute command and return structured result.
 
@@ -134,41 +194,87 @@ class CommandExecutor:
         Raises:
             ExecutionError: If command fails
         """
-        try:
+        timeout = self.timeout if self.timeout is not None else command_timeout(command)
+
+        # Add --json flag for commands that support it
+        if expect_json and "--json" not in command and self._supports_json(command):
+            command = command + ["--json"]
+
+        async with _get_command_slots():
             logger.debug(f"Executing command: {' '.join(command)}")
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    stdin=asyncio.subprocess.PIPE if input_data is not None else asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except Exception as e:
+                raise ExecutionError(f"Command execution failed: {str(e)}")
+
+            try:
+                stdout, stderr = await asyncio.wait_for(self._communicate(process, input_data), timeout)
+            except TimeoutError:
+                self._kill(process)
+                raise ExecutionError(f"Command timed out after {timeout} seconds")
+            except asyncio.CancelledError:
+                self._kill(process)
+                raise
+            except Exception as e:
+                self._kill(process)
+                raise ExecutionError(f"Command execution failed: {str(e)}")
+
+        # Parse output
+        parsed_output = {}
+        if stdout:
+            if expect_json:
+                try:
+                    parsed_output = json.loads(stdout)
+                except json.JSONDecodeError:
+                    parsed_output = {"raw_output": stdout}
+            else:
+                parsed_output = {"output": stdout}
+
+        return {
+            "success": process.returncode == 0,
+            "returncode": process.returncode,
+            "stdout": stdout,
+            "stderr": stderr,
+            "data": parsed_output,
+            "command": " ".join(command),
+        }
+
+    async def _communicate(self, process: asyncio.subprocess.Process, input_data: str | None) -> tuple[str, str]:
+        """Feed stdin, then stream stdout line by line while collecting stderr."""
+        assert process.stdout is not None and process.stderr is not None
+        if input_data is not None and process.stdin is not None:
+            process.stdin.write(input_data.encode())
+            await process.stdin.drain()
+            process.stdin.close()
 
-            # Add --json flag for commands that support it
-            if expect_json and "--json" not in command and self._supports_json(command):
-                command = command + ["--json"]
-
-            result = subprocess.run(command, capture_output=True, text=True, timeout=self.timeout, input=input_data)
-
-            # Parse output
-            parsed_output = {}
-            if result.stdout:
-                if expect_json:
-                    try:
-                        parsed_output = json.loads(result.stdout)
-                    except json.JSONDecodeError:
-                        parsed_output = {"raw_output": result.stdout}
-                else:
-                    parsed_output = {"output": result.stdout}
-
-            return {
-                "success": result.returncode == 0,
-                "returncode": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "data": parsed_output,
-                "command": " ".join(command),
-            }
-
-        except subprocess.TimeoutExpired:
-            raise ExecutionError(f"Command timed out after {self.timeout} seconds")
-        except Exception as e:
-            raise ExecutionError(f"Command execution failed: {str(e)}")
-
-    def _supports_json(self, command: List[str]) -> bool:
+        stderr_task = asyncio.ensure_future(process.stderr.read())
+        try:
+            lines = []
+            async for raw_line in process.stdout:
+                line = raw_line.decode(errors="replace")
+                lines.append(line)
+                if self.on_output is not None:
+                    self.on_output(line.rstrip("\n"))
+            stderr = await stderr_task
+        finally:
+            stderr_task.cancel()
+        await process.wait()
+        return "".join(lines), stderr.decode(errors="replace")
+
+    @staticmethod
+    def _kill(process: asyncio.subprocess.Process) -> None:
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+
+    def _supports_json(self, command: list[str]) -> bool:
         """
         Check if command supports JSON output.
 
@@ -188,26 +294,63 @@ class CommandExecutor:
         return any(part in json_commands for part in command)
 
 
-def execute_command(
-    command: List[str], expect_json: bool = True, timeout: int = 60, input_data: Optional[str] = None
-) -> Dict[str, Any]:
+async def execute_command(
+    command: list[str], expect_json: bool = True, timeout: float | None = None, input_data: str | None = None
+) -> dict[str, Any]:
     """
     Convenience function for command execution.
 
     Args:
         command: Command to execute
         expect_json: Whether to parse output as JSON
-        timeout: Command timeout in seconds
+        timeout: Command timeout in seconds (default: per-command TOOL_TIMEOUTS)
         input_data: Optional stdin input
 
     Returns:
         Structured result dictionary
     """
     executor = CommandExecutor(timeout)
-    return executor.execute(command, expect_json, input_data)
+    return await executor.execute(command, expect_json, input_data)
+
+
+_tmux: Optional["TMUXManager"] = None
+
+
+def get_tmux() -> "TMUXManager":
+    """
+    Get the TMUXManager shared by in-process tool calls.
+
+    Returns:
+        TMUXManager instance, created on first use
+    """
+    global _tmux
+    if _tmux is None:
+        from tmux_orchestrator.utils.tmux import TMUXManager
+
+        _tmux = TMUXManager()
+    return _tmux
+
+
+async def run_in_process(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run core business logic in-process without blocking the event loop.
+
+    Tools use this instead of spawning ``tmux-orc`` for operations the core
+    modules expose directly, which avoids interpreter startup and CLI output
+    parsing on every call.
+
+    Args:
+        func: Core function to call
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The function's result
+    """
+    return await asyncio.to_thread(func, *args, **kwargs)
 
 
-def format_error_response(error: str, command: str, suggestions: Optional[List[str]] = None) -> Dict[str, Any]:
+def format_error_response(error: str, command: str, suggestions: list[str] | None = None) -> dict[str, Any]:
     """
     Format consistent error response.
 
@@ -231,7 +374,7 @@ def format_error_response(error: str, command: str, suggestions: Optional[List[s
     return response
 
 
-def format_success_response(data: Any, command: str, message: Optional[str] = None) -> Dict[str, Any]:
+def format_success_response(data: Any, command: str, message: str | None = None) -> dict[str, Any]:
     """
     Format consistent success response.
 
@@ -9,6 +9,8 @@ import logging
 import re
 from typing import Any, Dict, List, Optional
 
+from tmux_orchestrator.core.team_operations import get_team_status, list_all_teams
+
 # team_broadcast is implemented in communication_tools.py to avoid circular imports
 from .communication_tools import team_broadcast as comm_team_broadcast
 from .shared_logic import (
@@ -16,6 +18,8 @@ from .shared_logic import (
     ExecutionError,
     format_error_response,
     format_success_response,
+    get_tmux,
+    run_in_process,
 )
 
 logger = logging.getLogger(__name__)
@@ -55,57 +59,35 @@ async def team_status(
                 ["Use 'table', 'json', or 'summary' format"],
             )
 
-        # Build command
-        cmd = ["tmux-orc", "team", "status"]
-
-        # Add team name if provided
+        tmux = get_tmux()
         if team_name:
-            cmd.append(team_name)
-
-        # Add format if not default
-        if format != "table":
-            cmd.extend(["--format", format])
-
-        # Add exclude-agents flag if include_agents is false
-        if not include_agents:
-            cmd.append("--no-agents")
-
-        # Execute command
-        executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=(format == "json"))
-
-        if result["success"]:
-            data = result["data"]
-
-            # Structure response with metadata
-            response_data = {
-                "team_name": team_name,
-                "include_agents": include_agents,
-                "format": format,
-                "team_status": data if isinstance(data, dict) else {"raw_status": data},
-                "teams": data.get("teams", []) if isinstance(data, dict) else [],
-                "team_count": len(data.get("teams", [])) if isinstance(data, dict) else 0,
-            }
+            status = await run_in_process(get_team_status, tmux, team_name)
+            if status is None:
+                return format_error_response(
+                    f"Team '{team_name}' not found",
+                    f"team status {team_name}",
+                    [f"Check that team '{team_name}' exists", "Use 'tmux-orc team list' to see active teams"],
+                )
+            if not include_agents:
+                status.pop("windows", None)
+            teams = [status]
+            message = f"Status retrieved for team {team_name}"
+        else:
+            teams = await run_in_process(list_all_teams, tmux)
+            status = {"teams": teams}
+            message = f"Status retrieved for {len(teams)} teams"
 
-            if team_name:
-                message = f"Status retrieved for team {team_name}"
-            else:
-                message = f"Status retrieved for {response_data['team_count']} teams"
+        response_data = {
+            "team_name": team_name,
+            "include_agents": include_agents,
+            "format": format,
+            "team_status": status,
+            "teams": teams,
+            "team_count": len(teams),
+        }
 
-            return format_success_response(response_data, result["command"], message)
-        else:
-            return format_error_response(
-                result.get("stderr", "Failed to get team status"),
-                result["command"],
-                [
-                    f"Check that team '{team_name}' exists" if team_name else "Check that teams exist",
-                    "Verify team agents are running",
-                    "Ensure tmux-orc service is active",
-                ],
-            )
+        return format_success_response(response_data, f"team status {team_name or 'all'}", message)
 
-    except ExecutionError as e:
-        return format_error_response(str(e), f"team status {team_name or 'all'}")
     except Exception as e:
         logger.error(f"Unexpected error in team_status: {e}")
         return format_error_response(f"Unexpected error: {e}", f"team status {team_name or 'all'}")
@@ -162,7 +144,7 @@ async def team_deploy(
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
@@ -224,50 +206,20 @@ async def team_list(format: str = "table", include_empty: bool = False) -> Dict[
                 ["Use 'table', 'json', or 'summary' format"],
             )
 
-        # Build command
-        cmd = ["tmux-orc", "team", "list"]
-
-        # Add format if not default
-        if format != "table":
-            cmd.extend(["--format", format])
-
-        # Add include-empty flag if requested
-        if include_empty:
-            cmd.append("--include-empty")
-
-        # Execute command
-        executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=(format == "json"))
-
-        if result["success"]:
-            data = result["data"]
+        all_teams = await run_in_process(list_all_teams, get_tmux())
+        teams = [team for team in all_teams if include_empty or team["agents"] > 0]
 
-            # Structure response with metadata
-            response_data = {
-                "format": format,
-                "include_empty": include_empty,
-                "teams": data.get("teams", []) if isinstance(data, dict) else [],
-                "team_count": len(data.get("teams", [])) if isinstance(data, dict) else 0,
-                "active_teams": data.get("active_count", 0) if isinstance(data, dict) else 0,
-                "empty_teams": data.get("empty_count", 0) if isinstance(data, dict) else 0,
-            }
+        response_data = {
+            "format": format,
+            "include_empty": include_empty,
+            "teams": teams,
+            "team_count": len(teams),
+            "active_teams": sum(1 for team in all_teams if team["agents"] > 0),
+            "empty_teams": sum(1 for team in all_teams if team["agents"] == 0),
+        }
 
-            return format_success_response(
-                response_data, result["command"], f"Retrieved {response_data['team_count']} teams"
-            )
-        else:
-            return format_error_response(
-                result.get("stderr", "Failed to list teams"),
-                result["command"],
-                [
-                    "Check if any teams are deployed",
-                    "Verify tmux-orc service is active",
-                    "Ensure team sessions are accessible",
-                ],
-            )
+        return format_success_response(response_data, "team list", f"Retrieved {len(teams)} teams")
 
-    except ExecutionError as e:
-        return format_error_response(str(e), "team list")
     except Exception as e:
         logger.error(f"Unexpected error in team_list: {e}")
         return format_error_response(f"Unexpected error: {e}", "team list")
@@ -329,7 +281,7 @@ async def team_kill(team_name: str, graceful: bool = True, timeout: int = 30) ->
 
         # Execute command
         executor = CommandExecutor(timeout=timeout + 10)  # Add buffer to executor timeout
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
@@ -420,7 +372,7 @@ async def team_scale(
 
         # Execute command
         executor = CommandExecutor()
-        result = executor.execute(cmd, expect_json=True)
+        result = await executor.execute(cmd, expect_json=True)
 
         if result["success"]:
             data = result["data"]
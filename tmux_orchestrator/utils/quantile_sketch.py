@@ -0,0 +1,222 @@
+"""Streaming quantile sketches for latency metrics.
+
+Values are counted in logarithmic buckets, so each bucket covers a range of
+values within a fixed relative error (1% by default). Recording is O(1),
+memory is bounded by the number of distinct buckets (a few hundred for
+latencies spanning microseconds to minutes), and two sketches with the same
+accuracy merge exactly by adding bucket counts. Sketches serialize to plain
+dicts so they can be merged across processes and shards.
+"""
+
+import bisect
+import math
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Any, Optional
+
+DEFAULT_PERCENTILES = (0.5, 0.95, 0.99)
+
+
+def _percentile_key(q: float) -> str:
+    """Format a quantile as a percentile key: 0.5 -> "p50", 0.999 -> "p999"."""
+    return "p" + f"{q * 100:g}".replace(".", "")
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with bounded relative error."""
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantile estimates (0 < a < 1)
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self._buckets: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._cumulative: Optional[tuple[list[int], list[int]]] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def mean(self) -> float:
+        """Mean of recorded values (0 when empty)."""
+        return self.sum / self.count if self.count else 0.0
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Record a value.
+
+        Args:
+            value: Value to record (values <= 0 are counted as zero)
+            count: Number of occurrences
+        """
+        if value > 0:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        else:
+            self.zero_count += count
+        self.count += count
+        self.sum += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self._cumulative = None
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Add another sketch's counts into this one.
+
+        Args:
+            other: Sketch with the same relative accuracy
+
+        Returns:
+            This sketch
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if not other.count:
+            return self
+        for index, bucket_count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + bucket_count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._cumulative = None
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Estimate the value at quantile q (0 <= q <= 1).
+
+        Returns:
+            Estimated value (exact at the extremes), 0 when empty
+        """
+        if not self.count:
+            return 0.0
+        if self._cumulative is None:
+            keys = sorted(self._buckets)
+            running, totals = self.zero_count, []
+            for key in keys:
+                running += self._buckets[key]
+                totals.append(running)
+            self._cumulative = (keys, totals)
+
+        rank = max(0, math.ceil(min(max(q, 0.0), 1.0) * self.count) - 1)
+        if rank < self.zero_count:
+            return min(self.min, 0.0)
+
+        # The extreme buckets contain min and max, which are known exactly
+        keys, totals = self._cumulative
+        position = bisect.bisect_right(totals, rank)
+        if position == len(keys) - 1:
+            return self.max
+        if position == 0 and self.zero_count == 0:
+            return self.min
+        return 2 * self._gamma ** keys[position] / (self._gamma + 1)
+
+    def percentiles(self, quantiles: Iterable[float] = DEFAULT_PERCENTILES) -> dict[str, float]:
+        """Estimate several quantiles keyed as "p50", "p95", ..."""
+        return {_percentile_key(q): self.quantile(q) for q in quantiles}
+
+    def clear(self) -> None:
+        """Remove all recorded values."""
+        self._buckets.clear()
+        self.zero_count = self.count = 0
+        self.sum = 0.0
+        self.min, self.max = math.inf, -math.inf
+        self._cumulative = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for merging in another process."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "buckets": {str(index): count for index, count in self._buckets.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuantileSketch":
+        """Rebuild a sketch serialized with to_dict."""
+        sketch = cls(data.get("relative_accuracy", 0.01))
+        sketch._buckets = {int(index): count for index, count in data.get("buckets", {}).items()}
+        sketch.zero_count = data.get("zero_count", 0)
+        sketch.count = data.get("count", 0)
+        sketch.sum = data.get("sum", 0.0)
+        if sketch.count:
+            sketch.min, sketch.max = data["min"], data["max"]
+        return sketch
+
+
+class RollingQuantileSketch:
+    """Quantile sketch over a sliding time window, kept as rotating slices."""
+
+    def __init__(
+        self,
+        window_seconds: float = 300.0,
+        slices: int = 10,
+        relative_accuracy: float = 0.01,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the rolling sketch.
+
+        Args:
+            window_seconds: Approximate window covered by the sketch
+            slices: Number of slices the window is divided into
+            relative_accuracy: Relative error of quantile estimates
+            clock: Monotonic clock
+        """
+        self.window_seconds = window_seconds
+        self.slice_seconds = window_seconds / slices
+        self.relative_accuracy = relative_accuracy
+        self._clock = clock
+        self._slices: deque[tuple[float, QuantileSketch]] = deque(maxlen=slices)
+        self._snapshot: Optional[QuantileSketch] = None
+
+    def add(self, value: float) -> None:
+        """Record a value in the current slice."""
+        now = self._clock()
+        if not self._slices or now - self._slices[-1][0] >= self.slice_seconds:
+            self._slices.append((now, QuantileSketch(self.relative_accuracy)))
+        self._slices[-1][1].add(value)
+        self._snapshot = None
+
+    def snapshot(self) -> QuantileSketch:
+        """Merge the slices still inside the window (cached until the next change)."""
+        horizon = self._clock() - self.window_seconds
+        while self._slices and self._slices[0][0] < horizon:
+            self._slices.popleft()
+            self._snapshot = None
+
+        if self._snapshot is None:
+            merged = QuantileSketch(self.relative_accuracy)
+            for _, sketch in self._slices:
+                merged.merge(sketch)
+            self._snapshot = merged
+        return self._snapshot
+
+    def quantile(self, q: float) -> float:
+        """Estimate the value at quantile q over the window."""
+        return self.snapshot().quantile(q)
+
+    def percentiles(self, quantiles: Iterable[float] = DEFAULT_PERCENTILES) -> dict[str, float]:
+        """Estimate several quantiles over the window."""
+        return self.snapshot().percentiles(quantiles)
+
+    def clear(self) -> None:
+        """Remove all recorded values."""
+        self._slices.clear()
+        self._snapshot = None
@@ -54,13 +54,7 @@ class RateLimiter:
             RateLimitExceededError: If block_on_limit is False and limit exceeded
         """
         async with self._lock:
-            if key not in self._buckets:
-                self._buckets[key] = TokenBucket(
-                    capacity=self.config.burst_size,
-                    refill_rate=self.config.max_requests / self.config.window_seconds,
-                )
-
-            bucket = self._buckets[key]
+            bucket = self._bucket(key)
             if bucket.consume(1):
                 return True
 
@@ -72,6 +66,44 @@ class RateLimiter:
                 await asyncio.sleep(0.1)
             return True
 
+    def try_acquire(self, key: str) -> float:
+        """Consume a token without blocking or raising.
+
+        Intended for callers on a single event loop that must not yield
+        between the check and acting on it.
+
+        Args:
+            key: Identifier for rate limit bucket
+
+        Returns:
+            0.0 if the request is allowed, otherwise seconds until a token is available
+        """
+        bucket = self._bucket(key)
+        if bucket.consume(1):
+            return 0.0
+        return bucket.time_until_refill()
+
+    def time_until_available(self, key: str) -> float:
+        """Check a key's bucket without consuming a token.
+
+        Args:
+            key: Identifier for rate limit bucket
+
+        Returns:
+            0.0 if a token is available, otherwise seconds until one is
+        """
+        bucket = self._bucket(key)
+        bucket._refill()
+        return bucket.time_until_refill()
+
+    def _bucket(self, key: str) -> "TokenBucket":
+        if key not in self._buckets:
+            self._buckets[key] = TokenBucket(
+                capacity=self.config.burst_size,
+                refill_rate=self.config.max_requests / self.config.window_seconds,
+            )
+        return self._buckets[key]
+
     async def get_remaining_quota(self, key: str) -> tuple[int, float]:
         """Get remaining requests and time until reset.
 
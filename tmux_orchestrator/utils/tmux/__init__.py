@@ -81,6 +81,14 @@ class TMUXManager:
         """Capture pane output."""
         return self.basic_ops.capture_pane(target, lines)
 
+    def capture_pane_with_cursor(self, target: str) -> tuple[str, tuple[int, int] | None]:
+        """Capture the visible pane and cursor position in one call."""
+        return self.basic_ops.capture_pane_with_cursor(target)
+
+    def get_pane_current_command(self, target: str) -> str | None:
+        """Get the name of the foreground command running in the target pane."""
+        return self.basic_ops.get_pane_current_command(target)
+
     def kill_window(self, target: str) -> bool:
         """Kill a specific tmux window."""
         return self.basic_ops.kill_window(target)
@@ -157,6 +165,10 @@ class TMUXManager:
         """List windows in a session."""
         return self.list_ops.list_windows(session)
 
+    def list_all_windows(self) -> list[dict]:
+        """List windows across all sessions in one call."""
+        return self.list_ops.list_all_windows()
+
     def list_sessions(self) -> list[dict[str, str]]:
         """List all TMUX sessions."""
         return self.list_ops.list_sessions()
@@ -0,0 +1,177 @@
+"""Async TMUX operations for code running inside an event loop.
+
+Each tmux call runs as an asyncio subprocess, so waiting on tmux never blocks
+the loop. Calls are cancellable: cancelling one (or exceeding its timeout)
+kills the tmux process rather than leaving a worker thread stuck on it.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+
+class AsyncTmuxOperations:
+    """Non-blocking counterparts of the TMUX operations the messaging daemon needs."""
+
+    def __init__(self, tmux_cmd: str = "tmux", timeout: float = 2.0):
+        """Initialize async TMUX operations.
+
+        Args:
+            tmux_cmd: TMUX command to use (default: "tmux")
+            timeout: Seconds before a tmux call is killed
+        """
+        self.tmux_cmd = tmux_cmd
+        self.timeout = timeout
+        self._logger = logging.getLogger(__name__)
+
+    async def run(self, *args: str) -> Optional[str]:
+        """Run a tmux command.
+
+        Returns:
+            Standard output, or None if the command failed or timed out
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self.tmux_cmd, *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+        except OSError as e:
+            self._logger.error(f"Failed to run {self.tmux_cmd} {args[0] if args else ''}: {e}")
+            return None
+
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), self.timeout)
+        except TimeoutError:
+            self._kill(process)
+            self._logger.error(f"tmux {args[0] if args else ''} timed out after {self.timeout}s")
+            return None
+        except asyncio.CancelledError:
+            self._kill(process)
+            raise
+
+        if process.returncode != 0:
+            self._logger.error(f"tmux {args[0] if args else ''} failed: {stderr.decode(errors='replace').strip()}")
+            return None
+        return stdout.decode(errors="replace")
+
+    @staticmethod
+    def _kill(process: asyncio.subprocess.Process) -> None:
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+
+    async def send_keys(self, target: str, keys: str, literal: bool = False) -> bool:
+        """Send keys to a tmux target."""
+        args = ["send-keys", "-t", target, *(["-l"] if literal else []), keys]
+        return await self.run(*args) is not None
+
+    async def send_text(self, target: str, text: str) -> bool:
+        """Send literal text to the target pane."""
+        return await self.send_keys(target, text, literal=True)
+
+    async def press_enter(self, target: str) -> bool:
+        """Press Enter key in the target pane."""
+        return await self.send_keys(target, "Enter")
+
+    async def press_ctrl_u(self, target: str) -> bool:
+        """Press Ctrl+U (clear line) in the target pane."""
+        return await self.send_keys(target, "C-u")
+
+    async def capture_pane(self, target: str, lines: int = 50) -> str:
+        """Capture pane output ("" on failure)."""
+        args = ["capture-pane", "-t", target, "-p", *(["-S", f"-{lines}"] if lines > 0 else [])]
+        return await self.run(*args) or ""
+
+    async def capture_pane_with_cursor(self, target: str) -> tuple[str, Optional[tuple[int, int]]]:
+        """Capture the visible pane and its cursor position in a single tmux call."""
+        output = await self.run(
+            "capture-pane", "-t", target, "-p", ";", "display-message", "-t", target, "-p", "#{cursor_x} #{cursor_y}"
+        )
+        if output is None:
+            return "", None
+
+        screen, _, cursor_line = output.rstrip("\n").rpartition("\n")
+        try:
+            x, y = cursor_line.split()
+            return screen, (int(x), int(y))
+        except ValueError:
+            return output, None
+
+
+class PaneCaptureCache:
+    """Short-lived pane captures shared between concurrent readers.
+
+    A capture is reused for ``ttl`` seconds, and readers asking for the same
+    target and line count while a capture is running wait for that capture
+    instead of starting their own. ``invalidate`` drops a target's captures
+    after something was typed into it.
+    """
+
+    def __init__(self, tmux: AsyncTmuxOperations, ttl: float = 0.25, max_entries: int = 256):
+        """Initialize the cache.
+
+        Args:
+            tmux: Async TMUX operations used for captures
+            ttl: Seconds a capture stays fresh
+            max_entries: Captures kept before expired ones are pruned
+        """
+        self.tmux = tmux
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: dict[tuple[str, int], tuple[float, str]] = {}
+        self._inflight: dict[tuple[str, int], asyncio.Task] = {}
+        self._generations: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+
+    async def capture(self, target: str, lines: int = 50) -> str:
+        """Get a pane capture no older than the TTL."""
+        key = (target, lines)
+        loop = asyncio.get_running_loop()
+        entry = self._entries.get(key)
+        if entry is not None and loop.time() - entry[0] < self.ttl:
+            self.hits += 1
+            return entry[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = self._inflight[key] = asyncio.create_task(self._fetch(key))
+        else:
+            self.shared += 1
+        # Shield the shared capture: one reader giving up must not cancel it for the others
+        return await asyncio.shield(task)
+
+    async def _fetch(self, key: tuple[str, int]) -> str:
+        target, lines = key
+        generation = self._generations.get(target, 0)
+        try:
+            content = await self.tmux.capture_pane(target, lines)
+        finally:
+            self._inflight.pop(key, None)
+
+        # A capture started before an invalidation may predate the change; don't cache it
+        if self._generations.get(target, 0) == generation:
+            if len(self._entries) >= self.max_entries:
+                self._prune()
+            self._entries[key] = (asyncio.get_running_loop().time(), content)
+        return content
+
+    def _prune(self) -> None:
+        now = asyncio.get_running_loop().time()
+        for key in [key for key, (captured_at, _) in self._entries.items() if now - captured_at >= self.ttl]:
+            del self._entries[key]
+        while len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, target: str) -> None:
+        """Drop cached captures for a target."""
+        self._generations[target] = self._generations.get(target, 0) + 1
+        for key in [key for key in self._entries if key[0] == target]:
+            del self._entries[key]
+
+    def get_stats(self) -> dict[str, int]:
+        """Get hit, miss and shared-capture counts."""
+        return {"hits": self.hits, "misses": self.misses, "shared": self.shared, "entries": len(self._entries)}
@@ -147,6 +147,40 @@ class BasicTmuxOperations:
             self._logger.error(f"Error capturing pane {target}: {e}")
             return ""
 
+    def capture_pane_with_cursor(self, target: str) -> tuple[str, Optional[tuple[int, int]]]:
+        """Capture the visible pane and its cursor position in a single tmux call."""
+        try:
+            cmd = [self.tmux_cmd, "capture-pane", "-t", target, "-p", ";"]
+            cmd.extend(["display-message", "-t", target, "-p", "#{cursor_x} #{cursor_y}"])
+
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=2)
+            if result.returncode != 0:
+                self._logger.error(f"Failed to capture pane {target}: {result.stderr}")
+                return "", None
+
+            screen, _, cursor_line = result.stdout.rstrip("\n").rpartition("\n")
+            try:
+                x, y = cursor_line.split()
+                return screen, (int(x), int(y))
+            except ValueError:
+                return result.stdout, None
+        except Exception as e:
+            self._logger.error(f"Error capturing pane {target}: {e}")
+            return "", None
+
+    def get_pane_current_command(self, target: str) -> Optional[str]:
+        """Get the name of the foreground command running in the target pane."""
+        try:
+            cmd = [self.tmux_cmd, "display-message", "-p", "-t", target, "#{pane_current_command}"]
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=1)
+            command = result.stdout.strip()
+            if result.returncode == 0 and command:
+                return command
+            self._logger.debug(f"No pane command for {target}: {result.stderr.strip()}")
+        except Exception as e:
+            self._logger.debug(f"Error getting pane command for {target}: {e}")
+        return None
+
     def kill_window(self, target: str) -> bool:
         """Kill a specific tmux window."""
         self._logger.warning(f"🔪 TMUX KILL_WINDOW: Killing window {target}")
@@ -58,6 +58,31 @@ class TmuxListOperations:
             self._logger.error(f"Error listing windows for session {session}: {e}")
             return []
 
+    def list_all_windows(self) -> list[dict[str, Any]]:
+        """List windows across all sessions in a single tmux call.
+
+        Returns:
+            List of window dictionaries with session, index and name
+        """
+        try:
+            cmd = [self.tmux_cmd, "list-windows", "-a", "-F", "#{session_name}\t#{window_index}\t#{window_name}"]
+
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=2)
+            if result.returncode != 0:
+                return []
+
+            windows = []
+            for line in result.stdout.strip().split("\n"):
+                parts = line.split("\t", 2)
+                if len(parts) == 3:
+                    windows.append({"session": parts[0], "index": parts[1], "name": parts[2]})
+
+            return windows
+
+        except Exception as e:
+            self._logger.error(f"Error listing windows: {e}")
+            return []
+
     def list_sessions(self) -> list[dict[str, str]]:
         """List all TMUX sessions.
 
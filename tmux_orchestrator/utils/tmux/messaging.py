@@ -6,6 +6,7 @@ import subprocess
 from typing import Optional
 
 from .basic_operations import BasicTmuxOperations
+from .submit_timing import AdaptiveSubmitter
 
 
 class TmuxMessaging:
@@ -14,8 +15,21 @@ class TmuxMessaging:
     def __init__(self, basic_ops: Optional[BasicTmuxOperations] = None):
         """Initialize messaging operations."""
         self.basic_ops = basic_ops or BasicTmuxOperations()
+        self.submitter = AdaptiveSubmitter(self)
         self._logger = logging.getLogger(__name__)
 
+    def press_enter(self, target: str) -> bool:
+        """Press Enter key in the target pane."""
+        return self.basic_ops.press_enter(target)
+
+    def press_ctrl_u(self, target: str) -> bool:
+        """Press Ctrl+U (clear line) in the target pane."""
+        return self.basic_ops.press_ctrl_u(target)
+
+    def capture_pane_with_cursor(self, target: str) -> tuple[str, tuple[int, int] | None]:
+        """Capture the visible pane and cursor position in one call."""
+        return self.basic_ops.capture_pane_with_cursor(target)
+
     def send_text(self, target: str, text: str, **kwargs) -> bool:
         """Send literal text to the target pane directly. Ignores legacy chunking params."""
         try:
@@ -25,35 +39,27 @@ class TmuxMessaging:
             return False
 
     def send_message(self, target: str, message: str, delay: float = 0.5) -> bool:
-        """Send a message to an agent (text + Enter)."""
-        try:
-            self._logger.info(f"TmuxMessaging.send_message: to '{target}' ({len(message)} chars)")
-
-            # Send message text literally
-            cmd1 = ["tmux", "send-keys", "-t", target, "-l", message]
-            self._logger.debug(f"Sending message text: {' '.join(cmd1)}")
-            result = subprocess.run(cmd1, capture_output=True, text=True)
+        """Send a message to an agent (text + Enter).
 
-            if result.returncode != 0:
-                self._logger.error(f"Failed to send message text - return code: {result.returncode}")
-                if result.stderr:
-                    self._logger.error(f"send-keys stderr: {result.stderr.strip()}")
-                return False
+        Enter is pressed once the text is observed in the pane, and pressed
+        again (a bounded number of times) if the pane doesn't react to it.
 
-            self._logger.debug("Message text sent successfully, now sending Enter")
+        Args:
+            target: TMUX target
+            message: Message to send
+            delay: Delay before pressing Enter if the pane can't be observed
 
-            # Send Enter to submit
-            cmd2 = ["tmux", "send-keys", "-t", target, "Enter"]
-            self._logger.debug(f"Sending Enter: {' '.join(cmd2)}")
-            result = subprocess.run(cmd2, capture_output=True, text=True)
+        Returns:
+            True if the message was submitted
+        """
+        try:
+            self._logger.info(f"TmuxMessaging.send_message: to '{target}' ({len(message)} chars)")
 
-            success = result.returncode == 0
+            success = self.submitter.submit(target, message, clear=False, fallback_delay=delay)
             if success:
                 self._logger.info(f"Message sent successfully to '{target}'")
             else:
-                self._logger.error(f"Failed to send Enter - return code: {result.returncode}")
-                if result.stderr:
-                    self._logger.error(f"send-keys Enter stderr: {result.stderr.strip()}")
+                self._logger.error(f"Message to '{target}' was not confirmed as submitted")
 
             return success
         except Exception as e:
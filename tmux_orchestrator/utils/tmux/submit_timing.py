@@ -0,0 +1,397 @@
+"""Adaptive submit timing for keystroke delivery.
+
+Instead of fixed sleeps around keystrokes, each delivery step is confirmed by
+cheap observation of the pane: the cursor position plus a hash of the bottom
+of the screen (where Claude's prompt box lives), fetched with one tmux call.
+Steps poll on a short interval until the pane changes and settles, bounded by
+per-target timeouts learned from the delays actually observed. If Enter
+leaves the pane unchanged it is pressed again, a bounded number of times, and
+submit reports whether the submission was confirmed. Panes that can't be
+observed fall back to the previous fixed delays.
+
+AsyncAdaptiveSubmitter runs the same steps inside an event loop against an
+async tmux backend (see async_operations), so waits never block the loop and
+a delivery can be cancelled at any step.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections.abc import Callable, Generator
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from tmux_orchestrator.utils.quantile_sketch import QuantileSketch
+
+# Lines at the bottom of the screen compared between observations
+OBSERVED_LINES = 15
+
+# Claude Code prompt line: "│ > text │" (tmux may render the space as NBSP)
+_PROMPT_LINE = re.compile(r"│[\s\xa0]*>[\s\xa0]?(.*?)[\s\xa0]*│?[\s\xa0]*$")
+
+# Step -> (default timeout, floor, ceiling) in seconds
+STEP_TIMEOUTS = {
+    "clear": (0.1, 0.02, 0.2),
+    "paste": (1.0, 0.05, 3.0),
+    "submit": (0.5, 0.05, 1.0),
+}
+
+# Previous fixed delays, used when the pane can't be observed
+FALLBACK_DELAYS = {"clear": 0.05, "paste": 0.2}
+
+# Extra Enter presses when the pane doesn't react to the first one
+SUBMIT_RETRIES = 2
+
+
+@dataclass(frozen=True)
+class PaneObservation:
+    """Cheap fingerprint of a pane's visible state."""
+
+    cursor: Optional[tuple[int, int]]
+    screen_hash: int
+    prompt_input: Optional[str]
+
+
+class DelayProfile:
+    """Observed step delays for one target, kept as quantile sketches."""
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        """Initialize an empty profile.
+
+        Args:
+            relative_accuracy: Relative error of the delay quantiles
+        """
+        self._sketches: dict[str, QuantileSketch] = {}
+        self._relative_accuracy = relative_accuracy
+        self.timeouts = 0
+
+    def record(self, step: str, seconds: float) -> None:
+        """Record how long a step took to be confirmed."""
+        if step not in self._sketches:
+            self._sketches[step] = QuantileSketch(self._relative_accuracy)
+        self._sketches[step].add(seconds)
+
+    def median(self, step: str) -> Optional[float]:
+        """Median confirmed delay for a step, if any were observed."""
+        sketch = self._sketches.get(step)
+        return sketch.quantile(0.5) if sketch else None
+
+    def timeout(self, step: str, scale: float = 1.0) -> float:
+        """Timeout for a step: a multiple of the observed p90 within the step's bounds."""
+        default, floor, ceiling = STEP_TIMEOUTS[step]
+        sketch = self._sketches.get(step)
+        if sketch is None or sketch.count < 5:
+            return min(default * scale, ceiling * scale)
+        return max(floor, min(3 * sketch.quantile(0.9) * scale, ceiling * scale))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize the profile for stats output."""
+        return {
+            "median_ms": {step: sketch.quantile(0.5) * 1000 for step, sketch in self._sketches.items()},
+            "samples": {step: sketch.count for step, sketch in self._sketches.items()},
+            "timeouts": self.timeouts,
+        }
+
+
+def parse_prompt_input(screen: str) -> Optional[str]:
+    """Extract the text typed into Claude's prompt box.
+
+    Args:
+        screen: Captured pane content
+
+    Returns:
+        Prompt text ("" when empty), or None if no prompt box is visible
+    """
+    for line in reversed(screen.splitlines()):
+        match = _PROMPT_LINE.search(line)
+        if match:
+            return match.group(1).replace("\xa0", " ").strip()
+    return None
+
+
+def fingerprint(screen: Any, cursor: Any) -> Optional[PaneObservation]:
+    """Fingerprint a captured screen, or None if nothing usable was captured."""
+    if not isinstance(screen, str) or not screen:
+        return None
+    bottom = "\n".join(screen.rstrip("\n").splitlines()[-OBSERVED_LINES:])
+    return PaneObservation(
+        cursor=cursor if isinstance(cursor, tuple) else None,
+        screen_hash=hash(bottom),
+        prompt_input=parse_prompt_input(bottom),
+    )
+
+
+class _ProfiledSubmitter:
+    """Per-target delay profiles shared by the sync and async submitters."""
+
+    def __init__(self, tmux: Any, poll_interval: float, clock: Callable[[], float], submit_retries: int) -> None:
+        self.tmux = tmux
+        self.poll_interval = poll_interval
+        self.submit_retries = submit_retries
+        self._clock = clock
+        self._profiles: dict[str, DelayProfile] = {}
+        self._logger = logging.getLogger(__name__)
+
+    def profile(self, target: str) -> DelayProfile:
+        """Get the delay profile for a target."""
+        if target not in self._profiles:
+            self._profiles[target] = DelayProfile()
+        return self._profiles[target]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get observed delays per target."""
+        return {target: profile.to_dict() for target, profile in self._profiles.items()}
+
+    def _confirm(self, target: str, step: str, start: float, timeout: float, confirmed: bool) -> Optional[bool]:
+        """Record a confirmed step or a timeout; returns the step result, or None to keep polling."""
+        if confirmed:
+            self.profile(target).record(step, self._clock() - start)
+            return True
+        if self._clock() >= start + timeout:
+            self.profile(target).timeouts += 1
+            self._logger.debug(f"{step} not confirmed on {target} within {timeout * 1000:.0f}ms")
+            return False
+        return None
+
+    def _submit_steps(
+        self, target: str, text: str, clear: bool, fallback_delay: float | None
+    ) -> Generator[tuple[str, tuple], Any, bool]:
+        """Decide each step of a submission; the sync and async submitters perform them.
+
+        Yields (operation, args) pairs and is sent each operation's result.
+        Operations are "observe", "await_change" and "sleep" on the submitter,
+        and tmux keystroke methods ("press_ctrl_u", "send_text", "press_enter").
+
+        Returns:
+            True if the submission was confirmed (for panes that can't be
+            observed, if the keystrokes were sent)
+        """
+        profile = self.profile(target)
+        baseline = yield "observe", (target,)
+
+        if baseline is None:
+            # Unobservable pane: keep the previous fixed delays
+            if clear:
+                if not (yield "press_ctrl_u", (target,)):
+                    return False
+                yield "sleep", (FALLBACK_DELAYS["clear"],)
+            if not (yield "send_text", (target, text)):
+                return False
+            yield "sleep", (FALLBACK_DELAYS["paste"] if fallback_delay is None else fallback_delay,)
+            return bool((yield "press_enter", (target,)))
+
+        if clear and baseline.prompt_input != "":
+            if not (yield "press_ctrl_u", (target,)):
+                return False
+            yield "await_change", (target, "clear", baseline, profile.timeout("clear"), False)
+            baseline = (yield "observe", (target,)) or baseline
+
+        if not (yield "send_text", (target, text)):
+            return False
+        # Long pastes take longer to render; scale the bound with the text size
+        scale = 1.0 + len(text) / 4000
+        yield "await_change", (target, "paste", baseline, profile.timeout("paste", scale), True)
+
+        before_enter = (yield "observe", (target,)) or baseline
+        for attempt in range(self.submit_retries + 1):
+            if attempt:
+                # The pane may have reacted just after the timeout; only press again if it still hasn't
+                if ((yield "observe", (target,)) or before_enter) != before_enter:
+                    return True
+                self._logger.debug(f"Enter not confirmed on {target}, pressing again ({attempt}/{self.submit_retries})")
+            if not (yield "press_enter", (target,)):
+                return False
+            if (yield "await_change", (target, "submit", before_enter, profile.timeout("submit"), False)):
+                return True
+        return False
+
+
+def _changed(
+    current: Optional[PaneObservation],
+    previous: Optional[PaneObservation],
+    baseline: PaneObservation,
+    settle: bool,
+) -> bool:
+    """Whether the pane moved away from baseline (and, when settling, stopped changing)."""
+    return current is not None and current != baseline and (not settle or current == previous)
+
+
+class AdaptiveSubmitter(_ProfiledSubmitter):
+    """Types and submits messages, confirming each step by observing the pane."""
+
+    def __init__(
+        self,
+        tmux: Any,
+        poll_interval: float = 0.01,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        submit_retries: int = SUBMIT_RETRIES,
+    ) -> None:
+        """Initialize the submitter.
+
+        Args:
+            tmux: TMUXManager (or compatible) used for keystrokes and observation
+            poll_interval: Seconds between observations
+            clock: Monotonic clock
+            sleep: Sleep function
+            submit_retries: Extra Enter presses when the pane doesn't react
+        """
+        super().__init__(tmux, poll_interval, clock, submit_retries)
+        self._sleep = sleep
+
+    def observe(self, target: str) -> Optional[PaneObservation]:
+        """Fingerprint the pane, or None if it can't be observed."""
+        capture = getattr(self.tmux, "capture_pane_with_cursor", None)
+        if capture is None:
+            return fingerprint(self.tmux.capture_pane(target, lines=0), None)
+        result = capture(target)
+        if not isinstance(result, tuple) or len(result) != 2:
+            return None
+        return fingerprint(*result)
+
+    def _await_change(self, target: str, step: str, baseline: PaneObservation, timeout: float, settle: bool) -> bool:
+        """Poll until the pane differs from baseline (and optionally stops changing).
+
+        Returns:
+            True if confirmed within the timeout
+        """
+        start = self._clock()
+        previous: Optional[PaneObservation] = None
+        while True:
+            self._sleep(self.poll_interval)
+            current = self.observe(target)
+            result = self._confirm(target, step, start, timeout, _changed(current, previous, baseline, settle))
+            if result is not None:
+                return result
+            previous = current
+
+    def submit(self, target: str, text: str, clear: bool = True, fallback_delay: Optional[float] = None) -> bool:
+        """Type text into the target and press Enter once it has landed.
+
+        Args:
+            target: TMUX target
+            text: Text to send literally
+            clear: Clear any partial input first (skipped when the prompt is visibly empty)
+            fallback_delay: Fixed delay before Enter if the pane can't be observed
+
+        Returns:
+            True if the submission was confirmed (for panes that can't be
+            observed, if the keystrokes were sent)
+        """
+        steps = self._submit_steps(target, text, clear, fallback_delay)
+        result: Any = None
+        while True:
+            try:
+                operation, args = steps.send(result)
+            except StopIteration as done:
+                return done.value
+            if operation == "sleep":
+                result = self._sleep(*args)
+            elif operation == "observe":
+                result = self.observe(*args)
+            elif operation == "await_change":
+                result = self._await_change(*args)
+            else:
+                result = getattr(self.tmux, operation)(*args)
+
+    def wait_until_ready(self, target: str, timeout: float = 15.0, poll_interval: float = 0.1) -> bool:
+        """Wait for a Claude prompt box to appear and the pane to settle.
+
+        Args:
+            target: TMUX target
+            timeout: Maximum seconds to wait
+            poll_interval: Seconds between observations
+
+        Returns:
+            True once ready (or after a short fixed wait if the pane can't be observed)
+        """
+        start = self._clock()
+        previous: Optional[PaneObservation] = None
+        while self._clock() - start < timeout:
+            current = self.observe(target)
+            if current is None:
+                self._sleep(min(3.0, timeout))
+                return True
+            if current.prompt_input is not None and current == previous:
+                self.profile(target).record("startup", self._clock() - start)
+                return True
+            previous = current
+            self._sleep(poll_interval)
+        self.profile(target).timeouts += 1
+        return False
+
+
+class AsyncAdaptiveSubmitter(_ProfiledSubmitter):
+    """AdaptiveSubmitter for event loops, driving an async tmux backend.
+
+    Every tmux call and wait is awaited, so nothing blocks the loop and
+    cancelling ``submit`` stops the delivery at whichever step it reached.
+    """
+
+    def __init__(
+        self,
+        tmux: Any,
+        poll_interval: float = 0.01,
+        clock: Callable[[], float] = time.monotonic,
+        submit_retries: int = SUBMIT_RETRIES,
+    ) -> None:
+        """Initialize the submitter.
+
+        Args:
+            tmux: AsyncTmuxOperations (or compatible) used for keystrokes and observation
+            poll_interval: Seconds between observations
+            clock: Monotonic clock
+            submit_retries: Extra Enter presses when the pane doesn't react
+        """
+        super().__init__(tmux, poll_interval, clock, submit_retries)
+
+    async def observe(self, target: str) -> Optional[PaneObservation]:
+        """Fingerprint the pane, or None if it can't be observed."""
+        result = await self.tmux.capture_pane_with_cursor(target)
+        if not isinstance(result, tuple) or len(result) != 2:
+            return None
+        return fingerprint(*result)
+
+    async def _await_change(
+        self, target: str, step: str, baseline: PaneObservation, timeout: float, settle: bool
+    ) -> bool:
+        """Poll until the pane differs from baseline (and optionally stops changing)."""
+        start = self._clock()
+        previous: Optional[PaneObservation] = None
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            current = await self.observe(target)
+            result = self._confirm(target, step, start, timeout, _changed(current, previous, baseline, settle))
+            if result is not None:
+                return result
+            previous = current
+
+    async def submit(self, target: str, text: str, clear: bool = True, fallback_delay: Optional[float] = None) -> bool:
+        """Type text into the target and press Enter once it has landed.
+
+        Args:
+            target: TMUX target
+            text: Text to send literally
+            clear: Clear any partial input first (skipped when the prompt is visibly empty)
+            fallback_delay: Fixed delay before Enter if the pane can't be observed
+
+        Returns:
+            True if the submission was confirmed (for panes that can't be
+            observed, if the keystrokes were sent)
+        """
+        steps = self._submit_steps(target, text, clear, fallback_delay)
+        result: Any = None
+        while True:
+            try:
+                operation, args = steps.send(result)
+            except StopIteration as done:
+                return done.value
+            if operation == "sleep":
+                result = await asyncio.sleep(*args)
+            elif operation == "observe":
+                result = await self.observe(*args)
+            elif operation == "await_change":
+                result = await self._await_change(*args)
+            else:
+                result = await getattr(self.tmux, operation)(*args)